@@ -0,0 +1,52 @@
+"""قياس سرعة محرك اقتراح الإيموجي (عدد النصوص في الثانية على نواة واحدة)
+
+الاستخدام:
+    python benchmarks/emoji_bench.py [عدد النصوص]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.services import emoji
+
+TARGET_PER_SECOND = 10000
+
+SAMPLES = (
+    'مبروك إطلاق مشروعك الجديد! نتمنى لك النجاح والتوفيق في عملك',
+    'أحب القهوة في الصباح قبل الاجتماع مع فريق التسويق',
+    'Happy birthday! Let us celebrate with coffee, music and great friends',
+    'Our new marketing strategy doubled sales growth this quarter',
+    'رحلة إلى البحر مع العائلة في عطلة نهاية الأسبوع',
+    'Finally launching the exclusive design collection today, so excited',
+    'قصة قصيرة عن فنان يبحث عن فكرة جديدة للوحة',
+    'Weekly report: project status, meeting notes and next goals',
+    'نص عادي لا يحتوي على كلمات مفتاحية معروفة',
+    'Just a plain sentence without any known keywords in it',
+)
+
+
+def make_texts(count, seed=1):
+    rng = random.Random(seed)
+    return [' '.join(rng.sample(SAMPLES, 2)) for _ in range(count)]
+
+
+def main(count=20000):
+    texts = make_texts(count)
+    emoji.analyze('warm up')
+
+    start = time.perf_counter()
+    emoji.analyze_batch(texts)
+    elapsed = time.perf_counter() - start
+
+    average_length = sum(map(len, texts)) / len(texts)
+    rate = count / elapsed
+    print(f'texts={count} avg_length={average_length:.0f} chars')
+    print(f'{rate:,.0f} texts/s ({elapsed * 1e6 / count:.1f} us/text), target {TARGET_PER_SECOND:,}/s: '
+          f'{"ok" if rate >= TARGET_PER_SECOND else "below target"}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,442 @@
+"""قياس أداء مسارات API على بيانات اصطناعية بأحجام قابلة للتحديد
+
+يبني قاعدة SQLite بالحجم المطلوب (وتُعاد استخدامها في التشغيلات التالية)، ثم يطلب
+كل مسار من كل blueprint عبر عميل الاختبار في Flask وعبر gunicorn حقيقي بعدة عمال.
+يطبع الإنتاجية وزمن الاستجابة p50/p95/p99 وعدد استعلامات SQL لكل طلب، ويحفظ
+النتائج كخط أساس JSON تُقارن به التشغيلات اللاحقة (رمز خروج 1 عند التراجع).
+
+الاستخدام:
+    python benchmarks/endpoint_bench.py [--preset small|large] [--users N] [--comments N] ...
+        [--mode client|gunicorn|both] [--workers 4] [--concurrency 8] [--requests 200]
+        [--only posts,leaderboard] [--skip-writes]
+        [--save baseline.json] [--baseline baseline.json]
+        [--latency-threshold 0.25] [--throughput-threshold 0.25] [--query-threshold 0]
+
+أمثلة:
+    python benchmarks/endpoint_bench.py --save benchmarks/baseline.json
+    python benchmarks/endpoint_bench.py --baseline benchmarks/baseline.json
+    python benchmarks/endpoint_bench.py --preset large --mode gunicorn --workers 4
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+PRESETS = {
+    'small': {'users': 2_000, 'posts': 200, 'comments': 20_000, 'daily_points': 50_000, 'tasks': 5_000, 'images': 500},
+    'large': {'users': 100_000, 'posts': 10_000, 'comments': 1_000_000, 'daily_points': 5_000_000,
+              'tasks': 100_000, 'images': 20_000},
+}
+CHUNK = 20_000
+TOOL_NAMES = ('smart_titles', 'tasks', 'smart_emoji')
+ADMIN = {'username': 'admin', 'password': 'admin123'}
+
+# (الاسم، الطريقة، المسار، جسم الطلب، هل يكتب في القاعدة)
+# {post} و {user} يُستبدلان بمعرّفات من البيانات المولدة
+ENDPOINTS = (
+    ('api', 'GET', '/api', None, False),
+    # user_bp
+    ('profile', 'GET', '/api/profile', None, False),
+    ('users', 'GET', '/api/users', None, False),
+    ('user_detail', 'GET', '/api/users/{user}', None, False),
+    ('login', 'POST', '/api/login', ADMIN, True),
+    # posts_bp
+    ('posts', 'GET', '/api/posts', None, False),
+    ('posts_cursor', 'GET', '/api/posts?cursor=', None, False),
+    ('posts_search', 'GET', '/api/posts/search?q=Post', None, False),
+    ('post_detail', 'GET', '/api/posts/{post}', None, False),
+    ('post_comments', 'GET', '/api/posts/{post}/comments?cursor=', None, False),
+    ('comment_create', 'POST', '/api/posts/{post}/comments', {'content': 'تعليق للقياس'}, True),
+    # tools_bp
+    ('tools', 'GET', '/api/tools', None, False),
+    ('smart_titles', 'POST', '/api/tools/smart-titles', {'topic': 'التسويق الرقمي', 'language': 'ar'}, True),
+    ('advanced_titles', 'POST', '/api/tools/advanced-titles',
+     {'topic': 'Machine Learning', 'style': 'academic', 'language': 'en'}, True),
+    ('titles_batch', 'POST', '/api/tools/titles/batch',
+     {'topics': [f'topic {i}' for i in range(50)], 'language': 'en'}, True),
+    ('smart_emoji', 'POST', '/api/tools/smart-emoji', {'text': 'مبروك إطلاق مشروعك الجديد'}, True),
+    ('smart_emoji_batch', 'POST', '/api/tools/smart-emoji/batch',
+     {'texts': ['Happy birthday! Let us celebrate with coffee'] * 100}, True),
+    ('tasks', 'GET', '/api/tasks', None, False),
+    ('tasks_open', 'GET', '/api/tasks?status=open', None, False),
+    ('task_create', 'POST', '/api/tasks', {'title': 'مهمة للقياس'}, True),
+    ('leaderboard', 'GET', '/api/leaderboard', None, False),
+    ('leaderboard_me', 'GET', '/api/leaderboard/me', None, False),
+    # admin_bp
+    ('admin_dashboard', 'GET', '/api/admin/dashboard', None, False),
+    ('admin_dashboard_fresh', 'GET', '/api/admin/dashboard?fresh=1', None, False),
+    ('admin_users', 'GET', '/api/admin/users?cursor=', None, False),
+    ('admin_users_search', 'GET', '/api/admin/users/search?q=user12', None, False),
+    ('admin_images', 'GET', '/api/admin/images?cursor=', None, False),
+    ('admin_comments', 'GET', '/api/admin/comments?cursor=', None, False),
+    ('admin_tools', 'GET', '/api/admin/tools', None, False),
+    ('admin_analytics', 'GET', '/api/admin/analytics?granularity=day&range=30', None, False),
+)
+
+
+# ---------------------------------------------------------------- البيانات
+
+def dataset_path(sizes, directory):
+    key = '-'.join(f'{name}{sizes[name]}' for name in sorted(sizes))
+    return os.path.join(directory, f'endpoint_bench-{key}.db')
+
+
+def _insert(table, rows):
+    """إدراج صفوف مولدة على دفعات حتى لا تُحمَّل ملايين الصفوف في الذاكرة معاً"""
+    from src.models.user import db
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= CHUNK:
+            db.session.execute(table.insert(), batch)
+            batch.clear()
+    if batch:
+        db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def build_dataset(path, sizes, seed=1):
+    from src.main import create_app
+    from src.models.user import db, User, Post, Comment, DailyPoints, Task, UserImage
+    from src.routes.posts import recount_comments
+    from src.services.analytics import rebuild_rollups
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    today = now.date()
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path, 'INIT_DATABASE': True,
+                      'CLEANUP_INTERVAL_SECONDS': 0})
+    with app.app_context():
+        first = db.session.query(db.func.max(User.id)).scalar() + 1
+        _insert(User.__table__, ({
+            'username': f'user{i}', 'email': f'user{i}@example.com', 'total_points': rng.randint(0, 10_000),
+            'is_admin': False, 'preferred_language': 'ar' if i % 2 else 'en',
+            'created_at': now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+        } for i in range(sizes['users'])))
+        user_ids = range(first, first + sizes['users'])
+
+        _insert(Post.__table__, ({
+            'title_ar': f'منشور {i}', 'title_en': f'Post {i}', 'content_ar': 'محتوى ' * 50,
+            'content_en': 'Content ' * 50, 'is_active': i % 20 != 0, 'comments_count': 0,
+            'created_at': now - timedelta(minutes=i),
+        } for i in range(sizes['posts'])))
+
+        _insert(Comment.__table__, ({
+            'content': f'تعليق {i}', 'user_id': rng.choice(user_ids), 'post_id': rng.randint(1, sizes['posts']),
+            'is_approved': i % 10 != 0, 'created_at': now - timedelta(seconds=i),
+        } for i in range(sizes['comments'])))
+
+        # كل صف يأخذ تركيبة فريدة (مستخدم، أداة، يوم) لاحترام القيد الفريد
+        per_day = len(user_ids) * len(TOOL_NAMES)
+        _insert(DailyPoints.__table__, ({
+            'user_id': user_ids[i % len(user_ids)], 'tool_name': TOOL_NAMES[i // len(user_ids) % len(TOOL_NAMES)],
+            'points_earned': 25, 'date_earned': today - timedelta(days=i // per_day),
+        } for i in range(sizes['daily_points'])))
+
+        # نصف المهام للمسؤول (id=1) الذي تُطلب به مسارات المهام
+        _insert(Task.__table__, ({
+            'user_id': 1 if i % 2 else rng.choice(user_ids), 'title': f'مهمة {i}', 'description': '',
+            'is_completed': i % 3 == 0, 'created_at': now - timedelta(seconds=i),
+        } for i in range(sizes['tasks'])))
+
+        _insert(UserImage.__table__, ({
+            'user_id': rng.choice(user_ids), 'image_path': f'/tmp/bench/{i}.png',
+            'upload_date': now - timedelta(minutes=i), 'expiry_date': now + timedelta(days=1),
+            'is_approved': i % 2 == 0, 'is_active': True,
+        } for i in range(sizes['images'])))
+
+        recount_comments()
+        rebuild_rollups()
+        db.session.commit()
+    with sqlite3.connect(path) as connection:
+        connection.execute('ANALYZE')
+
+
+def prepare_dataset(sizes, directory, rebuild=False):
+    path = dataset_path(sizes, directory)
+    if rebuild or not os.path.exists(path):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        start = time.perf_counter()
+        print(f'building {path} ...', flush=True)
+        build_dataset(path, sizes)
+        print(f'built in {time.perf_counter() - start:.1f} s', flush=True)
+    return path
+
+
+# ---------------------------------------------------------------- القياس
+
+def percentile(ordered, fraction):
+    """النسبة المئوية بطريقة أقرب رتبة (القائمة مرتبة تصاعدياً)"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies, elapsed, errors, queries=None):
+    ordered = sorted(latencies)
+    result = {
+        'requests': len(ordered),
+        'errors': errors,
+        'rps': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+    }
+    if queries is not None:
+        result['queries'] = round(sum(queries) / len(queries), 2) if queries else 0
+    return result
+
+
+def selected_endpoints(args, ids):
+    only = set(args.only.split(',')) if args.only else None
+    for name, method, path, body, writes in ENDPOINTS:
+        if only is not None and name not in only:
+            continue
+        if writes and args.skip_writes:
+            continue
+        yield name, method, path.format(**ids), body
+
+
+def run_client(path, args, ids):
+    """قياس داخل العملية نفسها عبر عميل الاختبار، مع عدّ استعلامات SQL لكل طلب"""
+    from sqlalchemy import event
+
+    from src.main import create_app
+    from src.models.user import db
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path, 'INIT_DATABASE': True,
+                      'CLEANUP_INTERVAL_SECONDS': 0})
+    counter = [0]
+
+    def count(*_):
+        counter[0] += 1
+
+    with app.app_context():
+        engines = [db.engine, app.extensions.get('sqlite_read_engine')]
+    for engine in filter(None, engines):
+        event.listen(engine, 'before_cursor_execute', count)
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['username'] = ADMIN['username']
+
+    results = {}
+    for name, method, url, body in selected_endpoints(args, ids):
+        for _ in range(args.warmup):
+            client.open(url, method=method, json=body)
+        latencies, queries, errors = [], [], 0
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            counter[0] = 0
+            began = time.perf_counter()
+            response = client.open(url, method=method, json=body)
+            latencies.append(time.perf_counter() - began)
+            queries.append(counter[0])
+            errors += response.status_code >= 400
+        results[name] = summarize(latencies, time.perf_counter() - start, errors, queries)
+        report('client', name, results[name])
+    return results
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _request(connection, method, url, body, cookie):
+    headers = {'Cookie': cookie} if cookie else {}
+    payload = None
+    if body is not None:
+        payload = json.dumps(body).encode()
+        headers['Content-Type'] = 'application/json'
+    connection.request(method, url, body=payload, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    return response
+
+
+def _wait_ready(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            if _request(connection, 'GET', '/api', None, None).status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn did not become ready')
+
+
+def run_gunicorn(path, args, ids):
+    """قياس عبر HTTP على gunicorn بعدة عمال، بعدة اتصالات متزامنة"""
+    port = _free_port()
+    env = dict(os.environ, DATABASE_URL='sqlite:///' + path)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--workers', str(args.workers), '--bind', f'127.0.0.1:{port}',
+         '--log-level', 'warning', 'src.main:app'],
+        cwd=ROOT, env=env,
+    )
+    try:
+        _wait_ready(port, process)
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        login = _request(connection, 'POST', '/api/login', ADMIN, None)
+        cookie = login.getheader('Set-Cookie', '').split(';', 1)[0]
+
+        results = {}
+        for name, method, url, body in selected_endpoints(args, ids):
+            results[name] = _drive(port, method, url, body, cookie, args)
+            report('gunicorn', name, results[name])
+        return results
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _drive(port, method, url, body, cookie, args):
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    remaining = [args.requests]
+
+    def worker():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        for _ in range(args.warmup):
+            _request(connection, method, url, body, cookie)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            began = time.perf_counter()
+            try:
+                failed = _request(connection, method, url, body, cookie).status >= 400
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                failed = True
+            elapsed = time.perf_counter() - began
+            with lock:
+                latencies.append(elapsed)
+                errors[0] += failed
+
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, time.perf_counter() - start, errors[0])
+
+
+def report(mode, name, result):
+    queries = f"{result['queries']:>6.1f}" if 'queries' in result else '     -'
+    errors = f"  errors={result['errors']}" if result['errors'] else ''
+    print(f"{mode:<9} {name:<24} {result['rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.2f}  "
+          f"p95 {result['p95_ms']:>8.2f}  p99 {result['p99_ms']:>8.2f} ms  queries {queries}{errors}", flush=True)
+
+
+# ---------------------------------------------------------------- خط الأساس
+
+def compare(current, baseline, args):
+    """يعيد قائمة التراجعات مقارنة بخط الأساس حسب العتبات المحددة"""
+    regressions = []
+    for mode, endpoints in current['results'].items():
+        for name, result in endpoints.items():
+            base = baseline.get('results', {}).get(mode, {}).get(name)
+            if base is None:
+                continue
+            for key in ('p95_ms', 'p99_ms'):
+                limit = base[key] * (1 + args.latency_threshold)
+                if result[key] > limit and result[key] - base[key] >= args.min_delta_ms:
+                    regressions.append(f'{mode} {name}: {key} {base[key]:.2f} -> {result[key]:.2f}')
+            if result['rps'] < base['rps'] * (1 - args.throughput_threshold):
+                regressions.append(f"{mode} {name}: rps {base['rps']:.1f} -> {result['rps']:.1f}")
+            if 'queries' in result and 'queries' in base and \
+                    result['queries'] > base['queries'] + args.query_threshold:
+                regressions.append(f"{mode} {name}: queries {base['queries']} -> {result['queries']}")
+            if result['errors'] > base['errors']:
+                regressions.append(f"{mode} {name}: errors {base['errors']} -> {result['errors']}")
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='قياس أداء مسارات API')
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='small')
+    for name in PRESETS['small']:
+        parser.add_argument('--' + name.replace('_', '-'), type=int, dest=name)
+    parser.add_argument('--data-dir', default=tempfile.gettempdir())
+    parser.add_argument('--rebuild', action='store_true', help='إعادة بناء قاعدة البيانات حتى لو كانت موجودة')
+    parser.add_argument('--mode', choices=('client', 'gunicorn', 'both'), default='both')
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', 2)))
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--only', help='أسماء المسارات مفصولة بفواصل')
+    parser.add_argument('--skip-writes', action='store_true')
+    parser.add_argument('--save', help='حفظ النتائج كخط أساس JSON')
+    parser.add_argument('--baseline', help='مقارنة النتائج بخط أساس JSON')
+    parser.add_argument('--latency-threshold', type=float, default=0.25, help='أقصى زيادة نسبية في p95/p99')
+    parser.add_argument('--throughput-threshold', type=float, default=0.25, help='أقصى انخفاض نسبي في req/s')
+    parser.add_argument('--query-threshold', type=float, default=0, help='أقصى زيادة في الاستعلامات لكل طلب')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='تجاهل فروق الزمن الأصغر من هذا')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = {name: getattr(args, name) or value for name, value in PRESETS[args.preset].items()}
+    path = prepare_dataset(sizes, args.data_dir, args.rebuild)
+    ids = {'post': sizes['posts'] // 2 or 1, 'user': 2}
+
+    current = {
+        'meta': {
+            'sizes': sizes, 'mode': args.mode, 'workers': args.workers, 'concurrency': args.concurrency,
+            'requests': args.requests, 'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+            'cpus': os.cpu_count(), 'created_at': datetime.utcnow().isoformat(timespec='seconds'),
+        },
+        'results': {},
+    }
+    if args.mode in ('client', 'both'):
+        current['results']['client'] = run_client(path, args, ids)
+    if args.mode in ('gunicorn', 'both'):
+        current['results']['gunicorn'] = run_gunicorn(path, args, ids)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as handle:
+            json.dump(current, handle, indent=2, ensure_ascii=False)
+        print(f'\nbaseline saved to {args.save}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        if baseline['meta'].get('sizes') != sizes:
+            print('warning: baseline was recorded with different dataset sizes')
+        regressions = compare(current, baseline, args)
+        print(f'\n{len(regressions)} regression(s) against {args.baseline}')
+        for line in regressions:
+            print('  ' + line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
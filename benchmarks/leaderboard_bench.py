@@ -0,0 +1,75 @@
+"""مقارنة أداء لوحة الصدارة في الذاكرة مع استعلامات SQL
+
+الاستخدام:
+    python benchmarks/leaderboard_bench.py [عدد المستخدمين]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from src.models.user import db, User
+from src.services.leaderboard import Leaderboard
+
+
+def timed(label, func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<40} {elapsed / repeat * 1e6:>12.1f} µs/op')
+
+
+def main(user_count=100_000, repeat=200):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.execute(User.__table__.insert(), [
+            {
+                'id': i,
+                'username': f'user{i}',
+                'email': f'user{i}@example.com',
+                'total_points': random.randint(0, 10_000)
+            }
+            for i in range(1, user_count + 1)
+        ])
+        db.session.commit()
+
+        board = Leaderboard()
+        start = time.perf_counter()
+        board.load_from_db()
+        print(f'build ({user_count} users){"":<21} {time.perf_counter() - start:>12.3f} s')
+
+        sample_ids = [random.randint(1, user_count) for _ in range(repeat)]
+        ids = iter(sample_ids * 2)
+
+        def sql_top():
+            User.query.filter(User.total_points > 0).order_by(User.total_points.desc()).limit(10).all()
+
+        def sql_rank():
+            user = db.session.get(User, next(ids))
+            User.query.filter(
+                db.or_(
+                    User.total_points > user.total_points,
+                    db.and_(User.total_points == user.total_points, User.id < user.id)
+                )
+            ).count()
+
+        timed('SQL top 10', sql_top, repeat)
+        timed('SQL rank', sql_rank, repeat)
+
+        ids = iter(sample_ids * 4)
+        timed('engine top 10', lambda: board.top(10), repeat)
+        timed('engine rank', lambda: board.rank(next(ids)), repeat)
+        timed('engine around (radius 5)', lambda: board.around(next(ids), 5), repeat)
+        timed('engine update', lambda: board.add_points(next(ids), 25), repeat)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
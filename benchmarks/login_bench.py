@@ -0,0 +1,71 @@
+"""قياس معدل تسجيل الدخول مع أحجام مختلفة لمجموعة عمليات التجزئة
+
+الاستخدام:
+    python benchmarks/login_bench.py [عدد الطلبات] [عدد الخيوط المتزامنة]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from src.models.user import db, User
+from src.routes.user import user_bp
+from src.services.passwords import hasher
+
+
+def make_app(workers, method):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'bench'
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['PASSWORD_HASH_WORKERS'] = workers
+    app.config['PASSWORD_HASH_METHOD'] = method
+    app.config['PASSWORD_HASH_MAX_QUEUE'] = 1000
+    db.init_app(app)
+    app.register_blueprint(user_bp, url_prefix='/api')
+    with app.app_context():
+        db.create_all()
+        user = User(username='bench', email='bench@example.com')
+        user.password_hash = hasher.hash('secret')
+        db.session.add(user)
+        db.session.commit()
+    return app
+
+
+def run(app, requests, concurrency):
+    statuses = []
+    per_thread = requests // concurrency
+
+    def worker():
+        client = app.test_client()
+        for _ in range(per_thread):
+            response = client.post('/api/login', json={'username': 'bench', 'password': 'secret'})
+            statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(statuses) / elapsed, statuses.count(200), len(statuses)
+
+
+def main(requests=64, concurrency=8):
+    method = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+    print(f'method={method} cpus={os.cpu_count()} concurrency={concurrency}')
+    for workers in sorted({0, 1, 2, 4, os.cpu_count() or 1}):
+        app = make_app(workers, method)
+        with app.app_context():
+            throughput, ok, total = run(app, requests, concurrency)
+            hasher.shutdown()
+        label = 'inline' if workers == 0 else f'{workers} processes'
+        print(f'{label:<14} {throughput:>8.1f} logins/s  ({ok}/{total} ok)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,61 @@
+"""قياس كلفة القياس (request_metrics) لكل طلب ولكل استعلام
+
+يقيس خطافات الطلب (قبل/بعد/الإنهاء) ومستمعي الاستعلامات مباشرة داخل سياق طلب
+حقيقي، لأن فرق الزمن الكلي للطلب بين التفعيل والتعطيل أصغر من ضجيج القياس.
+
+الاستخدام:
+    python benchmarks/metrics_overhead.py [عدد التكرارات]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Response
+
+from src.main import create_app
+from src.services.metrics import _state, request_metrics
+
+TARGET_US = 5.0
+
+
+def best_us(func, count):
+    return min(timeit.repeat(func, number=count, repeat=5)) / count * 1e6
+
+
+def main(count=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'metrics.db'),
+            'INIT_DATABASE': True,
+            'CLEANUP_INTERVAL_SECONDS': 0,
+        })
+        response = Response('ok')
+
+        with app.test_request_context('/api/posts'):
+            def hooks():
+                request_metrics._before_request()
+                request_metrics._after_request(response)
+                request_metrics._teardown_request(None)
+
+            def query():
+                request_metrics._before_cursor_execute(None, None, 'SELECT 1', None, None, False)
+                request_metrics._after_cursor_execute(None, None, 'SELECT 1', None, None, False)
+
+            request_hooks = best_us(hooks, count)
+            request_metrics._before_request()
+            per_query = best_us(query, count)
+            _state.set(None)
+
+    request_metrics.reset()
+    print(f'request hooks    {request_hooks:6.2f} µs/request')
+    print(f'query listeners  {per_query:6.2f} µs/query')
+    total = request_hooks + 3 * per_query
+    print(f'typical request (3 queries) {total:6.2f} µs, target {TARGET_US} µs: '
+          f'{"ok" if total <= TARGET_US else "above target"}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,78 @@
+"""اختبار ضغط لمنح النقاط من عدة خيوط متزامنة
+
+يرسل طلبات متزامنة إلى /tools/smart-titles لعدة مستخدمين ويتحقق من أن
+كل مستخدم حصل على نقاط الأداة مرة واحدة فقط. النسخة الأصغر منه تعمل مع الاختبارات
+في tests/test_points_concurrency.py؛ هذا السكربت للتشغيل اليدوي بأحجام أكبر.
+
+الاستخدام:
+    python benchmarks/points_stress.py [عدد المستخدمين] [عدد الخيوط لكل مستخدم]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from src.models.user import db, User, DailyPoints
+from src.routes.tools import tools_bp
+
+
+def main(user_count=20, threads_per_user=10):
+    db_path = os.path.join(tempfile.mkdtemp(), 'stress.db')
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'stress'
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 30}}
+    db.init_app(app)
+    app.register_blueprint(tools_bp, url_prefix='/api')
+
+    with app.app_context():
+        db.create_all()
+        for i in range(user_count):
+            db.session.add(User(username=f'user{i}', email=f'user{i}@example.com', total_points=0))
+        db.session.commit()
+        user_ids = [user.id for user in User.query.all()]
+
+    errors = []
+    barrier = threading.Barrier(user_count * threads_per_user)
+
+    def worker(user_id):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['user_id'] = user_id
+        barrier.wait()
+        response = client.post('/api/tools/smart-titles', json={'topic': 'stress'})
+        if response.status_code != 200:
+            errors.append((user_id, response.status_code))
+
+    threads = [
+        threading.Thread(target=worker, args=(user_id,))
+        for user_id in user_ids
+        for _ in range(threads_per_user)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        wrong_totals = User.query.filter(User.total_points != 25).count()
+        awards = DailyPoints.query.count()
+
+    print(f'{len(threads)} requests in {elapsed:.2f} s')
+    print(f'failed requests: {len(errors)}')
+    print(f'daily points rows: {awards} (expected {user_count})')
+    print(f'users with wrong totals: {wrong_totals}')
+
+    if errors or wrong_totals or awards != user_count:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
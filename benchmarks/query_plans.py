@@ -0,0 +1,150 @@
+"""فحص خطط الاستعلام: يشغّل المسارات الأساسية ويطبّق EXPLAIN QUERY PLAN على كل استعلام
+
+يفشل (رمز خروج 1) إذا ظهر مسح كامل لجدول (SCAN بدون فهرس) أو فرز مؤقت لـ ORDER BY
+في أي استعلام غير مستثنى صراحةً في ALLOWED.
+
+الاستخدام:
+    python benchmarks/query_plans.py [-v]
+"""
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import event
+
+from src.main import create_app
+from src.models.user import db, User, Post, Comment, UserImage, Task
+
+# (الجدول، نمط من نص الاستعلام بعد توحيد المسافات) -> سبب الاستثناء
+ALLOWED = {
+    ('tool', ''): 'كتالوج الأدوات بضعة صفوف ويُحفظ في الذاكرة',
+    ('user', 'AS user_total_points FROM user'): 'تحميل لوحة الصدارة بالكامل مرة واحدة عن قصد',
+    ('daily_tool_rollup', 'GROUP BY daily_tool_rollup.tool_name'): 'جدول تجميع صغير (الأيام × الأدوات)',
+}
+
+ENDPOINTS = (
+    ('GET', '/api/posts', None),
+    ('GET', '/api/posts?cursor=', None),
+    ('GET', '/api/posts/1', None),
+    ('GET', '/api/posts/1/comments', None),
+    ('GET', '/api/posts/1/comments?cursor=', None),
+    ('GET', '/api/tools', None),
+    ('GET', '/api/leaderboard', None),
+    ('GET', '/api/leaderboard/me', None),
+    ('GET', '/api/profile', None),
+    ('GET', '/api/tasks', None),
+    ('GET', '/api/tasks?status=open', None),
+    ('GET', '/api/tasks?status=done&since=2024-01-01T00:00:00', None),
+    ('PUT', '/api/tasks/bulk/complete', {'ids': [1, 2, 3]}),
+    ('DELETE', '/api/tasks/bulk', {'ids': [4, 5]}),
+    ('GET', '/api/admin/dashboard?fresh=1', None),
+    ('GET', '/api/admin/users', None),
+    ('GET', '/api/admin/users?cursor=', None),
+    ('GET', '/api/admin/images', None),
+    ('GET', '/api/admin/images?status=approved&cursor=', None),
+    ('GET', '/api/admin/comments', None),
+    ('GET', '/api/admin/comments?approved_only=true&cursor=', None),
+    ('GET', '/api/admin/analytics', None),
+)
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+def seed():
+    now = datetime.utcnow()
+    users = [User(username=f'user{i}', email=f'user{i}@example.com', total_points=i * 10) for i in range(50)]
+    db.session.add_all(users)
+    db.session.flush()
+    for i in range(20):
+        post = Post(title_ar=f'منشور {i}', title_en=f'Post {i}', content_ar='محتوى', content_en='Content')
+        db.session.add(post)
+        db.session.flush()
+        for j in range(5):
+            db.session.add(Comment(content='تعليق', user_id=users[j].id, post_id=post.id))
+    for i, user in enumerate(users[:10]):
+        db.session.add(UserImage(
+            user_id=user.id, image_path=f'/tmp/{i}.png',
+            expiry_date=now + timedelta(days=1), is_approved=i % 2 == 0
+        ))
+    for i in range(100):
+        db.session.add(Task(user_id=1, title=f'task {i}', is_completed=i % 3 == 0))
+    db.session.commit()
+
+
+def explain(connection, statement, parameters):
+    return [row[3] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)]
+
+
+def problems(statement, plan):
+    found = []
+    for detail in plan:
+        match = FULL_SCAN.match(detail)
+        if match:
+            found.append((match.group(1), detail))
+        elif detail.startswith('USE TEMP B-TREE FOR') and 'ORDER BY' in detail:
+            found.append((None, detail))
+    statement = ' '.join(statement.split())
+    return [
+        (table, detail) for table, detail in found
+        if not any(table == allowed and pattern in statement for allowed, pattern in ALLOWED)
+    ]
+
+
+def main(verbose=False):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'plans.db'),
+            'INIT_DATABASE': True,
+            'CLEANUP_INTERVAL_SECONDS': 0,
+        })
+        with app.app_context():
+            seed()
+            engines = [db.engine, app.extensions.get('sqlite_read_engine')]
+
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(('SELECT', 'WITH', 'UPDATE', 'DELETE')) and not executemany:
+                captured.append((statement, parameters))
+
+        for engine in filter(None, engines):
+            event.listen(engine, 'before_cursor_execute', capture)
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['user_id'] = 1
+        with app.app_context():
+            db.session.get(User, 1).is_admin = True
+            db.session.commit()
+
+        failures = 0
+        with engines[0].connect() as connection:
+            for method, path, body in ENDPOINTS:
+                captured.clear()
+                response = client.open(path, method=method, json=body)
+                if response.status_code >= 400:
+                    print(f'FAIL {method} {path}: HTTP {response.status_code}')
+                    failures += 1
+                    continue
+                bad = []
+                for statement, parameters in captured:
+                    plan = explain(connection, statement, parameters)
+                    bad.extend((statement, detail) for _, detail in problems(statement, plan))
+                    if verbose:
+                        print(f'  {" | ".join(plan)}')
+                status = 'FAIL' if bad else 'ok  '
+                print(f'{status} {method} {path} ({len(captured)} queries)')
+                for statement, detail in bad:
+                    failures += 1
+                    print(f'       {detail}\n       {" ".join(statement.split())[:200]}')
+
+    print(f'\n{failures} problem(s)')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(verbose='-v' in sys.argv[1:]))
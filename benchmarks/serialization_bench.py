@@ -0,0 +1,91 @@
+"""مقارنة زمن المعالج لبناء صفحات القوائم الكبيرة: النماذج و to_dict مقابل مسار الأعمدة
+
+يبني كل صفحة بالطريقتين داخل سياق طلب (الاستعلام وبناء الصفوف وترميز JSON)،
+ويتحقق أن الاستجابتين متطابقتان بايتاً ببايت قبل القياس.
+
+الاستخدام:
+    python benchmarks/serialization_bench.py [--rows 1000] [--repeat 20] [--data-dir DIR]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from flask import jsonify
+
+from endpoint_bench import PRESETS, prepare_dataset
+from src.main import create_app
+from src.models.user import db, User, Comment
+from src.services import serialization
+
+
+def legacy_users(rows):
+    return jsonify([user.to_dict() for user in User.query.order_by(User.id).limit(rows).all()])
+
+
+def fast_users(rows):
+    result = serialization.fetch(db.select(*serialization.user_columns()).order_by(User.id).limit(rows))
+    return serialization.json_response(serialization.users(result))
+
+
+def legacy_comments(rows):
+    comments = Comment.query.options(db.joinedload(Comment.user).load_only(User.username)) \
+        .order_by(Comment.created_at.desc(), Comment.id.desc()).limit(rows).all()
+    return jsonify({'comments': [comment.to_dict() for comment in comments]})
+
+
+def fast_comments(rows):
+    result = serialization.fetch(
+        db.select(*serialization.comment_columns())
+        .order_by(Comment.created_at.desc(), Comment.id.desc()).limit(rows)
+    )
+    return serialization.json_response({'comments': serialization.comments(result)})
+
+
+CASES = (
+    ('users', legacy_users, fast_users),
+    ('admin_comments', legacy_comments, fast_comments),
+)
+
+
+def cpu_ms(func, rows, repeat):
+    """أفضل زمن معالج لبناء الاستجابة (بالملي ثانية)، بعد تفريغ الجلسة في كل مرة"""
+    best = float('inf')
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.process_time()
+        func(rows)
+        best = min(best, time.process_time() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--data-dir', default=tempfile.gettempdir())
+    args = parser.parse_args(argv)
+
+    path = prepare_dataset(PRESETS['small'], args.data_dir)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path, 'INIT_DATABASE': True,
+                      'CLEANUP_INTERVAL_SECONDS': 0})
+    print(f'encoder: {"orjson" if serialization.orjson is not None else "json"}, rows: {args.rows}')
+
+    failed = False
+    with app.test_request_context():
+        for name, legacy, fast in CASES:
+            if legacy(args.rows).get_data() != fast(args.rows).get_data():
+                print(f'{name:16} payload mismatch')
+                failed = True
+                continue
+            before, after = cpu_ms(legacy, args.rows, args.repeat), cpu_ms(fast, args.rows, args.repeat)
+            print(f'{name:16} legacy {before:7.2f} ms   fast {after:7.2f} ms   x{before / after:4.1f}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
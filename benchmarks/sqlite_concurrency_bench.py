@@ -0,0 +1,114 @@
+"""قياس الكتابة والقراءة المتزامنة من عدة عمليات على قاعدة SQLite واحدة
+
+يقارن بين الإعدادات الافتراضية لـ SQLite وبين إعدادات الإنتاج (WAL والـ pragmas
+ومجموعة اتصالات القراءة فقط). كل عملية كاتبة تضيف تعليقات، وكل عملية قارئة
+تطلب مسارات القراءة، كما يفعل عمال gunicorn.
+
+الاستخدام:
+    python benchmarks/sqlite_concurrency_bench.py [الكتّاب] [القرّاء] [الثواني]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+READ_PATHS = ('/api/posts', '/api/posts/1/comments', '/api/leaderboard', '/api/tools')
+
+
+def make_app(path, tuned, init=False):
+    from src.main import create_app
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path,
+        'SQLITE_TUNING': tuned,
+        'INIT_DATABASE': init,
+        'CLEANUP_INTERVAL_SECONDS': 0,
+    })
+
+
+def prepare(path, tuned, writers):
+    from src.models.user import db, User
+    app = make_app(path, tuned, init=True)
+    with app.app_context():
+        ids = []
+        for i in range(writers):
+            user = User(username=f'writer{i}', email=f'writer{i}@example.com', password_hash='x')
+            db.session.add(user)
+            db.session.flush()
+            ids.append(user.id)
+        db.session.commit()
+    return ids
+
+
+def writer(path, tuned, user_id, seconds, results):
+    client = make_app(path, tuned).test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = user_id
+    ok = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            response = client.post('/api/posts/1/comments', json={'content': 'bench'})
+            ok += response.status_code == 201
+            errors += response.status_code != 201
+        except Exception:
+            errors += 1
+    results.put(('write', ok, errors))
+
+
+def reader(path, tuned, seconds, results):
+    client = make_app(path, tuned).test_client()
+    ok = errors = 0
+    i = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            response = client.get(READ_PATHS[i % len(READ_PATHS)])
+            ok += response.status_code == 200
+            errors += response.status_code != 200
+        except Exception:
+            errors += 1
+        i += 1
+    results.put(('read', ok, errors))
+
+
+def run(tuned, writers, readers, seconds):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        user_ids = prepare(path, tuned, writers)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=writer, args=(path, tuned, user_id, seconds, results))
+            for user_id in user_ids
+        ] + [
+            multiprocessing.Process(target=reader, args=(path, tuned, seconds, results))
+            for _ in range(readers)
+        ]
+        for process in processes:
+            process.start()
+        totals = {'write': [0, 0], 'read': [0, 0]}
+        for _ in processes:
+            kind, ok, errors = results.get()
+            totals[kind][0] += ok
+            totals[kind][1] += errors
+        for process in processes:
+            process.join()
+    return totals
+
+
+def main(writers=4, readers=4, seconds=5):
+    print(f'writers={writers} readers={readers} seconds={seconds} cpus={os.cpu_count()}')
+    for label, tuned in (('default', False), ('tuned', True)):
+        totals = run(tuned, writers, readers, seconds)
+        (writes, write_errors), (reads, read_errors) = totals['write'], totals['read']
+        print(
+            f'{label:<8} writes {writes / seconds:>8.1f}/s ({write_errors} errors)  '
+            f'reads {reads / seconds:>8.1f}/s ({read_errors} errors)'
+        )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
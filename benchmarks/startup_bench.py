@@ -0,0 +1,58 @@
+"""قياس زمن الإقلاع البارد: زمن استيراد التطبيق وزمن أول استجابة
+
+كل تشغيل يتم في عملية جديدة مع قاعدة بيانات SQLite مؤقتة، كما يحدث عند
+إقلاع عامل gunicorn أو دالة serverless لأول مرة.
+
+الاستخدام:
+    python benchmarks/startup_bench.py [عدد التشغيلات]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import src.main
+imported = time.perf_counter()
+client = src.main.app.test_client()
+first = client.get('/api/tools')
+first_done = time.perf_counter()
+second = client.get('/api/tools')
+second_done = time.perf_counter()
+assert first.status_code == second.status_code == 200, (first.status_code, second.status_code)
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_response_ms': (first_done - imported) * 1000,
+    'warm_response_ms': (second_done - first_done) * 1000,
+    'modules': len(sys.modules),
+}))
+'''
+
+
+def run_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.join(tmp, 'bench.db'))
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD, ROOT], env=env, check=True, capture_output=True, text=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(runs=5):
+    results = [run_once() for _ in range(runs)]
+    print(f'runs={runs}')
+    for key in ('import_ms', 'first_response_ms', 'warm_response_ms'):
+        values = [result[key] for result in results]
+        print(f'{key:<18} median={statistics.median(values):>8.1f}  min={min(values):>8.1f}  max={max(values):>8.1f}')
+    print(f'modules loaded     {results[-1]["modules"]}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,72 @@
+"""مقارنة البحث عن المستخدمين عبر فهرس FTS5 مع LIKE '%x%'
+
+الاستخدام:
+    python benchmarks/user_search_bench.py [عدد المستخدمين]
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from src.models.user import db, User
+from src.services import user_search
+
+
+def timed(label, func, terms):
+    start = time.perf_counter()
+    matches = 0
+    for term in terms:
+        matches += len(func(term))
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {elapsed / len(terms) * 1e3:>10.2f} ms/query  ({matches / len(terms):.1f} rows)')
+
+
+def random_name():
+    return ''.join(random.choices(string.ascii_lowercase, k=random.randint(6, 12)))
+
+
+def main(user_count=1_000_000, batch_size=50_000):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        user_search.create_index()
+
+        start = time.perf_counter()
+        names = []
+        for offset in range(0, user_count, batch_size):
+            rows = []
+            for i in range(offset + 1, min(offset + batch_size, user_count) + 1):
+                name = f'{random_name()}{i}'
+                names.append(name)
+                rows.append({'id': i, 'username': name, 'email': f'{name}@{random_name()}.com'})
+            db.session.execute(User.__table__.insert(), rows)
+        db.session.commit()
+        print(f'insert + index {user_count} users: {time.perf_counter() - start:.1f} s')
+
+        samples = random.sample(names, 50)
+        substrings = [name[2:7] for name in samples]
+        prefixes = [name[:4] for name in samples]
+
+        def like_search(term):
+            return User.query.filter(
+                db.or_(User.username.contains(term), User.email.contains(term))
+            ).limit(20).all()
+
+        def index_search(term):
+            return user_search.filter_users(User.query, term).limit(20).all()
+
+        timed('LIKE substring', like_search, substrings)
+        timed('FTS5 substring', index_search, substrings)
+        timed('LIKE prefix', like_search, prefixes)
+        timed('FTS5 ranked (prefix first)', lambda term: user_search.search_users(term, 20), prefixes)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
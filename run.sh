@@ -3,6 +3,9 @@
 # تفعيل البيئة الافتراضية
 source venv/bin/activate
 
+# إنشاء الجداول وتطبيق الترحيلات قبل تشغيل الخادم
+flask --app src.main init-db
+
 # تشغيل الخادم الخلفي
 python src/main.py
 
@@ -1,4 +1,6 @@
 from src.models.user import db, User, Tool, Post
+from src.services import post_search
+from src.services.analytics import record_signup
 from datetime import datetime
 
 def init_database():
@@ -16,6 +18,7 @@ def init_database():
         )
         admin_user.set_password('admin123')
         db.session.add(admin_user)
+        record_signup()
     
     # إعداد الأدوات الأساسية
     tools_data = [
@@ -104,6 +107,8 @@ def init_database():
         if not existing_post:
             post = Post(**post_data)
             db.session.add(post)
+            db.session.flush()
+            post_search.index_post(post)
     
     try:
         db.session.commit()
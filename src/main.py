@@ -1,20 +1,159 @@
-from flask import Flask, jsonify, send_from_directory
 import os
+import sys
+import threading
+from collections.abc import Mapping
 
-app = Flask(__name__)
+# لتشغيل الملف مباشرة (python src/main.py) مع بقاء الاستيراد بصيغة src.*
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# روابط API الأساسية
-@app.route("/api")
-def home():
-    return jsonify({"message": "مرحبًا! الخادم يعمل بنجاح 🚀"})
+from flask import Flask, abort, jsonify, request
 
-# لتقديم ملفات الواجهة الأمامية (React)
-@app.route("/")
-def serve_frontend():
-    return send_from_directory("static", "index.html")
+from src.models.user import db
+from src.services import sqlite_profile
+from src.services.leaderboard import leaderboard
+from src.services.metrics import request_metrics
+from src.services.response_cache import response_cache
+from src.services.static_assets import static_assets
 
-@app.route("/<path:path>")
-def serve_static(path):
-    return send_from_directory("static", path)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# لا تضع app.run() هنا!
+
+def _database_url():
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        return "sqlite:///" + os.path.join(BASE_DIR, "database", "app.db")
+    # Heroku وبعض الخدمات ما زالت تستخدم البادئة القديمة التي لا يقبلها SQLAlchemy 2
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def _engine_options(url):
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_pre_ping": True, "pool_recycle": 300}
+
+
+def _init_database(app, migrate=True):
+    """إنشاء الجداول وتطبيق الترحيلات والبيانات الأولية (تُستورد وحداتها عند الحاجة فقط)
+
+    تجري تحت قفل المخطط حتى لا تتسابق عدة عمليات على قاعدة جديدة. مع migrate=False
+    (عمال الخادم) لا تُطبَّق الترحيلات، ويُكتفى بالتنبيه إلى المعلق منها.
+    """
+    from src.init_db import init_database
+    from src.services import migrations
+
+    with app.app_context(), migrations.lock():
+        db.create_all()
+        if migrate:
+            migrations.upgrade()
+        else:
+            waiting = migrations.pending()
+            if waiting:
+                app.logger.warning(
+                    f"ترحيلات غير مطبقة ({', '.join(waiting)})؛ شغّل flask --app src.main migrate"
+                )
+        init_database()
+
+
+def _lazy_init_database(app):
+    """تهيئة قاعدة البيانات مع أول طلب API بدلاً من وقت الاستيراد (مرة واحدة لكل عملية)
+
+    ملفات الواجهة لا تحتاج قاعدة البيانات، فلا تنتظر التهيئة ولا تتأثر بفشلها.
+    الترحيلات لا تُطبَّق هنا بل في خطوة release (flask migrate) قبل تشغيل العمال.
+    """
+    lock = threading.Lock()
+    state = {"done": False}
+
+    @app.before_request
+    def ensure_database():
+        if state["done"] or not request.path.startswith("/api"):
+            return
+        with lock:
+            if not state["done"]:
+                _init_database(app, migrate=False)
+                state["done"] = True
+
+
+def create_app(config=None):
+    """إنشاء تطبيق Flask وربط قاعدة البيانات والمسارات
+
+    config: قاموس أو كائن إعدادات يطغى على القيم الافتراضية.
+    INIT_DATABASE: 'lazy' (الافتراضي) للتهيئة مع أول طلب دون الترحيلات، أو True للتهيئة
+    فوراً مع الترحيلات، أو False لتركها لأمر flask init-db.
+    """
+    app = Flask(__name__, static_folder=None)
+
+    database_url = _database_url()
+    app.config.update(
+        SECRET_KEY=os.environ.get("SECRET_KEY", "dev-secret-key-change-me"),
+        SQLALCHEMY_DATABASE_URI=database_url,
+        SQLALCHEMY_ENGINE_OPTIONS=_engine_options(database_url),
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        INIT_DATABASE="lazy",
+    )
+    if isinstance(config, Mapping):
+        app.config.update(config)
+    elif config is not None:
+        app.config.from_object(config)
+
+    db.init_app(app)
+    sqlite_profile.init_app(app)
+    request_metrics.init_app(app)
+    response_cache.init_app(app)
+    leaderboard.init_app(app)
+
+    from src.routes.user import user_bp
+    from src.routes.tools import tools_bp
+    from src.routes.posts import posts_bp
+    from src.routes.admin import admin_bp
+
+    for blueprint in (user_bp, tools_bp, posts_bp, admin_bp):
+        app.register_blueprint(blueprint, url_prefix="/api")
+
+    static_assets.init_app(app, os.path.join(BASE_DIR, "static"))
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """إنشاء الجداول وتطبيق الترحيلات والبيانات الأولية"""
+        _init_database(app)
+
+    @app.cli.command("migrate")
+    def migrate_command():
+        """تطبيق ترحيلات المخطط المعلقة"""
+        from src.services import migrations
+
+        with migrations.lock():
+            db.create_all()
+            applied = migrations.upgrade()
+        print(f"تم تطبيق {len(applied)} ترحيل: {', '.join(applied)}" if applied else "المخطط محدث")
+
+    if app.config["INIT_DATABASE"] == "lazy":
+        _lazy_init_database(app)
+    elif app.config["INIT_DATABASE"]:
+        _init_database(app)
+
+    # روابط API الأساسية
+    @app.route("/api")
+    def home():
+        return jsonify({"message": "مرحبًا! الخادم يعمل بنجاح 🚀"})
+
+    # لتقديم ملفات الواجهة الأمامية (React) من الفهرس المحفوظ في الذاكرة
+    @app.route("/")
+    def serve_frontend():
+        return static_assets.serve("index.html") or abort(404)
+
+    @app.route("/<path:path>")
+    def serve_static(path):
+        if path.startswith("api/"):
+            abort(404)
+        return static_assets.serve(path) or abort(404)
+
+    return app
+
+
+# يستخدمه gunicorn (src.main:app) و Vercel
+app = create_app()
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
@@ -1,14 +1,18 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime, date
+from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 
 db = SQLAlchemy()
 
+def utc_today():
+    """تاريخ اليوم بتوقيت UTC: مصدر "اليوم" الوحيد للنقاط اليومية والتحليلات (مثل created_at)"""
+    return datetime.utcnow().date()
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128))
+    password_hash = db.Column(db.String(255))
     total_points = db.Column(db.Integer, default=0)
     is_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -18,6 +22,12 @@ class User(db.Model):
     daily_points = db.relationship('DailyPoints', backref='user', lazy=True)
     comments = db.relationship('Comment', backref='user', lazy=True)
     user_images = db.relationship('UserImage', backref='user', lazy=True)
+    
+    # فهارس لوحة الصدارة وإحصائيات التسجيل
+    __table_args__ = (
+        db.Index('ix_user_total_points', 'total_points'),
+        db.Index('ix_user_created_at', 'created_at'),
+    )
 
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
@@ -51,10 +61,13 @@ class DailyPoints(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     tool_name = db.Column(db.String(50), nullable=False)  # 'smart_titles', 'tasks', 'smart_emoji'
     points_earned = db.Column(db.Integer, default=25)
-    date_earned = db.Column(db.Date, default=date.today)
+    date_earned = db.Column(db.Date, default=utc_today)
     
-    # فهرس مركب لضمان عدم تكرار النقاط لنفس الأداة في نفس اليوم
-    __table_args__ = (db.UniqueConstraint('user_id', 'tool_name', 'date_earned'),)
+    # فهرس مركب لضمان عدم تكرار النقاط لنفس الأداة في نفس اليوم، وفهرس نقاط اليوم للوحة التحكم
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'tool_name', 'date_earned'),
+        db.Index('ix_daily_points_date_earned', 'date_earned'),
+    )
 
     def to_dict(self):
         return {
@@ -99,9 +112,15 @@ class Post(db.Model):
     content_en = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
+    comments_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # عدد التعليقات الموافق عليها
     
     # علاقات
     comments = db.relationship('Comment', backref='post', lazy=True, cascade='all, delete-orphan')
+    
+    # قائمة المنشورات النشطة الأحدث أولاً (فهرس جزئي في PostgreSQL)
+    __table_args__ = (
+        db.Index('ix_post_active_created', 'is_active', 'created_at', postgresql_where=db.text('is_active')),
+    )
 
     def to_dict(self):
         return {
@@ -112,7 +131,7 @@ class Post(db.Model):
             'content_en': self.content_en,
             'created_at': self.created_at.isoformat(),
             'is_active': self.is_active,
-            'comments_count': len(self.comments)
+            'comments_count': self.comments_count or 0
         }
 
 class Comment(db.Model):
@@ -122,6 +141,15 @@ class Comment(db.Model):
     post_id = db.Column(db.Integer, db.ForeignKey('post.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_approved = db.Column(db.Boolean, default=True)
+    
+    # تعليقات المنشور الموافق عليها، وقائمة المدير وإحصائيات الأسبوع حسب التاريخ
+    __table_args__ = (
+        db.Index(
+            'ix_comment_post_approved_created', 'post_id', 'is_approved', 'created_at',
+            postgresql_where=db.text('is_approved')
+        ),
+        db.Index('ix_comment_created_at', 'created_at'),
+    )
 
     def to_dict(self):
         return {
@@ -142,6 +170,15 @@ class UserImage(db.Model):
     expiry_date = db.Column(db.DateTime, nullable=False)  # تاريخ انتهاء العرض (يوم واحد)
     is_approved = db.Column(db.Boolean, default=False)
     is_active = db.Column(db.Boolean, default=True)
+    
+    # صور المراجعة للمدير، والصور المنتهية لمهمة التنظيف
+    __table_args__ = (
+        db.Index(
+            'ix_user_image_active_approved_upload', 'is_active', 'is_approved', 'upload_date',
+            postgresql_where=db.text('is_active')
+        ),
+        db.Index('ix_user_image_expiry_date', 'expiry_date'),
+    )
 
     def to_dict(self):
         return {
@@ -163,6 +200,12 @@ class Task(db.Model):
     is_completed = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     completed_at = db.Column(db.DateTime)
+    
+    # فهارس مركبة لقوائم مهام المستخدم تنازلياً حسب تاريخ الإنشاء، مع أو بدون فلتر الحالة
+    __table_args__ = (
+        db.Index('ix_task_user_status_created', 'user_id', 'is_completed', 'created_at'),
+        db.Index('ix_task_user_created', 'user_id', 'created_at'),
+    )
 
     def to_dict(self):
         return {
@@ -174,3 +217,52 @@ class Task(db.Model):
             'created_at': self.created_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None
         }
+
+class DailySignupRollup(db.Model):
+    """تجميع يومي لعدد المستخدمين الجدد"""
+    day = db.Column(db.Date, primary_key=True)
+    signups = db.Column(db.Integer, nullable=False, default=0)
+
+class DailyToolRollup(db.Model):
+    """تجميع يومي لاستخدام الأدوات والنقاط المكتسبة"""
+    day = db.Column(db.Date, primary_key=True)
+    tool_name = db.Column(db.String(50), primary_key=True)
+    usage_count = db.Column(db.Integer, nullable=False, default=0)
+    total_points = db.Column(db.Integer, nullable=False, default=0)
+
+class CleanupJob(db.Model):
+    """سجل مهمة تنظيف الصور المنتهية، مشترك بين كل العمال"""
+    id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, done, failed
+    scanned = db.Column(db.Integer, nullable=False, default=0)
+    deleted_files = db.Column(db.Integer, nullable=False, default=0)
+    deleted_rows = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'scanned': self.scanned,
+            'deleted_files': self.deleted_files,
+            'deleted_rows': self.deleted_rows,
+            'error': self.error,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+class JobLease(db.Model):
+    """قفل مؤقت لمهمة خلفية يضمن تشغيل نسخة واحدة منها بين كل العمال"""
+    name = db.Column(db.String(50), primary_key=True)
+    job_id = db.Column(db.String(32))
+    acquired_at = db.Column(db.DateTime)  # آخر بدء للمهمة، لحساب موعد التشغيل المجدول
+    expires_at = db.Column(db.DateTime)  # None بعد انتهاء المهمة
+
+class LeaderboardChange(db.Model):
+    """مستخدم تغيّرت نقاطه أو حُذف، لتطبق العمليات الأخرى التغيير على لوحة صدارتها"""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer)  # None: تغيير جماعي (مثل الاستيراد) يستلزم إعادة البناء
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -1,94 +1,137 @@
-from flask import Blueprint, request, jsonify, session
-from src.models.user import db, User, Post, Comment, UserImage, DailyPoints, Tool
-from datetime import datetime, timedelta
+from flask import Blueprint, Response, current_app, request, jsonify
+from src.models.user import db, User, UserImage, Tool, utc_today
+from src.services import analytics, serialization, user_import, user_search
+from src.services.auth import current_admin, invalidate_user
+from src.services.cleanup import cleanup_manager
+from src.services.dashboard import dashboard_snapshot
+from src.services.leaderboard import leaderboard
+from src.services.metrics import CONTENT_TYPE, request_metrics
+from src.services.pagination import paginate, ADMIN_MAX_PER_PAGE
+from src.services.response_cache import response_cache
+from src.services.tool_catalog import tool_catalog
+from datetime import timedelta
+import click
+import io
+import json
 import os
 
 admin_bp = Blueprint('admin', __name__)
-
-def get_current_admin():
-    """التحقق من أن المستخدم الحالي مدير"""
-    user_id = session.get('user_id')
-    if user_id:
-        user = User.query.get(user_id)
-        if user and user.is_admin:
-            return user
-    return None
+admin_bp.record_once(lambda state: cleanup_manager.init_app(state.app))
 
 @admin_bp.route('/admin/dashboard', methods=['GET'])
 def get_dashboard_stats():
     """الحصول على إحصائيات لوحة التحكم"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    # إحصائيات عامة
-    total_users = User.query.count()
-    total_posts = Post.query.count()
-    total_comments = Comment.query.count()
-    pending_images = UserImage.query.filter_by(is_approved=False, is_active=True).count()
-    
-    # إحصائيات الأسبوع الماضي
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    new_users_week = User.query.filter(User.created_at >= week_ago).count()
-    new_comments_week = Comment.query.filter(Comment.created_at >= week_ago).count()
-    
-    # أكثر المستخدمين نشاطاً
-    top_users = User.query.order_by(User.total_points.desc()).limit(5).all()
-    
-    # النقاط المكتسبة اليوم
-    today = datetime.utcnow().date()
-    points_today = db.session.query(db.func.sum(DailyPoints.points_earned)).filter(
-        DailyPoints.date_earned == today
-    ).scalar() or 0
+    fresh = request.args.get('fresh', '0').lower() in ('1', 'true')
+    data, as_of = dashboard_snapshot.get(fresh=fresh)
     
     return jsonify({
-        'stats': {
-            'total_users': total_users,
-            'total_posts': total_posts,
-            'total_comments': total_comments,
-            'pending_images': pending_images,
-            'new_users_week': new_users_week,
-            'new_comments_week': new_comments_week,
-            'points_today': points_today
-        },
-        'top_users': [user.to_dict() for user in top_users]
+        **data,
+        'as_of': as_of.isoformat()
     })
 
 @admin_bp.route('/admin/users', methods=['GET'])
 def get_all_users():
     """الحصول على جميع المستخدمين"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
     search = request.args.get('search', '').strip()
     
-    query = User.query
+    query = db.select(*serialization.user_columns())
     if search:
-        query = query.filter(
-            db.or_(
-                User.username.contains(search),
-                User.email.contains(search)
-            )
-        )
-    
-    users = query.order_by(User.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+        query = user_search.filter_users(query, search)
+    
+    users, page_info = paginate(
+        query, User.created_at, User.id,
+        default_per_page=20, max_per_page=ADMIN_MAX_PER_PAGE
     )
     
+    return serialization.json_response({
+        'users': serialization.users(users),
+        **page_info
+    })
+
+@admin_bp.route('/admin/users/search', methods=['GET'])
+def search_users():
+    """البحث السريع عن المستخدمين مرتبين حسب الصلة"""
+    admin = current_admin()
+    if not admin:
+        return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
+    
+    term = request.args.get('q', '').strip()
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    if not term:
+        return jsonify({'users': []})
+    
     return jsonify({
-        'users': [user.to_dict() for user in users.items],
-        'total': users.total,
-        'pages': users.pages,
-        'current_page': page
+        'users': [user.to_dict() for user in user_search.search_users(term, limit)]
     })
 
+@admin_bp.cli.command('rebuild-user-search')
+def rebuild_user_search_command():
+    """إعادة بناء فهرس البحث عن المستخدمين"""
+    user_search.rebuild_index()
+    print('تم إعادة بناء فهرس البحث عن المستخدمين')
+
+def _import_format(filename, content_type):
+    """تحديد صيغة ملف الاستيراد من الاسم أو نوع المحتوى"""
+    if (filename or '').endswith('.csv') or 'csv' in (content_type or ''):
+        return 'csv'
+    return 'ndjson'
+
+def _run_import(records):
+    # PASSWORD_IMPORT_HASH_METHOD (اختياري): طريقة أرخص للاستيراد الكبير، تُرقّى عند أول تسجيل دخول
+    return user_import.import_users(
+        records,
+        batch_size=current_app.config.get('IMPORT_BATCH_SIZE', 1000),
+        workers=current_app.config.get('IMPORT_HASH_WORKERS'),
+        method=current_app.config.get('PASSWORD_IMPORT_HASH_METHOD')
+    )
+
+@admin_bp.route('/admin/users/import', methods=['POST'])
+def import_users():
+    """استيراد المستخدمين من ملف CSV أو NDJSON بالبث"""
+    admin = current_admin()
+    if not admin:
+        return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
+    
+    fmt = request.args.get('format') or _import_format(None, request.content_type)
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({'error': 'صيغة الملف غير مدعومة'}), 400
+    
+    limit = current_app.config.get('IMPORT_MAX_HTTP_ROWS', user_import.DEFAULT_MAX_HTTP_ROWS)
+    stream = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+    records = user_import.limit_records(user_import.iter_records(stream, fmt), limit)
+    if records is None:
+        return jsonify({
+            'error': f'الحد الأقصى {limit} سجل في الطلب الواحد؛ استخدم أمر flask admin import-users للملفات الأكبر'
+        }), 413
+    
+    report = _run_import(records)
+    
+    return jsonify({
+        'message': f'تم استيراد {report.imported} مستخدم',
+        'report': report.to_dict()
+    })
+
+@admin_bp.cli.command('import-users')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), default=None)
+def import_users_command(path, fmt):
+    """استيراد المستخدمين من ملف CSV أو NDJSON"""
+    with open(path, encoding='utf-8', newline='') as stream:
+        report = _run_import(user_import.iter_records(stream, fmt or _import_format(path, None)))
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
 @admin_bp.route('/admin/users/<int:user_id>/toggle-admin', methods=['PUT'])
 def toggle_user_admin(user_id):
     """تبديل صلاحيات المدير للمستخدم"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -100,6 +143,7 @@ def toggle_user_admin(user_id):
     
     user.is_admin = not user.is_admin
     db.session.commit()
+    invalidate_user(user.id)
     
     return jsonify({
         'message': f'تم {"منح" if user.is_admin else "إزالة"} صلاحيات المدير للمستخدم',
@@ -109,7 +153,7 @@ def toggle_user_admin(user_id):
 @admin_bp.route('/admin/users/<int:user_id>/points', methods=['PUT'])
 def update_user_points(user_id):
     """تحديث نقاط المستخدم"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -121,7 +165,11 @@ def update_user_points(user_id):
         return jsonify({'error': 'عدد النقاط غير صحيح'}), 400
     
     user.total_points = new_points
+    leaderboard.record_change(user.id)
     db.session.commit()
+    invalidate_user(user.id)
+    leaderboard.update(user.id, new_points, user.username)
+    response_cache.invalidate('leaderboard')
     
     return jsonify({
         'message': 'تم تحديث نقاط المستخدم بنجاح',
@@ -131,36 +179,33 @@ def update_user_points(user_id):
 @admin_bp.route('/admin/images', methods=['GET'])
 def get_pending_images():
     """الحصول على الصور في انتظار الموافقة"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
     status = request.args.get('status', 'pending')  # pending, approved, all
     
-    query = UserImage.query.filter_by(is_active=True)
+    query = db.select(*serialization.image_columns()).where(UserImage.is_active == True)
     
     if status == 'pending':
-        query = query.filter_by(is_approved=False)
+        query = query.where(UserImage.is_approved == False)
     elif status == 'approved':
-        query = query.filter_by(is_approved=True)
+        query = query.where(UserImage.is_approved == True)
     
-    images = query.order_by(UserImage.upload_date.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    images, page_info = paginate(
+        query, UserImage.upload_date, UserImage.id,
+        default_per_page=20, max_per_page=ADMIN_MAX_PER_PAGE
     )
     
-    return jsonify({
-        'images': [image.to_dict() for image in images.items],
-        'total': images.total,
-        'pages': images.pages,
-        'current_page': page
+    return serialization.json_response({
+        'images': serialization.images(images),
+        **page_info
     })
 
 @admin_bp.route('/admin/images/<int:image_id>/approve', methods=['PUT'])
 def approve_image(image_id):
     """الموافقة على صورة"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -176,7 +221,7 @@ def approve_image(image_id):
 @admin_bp.route('/admin/images/<int:image_id>/reject', methods=['DELETE'])
 def reject_image(image_id):
     """رفض ونذف صورة"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -197,7 +242,7 @@ def reject_image(image_id):
 @admin_bp.route('/admin/tools', methods=['GET'])
 def get_tools_admin():
     """الحصول على جميع الأدوات للإدارة"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -207,7 +252,7 @@ def get_tools_admin():
 @admin_bp.route('/admin/tools/<int:tool_id>', methods=['PUT'])
 def update_tool(tool_id):
     """تحديث إعدادات أداة"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -231,6 +276,8 @@ def update_tool(tool_id):
         tool.daily_points_reward = max(0, data['daily_points_reward'])
     
     db.session.commit()
+    tool_catalog.invalidate()
+    response_cache.invalidate('tools')
     
     return jsonify({
         'message': 'تم تحديث الأداة بنجاح',
@@ -240,34 +287,22 @@ def update_tool(tool_id):
 @admin_bp.route('/admin/analytics', methods=['GET'])
 def get_analytics():
     """الحصول على تحليلات الموقع"""
-    admin = get_current_admin()
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
+    granularity = request.args.get('granularity', 'week')
+    if granularity not in analytics.GRANULARITIES:
+        return jsonify({'error': 'الفترة الزمنية غير صحيحة'}), 400
+    
+    bucket_count = request.args.get('range', 4, type=int)
+    bucket_count = min(max(bucket_count, 1), analytics.MAX_BUCKETS[granularity])
+    
     # تحليل النقاط حسب الأداة
-    tools_usage = db.session.query(
-        DailyPoints.tool_name,
-        db.func.count(DailyPoints.id).label('usage_count'),
-        db.func.sum(DailyPoints.points_earned).label('total_points')
-    ).group_by(DailyPoints.tool_name).all()
-    
-    # تحليل المستخدمين الجدد حسب الأسبوع
-    weeks_data = []
-    for i in range(4):  # آخر 4 أسابيع
-        week_start = datetime.utcnow() - timedelta(weeks=i+1)
-        week_end = datetime.utcnow() - timedelta(weeks=i)
-        
-        new_users = User.query.filter(
-            User.created_at >= week_start,
-            User.created_at < week_end
-        ).count()
-        
-        weeks_data.append({
-            'week': f'الأسبوع {i+1}',
-            'new_users': new_users
-        })
+    tools_usage = analytics.tools_usage_totals()
+    buckets = analytics.get_buckets(granularity, bucket_count)
     
-    return jsonify({
+    result = {
         'tools_usage': [
             {
                 'tool_name': usage.tool_name,
@@ -276,37 +311,61 @@ def get_analytics():
             }
             for usage in tools_usage
         ],
-        'weekly_users': weeks_data
-    })
+        'granularity': granularity,
+        'buckets': buckets
+    }
+    
+    # الأسابيع تقويمية (من الاثنين بتوقيت UTC) لا نوافذ 7 أيام متحركة كما كانت سابقاً
+    if granularity == 'week':
+        result['weekly_users'] = [
+            {
+                'week': f'الأسبوع {i+1}',
+                'new_users': bucket['new_users']
+            }
+            for i, bucket in enumerate(buckets)
+        ]
+    
+    return jsonify(result)
+
+@admin_bp.cli.command('rebuild-analytics')
+@click.option('--days', type=int, default=None, help='إعادة بناء آخر عدد من الأيام فقط')
+def rebuild_analytics_command(days):
+    """إعادة بناء جداول التجميع اليومية للتحليلات"""
+    since = utc_today() - timedelta(days=days) if days else None
+    analytics.rebuild_rollups(since)
+    print('تم إعادة بناء جداول التحليلات')
 
 @admin_bp.route('/admin/cleanup', methods=['POST'])
 def cleanup_expired_data():
-    """تنظيف البيانات المنتهية الصلاحية"""
-    admin = get_current_admin()
+    """بدء تنظيف البيانات المنتهية الصلاحية في الخلفية"""
+    admin = current_admin()
     if not admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    now = datetime.utcnow()
+    job = cleanup_manager.start(current_app._get_current_object())
     
-    # حذف الصور المنتهية الصلاحية
-    expired_images = UserImage.query.filter(UserImage.expiry_date < now).all()
+    return jsonify({
+        'message': 'تم بدء تنظيف الصور المنتهية الصلاحية',
+        'job': job.to_dict()
+    }), 202
+
+@admin_bp.route('/admin/cleanup/<job_id>', methods=['GET'])
+def get_cleanup_status(job_id):
+    """الحصول على حالة مهمة التنظيف"""
+    admin = current_admin()
+    if not admin:
+        return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    deleted_count = 0
-    for image in expired_images:
-        # حذف الملف من النظام
-        if os.path.exists(image.image_path):
-            try:
-                os.remove(image.image_path)
-                deleted_count += 1
-            except:
-                pass
-        
-        db.session.delete(image)
+    job = cleanup_manager.get(job_id)
+    if not job:
+        return jsonify({'error': 'المهمة غير موجودة'}), 404
     
-    db.session.commit()
-    
-    return jsonify({
-        'message': f'تم حذف {deleted_count} صورة منتهية الصلاحية',
-        'deleted_count': deleted_count
-    })
+    return jsonify(job.to_dict())
 
+@admin_bp.route('/admin/metrics', methods=['GET'])
+def get_metrics():
+    """مقاييس الطلبات وقاعدة البيانات بصيغة Prometheus النصية"""
+    if not request_metrics.authorized(request) and not current_admin():
+        return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
+    
+    return Response(request_metrics.render(), content_type=CONTENT_TYPE)
@@ -1,34 +1,96 @@
-from flask import Blueprint, request, jsonify, session
-from src.models.user import db, User, Post, Comment
+from flask import Blueprint, request, jsonify
+from src.models.user import db, Post, Comment
+from src.services import post_search, serialization
+from src.services.auth import current_identity
+from src.services.pagination import paginate, ADMIN_MAX_PER_PAGE
+from src.services.response_cache import response_cache
+from src.services.sqlite_profile import read_only
 from datetime import datetime
 
 posts_bp = Blueprint('posts', __name__)
 
-def get_current_user():
-    """الحصول على المستخدم الحالي من الجلسة"""
-    user_id = session.get('user_id')
-    if user_id:
-        return User.query.get(user_id)
-    return None
+def adjust_comments_count(post_id, delta):
+    """تعديل عداد التعليقات للمنشور بشكل ذري ضمن المعاملة الحالية"""
+    db.session.execute(
+        db.update(Post)
+        .where(Post.id == post_id)
+        .values(comments_count=Post.comments_count + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+def recount_comments():
+    """إعادة حساب عدادات التعليقات لجميع المنشورات دفعة واحدة"""
+    approved_count = (
+        db.select(db.func.count(Comment.id))
+        .where(Comment.post_id == Post.id, Comment.is_approved.is_(True))
+        .scalar_subquery()
+    )
+    result = db.session.execute(
+        db.update(Post)
+        .values(comments_count=approved_count)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+@posts_bp.cli.command('recount-comments')
+def recount_comments_command():
+    """إعادة حساب عدادات التعليقات"""
+    updated = recount_comments()
+    print(f'تم تحديث عداد التعليقات لـ {updated} منشور')
 
 @posts_bp.route('/posts', methods=['GET'])
+@response_cache.cached('posts')
+@read_only
 def get_posts():
     """الحصول على قائمة المنشورات"""
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    
-    posts = Post.query.filter_by(is_active=True).order_by(Post.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    posts, page_info = paginate(
+        db.select(*serialization.post_columns()).where(Post.is_active == True),
+        Post.created_at, Post.id,
+        default_per_page=10
     )
+    # تتغير الصفحة المخزنة عند تعديل أي منشور فيها (مثل عدد تعليقاته)
+    response_cache.tag(*(f'post:{post.id}' for post in posts))
+    
+    return serialization.json_response({
+        'posts': serialization.posts(posts),
+        **page_info
+    })
+
+@posts_bp.route('/posts/search', methods=['GET'])
+def search_posts():
+    """البحث في المنشورات بالعربية والإنجليزية"""
+    query = request.args.get('q', '').strip()
+    language = request.args.get('lang')
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 50)
+    
+    if not query:
+        return jsonify({'error': 'يرجى إدخال نص البحث'}), 400
+    
+    if language not in (None, 'ar', 'en'):
+        return jsonify({'error': 'اللغة غير مدعومة'}), 400
+    
+    results = post_search.search_posts(query, language, limit)
     
     return jsonify({
-        'posts': [post.to_dict() for post in posts.items],
-        'total': posts.total,
-        'pages': posts.pages,
-        'current_page': page
+        'results': [
+            {
+                'post': post.to_dict(),
+                'snippet': snippet
+            }
+            for post, snippet in results
+        ],
+        'query': query
     })
 
+@posts_bp.cli.command('rebuild-search')
+def rebuild_search_command():
+    """إعادة بناء فهرس البحث في المنشورات"""
+    post_search.rebuild_index()
+    print('تم إعادة بناء فهرس البحث في المنشورات')
+
 @posts_bp.route('/posts/<int:post_id>', methods=['GET'])
+@response_cache.cached('post:{post_id}')
 def get_post(post_id):
     """الحصول على منشور محدد"""
     post = Post.query.filter_by(id=post_id, is_active=True).first_or_404()
@@ -37,7 +99,7 @@ def get_post(post_id):
 @posts_bp.route('/posts', methods=['POST'])
 def create_post():
     """إنشاء منشور جديد (للمدير فقط)"""
-    user = get_current_user()
+    user = current_identity()
     if not user or not user.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
@@ -59,7 +121,10 @@ def create_post():
     )
     
     db.session.add(post)
+    db.session.flush()
+    post_search.index_post(post)
     db.session.commit()
+    response_cache.invalidate('posts')
     
     return jsonify({
         'message': 'تم إنشاء المنشور بنجاح',
@@ -69,12 +134,13 @@ def create_post():
 @posts_bp.route('/posts/<int:post_id>', methods=['PUT'])
 def update_post(post_id):
     """تحديث منشور (للمدير فقط)"""
-    user = get_current_user()
+    user = current_identity()
     if not user or not user.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
     post = Post.query.get_or_404(post_id)
     data = request.get_json()
+    was_active = post.is_active
     
     # تحديث البيانات
     if 'title_ar' in data:
@@ -88,7 +154,10 @@ def update_post(post_id):
     if 'is_active' in data:
         post.is_active = data['is_active']
     
+    post_search.index_post(post)
     db.session.commit()
+    # إخفاء المنشور أو إظهاره يغيّر محتوى كل صفحات القائمة
+    response_cache.invalidate(f'post:{post_id}', *(('posts',) if post.is_active != was_active else ()))
     
     return jsonify({
         'message': 'تم تحديث المنشور بنجاح',
@@ -98,42 +167,45 @@ def update_post(post_id):
 @posts_bp.route('/posts/<int:post_id>', methods=['DELETE'])
 def delete_post(post_id):
     """حذف منشور (للمدير فقط)"""
-    user = get_current_user()
+    user = current_identity()
     if not user or not user.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
     post = Post.query.get_or_404(post_id)
+    # حذف التعليقات دفعة واحدة بدلاً من تحميلها عبر العلاقة
+    Comment.query.filter_by(post_id=post.id).delete(synchronize_session=False)
+    post_search.remove_post(post.id)
     db.session.delete(post)
     db.session.commit()
+    response_cache.invalidate(f'post:{post_id}', 'posts')
     
     return jsonify({'message': 'تم حذف المنشور بنجاح'})
 
 @posts_bp.route('/posts/<int:post_id>/comments', methods=['GET'])
+@response_cache.cached('post:{post_id}')
+@read_only
 def get_post_comments(post_id):
     """الحصول على تعليقات منشور"""
     post = Post.query.filter_by(id=post_id, is_active=True).first_or_404()
     
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-    
-    comments = Comment.query.filter_by(
-        post_id=post_id, 
-        is_approved=True
-    ).order_by(Comment.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    comments, page_info = paginate(
+        db.select(*serialization.comment_columns()).where(
+            Comment.post_id == post_id,
+            Comment.is_approved == True
+        ),
+        Comment.created_at, Comment.id,
+        default_per_page=20
     )
     
-    return jsonify({
-        'comments': [comment.to_dict() for comment in comments.items],
-        'total': comments.total,
-        'pages': comments.pages,
-        'current_page': page
+    return serialization.json_response({
+        'comments': serialization.comments(comments),
+        **page_info
     })
 
 @posts_bp.route('/posts/<int:post_id>/comments', methods=['POST'])
 def create_comment(post_id):
     """إضافة تعليق على منشور"""
-    user = get_current_user()
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -156,7 +228,9 @@ def create_comment(post_id):
     )
     
     db.session.add(comment)
+    adjust_comments_count(post_id, 1)
     db.session.commit()
+    response_cache.invalidate(f'post:{post_id}')
     
     return jsonify({
         'message': 'تم إضافة التعليق بنجاح',
@@ -166,7 +240,7 @@ def create_comment(post_id):
 @posts_bp.route('/comments/<int:comment_id>', methods=['PUT'])
 def update_comment(comment_id):
     """تحديث تعليق (للمالك أو المدير)"""
-    user = get_current_user()
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -187,9 +261,13 @@ def update_comment(comment_id):
         comment.content = content
     
     if 'is_approved' in data and user.is_admin:
-        comment.is_approved = data['is_approved']
+        is_approved = bool(data['is_approved'])
+        if is_approved != bool(comment.is_approved):
+            adjust_comments_count(comment.post_id, 1 if is_approved else -1)
+        comment.is_approved = is_approved
     
     db.session.commit()
+    response_cache.invalidate(f'post:{comment.post_id}')
     
     return jsonify({
         'message': 'تم تحديث التعليق بنجاح',
@@ -199,7 +277,7 @@ def update_comment(comment_id):
 @posts_bp.route('/comments/<int:comment_id>', methods=['DELETE'])
 def delete_comment(comment_id):
     """حذف تعليق (للمالك أو المدير)"""
-    user = get_current_user()
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -209,34 +287,35 @@ def delete_comment(comment_id):
     if comment.user_id != user.id and not user.is_admin:
         return jsonify({'error': 'غير مصرح لك بحذف هذا التعليق'}), 403
     
+    post_id = comment.post_id
+    if comment.is_approved:
+        adjust_comments_count(post_id, -1)
     db.session.delete(comment)
     db.session.commit()
+    response_cache.invalidate(f'post:{post_id}')
     
     return jsonify({'message': 'تم حذف التعليق بنجاح'})
 
 @posts_bp.route('/admin/comments', methods=['GET'])
 def get_all_comments():
     """الحصول على جميع التعليقات (للمدير فقط)"""
-    user = get_current_user()
+    user = current_identity()
     if not user or not user.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 50, type=int)
     approved_only = request.args.get('approved_only', 'false').lower() == 'true'
     
-    query = Comment.query
+    query = db.select(*serialization.comment_columns())
     if approved_only:
-        query = query.filter_by(is_approved=True)
+        query = query.where(Comment.is_approved == True)
     
-    comments = query.order_by(Comment.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    comments, page_info = paginate(
+        query, Comment.created_at, Comment.id,
+        default_per_page=50, max_per_page=ADMIN_MAX_PER_PAGE
     )
     
-    return jsonify({
-        'comments': [comment.to_dict() for comment in comments.items],
-        'total': comments.total,
-        'pages': comments.pages,
-        'current_page': page
+    return serialization.json_response({
+        'comments': serialization.comments(comments),
+        **page_info
     })
 
@@ -1,59 +1,65 @@
-from flask import Blueprint, request, jsonify, session
-from src.models.user import db, User, Tool, DailyPoints, Task
-from datetime import date, datetime
-import random
+from flask import Blueprint, request, jsonify
+from src.models.user import db, DailyPoints, Task, utc_today
+from src.services import emoji, serialization, titles
+from src.services.auth import current_identity, current_user
+from src.services.leaderboard import TOP_SIZE, leaderboard
+from src.services.pagination import paginate
+from src.services.points import award_points
+from src.services.response_cache import response_cache
+from src.services.sqlite_profile import read_only
+from src.services.tool_catalog import tool_catalog
+from datetime import datetime
 
 tools_bp = Blueprint('tools', __name__)
 
-def get_current_user():
-    """الحصول على المستخدم الحالي من الجلسة"""
-    user_id = session.get('user_id')
-    if user_id:
-        return User.query.get(user_id)
+TASK_STATUSES = {'open': False, 'done': True}
+MAX_BULK_TASKS = 1000
+
+def topic_error(topic):
+    """رسالة الخطأ إن كان الموضوع غير صالح (ليس نصاً أو فارغاً أو طويلاً)، وإلا None"""
+    if not isinstance(topic, str) or not topic.strip():
+        return 'يرجى إدخال الموضوع'
+    if len(topic) > titles.MAX_TOPIC_LENGTH:
+        return f'الموضوع طويل جداً (الحد الأقصى {titles.MAX_TOPIC_LENGTH} حرف)'
     return None
 
-def can_earn_points(user_id, tool_name):
-    """التحقق من إمكانية كسب النقاط لأداة معينة اليوم"""
-    today = date.today()
-    existing_points = DailyPoints.query.filter_by(
-        user_id=user_id,
-        tool_name=tool_name,
-        date_earned=today
-    ).first()
-    return existing_points is None
+def text_error(text):
+    """رسالة الخطأ إن كان نص أداة الإيموجي غير صالح (ليس نصاً أو فارغاً أو طويلاً)، وإلا None"""
+    if not isinstance(text, str) or not text:
+        return 'يرجى إدخال النص'
+    if len(text) > emoji.MAX_TEXT_LENGTH:
+        return f'النص طويل جداً (الحد الأقصى {emoji.MAX_TEXT_LENGTH} حرف)'
+    return None
 
-def award_points(user_id, tool_name, points=25):
-    """منح النقاط للمستخدم"""
-    if can_earn_points(user_id, tool_name):
-        daily_points = DailyPoints(
-            user_id=user_id,
-            tool_name=tool_name,
-            points_earned=points
-        )
-        db.session.add(daily_points)
-        
-        user = User.query.get(user_id)
-        user.total_points += points
-        db.session.commit()
-        return True
-    return False
+def _mood(value):
+    """المزاج المطلوب إن كان نصاً، وإلا None ليُستنتج من النص"""
+    return value if isinstance(value, str) else None
 
 @tools_bp.route('/tools', methods=['GET'])
+@response_cache.cached('tools', anonymous_only=True)
+@read_only
 def get_tools():
     """الحصول على قائمة الأدوات المتاحة"""
-    tools = Tool.query.filter_by(is_active=True).all()
-    user = get_current_user()
+    tools = tool_catalog.active_tools()
+    user = current_identity()
+    
+    earned_today = set()
+    if user:
+        earned_today = {
+            tool_name for (tool_name,) in db.session.query(DailyPoints.tool_name).filter_by(
+                user_id=user.id,
+                date_earned=utc_today()
+            )
+        }
     
     tools_data = []
     for tool in tools:
-        tool_dict = tool.to_dict()
+        tool_dict = dict(tool)
         if user:
-            tool_dict['can_use'] = (tool.is_free or 
-                                  (tool.name == 'advanced_titles' and user.can_use_advanced_titles()) or
-                                  (tool.name == 'user_image' and user.can_use_image_feature()))
-            tool_dict['can_earn_points'] = can_earn_points(user.id, tool.name) if tool.is_free else False
+            tool_dict['can_use'] = tool['is_free'] or (user.total_points or 0) >= (tool['required_points'] or 0)
+            tool_dict['can_earn_points'] = tool['is_free'] and tool['name'] not in earned_today
         else:
-            tool_dict['can_use'] = tool.is_free
+            tool_dict['can_use'] = tool['is_free']
             tool_dict['can_earn_points'] = False
         
         tools_data.append(tool_dict)
@@ -63,36 +69,20 @@ def get_tools():
 @tools_bp.route('/tools/smart-titles', methods=['POST'])
 def generate_smart_titles():
     """أداة إنشاء العناوين الذكية"""
-    user = get_current_user()
+    user = current_user()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     topic = data.get('topic', '')
-    language = data.get('language', user.preferred_language)
+    language = titles.normalize_language(data.get('language', user.preferred_language))
     
-    if not topic:
-        return jsonify({'error': 'يرجى إدخال الموضوع'}), 400
+    error = topic_error(topic)
+    if error:
+        return jsonify({'error': error}), 400
     
     # عناوين تجريبية (سيتم استبدالها بـ OpenAI لاحقاً)
-    sample_titles_ar = [
-        f"🚀 {topic}: دليلك الشامل للنجاح",
-        f"💡 أسرار {topic} التي لم تعرفها من قبل",
-        f"🔥 كيف تتقن {topic} في 7 خطوات بسيطة",
-        f"⭐ {topic}: الطريق إلى الاحتراف",
-        f"🎯 تعلم {topic} واحصل على النتائج المذهلة"
-    ]
-    
-    sample_titles_en = [
-        f"🚀 {topic}: Your Complete Guide to Success",
-        f"💡 {topic} Secrets You Never Knew Before",
-        f"🔥 Master {topic} in 7 Simple Steps",
-        f"⭐ {topic}: The Path to Professionalism",
-        f"🎯 Learn {topic} and Get Amazing Results"
-    ]
-    
-    titles = sample_titles_ar if language == 'ar' else sample_titles_en
-    titles_text = "\n".join([f"{i+1}. {title}" for i, title in enumerate(titles)])
+    titles_text = titles.render_titles(topic, language)
     
     # منح النقاط إذا كان ممكناً
     points_awarded = award_points(user.id, 'smart_titles')
@@ -106,70 +96,99 @@ def generate_smart_titles():
 @tools_bp.route('/tools/advanced-titles', methods=['POST'])
 def generate_advanced_titles():
     """أداة العناوين المطورة (تتطلب 200 نقطة)"""
-    user = get_current_user()
+    user = current_user()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
     if not user.can_use_advanced_titles():
         return jsonify({'error': 'تحتاج إلى 200 نقطة لاستخدام هذه الأداة'}), 403
     
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     topic = data.get('topic', '')
-    style = data.get('style', 'professional')
-    language = data.get('language', user.preferred_language)
+    style = data.get('style', titles.DEFAULT_ADVANCED_STYLE)
+    language = titles.normalize_language(data.get('language', user.preferred_language))
     
-    if not topic:
-        return jsonify({'error': 'يرجى إدخال الموضوع'}), 400
+    error = topic_error(topic)
+    if error:
+        return jsonify({'error': error}), 400
     
-    # عناوين متقدمة تجريبية
-    advanced_titles_ar = [
-        f"📊 تحليل شامل: {topic} وتأثيره على السوق (تقييم: 9/10)",
-        f"🎓 دليل الخبراء: إتقان {topic} بمنهجية علمية (تقييم: 10/10)",
-        f"💼 استراتيجية احترافية: {topic} للمؤسسات الناجحة (تقييم: 9/10)",
-        f"🔬 دراسة متعمقة: {topic} والابتكار التقني (تقييم: 8/10)",
-        f"📈 تطبيق عملي: {topic} لتحقيق النمو المستدام (تقييم: 9/10)"
-    ]
+    if style not in titles.ADVANCED_STYLES:
+        return jsonify({'error': 'الأسلوب غير مدعوم', 'styles': list(titles.ADVANCED_STYLES)}), 400
     
-    titles_text = "\n".join([f"{i+1}. {title}" for i, title in enumerate(advanced_titles_ar)])
+    return jsonify({
+        'titles': titles.render_titles(topic, language, style),
+        'style': style,
+        'language': language,
+        'user_points': user.total_points
+    })
+
+@tools_bp.route('/tools/titles/batch', methods=['POST'])
+def generate_titles_batch():
+    """إنشاء العناوين لعدة مواضيع في طلب واحد (العادية أو المطورة حسب style)"""
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
+    
+    data = request.get_json(silent=True) or {}
+    topics = data.get('topics')
+    style = data.get('style', titles.BASIC_STYLE)
+    language = titles.normalize_language(data.get('language', user.preferred_language))
+    
+    if not isinstance(topics, list) or not topics:
+        return jsonify({'error': 'يرجى إدخال قائمة المواضيع'}), 400
+    
+    if len(topics) > titles.MAX_BATCH_TOPICS:
+        return jsonify({'error': f'الحد الأقصى {titles.MAX_BATCH_TOPICS} موضوع في الطلب الواحد'}), 400
+    
+    for index, topic in enumerate(topics):
+        error = topic_error(topic)
+        if error:
+            return jsonify({'error': error, 'index': index}), 400
+    
+    if style != titles.BASIC_STYLE:
+        if style not in titles.ADVANCED_STYLES:
+            return jsonify({'error': 'الأسلوب غير مدعوم', 'styles': [titles.BASIC_STYLE, *titles.ADVANCED_STYLES]}), 400
+        if not user.can_use_advanced_titles():
+            return jsonify({'error': 'تحتاج إلى 200 نقطة لاستخدام هذه الأداة'}), 403
+    
+    results = titles.render_batch(topics, language, style)
+    
+    # الدفعة العادية تُحتسب كاستخدام واحد لأداة العناوين الذكية
+    points_awarded = award_points(user.id, 'smart_titles') if style == titles.BASIC_STYLE else False
     
     return jsonify({
-        'titles': titles_text,
+        'results': results,
         'style': style,
+        'language': language,
+        'points_awarded': points_awarded,
         'user_points': user.total_points
     })
 
 @tools_bp.route('/tools/smart-emoji', methods=['POST'])
 def generate_smart_emoji():
     """أداة الإيموجي الذكية"""
-    user = get_current_user()
+    user = current_user()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     text = data.get('text', '')
-    mood = data.get('mood', 'neutral')
-    
-    if not text:
-        return jsonify({'error': 'يرجى إدخال النص'}), 400
+    # بدون مزاج صريح يُستنتج المزاج من كلمات النص
+    requested_mood = _mood(data.get('mood'))
     
-    # إيموجي تجريبية حسب المزاج
-    emoji_sets = {
-        'happy': ['😊', '😄', '🎉', '✨', '🌟', '💫', '🎊', '🥳'],
-        'professional': ['💼', '📊', '📈', '🎯', '⭐', '🏆', '💡', '🔥'],
-        'creative': ['🎨', '✨', '🌈', '💡', '🚀', '⚡', '🎭', '🎪'],
-        'excited': ['🚀', '⚡', '🔥', '💥', '🎯', '🌟', '✨', '🎉'],
-        'neutral': ['📝', '💭', '🤔', '📚', '💡', '🔍', '📌', '✅']
-    }
+    error = text_error(text)
+    if error:
+        return jsonify({'error': error}), 400
     
-    selected_emojis = emoji_sets.get(mood, emoji_sets['neutral'])
-    random_emojis = random.sample(selected_emojis, min(5, len(selected_emojis)))
+    result = emoji.analyze(text, requested_mood)
+    mood = result['mood']
     
     emoji_suggestions = f"""الإيموجي المقترحة للنص: "{text[:50]}..."
 
-الإيموجي المناسبة: {' '.join(random_emojis)}
+الإيموجي المناسبة: {' '.join(result['emojis'])}
 
 تفسير الاختيار:
-• هذه الإيموجي تناسب المزاج المطلوب ({mood})
+• هذه الإيموجي تناسب المزاج {'المطلوب' if requested_mood == mood else 'المكتشف في النص'} ({mood})
 • تعزز المعنى وتجعل النص أكثر تفاعلاً
 • مناسبة لوسائل التواصل الاجتماعي
 
@@ -183,24 +202,80 @@ def generate_smart_emoji():
     
     return jsonify({
         'emoji_suggestions': emoji_suggestions,
+        'emojis': result['emojis'],
+        'mood': mood,
+        'points_awarded': points_awarded,
+        'user_points': user.total_points
+    })
+
+@tools_bp.route('/tools/smart-emoji/batch', methods=['POST'])
+def generate_smart_emoji_batch():
+    """اقتراح الإيموجي لعدة نصوص في طلب واحد"""
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
+    
+    data = request.get_json(silent=True) or {}
+    texts = data.get('texts')
+    mood = _mood(data.get('mood'))
+    limit = data.get('limit', 5)
+    limit = min(max(limit, 1), 20) if isinstance(limit, int) else 5
+    
+    if not isinstance(texts, list) or not texts:
+        return jsonify({'error': 'يرجى إدخال قائمة النصوص'}), 400
+    
+    if len(texts) > emoji.MAX_BATCH_TEXTS:
+        return jsonify({'error': f'الحد الأقصى {emoji.MAX_BATCH_TEXTS} نص في الطلب الواحد'}), 400
+    
+    for index, text in enumerate(texts):
+        error = text_error(text)
+        if error:
+            return jsonify({'error': error, 'index': index}), 400
+    
+    results = emoji.analyze_batch(texts, mood, limit)
+    
+    # الدفعة تُحتسب كاستخدام واحد لأداة الإيموجي
+    points_awarded = award_points(user.id, 'smart_emoji')
+    
+    return jsonify({
+        'results': results,
         'points_awarded': points_awarded,
         'user_points': user.total_points
     })
 
 @tools_bp.route('/tasks', methods=['GET'])
 def get_user_tasks():
-    """الحصول على مهام المستخدم"""
-    user = get_current_user()
+    """الحصول على مهام المستخدم (تقسيم بالمفتاح مع فلتر status=open|done و since)"""
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    tasks = Task.query.filter_by(user_id=user.id).order_by(Task.created_at.desc()).all()
-    return jsonify([task.to_dict() for task in tasks])
+    query = db.select(*serialization.task_columns()).where(Task.user_id == user.id)
+    
+    status = request.args.get('status')
+    if status:
+        if status not in TASK_STATUSES:
+            return jsonify({'error': 'الحالة يجب أن تكون open أو done'}), 400
+        query = query.filter(Task.is_completed == TASK_STATUSES[status])
+    
+    since = request.args.get('since')
+    if since:
+        try:
+            query = query.filter(Task.created_at >= datetime.fromisoformat(since))
+        except ValueError:
+            return jsonify({'error': 'تاريخ since غير صحيح (صيغة ISO 8601)'}), 400
+    
+    tasks, page_info = paginate(query, Task.created_at, Task.id, default_per_page=50, keyset=True)
+    
+    return serialization.json_response({
+        'tasks': serialization.tasks(tasks),
+        **page_info
+    })
 
 @tools_bp.route('/tasks', methods=['POST'])
 def create_task():
     """إنشاء مهمة جديدة"""
-    user = get_current_user()
+    user = current_user()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -232,7 +307,7 @@ def create_task():
 @tools_bp.route('/tasks/<int:task_id>/complete', methods=['PUT'])
 def complete_task(task_id):
     """تمييز المهمة كمكتملة"""
-    user = get_current_user()
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -249,7 +324,7 @@ def complete_task(task_id):
 @tools_bp.route('/tasks/<int:task_id>', methods=['DELETE'])
 def delete_task(task_id):
     """حذف مهمة"""
-    user = get_current_user()
+    user = current_identity()
     if not user:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
@@ -262,18 +337,126 @@ def delete_task(task_id):
     
     return jsonify({'message': 'تم حذف المهمة بنجاح'})
 
+def _bulk_task_ids(data):
+    """معرفات المهام من جسم الطلب، أو None إذا كانت غير صالحة"""
+    ids = data.get('ids')
+    if not isinstance(ids, list) or not ids or len(ids) > MAX_BULK_TASKS:
+        return None
+    if not all(isinstance(task_id, int) and not isinstance(task_id, bool) for task_id in ids):
+        return None
+    return set(ids)
+
+@tools_bp.route('/tasks/bulk', methods=['POST'])
+def create_tasks_bulk():
+    """إنشاء عدة مهام في معاملة واحدة"""
+    user = current_user()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
+    
+    data = request.get_json(silent=True) or {}
+    items = data.get('tasks')
+    
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'يرجى إدخال قائمة المهام'}), 400
+    
+    if len(items) > MAX_BULK_TASKS:
+        return jsonify({'error': f'الحد الأقصى {MAX_BULK_TASKS} مهمة في الطلب الواحد'}), 400
+    
+    rows = []
+    for index, item in enumerate(items):
+        title = item.get('title') if isinstance(item, dict) else None
+        if not isinstance(title, str) or not title.strip():
+            return jsonify({'error': 'يرجى إدخال عنوان المهمة', 'index': index}), 400
+        if len(title) > 200:
+            return jsonify({'error': 'عنوان المهمة طويل جداً (الحد الأقصى 200 حرف)', 'index': index}), 400
+        rows.append({'user_id': user.id, 'title': title, 'description': item.get('description', '')})
+    
+    tasks = db.session.scalars(db.insert(Task).returning(Task), rows).all()
+    db.session.commit()
+    
+    # منح النقاط إذا كان ممكناً
+    points_awarded = award_points(user.id, 'tasks')
+    
+    return jsonify({
+        'tasks': [task.to_dict() for task in tasks],
+        'created': len(tasks),
+        'points_awarded': points_awarded,
+        'user_points': user.total_points
+    }), 201
+
+@tools_bp.route('/tasks/bulk/complete', methods=['PUT'])
+def complete_tasks_bulk():
+    """تمييز عدة مهام كمكتملة بجملة UPDATE واحدة"""
+    user = current_identity()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
+    
+    ids = _bulk_task_ids(request.get_json(silent=True) or {})
+    if ids is None:
+        return jsonify({'error': f'يرجى إدخال قائمة معرفات المهام (الحد الأقصى {MAX_BULK_TASKS})'}), 400
+    
+    updated = db.session.execute(
+        db.update(Task)
+        .where(Task.user_id == user.id, Task.id.in_(ids), Task.is_completed == False)
+        .values(is_completed=True, completed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    
+    return jsonify({'updated': updated})
+
+@tools_bp.route('/tasks/bulk', methods=['DELETE'])
+def delete_tasks_bulk():
+    """حذف عدة مهام بجملة DELETE واحدة"""
+    user = current_identity()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
+    
+    ids = _bulk_task_ids(request.get_json(silent=True) or {})
+    if ids is None:
+        return jsonify({'error': f'يرجى إدخال قائمة معرفات المهام (الحد الأقصى {MAX_BULK_TASKS})'}), 400
+    
+    deleted = db.session.execute(
+        db.delete(Task)
+        .where(Task.user_id == user.id, Task.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    
+    return jsonify({'deleted': deleted})
+
 @tools_bp.route('/leaderboard', methods=['GET'])
+@response_cache.cached('leaderboard')
+@read_only
 def get_leaderboard():
     """الحصول على لوحة الصدارة (أفضل 10 مستخدمين)"""
-    top_users = User.query.filter(User.total_points > 0).order_by(User.total_points.desc()).limit(10).all()
+    leaderboard.ensure_loaded()
+    
+    return jsonify([
+        {
+            'rank': entry['rank'],
+            'username': entry['username'],
+            'total_points': entry['total_points']
+        }
+        for entry in leaderboard.top(TOP_SIZE)
+    ])
+
+@tools_bp.route('/leaderboard/me', methods=['GET'])
+def get_my_rank():
+    """الحصول على ترتيب المستخدم الحالي والمستخدمين المحيطين به"""
+    user = current_identity()
+    if not user:
+        return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    leaderboard = []
-    for i, user in enumerate(top_users, 1):
-        leaderboard.append({
-            'rank': i,
-            'username': user.username,
-            'total_points': user.total_points
-        })
+    leaderboard.ensure_loaded()
+    radius = min(max(request.args.get('radius', 2, type=int), 0), 25)
     
-    return jsonify(leaderboard)
-
+    rank = leaderboard.rank(user.id)
+    if rank is None:
+        return jsonify({'error': 'المستخدم غير موجود'}), 404
+    
+    return jsonify({
+        'rank': rank,
+        'total_users': len(leaderboard),
+        'around': leaderboard.around(user.id, radius)
+    })
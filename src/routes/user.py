@@ -1,9 +1,20 @@
 from flask import Blueprint, jsonify, request, session
 from src.models.user import User, db
-from werkzeug.security import check_password_hash
+from src.services import serialization
+from src.services.analytics import record_signup
+from src.services.auth import current_identity, current_user, invalidate_user
+from src.services.leaderboard import leaderboard
+from src.services.passwords import hasher, HasherBusy
+from src.services.response_cache import response_cache
+from sqlalchemy.exc import IntegrityError
 
 user_bp = Blueprint('user', __name__)
 
+@user_bp.errorhandler(HasherBusy)
+def handle_hasher_busy(error):
+    """رفض سريع عند امتلاء طابور تجزئة كلمات المرور"""
+    return jsonify({'error': 'الخادم مشغول حالياً، يرجى المحاولة بعد قليل'}), 503, {'Retry-After': '1'}
+
 @user_bp.route('/register', methods=['POST'])
 def register():
     """تسجيل مستخدم جديد"""
@@ -17,23 +28,28 @@ def register():
     if not username or not email or not password:
         return jsonify({'error': 'جميع الحقول مطلوبة'}), 400
     
-    # التحقق من عدم وجود المستخدم مسبقاً
-    if User.query.filter_by(username=username).first():
-        return jsonify({'error': 'اسم المستخدم موجود مسبقاً'}), 400
-    
-    if User.query.filter_by(email=email).first():
-        return jsonify({'error': 'البريد الإلكتروني موجود مسبقاً'}), 400
-    
     # إنشاء المستخدم الجديد
     user = User(
         username=username,
         email=email,
         preferred_language=language
     )
-    user.set_password(password)
+    user.password_hash = hasher.hash(password)
+    
+    # الاعتماد على القيود الفريدة بدلاً من التحقق المسبق من وجود المستخدم
+    try:
+        db.session.add(user)
+        db.session.flush()
+        record_signup()
+        leaderboard.record_change(user.id)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if 'username' in str(e.orig):
+            return jsonify({'error': 'اسم المستخدم موجود مسبقاً'}), 400
+        return jsonify({'error': 'البريد الإلكتروني موجود مسبقاً'}), 400
     
-    db.session.add(user)
-    db.session.commit()
+    leaderboard.update(user.id, user.total_points, user.username)
     
     # تسجيل الدخول تلقائياً
     session['user_id'] = user.id
@@ -58,9 +74,21 @@ def login():
     # البحث عن المستخدم
     user = User.query.filter_by(username=username).first()
     
-    if not user or not user.check_password(password):
+    if not user:
         return jsonify({'error': 'اسم المستخدم أو كلمة المرور غير صحيحة'}), 401
     
+    is_valid, needs_rehash = hasher.verify(user.password_hash, password)
+    if not is_valid:
+        return jsonify({'error': 'اسم المستخدم أو كلمة المرور غير صحيحة'}), 401
+    
+    # ترقية التجزئة المخزنة عند تغيير الطريقة أو التكلفة
+    if needs_rehash:
+        try:
+            user.password_hash = hasher.hash(password)
+            db.session.commit()
+        except HasherBusy:
+            pass
+    
     # تسجيل الدخول
     session['user_id'] = user.id
     session['username'] = user.username
@@ -79,11 +107,10 @@ def logout():
 @user_bp.route('/profile', methods=['GET'])
 def get_profile():
     """الحصول على بيانات المستخدم الحالي"""
-    user_id = session.get('user_id')
-    if not user_id:
+    if not session.get('user_id'):
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    user = User.query.get(user_id)
+    user = current_user()
     if not user:
         return jsonify({'error': 'المستخدم غير موجود'}), 404
     
@@ -92,11 +119,10 @@ def get_profile():
 @user_bp.route('/profile', methods=['PUT'])
 def update_profile():
     """تحديث بيانات المستخدم الحالي"""
-    user_id = session.get('user_id')
-    if not user_id:
+    if not session.get('user_id'):
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    user = User.query.get(user_id)
+    user = current_user()
     if not user:
         return jsonify({'error': 'المستخدم غير موجود'}), 404
     
@@ -114,7 +140,7 @@ def update_profile():
         user.preferred_language = data['preferred_language']
     
     if 'password' in data and data['password'].strip():
-        user.set_password(data['password'].strip())
+        user.password_hash = hasher.hash(data['password'].strip())
     
     db.session.commit()
     
@@ -126,16 +152,15 @@ def update_profile():
 @user_bp.route('/users', methods=['GET'])
 def get_users():
     """الحصول على قائمة المستخدمين (للمدير فقط)"""
-    user_id = session.get('user_id')
-    if not user_id:
+    if not session.get('user_id'):
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    current_user = User.query.get(user_id)
-    if not current_user or not current_user.is_admin:
+    identity = current_identity()
+    if not identity or not identity.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
-    users = User.query.all()
-    return jsonify([user.to_dict() for user in users])
+    rows = serialization.fetch(db.select(*serialization.user_columns()).order_by(User.id))
+    return serialization.json_response(serialization.users(rows))
 
 @user_bp.route('/users/<int:user_id>', methods=['GET'])
 def get_user(user_id):
@@ -146,8 +171,8 @@ def get_user(user_id):
     
     # يمكن للمستخدم رؤية بياناته أو للمدير رؤية بيانات أي مستخدم
     if current_user_id != user_id:
-        current_user = User.query.get(current_user_id)
-        if not current_user or not current_user.is_admin:
+        identity = current_identity()
+        if not identity or not identity.is_admin:
             return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
     user = User.query.get_or_404(user_id)
@@ -160,17 +185,21 @@ def delete_user(user_id):
     if not current_user_id:
         return jsonify({'error': 'يجب تسجيل الدخول أولاً'}), 401
     
-    current_user = User.query.get(current_user_id)
-    if not current_user or not current_user.is_admin:
+    identity = current_identity()
+    if not identity or not identity.is_admin:
         return jsonify({'error': 'غير مصرح لك بالوصول'}), 403
     
     user = User.query.get_or_404(user_id)
     
     # منع المدير من حذف نفسه
-    if user.id == current_user.id:
+    if user.id == identity.id:
         return jsonify({'error': 'لا يمكنك حذف حسابك الخاص'}), 400
     
     db.session.delete(user)
+    leaderboard.record_change(user_id)
     db.session.commit()
+    invalidate_user(user_id)
+    leaderboard.remove(user_id)
+    response_cache.invalidate('leaderboard')
     
     return jsonify({'message': 'تم حذف المستخدم بنجاح'})
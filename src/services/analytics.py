@@ -0,0 +1,154 @@
+from datetime import date, datetime, timedelta
+
+from src.models.user import db, User, DailyPoints, DailySignupRollup, DailyToolRollup, utc_today
+from src.services.upsert import upsert_insert
+
+GRANULARITIES = ('day', 'week', 'month')
+MAX_BUCKETS = {'day': 366, 'week': 104, 'month': 60}
+
+
+def _increment(model, key_values, increments):
+    """زيادة عدادات صف التجميع مع إنشائه إذا لم يكن موجوداً"""
+    insert = upsert_insert(model)
+    if insert is not None:
+        stmt = insert.values(**key_values, **increments)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=list(key_values),
+            set_={name: getattr(model, name) + stmt.excluded[name] for name in increments}
+        ))
+        return
+
+    updated = db.session.execute(
+        db.update(model)
+        .where(*(getattr(model, name) == value for name, value in key_values.items()))
+        .values({name: getattr(model, name) + value for name, value in increments.items()})
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not updated:
+        db.session.execute(db.insert(model).values(**key_values, **increments))
+
+
+def record_signup(day=None, count=1):
+    """تسجيل مستخدمين جدد في التجميع اليومي (ضمن المعاملة الحالية)"""
+    if count:
+        _increment(DailySignupRollup, {'day': day or utc_today()}, {'signups': count})
+
+
+def record_tool_usage(tool_name, points, day=None):
+    """تسجيل استخدام أداة ونقاطها في التجميع اليومي (ضمن المعاملة الحالية)"""
+    _increment(
+        DailyToolRollup,
+        {'day': day or utc_today(), 'tool_name': tool_name},
+        {'usage_count': 1, 'total_points': points}
+    )
+
+
+def rebuild_rollups(since=None):
+    """إعادة بناء جداول التجميع من الجداول الأصلية ابتداءً من تاريخ معين (أو بالكامل)"""
+    signup_day = db.func.date(User.created_at)
+    signups = db.select(signup_day, db.func.count(User.id)).group_by(signup_day)
+    tools = db.select(
+        DailyPoints.date_earned,
+        DailyPoints.tool_name,
+        db.func.count(DailyPoints.id),
+        db.func.coalesce(db.func.sum(DailyPoints.points_earned), 0)
+    ).group_by(DailyPoints.date_earned, DailyPoints.tool_name)
+
+    delete_signups = db.delete(DailySignupRollup)
+    delete_tools = db.delete(DailyToolRollup)
+    if since is not None:
+        signups = signups.where(User.created_at >= datetime.combine(since, datetime.min.time()))
+        tools = tools.where(DailyPoints.date_earned >= since)
+        delete_signups = delete_signups.where(DailySignupRollup.day >= since)
+        delete_tools = delete_tools.where(DailyToolRollup.day >= since)
+
+    db.session.execute(delete_signups)
+    db.session.execute(delete_tools)
+    db.session.execute(db.insert(DailySignupRollup).from_select(['day', 'signups'], signups))
+    db.session.execute(db.insert(DailyToolRollup).from_select(
+        ['day', 'tool_name', 'usage_count', 'total_points'], tools
+    ))
+    db.session.commit()
+
+
+def _truncate(column, granularity):
+    """تعبير SQL يقرّب التاريخ إلى بداية اليوم/الأسبوع (الاثنين)/الشهر"""
+    if granularity == 'day':
+        return column
+    if db.session.get_bind().dialect.name == 'sqlite':
+        if granularity == 'week':
+            return db.func.date(column, 'weekday 0', '-6 days')
+        return db.func.strftime('%Y-%m-01', column)
+    return db.cast(db.func.date_trunc(granularity, column), db.Date)
+
+
+def bucket_starts(granularity, count, today=None):
+    """بدايات آخر count فترات، من الأحدث إلى الأقدم"""
+    today = today or utc_today()
+    if granularity == 'day':
+        return [today - timedelta(days=i) for i in range(count)]
+    if granularity == 'week':
+        monday = today - timedelta(days=today.weekday())
+        return [monday - timedelta(weeks=i) for i in range(count)]
+
+    starts = []
+    year, month = today.year, today.month
+    for _ in range(count):
+        starts.append(date(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts
+
+
+def _bucket_key(value):
+    return str(value)[:10]
+
+
+def get_buckets(granularity='week', count=4):
+    """إحصائيات كل فترة (المستخدمون الجدد، استخدام الأدوات، النقاط) من جداول التجميع
+
+    الفترات تقويمية بتوقيت UTC: الأسبوع من الاثنين والأولى هي الفترة الجارية (جزئية).
+    قبل جداول التجميع كان weekly_users نوافذ متحركة من 7 أيام تنتهي الآن.
+    """
+    starts = bucket_starts(granularity, count)
+    earliest = starts[-1]
+
+    signup_bucket = _truncate(DailySignupRollup.day, granularity).label('bucket')
+    signups = dict(
+        (_bucket_key(bucket), total) for bucket, total in db.session.execute(
+            db.select(signup_bucket, db.func.sum(DailySignupRollup.signups))
+            .where(DailySignupRollup.day >= earliest)
+            .group_by(signup_bucket)
+        )
+    )
+
+    tool_bucket = _truncate(DailyToolRollup.day, granularity).label('bucket')
+    usage = {
+        _bucket_key(bucket): (usage_count, total_points) for bucket, usage_count, total_points in db.session.execute(
+            db.select(tool_bucket, db.func.sum(DailyToolRollup.usage_count), db.func.sum(DailyToolRollup.total_points))
+            .where(DailyToolRollup.day >= earliest)
+            .group_by(tool_bucket)
+        )
+    }
+
+    buckets = []
+    for start in starts:
+        key = start.isoformat()
+        usage_count, total_points = usage.get(key, (0, 0))
+        buckets.append({
+            'start': key,
+            'new_users': signups.get(key, 0) or 0,
+            'tool_usage': usage_count or 0,
+            'points': total_points or 0
+        })
+    return buckets
+
+
+def tools_usage_totals():
+    """إجمالي الاستخدام والنقاط لكل أداة من جداول التجميع"""
+    return db.session.execute(
+        db.select(
+            DailyToolRollup.tool_name,
+            db.func.sum(DailyToolRollup.usage_count).label('usage_count'),
+            db.func.sum(DailyToolRollup.total_points).label('total_points')
+        ).group_by(DailyToolRollup.tool_name)
+    ).all()
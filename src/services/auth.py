@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, g, session
+
+from src.models.user import db, User
+
+
+class Identity:
+    """الحقول اللازمة للتحقق من الصلاحيات فقط، دون تحميل صف المستخدم الكامل"""
+
+    __slots__ = ('id', 'is_admin', 'total_points')
+
+    def __init__(self, id, is_admin, total_points):
+        self.id = id
+        self.is_admin = bool(is_admin)
+        self.total_points = total_points or 0
+
+    def can_use_advanced_titles(self):
+        return self.total_points >= 200
+
+    def can_use_image_feature(self):
+        return self.total_points >= 500
+
+
+class TTLCache:
+    """ذاكرة مؤقتة محدودة الحجم مع مدة صلاحية لكل عنصر (الأقدم استخداماً يُحذف أولاً)"""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_identities = TTLCache()
+
+
+def invalidate_user(user_id):
+    """حذف بيانات صلاحيات المستخدم من الذاكرة المؤقتة بعد تغييرها"""
+    _identities.discard(user_id)
+    if getattr(g, '_auth_identity', None) is not None and g._auth_identity.id == user_id:
+        g.pop('_auth_identity', None)
+
+
+def current_identity():
+    """صلاحيات المستخدم الحالي، تُحسب مرة واحدة لكل طلب وتُخزَّن مؤقتاً بين الطلبات"""
+    if '_auth_identity' in g:
+        return g._auth_identity
+
+    identity = None
+    user_id = session.get('user_id')
+    if user_id:
+        identity = _identities.get(user_id)
+        if identity is None:
+            row = db.session.execute(
+                db.select(User.id, User.is_admin, User.total_points).where(User.id == user_id)
+            ).first()
+            if row is not None:
+                identity = Identity(*row)
+                _identities.set(user_id, identity, current_app.config.get('AUTH_CACHE_TTL', 30))
+    g._auth_identity = identity
+    return identity
+
+
+def current_admin():
+    """صلاحيات المستخدم الحالي إذا كان مديراً، وإلا None"""
+    identity = current_identity()
+    return identity if identity is not None and identity.is_admin else None
+
+
+def current_user():
+    """صف المستخدم الحالي الكامل (يُحمَّل مرة واحدة لكل طلب) للمسارات التي تحتاجه"""
+    if '_auth_user' in g:
+        return g._auth_user
+
+    user_id = session.get('user_id')
+    user = db.session.get(User, user_id) if user_id else None
+    g._auth_user = user
+    return user
@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from src.models.user import db, CleanupJob, JobLease, UserImage
+from src.services.upsert import upsert_insert
+
+LEASE_NAME = 'image-cleanup'
+DEFAULT_LEASE_SECONDS = 300  # يُجدَّد مع كل دفعة؛ إن توقف العامل تصبح المهمة متاحة لغيره بعده
+SCHEDULER_TICK_SECONDS = 60
+
+
+def _remove_file(path):
+    """حذف ملف الصورة من النظام، ويعيد True إذا تم الحذف"""
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def _renew_lease(job_id, lease_seconds):
+    """تمديد القفل للمهمة، ويفشل إن أخذه عامل آخر بعد انتهاء صلاحيته"""
+    result = db.session.execute(
+        db.update(JobLease)
+        .where(JobLease.name == LEASE_NAME, JobLease.job_id == job_id)
+        .values(expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise RuntimeError('فقدت المهمة قفل التنظيف')
+
+
+def run_job(job_id, batch_size=500, workers=4, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """المرور على الصور المنتهية على دفعات بحسب المعرف وحذفها، مع حفظ التقدم في سجل المهمة"""
+    job = db.session.get(CleanupJob, job_id)
+    job.status = 'running'
+    job.started_at = datetime.utcnow()
+    db.session.commit()
+    now = job.started_at
+    last_id = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = db.session.execute(
+                    db.select(UserImage.id, UserImage.image_path)
+                    .where(UserImage.expiry_date < now, UserImage.id > last_id)
+                    .order_by(UserImage.id)
+                    .limit(batch_size)
+                ).all()
+                if not batch:
+                    break
+
+                ids = [row.id for row in batch]
+                last_id = ids[-1]
+                deleted_files = sum(executor.map(_remove_file, [row.image_path for row in batch]))
+
+                result = db.session.execute(
+                    db.delete(UserImage)
+                    .where(UserImage.id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+                job.scanned += len(batch)
+                job.deleted_files += deleted_files
+                job.deleted_rows += result.rowcount
+                _renew_lease(job_id, lease_seconds)
+                db.session.commit()
+        job.status = 'done'
+    except Exception as e:
+        db.session.rollback()
+        job.status = 'failed'
+        job.error = str(e)
+    finally:
+        job.finished_at = datetime.utcnow()
+        db.session.execute(
+            db.update(JobLease)
+            .where(JobLease.name == LEASE_NAME, JobLease.job_id == job_id)
+            .values(expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+
+class CleanupManager:
+    """تشغيل مهام التنظيف في الخلفية وجدولتها كل CLEANUP_INTERVAL_SECONDS ثانية
+
+    سجلات المهام في قاعدة البيانات فيمكن متابعتها من أي عامل، وقفل JobLease يضمن
+    تشغيل مهمة واحدة في كل مرة مهما كان عدد العمال الذين يشغّلون المجدول.
+    """
+
+    max_history = 20
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scheduler = None
+
+    def init_app(self, app):
+        app.before_request(lambda: self._ensure_scheduler(app))
+
+    def _acquire(self, job_id, now, lease_seconds, min_interval):
+        """أخذ القفل لمهمة جديدة إن كان حراً (وحان موعدها عند min_interval)، ويعيد True عند النجاح"""
+        insert = upsert_insert(JobLease)
+        if insert is not None:
+            db.session.execute(insert.values(name=LEASE_NAME).on_conflict_do_nothing())
+        elif db.session.get(JobLease, LEASE_NAME) is None:
+            db.session.add(JobLease(name=LEASE_NAME))
+            db.session.flush()
+
+        conditions = [
+            JobLease.name == LEASE_NAME,
+            db.or_(JobLease.expires_at.is_(None), JobLease.expires_at < now),
+        ]
+        if min_interval:
+            conditions.append(db.or_(
+                JobLease.acquired_at.is_(None),
+                JobLease.acquired_at <= now - timedelta(seconds=min_interval)
+            ))
+        # التحديث المشروط ذري: عامل واحد فقط يغيّر الصف
+        result = db.session.execute(
+            db.update(JobLease).where(*conditions)
+            .values(job_id=job_id, acquired_at=now, expires_at=now + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def start(self, app, min_interval=None):
+        """بدء مهمة تنظيف في الخلفية، أو إرجاع المهمة الجارية (في أي عامل) إن وجدت
+
+        مع min_interval (المجدول) لا تبدأ المهمة إلا إذا مضت هذه المدة على آخر مهمة،
+        ويعاد None إن لم تبدأ.
+        """
+        now = datetime.utcnow()
+        lease_seconds = app.config.get('CLEANUP_LEASE_SECONDS', DEFAULT_LEASE_SECONDS)
+        job = CleanupJob(id=uuid.uuid4().hex, status='pending', created_at=now)
+        try:
+            if not self._acquire(job.id, now, lease_seconds, min_interval):
+                current_id = db.session.execute(
+                    db.select(JobLease.job_id).where(JobLease.name == LEASE_NAME)
+                ).scalar()
+                db.session.commit()
+                return None if min_interval else db.session.get(CleanupJob, current_id)
+
+            # مهام توقف عاملها قبل إنهائها وانتهى قفلها
+            db.session.execute(
+                db.update(CleanupJob)
+                .where(CleanupJob.status.in_(('pending', 'running')))
+                .values(status='failed', error='interrupted', finished_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.add(job)
+            db.session.flush()
+            recent = db.select(CleanupJob.id).order_by(CleanupJob.created_at.desc()).limit(self.max_history)
+            db.session.execute(
+                db.delete(CleanupJob).where(CleanupJob.id.not_in(recent))
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        threading.Thread(target=self._run, args=(app, job.id), name='image-cleanup', daemon=True).start()
+        return job
+
+    def get(self, job_id):
+        return db.session.get(CleanupJob, job_id)
+
+    def _run(self, app, job_id):
+        with app.app_context():
+            try:
+                run_job(
+                    job_id,
+                    batch_size=app.config.get('CLEANUP_BATCH_SIZE', 500),
+                    workers=app.config.get('CLEANUP_WORKERS', 4),
+                    lease_seconds=app.config.get('CLEANUP_LEASE_SECONDS', DEFAULT_LEASE_SECONDS)
+                )
+            finally:
+                db.session.remove()
+
+    def _ensure_scheduler(self, app):
+        if self._scheduler is not None:
+            return
+        interval = app.config.get('CLEANUP_INTERVAL_SECONDS', 3600)
+        with self._lock:
+            if self._scheduler is not None:
+                return
+            self._scheduler = threading.Thread(
+                target=self._schedule, args=(app, interval), name='image-cleanup-scheduler', daemon=True
+            )
+            if interval and interval > 0:
+                self._scheduler.start()
+
+    def _schedule(self, app, interval):
+        # كل عامل يتحقق دورياً، والقفل يختار عاملاً واحداً عند حلول الموعد
+        while True:
+            time.sleep(min(interval, SCHEDULER_TICK_SECONDS))
+            with app.app_context():
+                try:
+                    self.start(app, min_interval=interval)
+                except Exception as e:
+                    app.logger.warning(f'تعذر بدء مهمة التنظيف المجدولة: {e}')
+                finally:
+                    db.session.remove()
+
+
+cleanup_manager = CleanupManager()
@@ -0,0 +1,90 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from src.models.user import db, User, Post, Comment, UserImage, DailyPoints, utc_today
+from src.services.leaderboard import leaderboard
+
+
+def _count(model, *criteria):
+    return db.select(db.func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+def compute_dashboard_stats():
+    """حساب إحصائيات لوحة التحكم باستعلام تجميعي واحد"""
+    now = datetime.utcnow()
+    week_ago = now - timedelta(days=7)
+
+    row = db.session.execute(db.select(
+        _count(User).label('total_users'),
+        _count(Post).label('total_posts'),
+        _count(Comment).label('total_comments'),
+        _count(UserImage, UserImage.is_approved.is_(False), UserImage.is_active.is_(True)).label('pending_images'),
+        _count(User, User.created_at >= week_ago).label('new_users_week'),
+        _count(Comment, Comment.created_at >= week_ago).label('new_comments_week'),
+        db.select(db.func.coalesce(db.func.sum(DailyPoints.points_earned), 0))
+        .where(DailyPoints.date_earned == utc_today())
+        .scalar_subquery().label('points_today')
+    )).one()
+
+    # أكثر المستخدمين نشاطاً
+    leaderboard.ensure_loaded()
+    top_ids = [entry['user_id'] for entry in leaderboard.top(5, min_points=0)]
+    users_by_id = {user.id: user for user in User.query.filter(User.id.in_(top_ids)).all()} if top_ids else {}
+
+    return {
+        'stats': dict(row._mapping),
+        'top_users': [users_by_id[user_id].to_dict() for user_id in top_ids if user_id in users_by_id]
+    }
+
+
+class DashboardSnapshot:
+    """لقطة لإحصائيات لوحة التحكم يحدّثها خيط في الخلفية كل DASHBOARD_REFRESH_SECONDS ثانية"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = None
+        self._as_of = None
+        self._thread = None
+
+    def get(self, fresh=False):
+        """إرجاع (الإحصائيات، وقت حسابها)، مع إعادة الحساب فوراً عند الطلب"""
+        if fresh or self._data is None:
+            self.refresh()
+        self._ensure_thread(current_app._get_current_object())
+        with self._lock:
+            return self._data, self._as_of
+
+    def refresh(self):
+        data = compute_dashboard_stats()
+        with self._lock:
+            self._data = data
+            self._as_of = datetime.utcnow()
+
+    def _ensure_thread(self, app):
+        interval = app.config.get('DASHBOARD_REFRESH_SECONDS', 60)
+        if not interval or interval <= 0:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, args=(app, interval), name='dashboard-snapshot', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self, app, interval):
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    self.refresh()
+                except Exception as e:
+                    app.logger.warning(f'تعذر تحديث إحصائيات لوحة التحكم: {e}')
+                finally:
+                    db.session.remove()
+
+
+dashboard_snapshot = DashboardSnapshot()
@@ -0,0 +1,198 @@
+from collections import deque
+
+from src.services.post_search import normalize_arabic
+
+MOODS = ('happy', 'professional', 'creative', 'excited', 'neutral')
+DEFAULT_MOOD = 'neutral'
+MAX_TEXT_LENGTH = 5000
+MAX_BATCH_TEXTS = 1000
+ARABIC_PREFIXES = ('ال', 'و', 'ف', 'ب', 'ل', 'ك', 'وال', 'فال', 'بال', 'كال', 'لل', 'ولل')
+
+# مجموعات الإيموجي لكل مزاج (تُكمَّل بها الاقتراحات بعد الإيموجي المطابقة للنص)
+MOOD_EMOJIS = {
+    'happy': ('😊', '😄', '🎉', '✨', '🌟', '💫', '🎊', '🥳'),
+    'professional': ('💼', '📊', '📈', '🎯', '⭐', '🏆', '💡', '🔥'),
+    'creative': ('🎨', '✨', '🌈', '💡', '🚀', '⚡', '🎭', '🎪'),
+    'excited': ('🚀', '⚡', '🔥', '💥', '🎯', '🌟', '✨', '🎉'),
+    'neutral': ('📝', '💭', '🤔', '📚', '💡', '🔍', '📌', '✅'),
+}
+
+# الكلمة -> (الإيموجي المحددة أو None، المزاج الذي ترجّحه أو None)
+# تُطابَق كل كلمة من بداية كلمة في النص. الكلمات العربية جذوع تقبل أي لاحقة وتُطابَق
+# أيضاً بعد السوابق الشائعة (ال، و، ب...). الكلمات الإنجليزية تُطابَق كاملة (أو بصيغة
+# الجمع s) إلا إذا انتهت بـ * فتُعامل كجذع.
+LEXICON = {
+    # سعادة
+    'سعيد': ('😊', 'happy'), 'سعاد': ('😊', 'happy'), 'فرح': ('😄', 'happy'),
+    'مبروك': ('🎉', 'happy'), 'تهنئ': ('🎊', 'happy'), 'عيد': ('🎉', 'happy'),
+    'احتفال': ('🥳', 'happy'), 'ضحك': ('😂', 'happy'), 'احب': ('❤️', 'happy'), 'حبيب': ('❤️', 'happy'),
+    'شكرا': ('🙏', 'happy'), 'جميل': ('🌟', 'happy'), 'رائع': ('✨', 'happy'),
+    'happy': ('😊', 'happy'), 'joy': ('😄', 'happy'), 'congrat*': ('🎉', 'happy'),
+    'celebrat*': ('🥳', 'happy'), 'birthday': ('🎂', 'happy'), 'love': ('❤️', 'happy'),
+    'laugh*': ('😂', 'happy'), 'thank*': ('🙏', 'happy'), 'beautiful': ('🌟', 'happy'),
+    'awesome': ('✨', 'happy'), 'smile': ('😊', 'happy'),
+    # عمل
+    'عمل': ('💼', 'professional'), 'شركه': ('🏢', 'professional'), 'شركات': ('🏢', 'professional'),
+    'مشروع': ('📋', 'professional'), 'اجتماع': ('🤝', 'professional'), 'تقرير': ('📊', 'professional'),
+    'مبيعات': ('📈', 'professional'), 'نمو': ('📈', 'professional'), 'هدف': ('🎯', 'professional'),
+    'استراتيجي': ('♟️', 'professional'),
+    'ادار': ('🗂️', 'professional'), 'تسويق': ('📣', 'professional'), 'مال': ('💰', 'professional'),
+    'business': ('💼', 'professional'), 'company': ('🏢', 'professional'), 'project': ('📋', 'professional'),
+    'meeting': ('🤝', 'professional'), 'report': ('📊', 'professional'), 'sales': ('📈', 'professional'),
+    'growth': ('📈', 'professional'), 'goal': ('🎯', 'professional'), 'strateg*': ('♟️', 'professional'),
+    'manag*': ('🗂️', 'professional'), 'marketing': ('📣', 'professional'), 'money': ('💰', 'professional'),
+    'career': ('🏆', 'professional'),
+    # إبداع
+    'فنون': ('🎨', 'creative'), 'فنان': ('🎨', 'creative'), 'رسم': ('🖌️', 'creative'), 'تصميم': ('🎨', 'creative'),
+    'موسيق': ('🎵', 'creative'), 'فكر': ('💡', 'creative'), 'ابداع': ('🌈', 'creative'),
+    'كتاب': ('📖', 'creative'), 'قصه': ('📖', 'creative'), 'قصص': ('📖', 'creative'), 'تصوير': ('📷', 'creative'),
+    'فيلم': ('🎬', 'creative'), 'شعر': ('✍️', 'creative'),
+    'art': ('🎨', 'creative'), 'draw': ('🖌️', 'creative'), 'design': ('🎨', 'creative'),
+    'music*': ('🎵', 'creative'), 'idea': ('💡', 'creative'), 'creativ*': ('🌈', 'creative'),
+    'story': ('📖', 'creative'), 'stories': ('📖', 'creative'), 'photo*': ('📷', 'creative'), 'film': ('🎬', 'creative'),
+    'movie': ('🎬', 'creative'), 'poem': ('✍️', 'creative'), 'writing': ('✍️', 'creative'),
+    # حماس
+    'اطلاق': ('🚀', 'excited'), 'جديد': ('🆕', 'excited'), 'مذهل': ('🤩', 'excited'),
+    'عاجل': ('⚡', 'excited'), 'فوز': ('🏆', 'excited'), 'انجاز': ('🏅', 'excited'),
+    'حصري': ('🔥', 'excited'), 'اخيرا': ('🙌', 'excited'), 'قوي': ('💪', 'excited'),
+    'launch': ('🚀', 'excited'), 'new': ('🆕', 'excited'), 'amazing': ('🤩', 'excited'),
+    'breaking': ('⚡', 'excited'), 'win': ('🏆', 'excited'), 'winner': ('🏆', 'excited'), 'achiev*': ('🏅', 'excited'),
+    'exclusive': ('🔥', 'excited'), 'finally': ('🙌', 'excited'), 'excit*': ('🤩', 'excited'),
+    'wow': ('😮', 'excited'), 'power*': ('💪', 'excited'),
+    # موضوعات محددة بلا مزاج
+    'قهوه': ('☕', None), 'طعام': ('🍽️', None), 'اكل': ('🍽️', None), 'سفر': ('✈️', None),
+    'رياض': ('⚽', None), 'كره القدم': ('⚽', None), 'تعليم': ('📚', None), 'دراس': ('📚', None),
+    'تقني': ('💻', None), 'برمج': ('👨‍💻', None), 'هاتف': ('📱', None), 'صحه': ('🩺', None), 'صحي': ('🩺', None),
+    'طبيع': ('🌿', None), 'بحر': ('🌊', None), 'شمس': ('☀️', None), 'مطر': ('🌧️', None),
+    'رمضان': ('🌙', None), 'وقت': ('⏰', None),
+    'coffee': ('☕', None), 'food': ('🍽️', None), 'travel': ('✈️', None), 'sport': ('⚽', None),
+    'football': ('⚽', None), 'educat*': ('📚', None), 'study': ('📚', None), 'learn*': ('📚', None),
+    'tech*': ('💻', None), 'code': ('👨‍💻', None), 'coding': ('👨‍💻', None),
+    'programming': ('👨‍💻', None), 'phone': ('📱', None),
+    'health': ('🩺', None), 'nature': ('🌿', None), 'sea': ('🌊', None), 'sun': ('☀️', None),
+    'rain': ('🌧️', None), 'time': ('⏰', None),
+}
+
+
+def normalize(text):
+    """توحيد النص قبل المطابقة: أشكال الحروف العربية والأحرف الصغيرة"""
+    return normalize_arabic(text).lower()
+
+
+def _word_ends(text, end):
+    """تنتهي الكلمة عند end، أو بعد حرف s واحد (صيغة الجمع الإنجليزية)"""
+    if end < len(text) and text[end] == 's':
+        end += 1
+    return end >= len(text) or not text[end].isalnum()
+
+
+class EmojiAutomaton:
+    """آلة Aho-Corasick لمطابقة كل كلمات المعجم في مرور واحد على النص"""
+
+    def __init__(self, lexicon):
+        self.entries = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for keyword, (emoji, mood) in lexicon.items():
+            stem = keyword.endswith('*')
+            keyword = normalize(keyword.rstrip('*'))
+            if keyword.isascii():
+                forms, whole_word = (keyword,), not stem
+            else:
+                forms, whole_word = (keyword, *(prefix + keyword for prefix in ARABIC_PREFIXES)), False
+            for form in forms:
+                self.entries.append((emoji, mood, len(form), whole_word))
+                self._add(form, len(self.entries) - 1)
+        self._build_failure_links()
+
+    def _add(self, keyword, entry):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] += (entry,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def scan(self, text):
+        """يعيد المطابقات كقائمة (رقم المدخل) بترتيب ظهورها في النص"""
+        goto, fail, out, entries = self._goto, self._fail, self._out, self.entries
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for entry in out[state]:
+                    _, _, length, whole_word = entries[entry]
+                    start = position - length + 1
+                    if start > 0 and text[start - 1].isalnum():
+                        continue
+                    if whole_word and not _word_ends(text, position + 1):
+                        continue
+                    matches.append(entry)
+        return matches
+
+
+_automaton = None
+
+
+def _get_automaton():
+    global _automaton
+    if _automaton is None:
+        _automaton = EmojiAutomaton(LEXICON)
+    return _automaton
+
+
+def analyze(text, mood=None, limit=5):
+    """اقتراح الإيموجي للنص: المطابقات المباشرة أولاً ثم إيموجي المزاج المكتشف أو المطلوب
+
+    يعيد قاموساً فيه emojis و mood و scores (عدد الكلمات الدالة على كل مزاج).
+    """
+    automaton = _get_automaton()
+    scores = {}
+    counts = {}
+    for entry in automaton.scan(normalize(text)):
+        emoji, entry_mood, _, _ = automaton.entries[entry]
+        if entry_mood is not None:
+            scores[entry_mood] = scores.get(entry_mood, 0) + 1
+        if emoji is not None:
+            counts[emoji] = counts.get(emoji, 0) + 1
+
+    if mood not in MOOD_EMOJIS:
+        # عند التعادل يُقدَّم المزاج الأسبق في MOODS
+        mood = max(scores, key=lambda name: (scores[name], -MOODS.index(name))) if scores else DEFAULT_MOOD
+
+    # ترتيب الإدراج في القاموس هو ترتيب الظهور، فالترتيب ثابت عند تساوي التكرار
+    emojis = sorted(counts, key=counts.get, reverse=True)[:limit]
+    for emoji in MOOD_EMOJIS[mood]:
+        if len(emojis) >= limit:
+            break
+        if emoji not in emojis:
+            emojis.append(emoji)
+
+    return {'emojis': emojis, 'mood': mood, 'scores': scores}
+
+
+def analyze_batch(texts, mood=None, limit=5):
+    return [analyze(text, mood, limit) for text in texts]
@@ -0,0 +1,15 @@
+from src.models.user import db
+
+
+def fts5_supported():
+    """هل قاعدة البيانات الحالية SQLite مع FTS5 ومقطّع trigram (الإصدار 3.34 فما فوق)"""
+    if db.session.get_bind().dialect.name != 'sqlite':
+        return False
+    options = {row[0] for row in db.session.execute(db.text('PRAGMA compile_options'))}
+    version = db.session.execute(db.text('SELECT sqlite_version()')).scalar()
+    return 'ENABLE_FTS5' in options and tuple(int(part) for part in version.split('.')) >= (3, 34)
+
+
+def quote_phrase(term):
+    """نص بين علامتي اقتباس لاستخدامه بأمان داخل تعبير MATCH"""
+    return '"' + term.replace('"', '""') + '"'
@@ -0,0 +1,330 @@
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+TOP_SIZE = 10  # عدد المستخدمين في لوحة الصدارة العامة
+DEFAULT_REFRESH_SECONDS = 5
+DEFAULT_MAX_AGE = 3600
+# هامش إعادة قراءة التغييرات: معاملة بدأت قبل المزامنة قد تُثبَّت بعدها بتاريخ أقدم
+SYNC_OVERLAP_SECONDS = 30
+
+
+class _Node:
+    __slots__ = ('value', 'next', 'width')
+
+    def __init__(self, value, next, width):
+        self.value = value
+        self.next = next
+        self.width = width
+
+
+_NIL = _Node(None, [], [])
+
+
+class IndexableSkiplist:
+    """قائمة تخطي مرتبة تدعم البحث بالترتيب والإدراج والحذف في زمن لوغاريتمي"""
+
+    def __init__(self, max_levels=24):
+        self.size = 0
+        self.max_levels = max_levels
+        self.head = _Node(None, [_NIL] * max_levels, [1] * max_levels)
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_sorted(cls, values, max_levels=24):
+        """بناء القائمة من قيم مرتبة مسبقاً في زمن خطي"""
+        skiplist = cls(max_levels)
+        last_nodes = [skiplist.head] * max_levels
+        last_positions = [0] * max_levels
+        position = 0
+        for value in values:
+            position += 1
+            depth = skiplist._random_level()
+            node = _Node(value, [_NIL] * depth, [1] * depth)
+            for level in range(depth):
+                last_nodes[level].next[level] = node
+                last_nodes[level].width[level] = position - last_positions[level]
+                last_nodes[level] = node
+                last_positions[level] = position
+        for level in range(max_levels):
+            last_nodes[level].width[level] = position + 1 - last_positions[level]
+        skiplist.size = position
+        return skiplist
+
+    def _random_level(self):
+        return min(self.max_levels, 1 - int(math.log(1.0 - random.random(), 2.0)))
+
+    def insert(self, value):
+        chain = [None] * self.max_levels
+        steps_at_level = [0] * self.max_levels
+        node = self.head
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not _NIL and node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        depth = self._random_level()
+        new_node = _Node(value, [None] * depth, [None] * depth)
+        steps = 0
+        for level in range(depth):
+            prev_node = chain[level]
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+            new_node.width[level] = prev_node.width[level] - steps
+            prev_node.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(depth, self.max_levels):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, value):
+        chain = [None] * self.max_levels
+        node = self.head
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not _NIL and node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is _NIL or target.value != value:
+            raise KeyError(value)
+
+        for level in range(len(target.next)):
+            prev_node = chain[level]
+            prev_node.width[level] += target.width[level] - 1
+            prev_node.next[level] = target.next[level]
+        for level in range(len(target.next), self.max_levels):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def index(self, value):
+        """ترتيب القيمة (يبدأ من صفر) أو KeyError إذا لم تكن موجودة"""
+        node = self.head
+        position = 0
+        for level in reversed(range(self.max_levels)):
+            while node.next[level] is not _NIL and node.next[level].value < value:
+                position += node.width[level]
+                node = node.next[level]
+        target = node.next[0]
+        if target is _NIL or target.value != value:
+            raise KeyError(value)
+        return position
+
+    def iter_from(self, index):
+        """المرور على القيم ابتداءً من ترتيب معين"""
+        if index >= self.size:
+            return
+        node = self.head
+        remaining = index + 1
+        for level in reversed(range(self.max_levels)):
+            while node.width[level] <= remaining and node.next[level] is not _NIL:
+                remaining -= node.width[level]
+                node = node.next[level]
+        while node is not _NIL:
+            yield node.value
+            node = node.next[0]
+
+
+class Leaderboard:
+    """لوحة صدارة في الذاكرة مرتبة حسب (النقاط تنازلياً، المعرف تصاعدياً)
+
+    تُبنى مرة واحدة ثم تُحدَّث تدريجياً: العملية التي تكتب تحدّث نسختها مباشرة وتسجّل
+    المستخدم في جدول LeaderboardChange ضمن المعاملة نفسها، وتطبّق العمليات الأخرى هذه
+    التغييرات كل LEADERBOARD_REFRESH_SECONDS بقراءة صفوف المستخدمين المتغيرين فقط.
+    إعادة البناء الكاملة احتياط نادر: بعد التغييرات الجماعية، أو إذا لم تزامن العملية
+    منذ LEADERBOARD_MAX_AGE ثانية (فقد تكون التغييرات القديمة حُذفت).
+    """
+
+    def __init__(self, refresh_seconds=DEFAULT_REFRESH_SECONDS, max_age=DEFAULT_MAX_AGE):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._entries = {}  # user_id -> (total_points, username)
+        self._ranking = IndexableSkiplist()
+        self.loaded = False
+        self.refresh_seconds = refresh_seconds
+        self.max_age = max_age
+        self._synced_at = None  # وقت آخر مزامنة (UTC، بساعة created_at نفسها)
+        self._checked_at = 0.0
+        self._pruned_at = 0.0
+
+    def init_app(self, app):
+        self.refresh_seconds = app.config.get('LEADERBOARD_REFRESH_SECONDS', DEFAULT_REFRESH_SECONDS)
+        self.max_age = app.config.get('LEADERBOARD_MAX_AGE', DEFAULT_MAX_AGE)
+
+    @staticmethod
+    def _key(user_id, total_points):
+        return (-(total_points or 0), user_id)
+
+    def load(self, rows):
+        """بناء اللوحة من صفوف (id, username, total_points)"""
+        with self._lock:
+            self._entries = {
+                user_id: (total_points or 0, username)
+                for user_id, username, total_points in rows
+            }
+            self._ranking = IndexableSkiplist.from_sorted(sorted(
+                self._key(user_id, entry[0]) for user_id, entry in self._entries.items()
+            ))
+            self.loaded = True
+
+    def load_from_db(self):
+        """بناء اللوحة من جدول المستخدمين (يتطلب سياق التطبيق)"""
+        from src.models.user import db, User
+        # وقت المزامنة قبل القراءة: أي تغيير أثناءها يُعاد تطبيقه في المزامنة التالية
+        synced_at = datetime.utcnow()
+        rows = db.session.query(User.id, User.username, User.total_points).all()
+        self.load(rows)
+        self._synced_at = synced_at
+        self._checked_at = time.monotonic()
+
+    def record_change(self, user_id=None):
+        """تسجيل تغيّر نقاط المستخدم أو حذفه ضمن المعاملة الحالية (None لإعادة البناء الكاملة)
+
+        تُحذف في المعاملة نفسها، مرة كل LEADERBOARD_MAX_AGE لكل عملية، التغييرات الأقدم
+        من ضعف هذه المدة؛ فالعملية التي لم تزامن خلالها تعيد البناء بالكامل.
+        """
+        from src.models.user import db, LeaderboardChange
+        now = datetime.utcnow()
+        db.session.execute(db.insert(LeaderboardChange).values(user_id=user_id, created_at=now))
+        if time.monotonic() - self._pruned_at >= self.max_age:
+            self._pruned_at = time.monotonic()
+            db.session.execute(
+                db.delete(LeaderboardChange)
+                .where(LeaderboardChange.created_at < now - timedelta(seconds=2 * self.max_age))
+                .execution_options(synchronize_session=False)
+            )
+
+    def sync(self):
+        """تطبيق التغييرات المسجلة منذ آخر مزامنة، ويعيد عدد المستخدمين المحدَّثين"""
+        from src.models.user import db, User, LeaderboardChange
+        synced_at = datetime.utcnow()
+        changed = {
+            user_id for (user_id,) in db.session.execute(
+                db.select(LeaderboardChange.user_id)
+                .where(LeaderboardChange.created_at >= self._synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS))
+            )
+        }
+        if None in changed:
+            self.load_from_db()
+            return len(self._entries)
+
+        rows = db.session.execute(
+            db.select(User.id, User.username, User.total_points).where(User.id.in_(changed))
+        ).all() if changed else []
+        with self._lock:
+            for user_id, username, total_points in rows:
+                self._set(user_id, total_points, username)
+            for user_id in changed - {row.id for row in rows}:
+                current = self._entries.pop(user_id, None)
+                if current is not None:
+                    self._ranking.remove(self._key(user_id, current[0]))
+        self._synced_at = synced_at
+        return len(changed)
+
+    def ensure_loaded(self):
+        """تحميل اللوحة عند أول استخدام، ثم تطبيق تغييرات العمليات الأخرى تدريجياً"""
+        now = time.monotonic()
+        if self.loaded and now - self._checked_at < self.refresh_seconds:
+            return
+        # طلب واحد يزامن والبقية تستخدم اللوحة الحالية (ما لم تكن غير محمّلة)
+        if not self._sync_lock.acquire(blocking=not self.loaded):
+            return
+        try:
+            if self.loaded and time.monotonic() - self._checked_at < self.refresh_seconds:
+                return  # زامنها طلب آخر أثناء الانتظار
+            if not self.loaded or datetime.utcnow() - self._synced_at > timedelta(seconds=self.max_age):
+                self.load_from_db()
+            else:
+                self.sync()
+            self._checked_at = now
+        finally:
+            self._sync_lock.release()
+
+    def invalidate(self):
+        """إعادة البناء من قاعدة البيانات عند الاستخدام التالي (بعد التعديلات الجماعية)"""
+        with self._lock:
+            self.loaded = False
+
+    def _set(self, user_id, total_points, username=None):
+        current = self._entries.get(user_id)
+        if current is not None:
+            self._ranking.remove(self._key(user_id, current[0]))
+            username = username or current[1]
+        self._entries[user_id] = (total_points or 0, username)
+        self._ranking.insert(self._key(user_id, total_points))
+
+    def update(self, user_id, total_points, username=None):
+        """إدراج مستخدم أو تحديث نقاطه"""
+        if not self.loaded:
+            return
+        with self._lock:
+            self._set(user_id, total_points, username)
+
+    def add_points(self, user_id, points):
+        if not self.loaded:
+            return
+        with self._lock:
+            current = self._entries.get(user_id)
+            if current is not None:
+                self._set(user_id, current[0] + points)
+
+    def remove(self, user_id):
+        if not self.loaded:
+            return
+        with self._lock:
+            current = self._entries.pop(user_id, None)
+            if current is not None:
+                self._ranking.remove(self._key(user_id, current[0]))
+
+    def _entry(self, rank, key):
+        total_points, username = self._entries[key[1]]
+        return {
+            'rank': rank,
+            'user_id': key[1],
+            'username': username,
+            'total_points': total_points
+        }
+
+    def top(self, limit=10, min_points=1):
+        """أفضل المستخدمين مع استبعاد من لديهم نقاط أقل من الحد الأدنى"""
+        with self._lock:
+            result = []
+            for rank, key in enumerate(self._ranking.iter_from(0), 1):
+                if rank > limit or -key[0] < min_points:
+                    break
+                result.append(self._entry(rank, key))
+            return result
+
+    def rank(self, user_id):
+        """ترتيب المستخدم (يبدأ من 1) أو None إذا لم يكن موجوداً"""
+        with self._lock:
+            current = self._entries.get(user_id)
+            if current is None:
+                return None
+            return self._ranking.index(self._key(user_id, current[0])) + 1
+
+    def around(self, user_id, radius=2):
+        """المستخدمون المحيطون بالمستخدم في الترتيب"""
+        with self._lock:
+            current = self._entries.get(user_id)
+            if current is None:
+                return []
+            index = self._ranking.index(self._key(user_id, current[0]))
+            start = max(0, index - radius)
+            result = []
+            for offset, key in enumerate(self._ranking.iter_from(start)):
+                if offset > index - start + radius:
+                    break
+                result.append(self._entry(start + offset + 1, key))
+            return result
+
+    def __len__(self):
+        return len(self._ranking)
+
+
+leaderboard = Leaderboard()
@@ -0,0 +1,249 @@
+import bisect
+import hmac
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from time import perf_counter
+
+from flask import request
+from sqlalchemy import event
+
+from src.models.user import db
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+MAX_SUSPECTS = 50
+MAX_STATEMENT_LABEL = 200
+
+# حالة الطلب الجاري؛ ContextVar أسرع من flask.g بكثير داخل مستمعي الاستعلامات
+# ولا تتداخل بين الخيوط، واستعلامات الخيوط الخلفية (None) لا تُحسب على أي طلب
+_state = ContextVar('request_metrics_state', default=None)
+
+
+class _RequestState:
+    __slots__ = ('start', 'queries', 'db_time', 'query_start', 'shapes')
+
+    def __init__(self, start):
+        self.start = start
+        self.queries = 0
+        self.db_time = 0.0
+        self.query_start = start
+        self.shapes = {}
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # الخانة الأخيرة لـ +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class _Series:
+    """مقاييس مسار واحد (endpoint، method)"""
+
+    __slots__ = ('latency', 'queries', 'db_time', 'statuses', 'n_plus_one')
+
+    def __init__(self):
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.queries = _Histogram(QUERY_BUCKETS)
+        self.db_time = 0.0
+        self.statuses = {}
+        self.n_plus_one = 0
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+    """قياس زمن كل طلب واستعلاماته ووقت قاعدة البيانات، مع كشف أنماط N+1
+
+    المقاييس لكل عملية؛ مع عدة عمال gunicorn يعرض كل عامل أرقامه فقط.
+
+    الإعدادات:
+        METRICS_ENABLED: تفعيل القياس (الافتراضي True)
+        N_PLUS_ONE_THRESHOLD: أقصى تكرار لنفس الاستعلام في طلب واحد قبل اعتباره N+1 (الافتراضي 10)
+        METRICS_TOKEN: رمز اختياري يسمح لـ Prometheus بالقراءة عبر Authorization: Bearer
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self._suspects = OrderedDict()
+        self._threshold = DEFAULT_N_PLUS_ONE_THRESHOLD
+        self._token = None
+        self._logger = None
+
+    def init_app(self, app):
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+        self._threshold = app.config.get('N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)
+        self._token = app.config.get('METRICS_TOKEN')
+        self._logger = app.logger
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+        with app.app_context():
+            engines = [db.engine, app.extensions.get('sqlite_read_engine')]
+        for engine in filter(None, engines):
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    # ---------------------------------------------------------------- الخطافات
+
+    @staticmethod
+    def _before_request():
+        _state.set(_RequestState(perf_counter()))
+
+    def _after_request(self, response):
+        state = _state.get()
+        if state is not None:
+            # الوصول إلى الطلب مرة واحدة عبر الوكيل أرخص من قراءة كل خاصية عبره
+            req = request._get_current_object()
+            rule = req.url_rule
+            self._record(rule.endpoint if rule is not None else 'unmatched', req.method, response.status_code,
+                         perf_counter() - state.start, state)
+        return response
+
+    @staticmethod
+    def _teardown_request(exc):
+        _state.set(None)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        state = _state.get()
+        if state is not None:
+            state.query_start = perf_counter()
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        state = _state.get()
+        if state is not None:
+            state.db_time += perf_counter() - state.query_start
+            state.queries += 1
+            shapes = state.shapes
+            shapes[statement] = shapes.get(statement, 0) + 1
+
+    def _record(self, endpoint, method, status, duration, state):
+        repeated = None
+        if state.queries > self._threshold:
+            statement, count = max(state.shapes.items(), key=lambda item: item[1])
+            if count > self._threshold:
+                repeated = (statement, count)
+
+        key = (endpoint, method)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.latency.observe(duration)
+            series.queries.observe(state.queries)
+            series.db_time += state.db_time
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            if repeated is None:
+                return
+            series.n_plus_one += 1
+            suspect = (endpoint, repeated[0])
+            is_new = suspect not in self._suspects
+            self._suspects[suspect] = max(self._suspects.get(suspect, 0), repeated[1])
+            self._suspects.move_to_end(suspect)
+            while len(self._suspects) > MAX_SUSPECTS:
+                self._suspects.popitem(last=False)
+
+        if is_new and self._logger is not None:
+            self._logger.warning(
+                f'اشتباه N+1 في {endpoint}: نفس الاستعلام نُفّذ {repeated[1]} مرة في طلب واحد: '
+                f'{" ".join(repeated[0].split())[:MAX_STATEMENT_LABEL]}'
+            )
+
+    # ---------------------------------------------------------------- العرض
+
+    def authorized(self, req):
+        """هل يحمل الطلب رمز METRICS_TOKEN الصحيح"""
+        if not self._token:
+            return False
+        header = req.headers.get('Authorization', '')
+        return header.startswith('Bearer ') and hmac.compare_digest(header[7:], self._token)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self._suspects.clear()
+
+    def render(self):
+        """المقاييس بصيغة Prometheus النصية"""
+        with self._lock:
+            series = sorted(self._series.items())
+            snapshot = [
+                (key, list(item.latency.counts), item.latency.sum, list(item.queries.counts), item.queries.sum,
+                 item.db_time, sorted(item.statuses.items()), item.n_plus_one)
+                for key, item in series
+            ]
+            suspects = list(self._suspects.items())
+
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+        def histogram(name, labels, buckets, counts, total):
+            cumulative = 0
+            for bound, count in zip((*buckets, '+Inf'), counts):
+                cumulative += count
+                le = bound if bound == '+Inf' else _number(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{labels}}} {_number(float(total))}')
+            lines.append(f'{name}_count{{{labels}}} {cumulative}')
+
+        def labels_for(endpoint, method):
+            return f'endpoint="{_label(endpoint)}",method="{_label(method)}"'
+
+        header('app_http_requests_total', 'counter', 'Requests handled, by endpoint, method and status.')
+        for (endpoint, method), *_, statuses, _ in snapshot:
+            for status, count in statuses:
+                lines.append(f'app_http_requests_total{{{labels_for(endpoint, method)},status="{status}"}} {count}')
+
+        header('app_http_request_duration_seconds', 'histogram', 'Request latency in seconds.')
+        for (endpoint, method), counts, total, *_ in snapshot:
+            histogram('app_http_request_duration_seconds', labels_for(endpoint, method),
+                      LATENCY_BUCKETS, counts, total)
+
+        header('app_db_queries_per_request', 'histogram', 'SQL statements executed per request.')
+        for (endpoint, method), _, _, counts, total, *_ in snapshot:
+            histogram('app_db_queries_per_request', labels_for(endpoint, method), QUERY_BUCKETS, counts, total)
+
+        header('app_db_time_seconds_total', 'counter', 'Time spent executing SQL statements.')
+        for (endpoint, method), _, _, _, _, db_time, *_ in snapshot:
+            lines.append(f'app_db_time_seconds_total{{{labels_for(endpoint, method)}}} {_number(db_time)}')
+
+        header('app_n_plus_one_suspected_total', 'counter',
+               'Requests that ran one statement shape more than N_PLUS_ONE_THRESHOLD times.')
+        for (endpoint, method), *_, n_plus_one in snapshot:
+            lines.append(f'app_n_plus_one_suspected_total{{{labels_for(endpoint, method)}}} {n_plus_one}')
+
+        header('app_n_plus_one_statement_repeats', 'gauge',
+               'Highest repeat count seen for a suspected N+1 statement.')
+        for (endpoint, statement), count in suspects:
+            statement = _label(' '.join(statement.split())[:MAX_STATEMENT_LABEL])
+            lines.append(f'app_n_plus_one_statement_repeats{{endpoint="{_label(endpoint)}",'
+                         f'statement="{statement}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,233 @@
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.schema import CreateIndex
+
+from src.models.user import db, User, Post, DailySignupRollup, DailyToolRollup
+
+try:
+    import fcntl
+except ImportError:  # Windows: بدون قفل بين العمليات، وكل ترحيل آمن للتكرار على أي حال
+    fcntl = None
+
+# مفتاح القفل الاستشاري في PostgreSQL لتغييرات المخطط
+ADVISORY_LOCK_KEY = 72616469
+_held = threading.local()
+
+# جدول منفصل عن db.metadata حتى لا يرتبط بنماذج التطبيق
+_metadata = MetaData()
+schema_migrations = Table(
+    'schema_migrations', _metadata,
+    Column('version', String(64), primary_key=True),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+MIGRATIONS = []
+
+
+def migration(version):
+    """تسجيل دالة ترحيل؛ تُنفَّذ بترتيب الإصدار مرة واحدة لكل قاعدة بيانات"""
+    def register(func):
+        MIGRATIONS.append((version, func))
+        MIGRATIONS.sort(key=lambda item: item[0])
+        return func
+    return register
+
+
+def _index(name):
+    for table in db.metadata.tables.values():
+        for index in table.indexes:
+            if index.name == name:
+                return index
+    raise KeyError(name)
+
+
+def create_indexes(engine, names):
+    """إنشاء الفهارس المعرّفة في النماذج إن لم تكن موجودة
+
+    في PostgreSQL تُنشأ بـ CONCURRENTLY خارج المعاملة فلا تُقفل الكتابة أثناء البناء.
+    في SQLite يُقفل البناء الكتابة لمدة بنائه فقط، والقراءة مستمرة مع WAL.
+    """
+    concurrently = engine.dialect.name == 'postgresql'
+    options = {'isolation_level': 'AUTOCOMMIT'} if concurrently else {}
+    with engine.connect().execution_options(**options) as connection:
+        for name in names:
+            sql = str(CreateIndex(_index(name), if_not_exists=True).compile(dialect=engine.dialect))
+            if concurrently:
+                sql = sql.replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY', 1)
+            connection.exec_driver_sql(sql)
+        if not concurrently:
+            connection.commit()
+
+
+def _has_column(engine, table, name):
+    return name in {column['name'] for column in inspect(engine).get_columns(table)}
+
+
+def add_column(engine, table, column_ddl):
+    """إضافة عمود إن لم يكن موجوداً (ALTER TABLE ... ADD COLUMN)"""
+    name = column_ddl.split()[0]
+    if _has_column(engine, table, name):
+        return False
+    try:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f'ALTER TABLE "{table}" ADD COLUMN {column_ddl}')
+    except DBAPIError:
+        # أضافته عملية أخرى لا تأخذ القفل (مثل إصدار أقدم) بعد الفحص
+        if not _has_column(engine, table, name):
+            raise
+        return False
+    return True
+
+
+@migration('0001_post_comments_count')
+def _post_comments_count(engine):
+    from src.routes.posts import recount_comments
+
+    if add_column(engine, Post.__tablename__, 'comments_count INTEGER NOT NULL DEFAULT 0'):
+        recount_comments()
+
+
+@migration('0002_hot_path_indexes')
+def _hot_path_indexes(engine):
+    create_indexes(engine, (
+        'ix_post_active_created',
+        'ix_comment_post_approved_created',
+        'ix_comment_created_at',
+        'ix_user_image_active_approved_upload',
+        'ix_user_image_expiry_date',
+        'ix_user_total_points',
+        'ix_user_created_at',
+        'ix_daily_points_date_earned',
+        'ix_task_user_status_created',
+        'ix_task_user_created',
+    ))
+
+
+@migration('0003_backfill_rollups')
+def _backfill_rollups(engine):
+    from src.services.analytics import rebuild_rollups
+
+    empty = not db.session.query(DailySignupRollup.day).first() and not db.session.query(DailyToolRollup.day).first()
+    if empty:
+        rebuild_rollups()
+
+
+@migration('0004_post_search_index')
+def _post_search_index(engine):
+    from src.services import post_search
+
+    post_search.create_index(engine)
+
+
+@migration('0005_password_hash_length')
+def _password_hash_length(engine):
+    # SQLite لا يفرض طول VARCHAR؛ القواعد الأخرى أُنشئت بـ varchar(128) وتجزئات scrypt أطول
+    if engine.dialect.name == 'sqlite':
+        return
+    table = User.__tablename__
+    column = next(column for column in inspect(engine).get_columns(table) if column['name'] == 'password_hash')
+    if (getattr(column['type'], 'length', None) or 0) >= 255:
+        return
+    quoted = engine.dialect.identifier_preparer.quote(table)
+    if engine.dialect.name == 'mysql':
+        sql = f'ALTER TABLE {quoted} MODIFY password_hash VARCHAR(255)'
+    else:
+        sql = f'ALTER TABLE {quoted} ALTER COLUMN password_hash TYPE VARCHAR(255)'
+    with engine.begin() as connection:
+        connection.exec_driver_sql(sql)
+
+
+@migration('0006_user_search_index')
+def _user_search_index(engine):
+    from src.services import user_search
+
+    user_search.create_index(engine)
+
+
+@contextmanager
+def lock(engine=None):
+    """قفل بين العمليات حول تغييرات المخطط (يتطلب سياق التطبيق، ويمكن تداخله في نفس الخيط)
+
+    PostgreSQL: pg_advisory_lock على اتصال مخصص. SQLite: قفل ملف بجانب قاعدة البيانات؛
+    لا يصلح BEGIN IMMEDIATE هنا لأن الترحيلات تكتب من اتصالات أخرى (engine.begin و db.session)
+    فتنتظر القفل الذي تحمله معاملته.
+    """
+    engine = engine or db.engine
+    if getattr(_held, 'depth', 0):
+        _held.depth += 1
+        try:
+            yield
+        finally:
+            _held.depth -= 1
+        return
+
+    with _acquire(engine):
+        _held.depth = 1
+        try:
+            yield
+        finally:
+            _held.depth = 0
+
+
+@contextmanager
+def _acquire(engine):
+    if engine.dialect.name == 'postgresql':
+        with engine.connect() as connection:
+            connection.execute(db.text('SELECT pg_advisory_lock(:key)'), {'key': ADVISORY_LOCK_KEY})
+            try:
+                yield
+            finally:
+                connection.execute(db.text('SELECT pg_advisory_unlock(:key)'), {'key': ADVISORY_LOCK_KEY})
+                connection.commit()
+        return
+
+    path = engine.url.database if engine.dialect.name == 'sqlite' else None
+    if fcntl is None or not path or path == ':memory:' or path.startswith('file:'):
+        yield
+        return
+    with open(path + '.migrate.lock', 'a') as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def applied_versions(engine):
+    schema_migrations.create(engine, checkfirst=True)
+    with engine.connect() as connection:
+        return {row.version for row in connection.execute(schema_migrations.select())}
+
+
+def pending(engine=None):
+    engine = engine or db.engine
+    applied = applied_versions(engine)
+    return [version for version, _ in MIGRATIONS if version not in applied]
+
+
+def upgrade(engine=None):
+    """تطبيق الترحيلات المعلقة بالترتيب تحت القفل (يتطلب سياق التطبيق)، ويعيد الإصدارات المطبقة
+
+    تُشغَّل من flask migrate أو init-db (خطوة release في Procfile) لا من عمال الخادم.
+    """
+    engine = engine or db.engine
+    with lock(engine):
+        # تُقرأ بعد أخذ القفل: ما طبقته عملية سبقتنا إليه لا يُعاد
+        applied = applied_versions(engine)
+        done = []
+        for version, func in MIGRATIONS:
+            if version in applied:
+                continue
+            func(engine)
+            try:
+                with engine.begin() as connection:
+                    connection.execute(schema_migrations.insert().values(version=version, applied_at=datetime.utcnow()))
+            except IntegrityError:
+                # سجّلته عملية لا تأخذ القفل
+                pass
+            done.append(version)
+        return done
@@ -0,0 +1,101 @@
+import base64
+import json
+import math
+from datetime import datetime
+
+from flask import abort, jsonify, make_response, request
+
+from src.models.user import db
+from src.services.serialization import fetch
+
+MAX_PER_PAGE = 100
+ADMIN_MAX_PER_PAGE = 1000
+
+
+def encode_cursor(sort_value, row_id):
+    """ترميز موضع آخر صف في الصفحة كمؤشر معتم (القيمة تاريخ أو نص ISO جاهز من SQL)"""
+    if sort_value and not isinstance(sort_value, str):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value or None, row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """فك ترميز المؤشر إلى (قيمة الترتيب، المعرف) أو ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('invalid cursor')
+
+
+def clamp_per_page(per_page, max_per_page=MAX_PER_PAGE):
+    return min(max(per_page, 1), max_per_page)
+
+
+def _all(query):
+    if isinstance(query, db.Select):
+        return fetch(query)
+    return query.all()
+
+
+def _count(query):
+    if isinstance(query, db.Select):
+        # count(*) مباشرة على الجداول بدلاً من استعلام فرعي يحسب كل الأعمدة (مثل Query.count)
+        counted = query.with_only_columns(db.func.count(), maintain_column_froms=True).order_by(None)
+        return db.session.connection().execute(counted).scalar()
+    return query.order_by(None).count()
+
+
+def paginate(query, sort_column, id_column, default_per_page=20, max_per_page=MAX_PER_PAGE, keyset=False):
+    """تقسيم النتائج إلى صفحات تنازلياً حسب (sort_column, id_column)
+
+    إذا وُجد المعامل cursor في الطلب (أو keyset=True) يُستخدم التقسيم بالمفتاح (بدون
+    OFFSET ولا COUNT إلا عند طلب with_total=1)، وإلا يُستخدم تقسيم الصفحات التقليدي.
+    يقبل Query من ORM أو select() من أعمدة (مسار التسلسل السريع) فيعيد صفوفاً.
+    يعيد (العناصر، بيانات الصفحة).
+    """
+    per_page = clamp_per_page(request.args.get('per_page', default_per_page, type=int), max_per_page)
+    ordered = query.order_by(sort_column.desc(), id_column.desc())
+
+    if not keyset and 'cursor' not in request.args:
+        page = request.args.get('page', 1, type=int)
+        if isinstance(query, db.Select):
+            # مثل Query.paginate(error_out=False): الصفحات غير الصحيحة تُعامل كالأولى
+            items = fetch(ordered.limit(per_page).offset((max(page, 1) - 1) * per_page))
+            total = _count(query)
+            return items, {
+                'total': total,
+                'pages': math.ceil(total / per_page),
+                'current_page': page
+            }
+        result = ordered.paginate(page=page, per_page=per_page, error_out=False)
+        return result.items, {
+            'total': result.total,
+            'pages': result.pages,
+            'current_page': page
+        }
+
+    cursor = request.args.get('cursor', '')
+    seek_query = ordered
+    if cursor:
+        try:
+            sort_value, last_id = decode_cursor(cursor)
+        except ValueError:
+            abort(make_response(jsonify({'error': 'مؤشر الصفحة غير صحيح'}), 400))
+        seek_query = seek_query.filter(
+            db.tuple_(sort_column, id_column) < db.tuple_(sort_value, last_id)
+        )
+
+    items = _all(seek_query.limit(per_page + 1))
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    meta = {'next_cursor': next_cursor, 'per_page': per_page}
+    if request.args.get('with_total', '0').lower() in ('1', 'true'):
+        meta['total'] = _count(query)
+    return items, meta
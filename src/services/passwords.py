@@ -0,0 +1,115 @@
+import os
+import threading
+from concurrent import futures
+
+from flask import current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
+
+DEFAULT_METHOD = 'scrypt'
+
+
+class HasherBusy(Exception):
+    """طابور تجزئة كلمات المرور ممتلئ أو انتهت مهلة الانتظار؛ يجب رفض الطلب بسرعة (503)"""
+
+
+def method_prefix(method):
+    """الصيغة الكاملة للطريقة كما تخزنها Werkzeug قبل '$' (مثل scrypt:32768:8:1)، دون حساب تجزئة"""
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        try:
+            n, r, p = map(int, args) if args else (2 ** 15, 8, 1)
+        except ValueError:
+            raise ValueError("'scrypt' takes 3 arguments.") from None
+        return f'scrypt:{n}:{r}:{p}'
+    if name == 'pbkdf2':
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' takes 2 arguments.")
+        hash_name = args[0] if args else 'sha256'
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    raise ValueError(f"Invalid hash method '{method}'.")
+
+
+class PasswordHasher:
+    """تجزئة كلمات المرور في مجموعة عمليات منفصلة بحد أقصى لطول الطابور
+
+    الإعدادات:
+        PASSWORD_HASH_METHOD: طريقة Werkzeug وتكلفتها (مثل 'scrypt' أو 'pbkdf2:sha256:600000')
+        PASSWORD_HASH_WORKERS: عدد العمليات (0 للتجزئة داخل نفس العملية)
+        PASSWORD_HASH_MAX_QUEUE: أقصى عدد من العمليات المعلقة قبل الرفض
+        PASSWORD_HASH_TIMEOUT: أقصى مدة انتظار للنتيجة بالثواني
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._slots = None
+        self._prefixes = {}
+
+    def _config(self, name, default):
+        return current_app.config.get(name, default)
+
+    def _get_executor(self):
+        workers = self._config('PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+        if not workers:
+            return None
+        # المجموعة لا تنتقل بين العمليات بعد fork (مثل عمال gunicorn)
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    self._executor = futures.ProcessPoolExecutor(max_workers=workers)
+                    self._slots = threading.BoundedSemaphore(
+                        self._config('PASSWORD_HASH_MAX_QUEUE', workers * 4)
+                    )
+                    self._pid = os.getpid()
+        return self._executor
+
+    def _run(self, func, *args):
+        executor = self._get_executor()
+        if executor is None:
+            return func(*args)
+
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = executor.submit(func, *args)
+        except Exception:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self._config('PASSWORD_HASH_TIMEOUT', 10))
+        except futures.TimeoutError:
+            future.cancel()
+            raise HasherBusy() from None
+
+    def method(self):
+        return self._config('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+
+    def _method_prefix(self, method):
+        prefix = self._prefixes.get(method)
+        if prefix is None:
+            prefix = self._prefixes[method] = method_prefix(method)
+        return prefix
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method())
+
+    def verify(self, password_hash, password):
+        """يعيد (صحة كلمة المرور، هل تحتاج إلى إعادة التجزئة بالإعدادات الحالية)"""
+        if not password_hash:
+            return False, False
+        if not self._run(check_password_hash, password_hash, password):
+            return False, False
+        return True, password_hash.split('$', 1)[0] != self._method_prefix(self.method())
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+hasher = PasswordHasher()
@@ -0,0 +1,66 @@
+from sqlalchemy.exc import IntegrityError
+
+from src.models.user import db, User, DailyPoints, utc_today
+from src.services.analytics import record_tool_usage
+from src.services.auth import invalidate_user
+from src.services.leaderboard import TOP_SIZE, leaderboard
+from src.services.response_cache import response_cache
+from src.services.upsert import upsert_insert
+
+
+def _insert_daily_points(user_id, tool_name, points, today):
+    """إدراج سجل النقاط اليومية مع تجاهل التكرار، ويعيد True إذا تم الإدراج فعلاً"""
+    values = {
+        'user_id': user_id,
+        'tool_name': tool_name,
+        'points_earned': points,
+        'date_earned': today
+    }
+    insert = upsert_insert(DailyPoints)
+    if insert is not None:
+        stmt = insert.values(**values).on_conflict_do_nothing(
+            index_elements=['user_id', 'tool_name', 'date_earned']
+        )
+        return db.session.execute(stmt).rowcount == 1
+
+    # قواعد بيانات أخرى: الاعتماد على القيد الفريد داخل نقطة حفظ
+    try:
+        with db.session.begin_nested():
+            db.session.execute(db.insert(DailyPoints).values(**values))
+        return True
+    except IntegrityError:
+        return False
+
+
+def award_points(user_id, tool_name, points=25):
+    """منح النقاط للمستخدم مرة واحدة يومياً لكل أداة بشكل ذري"""
+    try:
+        today = utc_today()
+        inserted = _insert_daily_points(user_id, tool_name, points, today)
+        new_total = None
+        if inserted:
+            record_tool_usage(tool_name, points, today)
+            stmt = db.update(User).where(User.id == user_id).values(
+                total_points=db.func.coalesce(User.total_points, 0) + points
+            ).execution_options(synchronize_session=False)
+            if db.session.get_bind().dialect.update_returning:
+                new_total = db.session.execute(stmt.returning(User.total_points)).scalar()
+            else:
+                db.session.execute(stmt)
+            leaderboard.record_change(user_id)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if inserted:
+        invalidate_user(user_id)
+        if new_total is not None:
+            leaderboard.update(user_id, new_total)
+        else:
+            leaderboard.add_points(user_id, points)
+        # النقاط هنا تزيد فقط، فمن بقي خارج القائمة العامة لم يغيّرها
+        rank = leaderboard.rank(user_id)
+        if rank is not None and rank <= TOP_SIZE:
+            response_cache.invalidate('leaderboard')
+    return inserted
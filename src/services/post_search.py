@@ -0,0 +1,228 @@
+import re
+import threading
+
+from src.models.user import db, Post
+from src.services.fts import fts5_supported, quote_phrase
+
+# التشكيل وعلامة الشدة والمدّ والتطويل
+_TASHKEEL_CHARS = '\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640'
+_TASHKEEL = re.compile(f'[{_TASHKEEL_CHARS}]')
+_KEPT = re.compile(f'[^{_TASHKEEL_CHARS}]', re.S)
+_LETTER_MAP = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',  # أشكال الألف
+    'ى': 'ي', 'ئ': 'ي',  # الألف المقصورة والياء المهموزة
+    'ؤ': 'و',
+    'ة': 'ه',  # التاء المربوطة
+})
+_WORD = re.compile(r'\w+')
+
+_COLUMNS = ('title_ar', 'content_ar', 'title_en', 'content_en')
+_LANGUAGE_COLUMNS = {
+    'ar': '{title_ar content_ar}',
+    'en': '{title_en content_en}',
+}
+
+_INDEX_DDL = """CREATE VIRTUAL TABLE IF NOT EXISTS post_search USING fts5(
+    title_ar, content_ar, title_en, content_en, tokenize='unicode61 remove_diacritics 2'
+)"""
+_INSERT = ('INSERT INTO post_search(rowid, title_ar, content_ar, title_en, content_en) '
+           'VALUES (:id, :title_ar, :content_ar, :title_en, :content_en)')
+_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'post_search'"
+
+# علامات highlight() داخل النص الموحّد (محارف تحكم لا تظهر في المنشورات)
+_OPEN, _CLOSE = '\x02', '\x03'
+SNIPPET_TOKENS = 12
+
+_lock = threading.Lock()
+_available = None
+
+
+def normalize_arabic(text):
+    """توحيد النص العربي: حذف التشكيل وتوحيد أشكال الألف والهمزة والياء والتاء المربوطة"""
+    if not text:
+        return ''
+    return _TASHKEEL.sub('', text).translate(_LETTER_MAP)
+
+
+def _indexed_values(row):
+    return {column: normalize_arabic(getattr(row, column)) for column in _COLUMNS}
+
+
+def ensure_index():
+    """هل فهرس البحث في المنشورات متاح
+
+    لا يُنشأ الفهرس هنا لأن الدالة تُستدعى داخل معاملات الكتابة (create_post و update_post)؛
+    يُنشئه الترحيل 0004 أو أمر flask posts rebuild-search. غياب الجدول لا يُحفظ حتى يظهر
+    الفهرس بعد إنشائه من عملية أخرى.
+    """
+    global _available
+    if _available is not None:
+        return _available
+
+    with _lock:
+        if _available is None:
+            if not fts5_supported():
+                _available = False
+            elif db.session.execute(db.text(_EXISTS)).first() is not None:
+                _available = True
+            else:
+                return False
+    return _available
+
+
+def _fill(connection, batch_size=1000):
+    connection.exec_driver_sql('DELETE FROM post_search')
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            db.select(Post.id, *(getattr(Post, column) for column in _COLUMNS))
+            .where(Post.is_active.is_(True), Post.id > last_id)
+            .order_by(Post.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        connection.execute(db.text(_INSERT), [{'id': row.id, **_indexed_values(row)} for row in rows])
+        last_id = rows[-1].id
+
+
+def create_index(engine=None):
+    """إنشاء فهرس البحث وتعبئته إن لم يكن موجوداً، على اتصال مستقل (من الترحيلات)
+
+    يعيد True إذا أُنشئ الفهرس.
+    """
+    if not fts5_supported():
+        return False
+    with (engine or db.engine).begin() as connection:
+        if connection.execute(db.text(_EXISTS)).first() is not None:
+            return False
+        connection.exec_driver_sql(_INDEX_DDL)
+        _fill(connection)
+    return True
+
+
+def rebuild_index():
+    """إعادة بناء فهرس المنشورات النشطة بالكامل على دفعات (وإنشاؤه إن لم يكن موجوداً)"""
+    global _available
+    if not fts5_supported():
+        return
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql(_INDEX_DDL)
+        _fill(connection)
+    _available = True
+
+
+def index_post(post):
+    """تحديث المنشور في الفهرس (ضمن المعاملة الحالية)؛ المنشورات غير النشطة تُزال"""
+    if not ensure_index():
+        return
+    remove_post(post.id)
+    if post.is_active:
+        db.session.execute(db.text(_INSERT), {'id': post.id, **_indexed_values(post)})
+
+
+def remove_post(post_id):
+    """إزالة المنشور من الفهرس (ضمن المعاملة الحالية)"""
+    if ensure_index():
+        db.session.execute(db.text('DELETE FROM post_search WHERE rowid = :id'), {'id': post_id})
+
+
+def _match_expression(query, language):
+    words = _WORD.findall(normalize_arabic(query))
+    if not words:
+        return None
+    expression = ' '.join(quote_phrase(word) + '*' for word in words)
+    columns = _LANGUAGE_COLUMNS.get(language)
+    return f'{columns} : ({expression})' if columns else expression
+
+
+def _match_spans(highlighted):
+    """مواضع المطابقات [(البداية، النهاية)] في النص الموحّد من مخرجات highlight()"""
+    spans = []
+    position = start = 0
+    for part in re.split(f'([{_OPEN}{_CLOSE}])', highlighted):
+        if part == _OPEN:
+            start = position
+        elif part == _CLOSE:
+            spans.append((start, position))
+        else:
+            position += len(part)
+    return spans
+
+
+def _snippet(text, spans):
+    """مقتطف من النص الأصلي (بتشكيله وإملائه) حول أول مطابقة مع تمييز المطابقات
+
+    التوحيد يحذف حروف التشكيل ويستبدل الباقي حرفاً بحرف، فكل موضع في النص الموحّد
+    يقابل موضعاً واحداً في النص الأصلي.
+    """
+    kept = [match.start() for match in _KEPT.finditer(text)]
+
+    def original(position, end=False):
+        # نهاية المطابقة تشمل علامات التشكيل التي تلي آخر حرف فيها
+        if end:
+            return kept[position] if position < len(kept) else len(text)
+        return kept[position]
+
+    tokens = [match.span() for match in _WORD.finditer(normalize_arabic(text))]
+    if not tokens:
+        return text
+    first = next((index for index, (_, end) in enumerate(tokens) if spans and end > spans[0][0]), 0)
+    start = max(0, min(first - 2, len(tokens) - SNIPPET_TOKENS))
+    stop = min(len(tokens), start + SNIPPET_TOKENS)
+    begin = 0 if start == 0 else original(tokens[start][0])
+    finish = len(text) if stop == len(tokens) else original(tokens[stop - 1][1], end=True)
+
+    parts = ['…'] if start > 0 else []
+    cursor = begin
+    for span_start, span_end in spans:
+        span_start, span_end = max(original(span_start), begin), min(original(span_end, end=True), finish)
+        if span_start >= span_end or span_start < cursor:
+            continue
+        parts += [text[cursor:span_start], '<mark>', text[span_start:span_end], '</mark>']
+        cursor = span_end
+    parts.append(text[cursor:finish])
+    if stop < len(tokens):
+        parts.append('…')
+    return ''.join(parts)
+
+
+def _best_snippet(post, highlighted, language):
+    """مقتطف العمود الذي فيه أكبر عدد من المطابقات (مثل snippet() في FTS5)"""
+    columns = _COLUMNS[:2] if language == 'ar' else _COLUMNS[2:] if language == 'en' else _COLUMNS
+    best = max(columns, key=lambda column: len(_match_spans(highlighted[_COLUMNS.index(column)] or '')))
+    text = getattr(post, best) or ''
+    return _snippet(text, _match_spans(highlighted[_COLUMNS.index(best)] or ''))
+
+
+def search_posts(query, language=None, limit=20):
+    """بحث مرتب في المنشورات النشطة، يعيد قائمة (المنشور، المقتطف)
+
+    الفهرس يحتوي النص الموحّد، أما المقتطف فيُبنى من النص الأصلي بمواضع المطابقات.
+    """
+    if ensure_index():
+        expression = _match_expression(query, language)
+        if expression is None:
+            return []
+        rows = db.session.execute(db.text(
+            """SELECT rowid,
+                      highlight(post_search, 0, :open, :close), highlight(post_search, 1, :open, :close),
+                      highlight(post_search, 2, :open, :close), highlight(post_search, 3, :open, :close)
+               FROM post_search
+               WHERE post_search MATCH :expression
+               ORDER BY bm25(post_search, 3.0, 1.0, 3.0, 1.0)
+               LIMIT :limit"""
+        ), {'expression': expression, 'limit': limit, 'open': _OPEN, 'close': _CLOSE}).all()
+        posts_by_id = {post.id: post for post in Post.query.filter(Post.id.in_([row[0] for row in rows])).all()} if rows else {}
+        return [
+            (posts_by_id[row[0]], _best_snippet(posts_by_id[row[0]], row[1:], language))
+            for row in rows if row[0] in posts_by_id
+        ]
+
+    # قاعدة بيانات بلا FTS5: بحث بسيط عن النص كما هو
+    columns = _COLUMNS[:2] if language == 'ar' else _COLUMNS[2:] if language == 'en' else _COLUMNS
+    posts = Post.query.filter(
+        Post.is_active.is_(True),
+        db.or_(*(getattr(Post, column).contains(query, autoescape=True) for column in columns))
+    ).order_by(Post.created_at.desc()).limit(limit).all()
+    return [(post, None) for post in posts]
@@ -0,0 +1,196 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import current_app, request, session
+
+LANGUAGES = ('ar', 'en')
+REVALIDATE = 'no-cache'
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TTL = 30
+ENTRY_OVERHEAD = 512  # تقدير لحجم المفتاح والترويسات والكائنات المرافقة لكل مدخل
+MAX_TRACKED_TAGS = 10000
+
+# وسوم إضافية يضيفها المسار أثناء تنفيذه (مثل منشورات الصفحة المعروضة)
+_extra_tags = ContextVar('response_cache_tags', default=None)
+
+
+class _Entry:
+    __slots__ = ('body', 'mimetype', 'etag', 'tags', 'size', 'expires_at')
+
+    def __init__(self, body, mimetype, etag, tags, expires_at):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = etag
+        self.tags = tags
+        self.size = len(body) + ENTRY_OVERHEAD
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """ذاكرة استجابات GET العامة مع ETag وحذف دقيق بالوسوم وحد أقصى للذاكرة (LRU)
+
+    كل مدخل موسوم بالبيانات التي بُني منها (مثل 'posts' و 'post:5')، ومسارات الكتابة
+    تحذف الوسوم التي تغيّرها فقط. الذاكرة محلية لكل عملية، فمدة الصلاحية تحدّ من
+    قِدم البيانات في العمال الآخرين.
+
+    الإعدادات:
+        RESPONSE_CACHE_ENABLED: تفعيل الذاكرة (الافتراضي True)
+        RESPONSE_CACHE_MAX_BYTES: الحد الأقصى لحجم الاستجابات المحفوظة (الافتراضي 32 ميجابايت)
+        RESPONSE_CACHE_TTL: مدة صلاحية المدخل بالثواني (الافتراضي 30)
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        self.enabled = True
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._tags = {}  # وسم -> مفاتيح المدخلات
+        self._sequence = 0  # يزيد مع كل عملية حذف
+        self._invalidated_at = {}  # وسم -> رقم آخر عملية حذف له
+        self._cleared_at = 0
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', True)
+        self.max_bytes = app.config.get('RESPONSE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', DEFAULT_TTL)
+
+    @property
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---------------------------------------------------------------- التخزين
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key, entry, started_at):
+        if entry.size > self.max_bytes // 8:
+            return
+        with self._lock:
+            # حُذف أحد الوسوم أثناء بناء الاستجابة، فقد تكون مبنية من بيانات قديمة
+            if self._cleared_at > started_at or \
+                    any(self._invalidated_at.get(tag, 0) > started_at for tag in entry.tags):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate(self, *tags):
+        """حذف كل المدخلات الموسومة بأي من الوسوم (يُستدعى بعد تثبيت التعديل)"""
+        with self._lock:
+            self._sequence += 1
+            for tag in tags:
+                self._invalidated_at[tag] = self._sequence
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+            if len(self._invalidated_at) > MAX_TRACKED_TAGS:
+                # نسيان أرقام الحذف القديمة آمن إذا اعتُبرت كل الاستجابات الجارية قديمة
+                self._invalidated_at.clear()
+                self._cleared_at = self._sequence
+
+    def clear(self):
+        with self._lock:
+            self._sequence += 1
+            # الاستجابات الجارية بناؤها الآن لن تُحفظ أياً كانت وسومها
+            self._cleared_at = self._sequence
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    # ---------------------------------------------------------------- المسارات
+
+    def tag(self, *tags):
+        """إضافة وسوم للاستجابة الجاري بناؤها (مثل معرّفات المنشورات المعروضة)"""
+        pending = _extra_tags.get()
+        if pending is not None:
+            pending.update(tags)
+
+    def _respond(self, entry, hit):
+        if request.if_none_match.contains(entry.etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(entry.body, mimetype=entry.mimetype)
+        response.set_etag(entry.etag)
+        response.headers['Cache-Control'] = REVALIDATE
+        response.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+        response.vary.add('Accept-Language')
+        return response
+
+    def cached(self, *tags, anonymous_only=False):
+        """تخزين استجابة المسار حسب (المسار، معاملات الاستعلام، اللغة)
+
+        tags: وسوم المدخل، ويمكن أن تحتوي معاملات المسار مثل 'post:{post_id}'.
+        anonymous_only: للمسارات التي تختلف استجابتها للمستخدم المسجل، فلا تُخزَّن إلا للزوار.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or request.method != 'GET' or (anonymous_only and session.get('user_id')):
+                    return view(*args, **kwargs)
+
+                # اللغة جزء من المفتاح حتى تبقى الاستجابات المترجمة صحيحة
+                language = request.accept_languages.best_match(LANGUAGES, default=LANGUAGES[0])
+                key = (request.path, tuple(sorted(request.args.items(multi=True))), language)
+                entry = self._get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return self._respond(entry, hit=True)
+
+                self.misses += 1
+                base_tags = tuple(tag.format(**kwargs) for tag in tags)
+                started_at = self._sequence
+                pending = set()
+                token = _extra_tags.set(pending)
+                try:
+                    response = current_app.make_response(view(*args, **kwargs))
+                finally:
+                    _extra_tags.reset(token)
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+
+                body = response.get_data()
+                entry = _Entry(
+                    body, response.mimetype, hashlib.blake2b(body, digest_size=16).hexdigest(),
+                    base_tags + tuple(pending - set(base_tags)), time.monotonic() + self.ttl
+                )
+                self._put(key, entry, started_at)
+                return self._respond(entry, hit=False)
+            return wrapper
+        return decorator
+
+
+response_cache = ResponseCache()
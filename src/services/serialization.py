@@ -0,0 +1,205 @@
+import json
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+from src.models.user import db, User, Post, Comment, UserImage, Task
+
+try:
+    import orjson
+except ImportError:  # اختياري: بدونه يُستخدم مرمّز json القياسي
+    orjson = None
+
+# بايتات UTF-8 للحروف التي لا يهرّبها backslashreplace كما يهرّبها json: 0x7f و
+# U+0080..U+00FF (تبدأ بـ 0xC2 أو 0xC3) وما بعد U+FFFF (تبدأ بـ 0xF0..0xF4)
+_UNSAFE_BYTES = (b'\x7f', b'\xc2', b'\xc3', b'\xf0', b'\xf1', b'\xf2', b'\xf3', b'\xf4')
+
+
+# ---------------------------------------------------------------- الأعمدة
+
+def fetch(statement):
+    """تنفيذ select() على اتصال الجلسة مباشرة: صفوف Core بلا identity map ولا محمّل ORM"""
+    return db.session.connection().execute(statement).all()
+
+
+def iso_timestamp(column):
+    """نص مطابق لـ datetime.isoformat() يُحسب في SQL بدلاً من تحويل كل صف في Python
+
+    يُعاد بالاسم نفسه (column.key) حتى يعمل معه paginate في حساب المؤشر. في قواعد
+    البيانات الأخرى يُعاد العمود كما هو ويُحوَّل في Python.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # يخزن SQLAlchemy التاريخ كـ 'YYYY-MM-DD HH:MM:SS.ffffff' دائماً، و isoformat يحذف الكسر الصفري
+        fraction = db.func.substr(column, 21, 6)
+        expression = db.func.replace(db.func.substr(column, 1, 19), ' ', 'T') + db.case(
+            (fraction.in_(('', '000000')), ''), else_='.' + fraction
+        )
+    elif dialect == 'postgresql':
+        microseconds = db.func.to_char(column, 'US')
+        expression = db.func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS') + db.case(
+            (microseconds == '000000', ''), else_='.' + microseconds
+        )
+    else:
+        return column
+    return db.case((column.is_(None), None), else_=expression).label(column.key)
+
+
+def _iso(value):
+    return value if value is None or isinstance(value, str) else value.isoformat()
+
+
+def _username(user_id):
+    """اسم صاحب الصف كاستعلام فرعي (بحث بالمفتاح الأساسي) حتى يبقى الاستعلام على جدول واحد"""
+    return db.select(User.username).where(User.id == user_id).scalar_subquery().label('username')
+
+
+def user_columns():
+    return (User.id, User.username, User.email, User.total_points, User.is_admin,
+            User.preferred_language, iso_timestamp(User.created_at))
+
+
+def post_columns():
+    return (Post.id, Post.title_ar, Post.title_en, Post.content_ar, Post.content_en,
+            iso_timestamp(Post.created_at), Post.is_active, Post.comments_count)
+
+
+def comment_columns():
+    return (Comment.id, Comment.content, Comment.user_id, _username(Comment.user_id), Comment.post_id,
+            iso_timestamp(Comment.created_at), Comment.is_approved)
+
+
+def image_columns():
+    return (UserImage.id, UserImage.user_id, _username(UserImage.user_id), UserImage.image_path,
+            iso_timestamp(UserImage.upload_date), iso_timestamp(UserImage.expiry_date),
+            UserImage.is_approved, UserImage.is_active)
+
+
+def task_columns():
+    return (Task.id, Task.user_id, Task.title, Task.description, Task.is_completed,
+            iso_timestamp(Task.created_at), iso_timestamp(Task.completed_at))
+
+
+# ---------------------------------------------------------------- الصفوف
+# كل دالة تطابق to_dict في النموذج المقابل مفتاحاً بمفتاح
+
+def users(rows):
+    return [
+        {
+            'id': id,
+            'username': username,
+            'email': email,
+            'total_points': total_points,
+            'is_admin': is_admin,
+            'preferred_language': preferred_language,
+            'can_use_advanced_titles': total_points >= 200,
+            'can_use_image_feature': total_points >= 500
+        }
+        for id, username, email, total_points, is_admin, preferred_language, _ in rows
+    ]
+
+
+def posts(rows):
+    return [
+        {
+            'id': id,
+            'title_ar': title_ar,
+            'title_en': title_en,
+            'content_ar': content_ar,
+            'content_en': content_en,
+            'created_at': _iso(created_at),
+            'is_active': is_active,
+            'comments_count': comments_count or 0
+        }
+        for id, title_ar, title_en, content_ar, content_en, created_at, is_active, comments_count in rows
+    ]
+
+
+def comments(rows):
+    return [
+        {
+            'id': id,
+            'content': content,
+            'user_id': user_id,
+            'username': username,
+            'post_id': post_id,
+            'created_at': _iso(created_at),
+            'is_approved': is_approved
+        }
+        for id, content, user_id, username, post_id, created_at, is_approved in rows
+    ]
+
+
+def images(rows):
+    return [
+        {
+            'id': id,
+            'user_id': user_id,
+            'username': username,
+            'image_path': image_path,
+            'upload_date': _iso(upload_date),
+            'expiry_date': _iso(expiry_date),
+            'is_approved': is_approved,
+            'is_active': is_active
+        }
+        for id, user_id, username, image_path, upload_date, expiry_date, is_approved, is_active in rows
+    ]
+
+
+def tasks(rows):
+    return [
+        {
+            'id': id,
+            'user_id': user_id,
+            'title': title,
+            'description': description,
+            'is_completed': is_completed,
+            'created_at': _iso(created_at),
+            'completed_at': _iso(completed_at) if completed_at else None
+        }
+        for id, user_id, title, description, is_completed, created_at, completed_at in rows
+    ]
+
+
+# ---------------------------------------------------------------- الترميز
+
+def _ascii_only(data):
+    """تحويل مخرجات orjson (UTF-8) إلى ما يكتبه json مع ensure_ascii، أو None إن تعذر ضمان التطابق
+
+    backslashreplace يكتب \\uXXXX كما يكتبه json لكل الحروف من U+0100 إلى U+FFFF،
+    ويختلف عنه في الحرف 0x7f وفي U+0080..U+00FF (\\xNN) وما بعد U+FFFF (\\UNNNNNNNN)،
+    وهذه تُكشف من بايتاتها الأولى في UTF-8 دون فك النص.
+    """
+    if data.isascii():
+        return None if b'\x7f' in data else data
+    if any(byte in data for byte in _UNSAFE_BYTES):
+        return None
+    return data.decode().encode('ascii', 'backslashreplace')
+
+
+def dumps(obj, ensure_ascii=True, sort_keys=True):
+    """ترميز JSON مضغوط مطابق بايتاً ببايت لـ json.dumps بإعدادات jsonify
+
+    يُستخدم orjson إن كان مثبتاً وكانت نتيجته مطابقة حتماً، وإلا المرمّز القياسي.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:  # نوع لا يدعمه orjson (مثل الأعداد الأكبر من 64 بت)
+            data = None
+        if data is not None and ensure_ascii:
+            data = _ascii_only(data)
+        if data is not None:
+            return data
+    return json.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, separators=(',', ':')).encode()
+
+
+def json_response(obj):
+    """بديل jsonify لقوائم كبيرة بنفس الاستجابة تماماً"""
+    provider = current_app.json
+    pretty = (provider.compact is None and current_app.debug) or provider.compact is False
+    if pretty or type(provider) is not DefaultJSONProvider:
+        return provider.response(obj)
+    return current_app.response_class(
+        dumps(obj, provider.ensure_ascii, provider.sort_keys) + b'\n', mimetype=provider.mimetype
+    )
@@ -0,0 +1,90 @@
+from functools import wraps
+from urllib.parse import quote
+
+from flask import current_app
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src.models.user import db
+
+# تُطبَّق على كل اتصال جديد؛ journal_mode للكاتب فقط لأنه يتطلب صلاحية الكتابة
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64000,
+    'temp_store': 'MEMORY',
+}
+WRITER_ONLY_PRAGMAS = ('journal_mode',)
+
+
+def _is_file_database(url):
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:') \
+        and url.query.get('mode') != 'memory'
+
+
+def _install_pragmas(engine, pragmas):
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+
+def init_app(app):
+    """تفعيل إعدادات SQLite للإنتاج وإنشاء مجموعة اتصالات للقراءة فقط
+
+    الإعدادات:
+        SQLITE_TUNING: تفعيل الإعدادات (الافتراضي True)
+        SQLITE_PRAGMAS: قيم تطغى على DEFAULT_PRAGMAS
+        SQLITE_READ_POOL: تفعيل مجموعة القراءة (الافتراضي True)
+        SQLITE_READ_POOL_SIZE: عدد اتصالات القراءة الدائمة (الافتراضي 10)
+    """
+    with app.app_context():
+        engine = db.engine
+    if not app.config.get('SQLITE_TUNING', True) or not _is_file_database(engine.url):
+        return
+
+    pragmas = dict(DEFAULT_PRAGMAS, **app.config.get('SQLITE_PRAGMAS', {}))
+    _install_pragmas(engine, pragmas)
+
+    if not app.config.get('SQLITE_READ_POOL', True):
+        return
+    # اتصالات mode=ro لا تأخذ قفل الكتابة أبداً، ومع WAL لا يحجبها الكاتب
+    read_url = f'sqlite:///file:{quote(engine.url.database)}?mode=ro&uri=true'
+    read_engine = create_engine(read_url, pool_size=app.config.get('SQLITE_READ_POOL_SIZE', 10))
+    _install_pragmas(read_engine, {
+        name: value for name, value in pragmas.items() if name not in WRITER_ONLY_PRAGMAS
+    })
+    app.extensions['sqlite_read_engine'] = read_engine
+
+
+def read_only(view):
+    """تنفيذ المسار على جلسة من مجموعة القراءة فقط (إن كانت مفعّلة)
+
+    يُستبدل db.session خلال المسار بجلسة مربوطة بمحرك القراءة ثم تُعاد الجلسة الأصلية،
+    فلا يحتاج كود المسار إلى أي تعديل.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        read_engine = current_app.extensions.get('sqlite_read_engine')
+        if read_engine is None:
+            return view(*args, **kwargs)
+
+        registry = db.session.registry
+        previous = registry() if registry.has() else None
+        session = Session(bind=read_engine)
+        registry.set(session)
+        try:
+            return view(*args, **kwargs)
+        finally:
+            session.close()
+            if previous is not None:
+                registry.set(previous)
+            else:
+                registry.clear()
+    return wrapper
@@ -0,0 +1,197 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+import click
+from flask import current_app, request, send_file
+
+try:
+    import brotli
+except ImportError:  # اختياري: بدونه يُقدَّم gzip فقط (أو ملفات .br المضغوطة مسبقاً)
+    brotli = None
+
+# ملفات Vite التي يتضمن اسمها بصمة المحتوى (مثل assets/index-Cw8tCNvj.js)
+HASHED_NAME = re.compile(r'^assets/.+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$')
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml')
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+MIN_COMPRESS_SIZE = 256
+MIN_SAVING_RATIO = 0.9
+
+
+def _compressible(mimetype):
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _compress(encoding, data):
+    if encoding == 'gzip':
+        # mtime=0 ليبقى الناتج ثابتاً بين التشغيلات
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=11)
+    return None
+
+
+def _fresh(path, compressed_path):
+    """النسخة المضغوطة على القرص موجودة وليست أقدم من الملف الأصلي"""
+    return os.path.isfile(compressed_path) and os.path.getmtime(compressed_path) >= os.path.getmtime(path)
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class StaticAsset:
+    """ملف ثابت واحد مع بصمته ونسخه المضغوطة"""
+
+    __slots__ = ('name', 'path', 'mimetype', 'etag', 'cache_control', 'data', 'variants')
+
+    def __init__(self, name, path, mimetype, etag, cache_control, data=None):
+        self.name = name
+        self.path = path
+        self.mimetype = mimetype
+        self.etag = etag
+        self.cache_control = cache_control
+        self.data = data
+        # الترميز -> (المحتوى، البصمة)
+        self.variants = {}
+
+    def negotiate(self):
+        """أفضل ترميز يقبله العميل ومتوفر لهذا الملف، أو None للمحتوى الأصلي"""
+        accepted = request.accept_encodings
+        for encoding, _ in ENCODINGS:
+            if encoding in self.variants and accepted.quality(encoding) > 0:
+                return encoding
+        return None
+
+
+class StaticAssets:
+    """تقديم ملفات الواجهة من فهرس في الذاكرة يُبنى مرة واحدة
+
+    - الملفات الصغيرة تُحفظ في الذاكرة مع نسخ gzip/brotli محسوبة مسبقاً
+    - ملفات .gz/.br المجاورة (من أمر compress-static وقت البناء) تُستخدم إن وُجدت
+    - الملفات ذات البصمة في اسمها تُخزَّن في المتصفح سنة كاملة (immutable)،
+      وغيرها يُعاد التحقق منها عبر ETag قوي
+    - أي مسار غير موجود في الفهرس يُعاد له index.html دون الرجوع لنظام الملفات
+
+    الإعدادات:
+        STATIC_MEMORY_MAX_BYTES: أقصى حجم لملف يُحفظ في الذاكرة (الافتراضي 1MB)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assets = None
+        self.folder = None
+        self.max_memory_bytes = 1024 * 1024
+
+    def init_app(self, app, folder=None):
+        self.folder = folder or app.static_folder
+        self.max_memory_bytes = app.config.get('STATIC_MEMORY_MAX_BYTES', self.max_memory_bytes)
+        app.cli.command('compress-static')(_compress_static_command)
+
+    def _scan(self):
+        assets = {}
+        if not self.folder or not os.path.isdir(self.folder):
+            return assets
+        for root, _, files in os.walk(self.folder):
+            for filename in files:
+                if filename.endswith(('.gz', '.br')):
+                    continue
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, self.folder).replace(os.sep, '/')
+                assets[name] = self._build(name, path)
+        return assets
+
+    def _build(self, name, path):
+        data = _read(path)
+        mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        etag = hashlib.sha256(data).hexdigest()[:20]
+        cache_control = IMMUTABLE if HASHED_NAME.match(name) else REVALIDATE
+        in_memory = len(data) <= self.max_memory_bytes
+        asset = StaticAsset(name, path, mimetype, etag, cache_control, data if in_memory else None)
+
+        if not _compressible(mimetype) or len(data) < MIN_COMPRESS_SIZE:
+            return asset
+        for encoding, suffix in ENCODINGS:
+            compressed = _read(path + suffix) if _fresh(path, path + suffix) else None
+            if compressed is None and in_memory:
+                compressed = _compress(encoding, data)
+            if compressed is not None and len(compressed) < len(data) * MIN_SAVING_RATIO:
+                asset.variants[encoding] = (compressed, f'{etag}-{encoding}')
+        return asset
+
+    def assets(self):
+        if self._assets is None:
+            with self._lock:
+                if self._assets is None:
+                    self._assets = self._scan()
+        return self._assets
+
+    def reload(self):
+        with self._lock:
+            self._assets = None
+
+    def get(self, name):
+        return self.assets().get(name)
+
+    def serve(self, name, fallback='index.html'):
+        """استجابة الملف المطلوب أو ملف الواجهة البديل، أو None إن لم يوجد أي منهما"""
+        asset = self.get(name)
+        if asset is None and fallback and not os.path.splitext(name)[1]:
+            # مسارات تطبيق الصفحة الواحدة (React Router) تُعاد لها الصفحة الرئيسية
+            asset = self.get(fallback)
+        if asset is None:
+            return None
+
+        encoding = asset.negotiate()
+        data, etag = asset.variants[encoding] if encoding else (asset.data, asset.etag)
+
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+        elif data is not None:
+            response = current_app.response_class(data, mimetype=asset.mimetype)
+        else:
+            response = send_file(asset.path, mimetype=asset.mimetype, conditional=False, etag=False)
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = asset.cache_control
+        if asset.variants:
+            response.vary.add('Accept-Encoding')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        return response
+
+
+static_assets = StaticAssets()
+
+
+@click.option('--force', is_flag=True, help='إعادة ضغط الملفات حتى لو كانت نسخها المضغوطة موجودة')
+def _compress_static_command(force):
+    """إنشاء نسخ .gz و .br بجانب ملفات الواجهة (خطوة وقت البناء)"""
+    written = 0
+    for root, _, files in os.walk(static_assets.folder):
+        for filename in files:
+            if filename.endswith(('.gz', '.br')):
+                continue
+            path = os.path.join(root, filename)
+            mimetype = mimetypes.guess_type(filename)[0] or ''
+            if not _compressible(mimetype) or os.path.getsize(path) < MIN_COMPRESS_SIZE:
+                continue
+            data = _read(path)
+            for encoding, suffix in ENCODINGS:
+                if _fresh(path, path + suffix) and not force:
+                    continue
+                compressed = _compress(encoding, data)
+                if compressed is not None and len(compressed) < len(data) * MIN_SAVING_RATIO:
+                    with open(path + suffix, 'wb') as f:
+                        f.write(compressed)
+                    written += 1
+    if brotli is None:
+        click.echo('تنبيه: مكتبة brotli غير مثبتة، تم إنشاء نسخ gzip فقط')
+    click.echo(f'تم إنشاء {written} ملفاً مضغوطاً')
+    static_assets.reload()
@@ -0,0 +1,116 @@
+from functools import lru_cache
+
+LANGUAGES = ('ar', 'en')
+BASIC_STYLE = 'basic'
+ADVANCED_STYLES = ('professional', 'creative', 'academic', 'marketing')
+DEFAULT_ADVANCED_STYLE = 'professional'
+MAX_TOPIC_LENGTH = 200
+MAX_BATCH_TOPICS = 500
+CACHE_SIZE = 4096
+
+# قوالب العناوين حسب (اللغة، الأسلوب)؛ {topic} يُستبدل بالموضوع
+TEMPLATES = {
+    ('ar', 'basic'): (
+        "🚀 {topic}: دليلك الشامل للنجاح",
+        "💡 أسرار {topic} التي لم تعرفها من قبل",
+        "🔥 كيف تتقن {topic} في 7 خطوات بسيطة",
+        "⭐ {topic}: الطريق إلى الاحتراف",
+        "🎯 تعلم {topic} واحصل على النتائج المذهلة",
+    ),
+    ('en', 'basic'): (
+        "🚀 {topic}: Your Complete Guide to Success",
+        "💡 {topic} Secrets You Never Knew Before",
+        "🔥 Master {topic} in 7 Simple Steps",
+        "⭐ {topic}: The Path to Professionalism",
+        "🎯 Learn {topic} and Get Amazing Results",
+    ),
+    ('ar', 'professional'): (
+        "📊 تحليل شامل: {topic} وتأثيره على السوق (تقييم: 9/10)",
+        "🎓 دليل الخبراء: إتقان {topic} بمنهجية علمية (تقييم: 10/10)",
+        "💼 استراتيجية احترافية: {topic} للمؤسسات الناجحة (تقييم: 9/10)",
+        "🔬 دراسة متعمقة: {topic} والابتكار التقني (تقييم: 8/10)",
+        "📈 تطبيق عملي: {topic} لتحقيق النمو المستدام (تقييم: 9/10)",
+    ),
+    ('en', 'professional'): (
+        "📊 In-Depth Analysis: {topic} and Its Market Impact (Rating: 9/10)",
+        "🎓 Expert Guide: Mastering {topic} with a Proven Method (Rating: 10/10)",
+        "💼 Professional Strategy: {topic} for Successful Organizations (Rating: 9/10)",
+        "🔬 Deep Dive: {topic} and Technical Innovation (Rating: 8/10)",
+        "📈 Practical Playbook: {topic} for Sustainable Growth (Rating: 9/10)",
+    ),
+    ('ar', 'creative'): (
+        "🎨 {topic} كما لم تره من قبل",
+        "✨ رحلة ملهمة في عالم {topic}",
+        "🌈 {topic}: حين يلتقي الخيال بالواقع",
+        "🧩 القطعة المفقودة في {topic}",
+        "🎭 قصة {topic} التي ستغير نظرتك",
+    ),
+    ('en', 'creative'): (
+        "🎨 {topic} Like You've Never Seen It Before",
+        "✨ An Inspiring Journey into {topic}",
+        "🌈 {topic}: Where Imagination Meets Reality",
+        "🧩 The Missing Piece of {topic}",
+        "🎭 The {topic} Story That Will Change Your Mind",
+    ),
+    ('ar', 'academic'): (
+        "📚 {topic}: مراجعة منهجية للأدبيات الحديثة",
+        "🔍 العوامل المؤثرة في {topic}: دراسة تحليلية",
+        "🧪 {topic} بين النظرية والتطبيق",
+        "📐 إطار مفاهيمي لفهم {topic}",
+        "🏛️ {topic}: الأصول والتطور والآفاق المستقبلية",
+    ),
+    ('en', 'academic'): (
+        "📚 {topic}: A Systematic Review of Recent Literature",
+        "🔍 Factors Influencing {topic}: An Analytical Study",
+        "🧪 {topic} Between Theory and Practice",
+        "📐 A Conceptual Framework for Understanding {topic}",
+        "🏛️ {topic}: Origins, Evolution and Future Directions",
+    ),
+    ('ar', 'marketing'): (
+        "🔥 لا تفوّت هذا: {topic} بطريقة مختلفة تماماً",
+        "💰 كيف يضاعف {topic} أرباحك هذا العام",
+        "⚡ {topic} في 5 دقائق فقط",
+        "🏆 لماذا يختار الناجحون {topic}؟",
+        "🎁 كل ما تحتاجه عن {topic} مجاناً",
+    ),
+    ('en', 'marketing'): (
+        "🔥 Don't Miss This: {topic} Done Completely Differently",
+        "💰 How {topic} Can Double Your Revenue This Year",
+        "⚡ {topic} in Just 5 Minutes",
+        "🏆 Why Top Performers Choose {topic}",
+        "🎁 Everything You Need to Know About {topic}, Free",
+    ),
+}
+
+_compiled = None
+
+
+def _compile():
+    """تقسيم كل قالب مرة واحدة إلى أجزاء ثابتة يُدرج الموضوع بينها"""
+    global _compiled
+    if _compiled is None:
+        _compiled = {
+            key: tuple(
+                (f"{i}. ", template.split('{topic}'))
+                for i, template in enumerate(templates, 1)
+            )
+            for key, templates in TEMPLATES.items()
+        }
+    return _compiled
+
+
+def normalize_language(language):
+    return 'ar' if language == 'ar' else 'en'
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def render_titles(topic, language, style=BASIC_STYLE):
+    """العناوين المرقّمة للموضوع كنص واحد (النتيجة محفوظة في ذاكرة LRU محدودة)"""
+    return "\n".join(
+        number + topic.join(parts)
+        for number, parts in _compile()[(normalize_language(language), style)]
+    )
+
+
+def render_batch(topics, language, style=BASIC_STYLE):
+    return [{'topic': topic, 'titles': render_titles(topic, language, style)} for topic in topics]
@@ -0,0 +1,36 @@
+import threading
+import time
+
+from src.models.user import Tool
+
+
+class ToolCatalog:
+    """ذاكرة مؤقتة محلية للأدوات النشطة تُحدَّث عند تعديل الأدوات أو بعد انتهاء المهلة"""
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._tools = None
+        self._loaded_at = 0.0
+
+    def active_tools(self):
+        """قائمة الأدوات النشطة كقواميس (للقراءة فقط)"""
+        tools = self._tools
+        if tools is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return tools
+
+        with self._lock:
+            if self._tools is None or time.monotonic() - self._loaded_at >= self.ttl:
+                self._tools = tuple(
+                    tool.to_dict()
+                    for tool in Tool.query.filter_by(is_active=True).order_by(Tool.id).all()
+                )
+                self._loaded_at = time.monotonic()
+            return self._tools
+
+    def invalidate(self):
+        with self._lock:
+            self._tools = None
+
+
+tool_catalog = ToolCatalog()
@@ -0,0 +1,18 @@
+from src.models.user import db
+
+
+def _dialect_insert(name):
+    # تُستورد اللهجة المستخدمة فقط عند أول حاجة (استيراد postgresql وحده يكلف عشرات الميلي ثانية)
+    if name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    if name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    return None
+
+
+def upsert_insert(model):
+    """جملة INSERT تدعم ON CONFLICT للّهجة الحالية، أو None إذا لم تكن مدعومة"""
+    insert = _dialect_insert(db.session.get_bind().dialect.name)
+    return insert(model) if insert is not None else None
@@ -0,0 +1,197 @@
+import csv
+import json
+import os
+from concurrent import futures
+from itertools import islice, repeat
+
+from werkzeug.security import generate_password_hash
+
+from src.models.user import db, User
+from src.services.analytics import record_signup
+from src.services.leaderboard import leaderboard
+from src.services.passwords import hasher
+from src.services.response_cache import response_cache
+from src.services.upsert import upsert_insert
+
+MAX_REPORTED_CONFLICTS = 1000
+# حد الاستيراد عبر HTTP: كل سجل يكلف تجزئة كاملة (~0.15 ثانية بـ scrypt على نواة واحدة)
+# فيجب أن ينتهي الطلب قبل مهلة gunicorn (30 ثانية)؛ الملفات الأكبر تُستورد بأمر flask admin import-users
+DEFAULT_MAX_HTTP_ROWS = 100
+
+
+def iter_records(stream, fmt):
+    """قراءة السجلات من ملف CSV أو NDJSON سطراً بسطر، يعيد (رقم السطر، السجل)"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield line_number, record if isinstance(record, dict) else None
+
+
+def limit_records(records, limit):
+    """قراءة السجلات في قائمة، أو None إن تجاوز عددها الحد (قبل تجزئة أي كلمة مرور)"""
+    records = list(islice(records, limit + 1))
+    return None if len(records) > limit else records
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ImportReport:
+    def __init__(self):
+        self.processed = 0
+        self.imported = 0
+        self.conflicts = 0
+        self.details = []
+
+    def conflict(self, line, username, reason):
+        self.conflicts += 1
+        if len(self.details) < MAX_REPORTED_CONFLICTS:
+            self.details.append({'line': line, 'username': username, 'reason': reason})
+
+    def to_dict(self):
+        return {
+            'processed': self.processed,
+            'imported': self.imported,
+            'conflicts': self.conflicts,
+            'conflict_details': self.details
+        }
+
+
+def _validate(batch, report):
+    """استبعاد السجلات الناقصة والمكررة داخل الدفعة"""
+    valid = []
+    seen_usernames, seen_emails = set(), set()
+    for line, record in batch:
+        report.processed += 1
+        if record is None:
+            report.conflict(line, None, 'invalid_record')
+            continue
+        username = str(record.get('username') or '').strip()
+        email = str(record.get('email') or '').strip()
+        password = str(record.get('password') or '').strip()
+        if not username or not email or not password:
+            report.conflict(line, username or None, 'missing_fields')
+        elif username in seen_usernames:
+            report.conflict(line, username, 'username_exists')
+        elif email in seen_emails:
+            report.conflict(line, username, 'email_exists')
+        else:
+            seen_usernames.add(username)
+            seen_emails.add(email)
+            language = record.get('language') or record.get('preferred_language') or 'ar'
+            valid.append((line, username, email, password, language if language in ('ar', 'en') else 'ar'))
+    return valid
+
+
+def _drop_existing(rows, report):
+    """استبعاد من يوجد اسمه أو بريده في قاعدة البيانات باستعلام واحد للدفعة"""
+    if not rows:
+        return rows
+    usernames = [row[1] for row in rows]
+    emails = [row[2] for row in rows]
+    existing_usernames, existing_emails = set(), set()
+    for username, email in db.session.execute(
+        db.select(User.username, User.email).where(
+            db.or_(User.username.in_(usernames), User.email.in_(emails))
+        )
+    ):
+        existing_usernames.add(username)
+        existing_emails.add(email)
+
+    remaining = []
+    for row in rows:
+        if row[1] in existing_usernames:
+            report.conflict(row[0], row[1], 'username_exists')
+        elif row[2] in existing_emails:
+            report.conflict(row[0], row[1], 'email_exists')
+        else:
+            remaining.append(row)
+    return remaining
+
+
+def _insert(rows, hashes):
+    values = [
+        {
+            'username': username,
+            'email': email,
+            'password_hash': password_hash,
+            'preferred_language': language,
+            'total_points': 0,
+            'is_admin': False
+        }
+        for (_, username, email, _, language), password_hash in zip(rows, hashes)
+    ]
+    table = User.__table__
+    insert = upsert_insert(table)
+    if insert is None:
+        db.session.execute(db.insert(table), values)
+        return len(values)
+
+    # حماية من السباق مع التسجيل المتزامن. rowcount لا يصلح للعد مع executemany
+    # (في psycopg يكون -1 أو يخص آخر دفعة)، فيُعدّ المُدرج فعلاً من RETURNING
+    insert = insert.on_conflict_do_nothing()
+    if db.session.get_bind().dialect.insert_executemany_returning:
+        return len(db.session.execute(insert.returning(table.c.id), values).all())
+    count = db.select(db.func.count()).select_from(table)
+    before = db.session.execute(count).scalar()
+    db.session.execute(insert, values)
+    return db.session.execute(count).scalar() - before
+
+
+def import_users(records, batch_size=1000, workers=None, method=None):
+    """استيراد المستخدمين على دفعات مع تجزئة كلمات المرور بالتوازي
+
+    تُستخدم طريقة التجزئة نفسها المعتمدة في التطبيق (PASSWORD_HASH_METHOD) ما لم تُمرَّر
+    method صراحة؛ الطريقة الأضعف اختيار صريح يُرقّى عند أول تسجيل دخول لكل مستخدم.
+    """
+    report = ImportReport()
+    method = method or hasher.method()
+    workers = workers or os.cpu_count() or 1
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in _batches(records, batch_size):
+            rows = _drop_existing(_validate(batch, report), report)
+            if not rows:
+                continue
+            hashes = list(executor.map(
+                generate_password_hash,
+                [row[3] for row in rows],
+                repeat(method),
+                chunksize=max(1, len(rows) // (workers * 4))
+            ))
+            try:
+                inserted = _insert(rows, hashes)
+                record_signup(count=inserted)
+                if inserted:
+                    leaderboard.record_change()
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            report.imported += inserted
+            skipped = len(rows) - inserted
+            if skipped:
+                report.conflicts += skipped
+
+    if report.imported:
+        leaderboard.invalidate()
+        response_cache.invalidate('leaderboard')
+    return report
@@ -0,0 +1,123 @@
+import threading
+
+from src.models.user import db, User
+from src.services.fts import fts5_supported, quote_phrase
+
+# فهرس FTS5 بمقطّع ثلاثي الأحرف (trigram) فوق اسم المستخدم والبريد الإلكتروني.
+# يبقى متزامناً مع جدول المستخدمين عبر محفزات على مستوى قاعدة البيانات،
+# لذلك يشمل التسجيل وتحديث الملف الشخصي والحذف وأي إدراج مباشر.
+_INDEX_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS user_search USING fts5(
+        username, email, content='user', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS user_search_ai AFTER INSERT ON "user" BEGIN
+        INSERT INTO user_search(rowid, username, email) VALUES (new.id, new.username, new.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS user_search_ad AFTER DELETE ON "user" BEGIN
+        INSERT INTO user_search(user_search, rowid, username, email) VALUES ('delete', old.id, old.username, old.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS user_search_au AFTER UPDATE OF username, email ON "user" BEGIN
+        INSERT INTO user_search(user_search, rowid, username, email) VALUES ('delete', old.id, old.username, old.email);
+        INSERT INTO user_search(rowid, username, email) VALUES (new.id, new.username, new.email);
+    END""",
+]
+
+_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_search'"
+_REBUILD = "INSERT INTO user_search(user_search) VALUES ('rebuild')"
+
+# أقصر نص يمكن لمقطّع trigram مطابقته
+MIN_INDEXED_LENGTH = 3
+
+_lock = threading.Lock()
+_available = None
+
+
+def ensure_index():
+    """هل فهرس البحث عن المستخدمين متاح
+
+    لا يُنشأ الفهرس هنا لأن بناءه الأول يمر على كل المستخدمين ويحجز الكتابة؛ يُنشئه
+    الترحيل 0006 أو أمر flask admin rebuild-user-search. غياب الجدول لا يُحفظ حتى يظهر
+    الفهرس بعد إنشائه من عملية أخرى، وحتى ذلك الحين يُستخدم البحث بـ LIKE.
+    """
+    global _available
+    if _available is not None:
+        return _available
+
+    with _lock:
+        if _available is None:
+            if not fts5_supported():
+                _available = False
+            elif db.session.execute(db.text(_EXISTS)).first() is not None:
+                _available = True
+            else:
+                return False
+    return _available
+
+
+def _create(connection, rebuild):
+    for statement in _INDEX_DDL:
+        connection.exec_driver_sql(statement)
+    if rebuild:
+        connection.exec_driver_sql(_REBUILD)
+
+
+def create_index(engine=None):
+    """إنشاء فهرس البحث ومحفزاته وبناؤه إن لم يكن موجوداً، على اتصال مستقل (من الترحيلات)
+
+    يعيد True إذا أُنشئ الفهرس.
+    """
+    if not fts5_supported():
+        return False
+    with (engine or db.engine).begin() as connection:
+        if connection.execute(db.text(_EXISTS)).first() is not None:
+            return False
+        _create(connection, rebuild=True)
+    return True
+
+
+def rebuild_index():
+    """إعادة بناء فهرس البحث بالكامل من جدول المستخدمين (وإنشاؤه ومحفزاته إن لم تكن موجودة)"""
+    global _available
+    if not fts5_supported():
+        return
+    with db.engine.begin() as connection:
+        _create(connection, rebuild=True)
+    _available = True
+
+
+def _escape_like(term):
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def filter_users(query, term):
+    """تقييد استعلام المستخدمين بمن يحتوي اسمه أو بريده على النص"""
+    if len(term) >= MIN_INDEXED_LENGTH and ensure_index():
+        matches = db.select(db.column('rowid')).select_from(db.table('user_search')).where(
+            db.text('user_search MATCH :term').bindparams(term=quote_phrase(term))
+        )
+        return query.filter(User.id.in_(matches))
+
+    # نصوص قصيرة أو قاعدة بيانات بلا FTS5
+    return query.filter(
+        db.or_(
+            User.username.contains(term, autoescape=True),
+            User.email.contains(term, autoescape=True)
+        )
+    )
+
+
+def search_users(term, limit=20):
+    """بحث مرتب: المطابقة في بداية الاسم أولاً، ثم حسب ترتيب bm25"""
+    if len(term) >= MIN_INDEXED_LENGTH and ensure_index():
+        rows = db.session.execute(db.text(
+            """SELECT rowid FROM user_search
+               WHERE user_search MATCH :term
+               ORDER BY CASE WHEN username LIKE :prefix ESCAPE '\\' THEN 0 ELSE 1 END, rank
+               LIMIT :limit"""
+        ), {'term': quote_phrase(term), 'prefix': _escape_like(term) + '%', 'limit': limit}).all()
+        ids = [row[0] for row in rows]
+        users_by_id = {user.id: user for user in User.query.filter(User.id.in_(ids)).all()} if ids else {}
+        return [users_by_id[user_id] for user_id in ids if user_id in users_by_id]
+
+    prefix_first = db.case((User.username.startswith(term, autoescape=True), 0), else_=1)
+    return filter_users(User.query, term).order_by(prefix_first, User.username).limit(limit).all()
@@ -1,121 +0,0 @@
-function r0(i,c){for(var s=0;s<c.length;s++){const r=c[s];if(typeof r!="string"&&!Array.isArray(r)){for(const f in r)if(f!=="default"&&!(f in i)){const m=Object.getOwnPropertyDescriptor(r,f);m&&Object.defineProperty(i,f,m.get?m:{enumerable:!0,get:()=>r[f]})}}}return Object.freeze(Object.defineProperty(i,Symbol.toStringTag,{value:"Module"}))}(function(){const c=document.createElement("link").relList;if(c&&c.supports&&c.supports("modulepreload"))return;for(const f of document.querySelectorAll('link[rel="modulepreload"]'))r(f);new MutationObserver(f=>{for(const m of f)if(m.type==="childList")for(const g of m.addedNodes)g.tagName==="LINK"&&g.rel==="modulepreload"&&r(g)}).observe(document,{childList:!0,subtree:!0});function s(f){const m={};return f.integrity&&(m.integrity=f.integrity),f.referrerPolicy&&(m.referrerPolicy=f.referrerPolicy),f.crossOrigin==="use-credentials"?m.credentials="include":f.crossOrigin==="anonymous"?m.credentials="omit":m.credentials="same-origin",m}function r(f){if(f.ep)return;f.ep=!0;const m=s(f);fetch(f.href,m)}})();function o0(i){return i&&i.__esModule&&Object.prototype.hasOwnProperty.call(i,"default")?i.default:i}var Yr={exports:{}},kn={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fm;function s0(){if(fm)return kn;fm=1;var i=Symbol.for("react.transitional.element"),c=Symbol.for("react.fragment");function s(r,f,m){var g=null;if(m!==void 0&&(g=""+m),f.key!==void 0&&(g=""+f.key),"key"in f){m={};for(var x in f)x!=="key"&&(m[x]=f[x])}else m=f;return f=m.ref,{$$typeof:i,type:r,key:g,ref:f!==void 0?f:null,props:m}}return kn.Fragment=c,kn.jsx=s,kn.jsxs=s,kn}var dm;function f0(){return dm||(dm=1,Yr.exports=s0()),Yr.exports}var w=f0(),Vr={exports:{}},ue={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var mm;function d0(){if(mm)return ue;mm=1;var i=Symbol.for("react.transitional.element"),c=Symbol.for("react.portal"),s=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),f=Symbol.for("react.profiler"),m=Symbol.for("react.consumer"),g=Symbol.for("react.context"),x=Symbol.for("react.forward_ref"),v=Symbol.for("react.suspense"),h=Symbol.for("react.memo"),S=Symbol.for("react.lazy"),N=Symbol.iterator;function R(p){return p===null||typeof p!="object"?null:(p=N&&p[N]||p["@@iterator"],typeof p=="function"?p:null)}var Y={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},C=Object.assign,B={};function q(p,L,Z){this.props=p,this.context=L,this.refs=B,this.updater=Z||Y}q.prototype.isReactComponent={},q.prototype.setState=function(p,L){if(typeof p!="object"&&typeof p!="function"&&p!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,p,L,"setState")},q.prototype.forceUpdate=function(p){this.updater.enqueueForceUpdate(this,p,"forceUpdate")};function U(){}U.prototype=q.prototype;function P(p,L,Z){this.props=p,this.context=L,this.refs=B,this.updater=Z||Y}var Q=P.prototype=new U;Q.constructor=P,C(Q,q.prototype),Q.isPureReactComponent=!0;var ee=Array.isArray,F={H:null,A:null,T:null,S:null,V:null},me=Object.prototype.hasOwnProperty;function ve(p,L,Z,V,K,oe){return Z=oe.ref,{$$typeof:i,type:p,key:L,ref:Z!==void 0?Z:null,props:oe}}function k(p,L){return ve(p.type,L,void 0,void 0,void 0,p.props)}function de(p){return typeof p=="object"&&p!==null&&p.$$typeof===i}function Ue(p){var L={"=":"=0",":":"=2"};return"$"+p.replace(/[=:]/g,function(Z){return L[Z]})}var Le=/\/+/g;function Oe(p,L){return typeof p=="object"&&p!==null&&p.key!=null?Ue(""+p.key):L.toString(36)}function yt(){}function gt(p){switch(p.status){case"fulfilled":return p.value;case"rejected":throw p.reason;default:switch(typeof p.status=="string"?p.then(yt,yt):(p.status="pending",p.then(function(L){p.status==="pending"&&(p.status="fulfilled",p.value=L)},function(L){p.status==="pending"&&(p.status="rejected",p.reason=L)})),p.status){case"fulfilled":return p.value;case"rejected":throw p.reason}}throw p}function ze(p,L,Z,V,K){var oe=typeof p;(oe==="undefined"||oe==="boolean")&&(p=null);var ne=!1;if(p===null)ne=!0;else switch(oe){case"bigint":case"string":case"number":ne=!0;break;case"object":switch(p.$$typeof){case i:case c:ne=!0;break;case S:return ne=p._init,ze(ne(p._payload),L,Z,V,K)}}if(ne)return K=K(p),ne=V===""?"."+Oe(p,0):V,ee(K)?(Z="",ne!=null&&(Z=ne.replace(Le,"$&/")+"/"),ze(K,L,Z,"",function(it){return it})):K!=null&&(de(K)&&(K=k(K,Z+(K.key==null||p&&p.key===K.key?"":(""+K.key).replace(Le,"$&/")+"/")+ne)),L.push(K)),1;ne=0;var ye=V===""?".":V+":";if(ee(p))for(var Re=0;Re<p.length;Re++)V=p[Re],oe=ye+Oe(V,Re),ne+=ze(V,L,Z,oe,K);else if(Re=R(p),typeof Re=="function")for(p=Re.call(p),Re=0;!(V=p.next()).done;)V=V.value,oe=ye+Oe(V,Re++),ne+=ze(V,L,Z,oe,K);else if(oe==="object"){if(typeof p.then=="function")return ze(gt(p),L,Z,V,K);throw L=String(p),Error("Objects are not valid as a React child (found: "+(L==="[object Object]"?"object with keys {"+Object.keys(p).join(", ")+"}":L)+"). If you meant to render a collection of children, use an array instead.")}return ne}function O(p,L,Z){if(p==null)return p;var V=[],K=0;return ze(p,V,"","",function(oe){return L.call(Z,oe,K++)}),V}function X(p){if(p._status===-1){var L=p._result;L=L(),L.then(function(Z){(p._status===0||p._status===-1)&&(p._status=1,p._result=Z)},function(Z){(p._status===0||p._status===-1)&&(p._status=2,p._result=Z)}),p._status===-1&&(p._status=0,p._result=L)}if(p._status===1)return p._result.default;throw p._result}var G=typeof reportError=="function"?reportError:function(p){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var L=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof p=="object"&&p!==null&&typeof p.message=="string"?String(p.message):String(p),error:p});if(!window.dispatchEvent(L))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",p);return}console.error(p)};function be(){}return ue.Children={map:O,forEach:function(p,L,Z){O(p,function(){L.apply(this,arguments)},Z)},count:function(p){var L=0;return O(p,function(){L++}),L},toArray:function(p){return O(p,function(L){return L})||[]},only:function(p){if(!de(p))throw Error("React.Children.only expected to receive a single React element child.");return p}},ue.Component=q,ue.Fragment=s,ue.Profiler=f,ue.PureComponent=P,ue.StrictMode=r,ue.Suspense=v,ue.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=F,ue.__COMPILER_RUNTIME={__proto__:null,c:function(p){return F.H.useMemoCache(p)}},ue.cache=function(p){return function(){return p.apply(null,arguments)}},ue.cloneElement=function(p,L,Z){if(p==null)throw Error("The argument must be a React element, but you passed "+p+".");var V=C({},p.props),K=p.key,oe=void 0;if(L!=null)for(ne in L.ref!==void 0&&(oe=void 0),L.key!==void 0&&(K=""+L.key),L)!me.call(L,ne)||ne==="key"||ne==="__self"||ne==="__source"||ne==="ref"&&L.ref===void 0||(V[ne]=L[ne]);var ne=arguments.length-2;if(ne===1)V.children=Z;else if(1<ne){for(var ye=Array(ne),Re=0;Re<ne;Re++)ye[Re]=arguments[Re+2];V.children=ye}return ve(p.type,K,void 0,void 0,oe,V)},ue.createContext=function(p){return p={$$typeof:g,_currentValue:p,_currentValue2:p,_threadCount:0,Provider:null,Consumer:null},p.Provider=p,p.Consumer={$$typeof:m,_context:p},p},ue.createElement=function(p,L,Z){var V,K={},oe=null;if(L!=null)for(V in L.key!==void 0&&(oe=""+L.key),L)me.call(L,V)&&V!=="key"&&V!=="__self"&&V!=="__source"&&(K[V]=L[V]);var ne=arguments.length-2;if(ne===1)K.children=Z;else if(1<ne){for(var ye=Array(ne),Re=0;Re<ne;Re++)ye[Re]=arguments[Re+2];K.children=ye}if(p&&p.defaultProps)for(V in ne=p.defaultProps,ne)K[V]===void 0&&(K[V]=ne[V]);return ve(p,oe,void 0,void 0,null,K)},ue.createRef=function(){return{current:null}},ue.forwardRef=function(p){return{$$typeof:x,render:p}},ue.isValidElement=de,ue.lazy=function(p){return{$$typeof:S,_payload:{_status:-1,_result:p},_init:X}},ue.memo=function(p,L){return{$$typeof:h,type:p,compare:L===void 0?null:L}},ue.startTransition=function(p){var L=F.T,Z={};F.T=Z;try{var V=p(),K=F.S;K!==null&&K(Z,V),typeof V=="object"&&V!==null&&typeof V.then=="function"&&V.then(be,G)}catch(oe){G(oe)}finally{F.T=L}},ue.unstable_useCacheRefresh=function(){return F.H.useCacheRefresh()},ue.use=function(p){return F.H.use(p)},ue.useActionState=function(p,L,Z){return F.H.useActionState(p,L,Z)},ue.useCallback=function(p,L){return F.H.useCallback(p,L)},ue.useContext=function(p){return F.H.useContext(p)},ue.useDebugValue=function(){},ue.useDeferredValue=function(p,L){return F.H.useDeferredValue(p,L)},ue.useEffect=function(p,L,Z){var V=F.H;if(typeof Z=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return V.useEffect(p,L)},ue.useId=function(){return F.H.useId()},ue.useImperativeHandle=function(p,L,Z){return F.H.useImperativeHandle(p,L,Z)},ue.useInsertionEffect=function(p,L){return F.H.useInsertionEffect(p,L)},ue.useLayoutEffect=function(p,L){return F.H.useLayoutEffect(p,L)},ue.useMemo=function(p,L){return F.H.useMemo(p,L)},ue.useOptimistic=function(p,L){return F.H.useOptimistic(p,L)},ue.useReducer=function(p,L,Z){return F.H.useReducer(p,L,Z)},ue.useRef=function(p){return F.H.useRef(p)},ue.useState=function(p){return F.H.useState(p)},ue.useSyncExternalStore=function(p,L,Z){return F.H.useSyncExternalStore(p,L,Z)},ue.useTransition=function(){return F.H.useTransition()},ue.version="19.1.0",ue}var hm;function no(){return hm||(hm=1,Vr.exports=d0()),Vr.exports}var E=no();const Ul=o0(E),Lm=r0({__proto__:null,default:Ul},[E]);var Xr={exports:{}},Qn={},kr={exports:{}},Qr={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var vm;function m0(){return vm||(vm=1,function(i){function c(O,X){var G=O.length;O.push(X);e:for(;0<G;){var be=G-1>>>1,p=O[be];if(0<f(p,X))O[be]=X,O[G]=p,G=be;else break e}}function s(O){return O.length===0?null:O[0]}function r(O){if(O.length===0)return null;var X=O[0],G=O.pop();if(G!==X){O[0]=G;e:for(var be=0,p=O.length,L=p>>>1;be<L;){var Z=2*(be+1)-1,V=O[Z],K=Z+1,oe=O[K];if(0>f(V,G))K<p&&0>f(oe,V)?(O[be]=oe,O[K]=G,be=K):(O[be]=V,O[Z]=G,be=Z);else if(K<p&&0>f(oe,G))O[be]=oe,O[K]=G,be=K;else break e}}return X}function f(O,X){var G=O.sortIndex-X.sortIndex;return G!==0?G:O.id-X.id}if(i.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var m=performance;i.unstable_now=function(){return m.now()}}else{var g=Date,x=g.now();i.unstable_now=function(){return g.now()-x}}var v=[],h=[],S=1,N=null,R=3,Y=!1,C=!1,B=!1,q=!1,U=typeof setTimeout=="function"?setTimeout:null,P=typeof clearTimeout=="function"?clearTimeout:null,Q=typeof setImmediate<"u"?setImmediate:null;function ee(O){for(var X=s(h);X!==null;){if(X.callback===null)r(h);else if(X.startTime<=O)r(h),X.sortIndex=X.expirationTime,c(v,X);else break;X=s(h)}}function F(O){if(B=!1,ee(O),!C)if(s(v)!==null)C=!0,me||(me=!0,Oe());else{var X=s(h);X!==null&&ze(F,X.startTime-O)}}var me=!1,ve=-1,k=5,de=-1;function Ue(){return q?!0:!(i.unstable_now()-de<k)}function Le(){if(q=!1,me){var O=i.unstable_now();de=O;var X=!0;try{e:{C=!1,B&&(B=!1,P(ve),ve=-1),Y=!0;var G=R;try{t:{for(ee(O),N=s(v);N!==null&&!(N.expirationTime>O&&Ue());){var be=N.callback;if(typeof be=="function"){N.callback=null,R=N.priorityLevel;var p=be(N.expirationTime<=O);if(O=i.unstable_now(),typeof p=="function"){N.callback=p,ee(O),X=!0;break t}N===s(v)&&r(v),ee(O)}else r(v);N=s(v)}if(N!==null)X=!0;else{var L=s(h);L!==null&&ze(F,L.startTime-O),X=!1}}break e}finally{N=null,R=G,Y=!1}X=void 0}}finally{X?Oe():me=!1}}}var Oe;if(typeof Q=="function")Oe=function(){Q(Le)};else if(typeof MessageChannel<"u"){var yt=new MessageChannel,gt=yt.port2;yt.port1.onmessage=Le,Oe=function(){gt.postMessage(null)}}else Oe=function(){U(Le,0)};function ze(O,X){ve=U(function(){O(i.unstable_now())},X)}i.unstable_IdlePriority=5,i.unstable_ImmediatePriority=1,i.unstable_LowPriority=4,i.unstable_NormalPriority=3,i.unstable_Profiling=null,i.unstable_UserBlockingPriority=2,i.unstable_cancelCallback=function(O){O.callback=null},i.unstable_forceFrameRate=function(O){0>O||125<O?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):k=0<O?Math.floor(1e3/O):5},i.unstable_getCurrentPriorityLevel=function(){return R},i.unstable_next=function(O){switch(R){case 1:case 2:case 3:var X=3;break;default:X=R}var G=R;R=X;try{return O()}finally{R=G}},i.unstable_requestPaint=function(){q=!0},i.unstable_runWithPriority=function(O,X){switch(O){case 1:case 2:case 3:case 4:case 5:break;default:O=3}var G=R;R=O;try{return X()}finally{R=G}},i.unstable_scheduleCallback=function(O,X,G){var be=i.unstable_now();switch(typeof G=="object"&&G!==null?(G=G.delay,G=typeof G=="number"&&0<G?be+G:be):G=be,O){case 1:var p=-1;break;case 2:p=250;break;case 5:p=1073741823;break;case 4:p=1e4;break;default:p=5e3}return p=G+p,O={id:S++,callback:X,priorityLevel:O,startTime:G,expirationTime:p,sortIndex:-1},G>be?(O.sortIndex=G,c(h,O),s(v)===null&&O===s(h)&&(B?(P(ve),ve=-1):B=!0,ze(F,G-be))):(O.sortIndex=p,c(v,O),C||Y||(C=!0,me||(me=!0,Oe()))),O},i.unstable_shouldYield=Ue,i.unstable_wrapCallback=function(O){var X=R;return function(){var G=R;R=X;try{return O.apply(this,arguments)}finally{R=G}}}}(Qr)),Qr}var ym;function h0(){return ym||(ym=1,kr.exports=m0()),kr.exports}var Zr={exports:{}},Ie={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var gm;function v0(){if(gm)return Ie;gm=1;var i=no();function c(v){var h="https://react.dev/errors/"+v;if(1<arguments.length){h+="?args[]="+encodeURIComponent(arguments[1]);for(var S=2;S<arguments.length;S++)h+="&args[]="+encodeURIComponent(arguments[S])}return"Minified React error #"+v+"; visit "+h+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function s(){}var r={d:{f:s,r:function(){throw Error(c(522))},D:s,C:s,L:s,m:s,X:s,S:s,M:s},p:0,findDOMNode:null},f=Symbol.for("react.portal");function m(v,h,S){var N=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:f,key:N==null?null:""+N,children:v,containerInfo:h,implementation:S}}var g=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function x(v,h){if(v==="font")return"";if(typeof h=="string")return h==="use-credentials"?h:""}return Ie.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,Ie.createPortal=function(v,h){var S=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!h||h.nodeType!==1&&h.nodeType!==9&&h.nodeType!==11)throw Error(c(299));return m(v,h,null,S)},Ie.flushSync=function(v){var h=g.T,S=r.p;try{if(g.T=null,r.p=2,v)return v()}finally{g.T=h,r.p=S,r.d.f()}},Ie.preconnect=function(v,h){typeof v=="string"&&(h?(h=h.crossOrigin,h=typeof h=="string"?h==="use-credentials"?h:"":void 0):h=null,r.d.C(v,h))},Ie.prefetchDNS=function(v){typeof v=="string"&&r.d.D(v)},Ie.preinit=function(v,h){if(typeof v=="string"&&h&&typeof h.as=="string"){var S=h.as,N=x(S,h.crossOrigin),R=typeof h.integrity=="string"?h.integrity:void 0,Y=typeof h.fetchPriority=="string"?h.fetchPriority:void 0;S==="style"?r.d.S(v,typeof h.precedence=="string"?h.precedence:void 0,{crossOrigin:N,integrity:R,fetchPriority:Y}):S==="script"&&r.d.X(v,{crossOrigin:N,integrity:R,fetchPriority:Y,nonce:typeof h.nonce=="string"?h.nonce:void 0})}},Ie.preinitModule=function(v,h){if(typeof v=="string")if(typeof h=="object"&&h!==null){if(h.as==null||h.as==="script"){var S=x(h.as,h.crossOrigin);r.d.M(v,{crossOrigin:S,integrity:typeof h.integrity=="string"?h.integrity:void 0,nonce:typeof h.nonce=="string"?h.nonce:void 0})}}else h==null&&r.d.M(v)},Ie.preload=function(v,h){if(typeof v=="string"&&typeof h=="object"&&h!==null&&typeof h.as=="string"){var S=h.as,N=x(S,h.crossOrigin);r.d.L(v,S,{crossOrigin:N,integrity:typeof h.integrity=="string"?h.integrity:void 0,nonce:typeof h.nonce=="string"?h.nonce:void 0,type:typeof h.type=="string"?h.type:void 0,fetchPriority:typeof h.fetchPriority=="string"?h.fetchPriority:void 0,referrerPolicy:typeof h.referrerPolicy=="string"?h.referrerPolicy:void 0,imageSrcSet:typeof h.imageSrcSet=="string"?h.imageSrcSet:void 0,imageSizes:typeof h.imageSizes=="string"?h.imageSizes:void 0,media:typeof h.media=="string"?h.media:void 0})}},Ie.preloadModule=function(v,h){if(typeof v=="string")if(h){var S=x(h.as,h.crossOrigin);r.d.m(v,{as:typeof h.as=="string"&&h.as!=="script"?h.as:void 0,crossOrigin:S,integrity:typeof h.integrity=="string"?h.integrity:void 0})}else r.d.m(v)},Ie.requestFormReset=function(v){r.d.r(v)},Ie.unstable_batchedUpdates=function(v,h){return v(h)},Ie.useFormState=function(v,h,S){return g.H.useFormState(v,h,S)},Ie.useFormStatus=function(){return g.H.useHostTransitionStatus()},Ie.version="19.1.0",Ie}var pm;function Gm(){if(pm)return Zr.exports;pm=1;function i(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(i)}catch(c){console.error(c)}}return i(),Zr.exports=v0(),Zr.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bm;function y0(){if(bm)return Qn;bm=1;var i=h0(),c=no(),s=Gm();function r(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var l=2;l<arguments.length;l++)t+="&args[]="+encodeURIComponent(arguments[l])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function f(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function m(e){var t=e,l=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(l=t.return),e=t.return;while(e)}return t.tag===3?l:null}function g(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function x(e){if(m(e)!==e)throw Error(r(188))}function v(e){var t=e.alternate;if(!t){if(t=m(e),t===null)throw Error(r(188));return t!==e?null:e}for(var l=e,a=t;;){var n=l.return;if(n===null)break;var u=n.alternate;if(u===null){if(a=n.return,a!==null){l=a;continue}break}if(n.child===u.child){for(u=n.child;u;){if(u===l)return x(n),e;if(u===a)return x(n),t;u=u.sibling}throw Error(r(188))}if(l.return!==a.return)l=n,a=u;else{for(var o=!1,d=n.child;d;){if(d===l){o=!0,l=n,a=u;break}if(d===a){o=!0,a=n,l=u;break}d=d.sibling}if(!o){for(d=u.child;d;){if(d===l){o=!0,l=u,a=n;break}if(d===a){o=!0,a=u,l=n;break}d=d.sibling}if(!o)throw Error(r(189))}}if(l.alternate!==a)throw Error(r(190))}if(l.tag!==3)throw Error(r(188));return l.stateNode.current===l?e:t}function h(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e;for(e=e.child;e!==null;){if(t=h(e),t!==null)return t;e=e.sibling}return null}var S=Object.assign,N=Symbol.for("react.element"),R=Symbol.for("react.transitional.element"),Y=Symbol.for("react.portal"),C=Symbol.for("react.fragment"),B=Symbol.for("react.strict_mode"),q=Symbol.for("react.profiler"),U=Symbol.for("react.provider"),P=Symbol.for("react.consumer"),Q=Symbol.for("react.context"),ee=Symbol.for("react.forward_ref"),F=Symbol.for("react.suspense"),me=Symbol.for("react.suspense_list"),ve=Symbol.for("react.memo"),k=Symbol.for("react.lazy"),de=Symbol.for("react.activity"),Ue=Symbol.for("react.memo_cache_sentinel"),Le=Symbol.iterator;function Oe(e){return e===null||typeof e!="object"?null:(e=Le&&e[Le]||e["@@iterator"],typeof e=="function"?e:null)}var yt=Symbol.for("react.client.reference");function gt(e){if(e==null)return null;if(typeof e=="function")return e.$$typeof===yt?null:e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case C:return"Fragment";case q:return"Profiler";case B:return"StrictMode";case F:return"Suspense";case me:return"SuspenseList";case de:return"Activity"}if(typeof e=="object")switch(e.$$typeof){case Y:return"Portal";case Q:return(e.displayName||"Context")+".Provider";case P:return(e._context.displayName||"Context")+".Consumer";case ee:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ve:return t=e.displayName||null,t!==null?t:gt(e.type)||"Memo";case k:t=e._payload,e=e._init;try{return gt(e(t))}catch{}}return null}var ze=Array.isArray,O=c.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,X=s.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,G={pending:!1,data:null,method:null,action:null},be=[],p=-1;function L(e){return{current:e}}function Z(e){0>p||(e.current=be[p],be[p]=null,p--)}function V(e,t){p++,be[p]=e.current,e.current=t}var K=L(null),oe=L(null),ne=L(null),ye=L(null);function Re(e,t){switch(V(ne,t),V(oe,e),V(K,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?Ld(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)t=Ld(t),e=Gd(t,e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}Z(K),V(K,e)}function it(){Z(K),Z(oe),Z(ne)}function il(e){e.memoizedState!==null&&V(ye,e);var t=K.current,l=Gd(t,e.type);t!==l&&(V(oe,e),V(K,l))}function cl(e){oe.current===e&&(Z(K),Z(oe)),ye.current===e&&(Z(ye),Ln._currentValue=G)}var rl=Object.prototype.hasOwnProperty,zi=i.unstable_scheduleCallback,Ni=i.unstable_cancelCallback,Gh=i.unstable_shouldYield,Yh=i.unstable_requestPaint,Ct=i.unstable_now,Vh=i.unstable_getCurrentPriorityLevel,po=i.unstable_ImmediatePriority,bo=i.unstable_UserBlockingPriority,tu=i.unstable_NormalPriority,Xh=i.unstable_LowPriority,So=i.unstable_IdlePriority,kh=i.log,Qh=i.unstable_setDisableYieldValue,Za=null,ct=null;function ol(e){if(typeof kh=="function"&&Qh(e),ct&&typeof ct.setStrictMode=="function")try{ct.setStrictMode(Za,e)}catch{}}var rt=Math.clz32?Math.clz32:Jh,Zh=Math.log,Kh=Math.LN2;function Jh(e){return e>>>=0,e===0?32:31-(Zh(e)/Kh|0)|0}var lu=256,au=4194304;function jl(e){var t=e&42;if(t!==0)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return e&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function nu(e,t,l){var a=e.pendingLanes;if(a===0)return 0;var n=0,u=e.suspendedLanes,o=e.pingedLanes;e=e.warmLanes;var d=a&134217727;return d!==0?(a=d&~u,a!==0?n=jl(a):(o&=d,o!==0?n=jl(o):l||(l=d&~e,l!==0&&(n=jl(l))))):(d=a&~u,d!==0?n=jl(d):o!==0?n=jl(o):l||(l=a&~e,l!==0&&(n=jl(l)))),n===0?0:t!==0&&t!==n&&(t&u)===0&&(u=n&-n,l=t&-t,u>=l||u===32&&(l&4194048)!==0)?t:n}function Ka(e,t){return(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)===0}function $h(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function xo(){var e=lu;return lu<<=1,(lu&4194048)===0&&(lu=256),e}function Eo(){var e=au;return au<<=1,(au&62914560)===0&&(au=4194304),e}function Oi(e){for(var t=[],l=0;31>l;l++)t.push(e);return t}function Ja(e,t){e.pendingLanes|=t,t!==268435456&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Wh(e,t,l,a,n,u){var o=e.pendingLanes;e.pendingLanes=l,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=l,e.entangledLanes&=l,e.errorRecoveryDisabledLanes&=l,e.shellSuspendCounter=0;var d=e.entanglements,y=e.expirationTimes,M=e.hiddenUpdates;for(l=o&~l;0<l;){var D=31-rt(l),H=1<<D;d[D]=0,y[D]=-1;var _=M[D];if(_!==null)for(M[D]=null,D=0;D<_.length;D++){var z=_[D];z!==null&&(z.lane&=-536870913)}l&=~H}a!==0&&To(e,a,0),u!==0&&n===0&&e.tag!==0&&(e.suspendedLanes|=u&~(o&~t))}function To(e,t,l){e.pendingLanes|=t,e.suspendedLanes&=~t;var a=31-rt(t);e.entangledLanes|=t,e.entanglements[a]=e.entanglements[a]|1073741824|l&4194090}function Ao(e,t){var l=e.entangledLanes|=t;for(e=e.entanglements;l;){var a=31-rt(l),n=1<<a;n&t|e[a]&t&&(e[a]|=t),l&=~n}}function Ci(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function wi(e){return e&=-e,2<e?8<e?(e&134217727)!==0?32:268435456:8:2}function Ro(){var e=X.p;return e!==0?e:(e=window.event,e===void 0?32:um(e.type))}function Fh(e,t){var l=X.p;try{return X.p=e,t()}finally{X.p=l}}var sl=Math.random().toString(36).slice(2),Fe="__reactFiber$"+sl,tt="__reactProps$"+sl,ta="__reactContainer$"+sl,Di="__reactEvents$"+sl,Ph="__reactListeners$"+sl,Ih="__reactHandles$"+sl,Mo="__reactResources$"+sl,$a="__reactMarker$"+sl;function Ui(e){delete e[Fe],delete e[tt],delete e[Di],delete e[Ph],delete e[Ih]}function la(e){var t=e[Fe];if(t)return t;for(var l=e.parentNode;l;){if(t=l[ta]||l[Fe]){if(l=t.alternate,t.child!==null||l!==null&&l.child!==null)for(e=kd(e);e!==null;){if(l=e[Fe])return l;e=kd(e)}return t}e=l,l=e.parentNode}return null}function aa(e){if(e=e[Fe]||e[ta]){var t=e.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return e}return null}function Wa(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e.stateNode;throw Error(r(33))}function na(e){var t=e[Mo];return t||(t=e[Mo]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function ke(e){e[$a]=!0}var _o=new Set,zo={};function Hl(e,t){ua(e,t),ua(e+"Capture",t)}function ua(e,t){for(zo[e]=t,e=0;e<t.length;e++)_o.add(t[e])}var ev=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),No={},Oo={};function tv(e){return rl.call(Oo,e)?!0:rl.call(No,e)?!1:ev.test(e)?Oo[e]=!0:(No[e]=!0,!1)}function uu(e,t,l){if(tv(t))if(l===null)e.removeAttribute(t);else{switch(typeof l){case"undefined":case"function":case"symbol":e.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){e.removeAttribute(t);return}}e.setAttribute(t,""+l)}}function iu(e,t,l){if(l===null)e.removeAttribute(t);else{switch(typeof l){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(t);return}e.setAttribute(t,""+l)}}function Gt(e,t,l,a){if(a===null)e.removeAttribute(l);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(l);return}e.setAttributeNS(t,l,""+a)}}var ji,Co;function ia(e){if(ji===void 0)try{throw Error()}catch(l){var t=l.stack.trim().match(/\n( *(at )?)/);ji=t&&t[1]||"",Co=-1<l.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<l.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+ji+e+Co}var Hi=!1;function Bi(e,t){if(!e||Hi)return"";Hi=!0;var l=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(t){var H=function(){throw Error()};if(Object.defineProperty(H.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(H,[])}catch(z){var _=z}Reflect.construct(e,[],H)}else{try{H.call()}catch(z){_=z}e.call(H.prototype)}}else{try{throw Error()}catch(z){_=z}(H=e())&&typeof H.catch=="function"&&H.catch(function(){})}}catch(z){if(z&&_&&typeof z.stack=="string")return[z.stack,_.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var n=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");n&&n.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var u=a.DetermineComponentFrameRoot(),o=u[0],d=u[1];if(o&&d){var y=o.split(`
-`),M=d.split(`
-`);for(n=a=0;a<y.length&&!y[a].includes("DetermineComponentFrameRoot");)a++;for(;n<M.length&&!M[n].includes("DetermineComponentFrameRoot");)n++;if(a===y.length||n===M.length)for(a=y.length-1,n=M.length-1;1<=a&&0<=n&&y[a]!==M[n];)n--;for(;1<=a&&0<=n;a--,n--)if(y[a]!==M[n]){if(a!==1||n!==1)do if(a--,n--,0>n||y[a]!==M[n]){var D=`
-`+y[a].replace(" at new "," at ");return e.displayName&&D.includes("<anonymous>")&&(D=D.replace("<anonymous>",e.displayName)),D}while(1<=a&&0<=n);break}}}finally{Hi=!1,Error.prepareStackTrace=l}return(l=e?e.displayName||e.name:"")?ia(l):""}function lv(e){switch(e.tag){case 26:case 27:case 5:return ia(e.type);case 16:return ia("Lazy");case 13:return ia("Suspense");case 19:return ia("SuspenseList");case 0:case 15:return Bi(e.type,!1);case 11:return Bi(e.type.render,!1);case 1:return Bi(e.type,!0);case 31:return ia("Activity");default:return""}}function wo(e){try{var t="";do t+=lv(e),e=e.return;while(e);return t}catch(l){return`
-Error generating stack: `+l.message+`
-`+l.stack}}function pt(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Do(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function av(e){var t=Do(e)?"checked":"value",l=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),a=""+e[t];if(!e.hasOwnProperty(t)&&typeof l<"u"&&typeof l.get=="function"&&typeof l.set=="function"){var n=l.get,u=l.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return n.call(this)},set:function(o){a=""+o,u.call(this,o)}}),Object.defineProperty(e,t,{enumerable:l.enumerable}),{getValue:function(){return a},setValue:function(o){a=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function cu(e){e._valueTracker||(e._valueTracker=av(e))}function Uo(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var l=t.getValue(),a="";return e&&(a=Do(e)?e.checked?"true":"false":e.value),e=a,e!==l?(t.setValue(e),!0):!1}function ru(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}var nv=/[\n"\\]/g;function bt(e){return e.replace(nv,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function qi(e,t,l,a,n,u,o,d){e.name="",o!=null&&typeof o!="function"&&typeof o!="symbol"&&typeof o!="boolean"?e.type=o:e.removeAttribute("type"),t!=null?o==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+pt(t)):e.value!==""+pt(t)&&(e.value=""+pt(t)):o!=="submit"&&o!=="reset"||e.removeAttribute("value"),t!=null?Li(e,o,pt(t)):l!=null?Li(e,o,pt(l)):a!=null&&e.removeAttribute("value"),n==null&&u!=null&&(e.defaultChecked=!!u),n!=null&&(e.checked=n&&typeof n!="function"&&typeof n!="symbol"),d!=null&&typeof d!="function"&&typeof d!="symbol"&&typeof d!="boolean"?e.name=""+pt(d):e.removeAttribute("name")}function jo(e,t,l,a,n,u,o,d){if(u!=null&&typeof u!="function"&&typeof u!="symbol"&&typeof u!="boolean"&&(e.type=u),t!=null||l!=null){if(!(u!=="submit"&&u!=="reset"||t!=null))return;l=l!=null?""+pt(l):"",t=t!=null?""+pt(t):l,d||t===e.value||(e.value=t),e.defaultValue=t}a=a??n,a=typeof a!="function"&&typeof a!="symbol"&&!!a,e.checked=d?e.checked:!!a,e.defaultChecked=!!a,o!=null&&typeof o!="function"&&typeof o!="symbol"&&typeof o!="boolean"&&(e.name=o)}function Li(e,t,l){t==="number"&&ru(e.ownerDocument)===e||e.defaultValue===""+l||(e.defaultValue=""+l)}function ca(e,t,l,a){if(e=e.options,t){t={};for(var n=0;n<l.length;n++)t["$"+l[n]]=!0;for(l=0;l<e.length;l++)n=t.hasOwnProperty("$"+e[l].value),e[l].selected!==n&&(e[l].selected=n),n&&a&&(e[l].defaultSelected=!0)}else{for(l=""+pt(l),t=null,n=0;n<e.length;n++){if(e[n].value===l){e[n].selected=!0,a&&(e[n].defaultSelected=!0);return}t!==null||e[n].disabled||(t=e[n])}t!==null&&(t.selected=!0)}}function Ho(e,t,l){if(t!=null&&(t=""+pt(t),t!==e.value&&(e.value=t),l==null)){e.defaultValue!==t&&(e.defaultValue=t);return}e.defaultValue=l!=null?""+pt(l):""}function Bo(e,t,l,a){if(t==null){if(a!=null){if(l!=null)throw Error(r(92));if(ze(a)){if(1<a.length)throw Error(r(93));a=a[0]}l=a}l==null&&(l=""),t=l}l=pt(t),e.defaultValue=l,a=e.textContent,a===l&&a!==""&&a!==null&&(e.value=a)}function ra(e,t){if(t){var l=e.firstChild;if(l&&l===e.lastChild&&l.nodeType===3){l.nodeValue=t;return}}e.textContent=t}var uv=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function qo(e,t,l){var a=t.indexOf("--")===0;l==null||typeof l=="boolean"||l===""?a?e.setProperty(t,""):t==="float"?e.cssFloat="":e[t]="":a?e.setProperty(t,l):typeof l!="number"||l===0||uv.has(t)?t==="float"?e.cssFloat=l:e[t]=(""+l).trim():e[t]=l+"px"}function Lo(e,t,l){if(t!=null&&typeof t!="object")throw Error(r(62));if(e=e.style,l!=null){for(var a in l)!l.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?e.setProperty(a,""):a==="float"?e.cssFloat="":e[a]="");for(var n in t)a=t[n],t.hasOwnProperty(n)&&l[n]!==a&&qo(e,n,a)}else for(var u in t)t.hasOwnProperty(u)&&qo(e,u,t[u])}function Gi(e){if(e.indexOf("-")===-1)return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var iv=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),cv=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function ou(e){return cv.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Yi=null;function Vi(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var oa=null,sa=null;function Go(e){var t=aa(e);if(t&&(e=t.stateNode)){var l=e[tt]||null;e:switch(e=t.stateNode,t.type){case"input":if(qi(e,l.value,l.defaultValue,l.defaultValue,l.checked,l.defaultChecked,l.type,l.name),t=l.name,l.type==="radio"&&t!=null){for(l=e;l.parentNode;)l=l.parentNode;for(l=l.querySelectorAll('input[name="'+bt(""+t)+'"][type="radio"]'),t=0;t<l.length;t++){var a=l[t];if(a!==e&&a.form===e.form){var n=a[tt]||null;if(!n)throw Error(r(90));qi(a,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name)}}for(t=0;t<l.length;t++)a=l[t],a.form===e.form&&Uo(a)}break e;case"textarea":Ho(e,l.value,l.defaultValue);break e;case"select":t=l.value,t!=null&&ca(e,!!l.multiple,t,!1)}}}var Xi=!1;function Yo(e,t,l){if(Xi)return e(t,l);Xi=!0;try{var a=e(t);return a}finally{if(Xi=!1,(oa!==null||sa!==null)&&(Ju(),oa&&(t=oa,e=sa,sa=oa=null,Go(t),e)))for(t=0;t<e.length;t++)Go(e[t])}}function Fa(e,t){var l=e.stateNode;if(l===null)return null;var a=l[tt]||null;if(a===null)return null;l=a[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(e=e.type,a=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!a;break e;default:e=!1}if(e)return null;if(l&&typeof l!="function")throw Error(r(231,t,typeof l));return l}var Yt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ki=!1;if(Yt)try{var Pa={};Object.defineProperty(Pa,"passive",{get:function(){ki=!0}}),window.addEventListener("test",Pa,Pa),window.removeEventListener("test",Pa,Pa)}catch{ki=!1}var fl=null,Qi=null,su=null;function Vo(){if(su)return su;var e,t=Qi,l=t.length,a,n="value"in fl?fl.value:fl.textContent,u=n.length;for(e=0;e<l&&t[e]===n[e];e++);var o=l-e;for(a=1;a<=o&&t[l-a]===n[u-a];a++);return su=n.slice(e,1<a?1-a:void 0)}function fu(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function du(){return!0}function Xo(){return!1}function lt(e){function t(l,a,n,u,o){this._reactName=l,this._targetInst=n,this.type=a,this.nativeEvent=u,this.target=o,this.currentTarget=null;for(var d in e)e.hasOwnProperty(d)&&(l=e[d],this[d]=l?l(u):u[d]);return this.isDefaultPrevented=(u.defaultPrevented!=null?u.defaultPrevented:u.returnValue===!1)?du:Xo,this.isPropagationStopped=Xo,this}return S(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var l=this.nativeEvent;l&&(l.preventDefault?l.preventDefault():typeof l.returnValue!="unknown"&&(l.returnValue=!1),this.isDefaultPrevented=du)},stopPropagation:function(){var l=this.nativeEvent;l&&(l.stopPropagation?l.stopPropagation():typeof l.cancelBubble!="unknown"&&(l.cancelBubble=!0),this.isPropagationStopped=du)},persist:function(){},isPersistent:du}),t}var Bl={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},mu=lt(Bl),Ia=S({},Bl,{view:0,detail:0}),rv=lt(Ia),Zi,Ki,en,hu=S({},Ia,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:$i,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==en&&(en&&e.type==="mousemove"?(Zi=e.screenX-en.screenX,Ki=e.screenY-en.screenY):Ki=Zi=0,en=e),Zi)},movementY:function(e){return"movementY"in e?e.movementY:Ki}}),ko=lt(hu),ov=S({},hu,{dataTransfer:0}),sv=lt(ov),fv=S({},Ia,{relatedTarget:0}),Ji=lt(fv),dv=S({},Bl,{animationName:0,elapsedTime:0,pseudoElement:0}),mv=lt(dv),hv=S({},Bl,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),vv=lt(hv),yv=S({},Bl,{data:0}),Qo=lt(yv),gv={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},pv={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},bv={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Sv(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=bv[e])?!!t[e]:!1}function $i(){return Sv}var xv=S({},Ia,{key:function(e){if(e.key){var t=gv[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=fu(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?pv[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:$i,charCode:function(e){return e.type==="keypress"?fu(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?fu(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Ev=lt(xv),Tv=S({},hu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Zo=lt(Tv),Av=S({},Ia,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:$i}),Rv=lt(Av),Mv=S({},Bl,{propertyName:0,elapsedTime:0,pseudoElement:0}),_v=lt(Mv),zv=S({},hu,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Nv=lt(zv),Ov=S({},Bl,{newState:0,oldState:0}),Cv=lt(Ov),wv=[9,13,27,32],Wi=Yt&&"CompositionEvent"in window,tn=null;Yt&&"documentMode"in document&&(tn=document.documentMode);var Dv=Yt&&"TextEvent"in window&&!tn,Ko=Yt&&(!Wi||tn&&8<tn&&11>=tn),Jo=" ",$o=!1;function Wo(e,t){switch(e){case"keyup":return wv.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Fo(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var fa=!1;function Uv(e,t){switch(e){case"compositionend":return Fo(t);case"keypress":return t.which!==32?null:($o=!0,Jo);case"textInput":return e=t.data,e===Jo&&$o?null:e;default:return null}}function jv(e,t){if(fa)return e==="compositionend"||!Wi&&Wo(e,t)?(e=Vo(),su=Qi=fl=null,fa=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ko&&t.locale!=="ko"?null:t.data;default:return null}}var Hv={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Po(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Hv[e.type]:t==="textarea"}function Io(e,t,l,a){oa?sa?sa.push(a):sa=[a]:oa=a,t=ei(t,"onChange"),0<t.length&&(l=new mu("onChange","change",null,l,a),e.push({event:l,listeners:t}))}var ln=null,an=null;function Bv(e){Ud(e,0)}function vu(e){var t=Wa(e);if(Uo(t))return e}function es(e,t){if(e==="change")return t}var ts=!1;if(Yt){var Fi;if(Yt){var Pi="oninput"in document;if(!Pi){var ls=document.createElement("div");ls.setAttribute("oninput","return;"),Pi=typeof ls.oninput=="function"}Fi=Pi}else Fi=!1;ts=Fi&&(!document.documentMode||9<document.documentMode)}function as(){ln&&(ln.detachEvent("onpropertychange",ns),an=ln=null)}function ns(e){if(e.propertyName==="value"&&vu(an)){var t=[];Io(t,an,e,Vi(e)),Yo(Bv,t)}}function qv(e,t,l){e==="focusin"?(as(),ln=t,an=l,ln.attachEvent("onpropertychange",ns)):e==="focusout"&&as()}function Lv(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return vu(an)}function Gv(e,t){if(e==="click")return vu(t)}function Yv(e,t){if(e==="input"||e==="change")return vu(t)}function Vv(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var ot=typeof Object.is=="function"?Object.is:Vv;function nn(e,t){if(ot(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var l=Object.keys(e),a=Object.keys(t);if(l.length!==a.length)return!1;for(a=0;a<l.length;a++){var n=l[a];if(!rl.call(t,n)||!ot(e[n],t[n]))return!1}return!0}function us(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function is(e,t){var l=us(e);e=0;for(var a;l;){if(l.nodeType===3){if(a=e+l.textContent.length,e<=t&&a>=t)return{node:l,offset:t-e};e=a}e:{for(;l;){if(l.nextSibling){l=l.nextSibling;break e}l=l.parentNode}l=void 0}l=us(l)}}function cs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?cs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function rs(e){e=e!=null&&e.ownerDocument!=null&&e.ownerDocument.defaultView!=null?e.ownerDocument.defaultView:window;for(var t=ru(e.document);t instanceof e.HTMLIFrameElement;){try{var l=typeof t.contentWindow.location.href=="string"}catch{l=!1}if(l)e=t.contentWindow;else break;t=ru(e.document)}return t}function Ii(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}var Xv=Yt&&"documentMode"in document&&11>=document.documentMode,da=null,ec=null,un=null,tc=!1;function os(e,t,l){var a=l.window===l?l.document:l.nodeType===9?l:l.ownerDocument;tc||da==null||da!==ru(a)||(a=da,"selectionStart"in a&&Ii(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),un&&nn(un,a)||(un=a,a=ei(ec,"onSelect"),0<a.length&&(t=new mu("onSelect","select",null,t,l),e.push({event:t,listeners:a}),t.target=da)))}function ql(e,t){var l={};return l[e.toLowerCase()]=t.toLowerCase(),l["Webkit"+e]="webkit"+t,l["Moz"+e]="moz"+t,l}var ma={animationend:ql("Animation","AnimationEnd"),animationiteration:ql("Animation","AnimationIteration"),animationstart:ql("Animation","AnimationStart"),transitionrun:ql("Transition","TransitionRun"),transitionstart:ql("Transition","TransitionStart"),transitioncancel:ql("Transition","TransitionCancel"),transitionend:ql("Transition","TransitionEnd")},lc={},ss={};Yt&&(ss=document.createElement("div").style,"AnimationEvent"in window||(delete ma.animationend.animation,delete ma.animationiteration.animation,delete ma.animationstart.animation),"TransitionEvent"in window||delete ma.transitionend.transition);function Ll(e){if(lc[e])return lc[e];if(!ma[e])return e;var t=ma[e],l;for(l in t)if(t.hasOwnProperty(l)&&l in ss)return lc[e]=t[l];return e}var fs=Ll("animationend"),ds=Ll("animationiteration"),ms=Ll("animationstart"),kv=Ll("transitionrun"),Qv=Ll("transitionstart"),Zv=Ll("transitioncancel"),hs=Ll("transitionend"),vs=new Map,ac="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");ac.push("scrollEnd");function _t(e,t){vs.set(e,t),Hl(t,[e])}var ys=new WeakMap;function St(e,t){if(typeof e=="object"&&e!==null){var l=ys.get(e);return l!==void 0?l:(t={value:e,source:t,stack:wo(t)},ys.set(e,t),t)}return{value:e,source:t,stack:wo(t)}}var xt=[],ha=0,nc=0;function yu(){for(var e=ha,t=nc=ha=0;t<e;){var l=xt[t];xt[t++]=null;var a=xt[t];xt[t++]=null;var n=xt[t];xt[t++]=null;var u=xt[t];if(xt[t++]=null,a!==null&&n!==null){var o=a.pending;o===null?n.next=n:(n.next=o.next,o.next=n),a.pending=n}u!==0&&gs(l,n,u)}}function gu(e,t,l,a){xt[ha++]=e,xt[ha++]=t,xt[ha++]=l,xt[ha++]=a,nc|=a,e.lanes|=a,e=e.alternate,e!==null&&(e.lanes|=a)}function uc(e,t,l,a){return gu(e,t,l,a),pu(e)}function va(e,t){return gu(e,null,null,t),pu(e)}function gs(e,t,l){e.lanes|=l;var a=e.alternate;a!==null&&(a.lanes|=l);for(var n=!1,u=e.return;u!==null;)u.childLanes|=l,a=u.alternate,a!==null&&(a.childLanes|=l),u.tag===22&&(e=u.stateNode,e===null||e._visibility&1||(n=!0)),e=u,u=u.return;return e.tag===3?(u=e.stateNode,n&&t!==null&&(n=31-rt(l),e=u.hiddenUpdates,a=e[n],a===null?e[n]=[t]:a.push(t),t.lane=l|536870912),u):null}function pu(e){if(50<Cn)throw Cn=0,fr=null,Error(r(185));for(var t=e.return;t!==null;)e=t,t=e.return;return e.tag===3?e.stateNode:null}var ya={};function Kv(e,t,l,a){this.tag=e,this.key=l,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function st(e,t,l,a){return new Kv(e,t,l,a)}function ic(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Vt(e,t){var l=e.alternate;return l===null?(l=st(e.tag,t,e.key,e.mode),l.elementType=e.elementType,l.type=e.type,l.stateNode=e.stateNode,l.alternate=e,e.alternate=l):(l.pendingProps=t,l.type=e.type,l.flags=0,l.subtreeFlags=0,l.deletions=null),l.flags=e.flags&65011712,l.childLanes=e.childLanes,l.lanes=e.lanes,l.child=e.child,l.memoizedProps=e.memoizedProps,l.memoizedState=e.memoizedState,l.updateQueue=e.updateQueue,t=e.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},l.sibling=e.sibling,l.index=e.index,l.ref=e.ref,l.refCleanup=e.refCleanup,l}function ps(e,t){e.flags&=65011714;var l=e.alternate;return l===null?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=l.childLanes,e.lanes=l.lanes,e.child=l.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=l.memoizedProps,e.memoizedState=l.memoizedState,e.updateQueue=l.updateQueue,e.type=l.type,t=l.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function bu(e,t,l,a,n,u){var o=0;if(a=e,typeof e=="function")ic(e)&&(o=1);else if(typeof e=="string")o=$y(e,l,K.current)?26:e==="html"||e==="head"||e==="body"?27:5;else e:switch(e){case de:return e=st(31,l,t,n),e.elementType=de,e.lanes=u,e;case C:return Gl(l.children,n,u,t);case B:o=8,n|=24;break;case q:return e=st(12,l,t,n|2),e.elementType=q,e.lanes=u,e;case F:return e=st(13,l,t,n),e.elementType=F,e.lanes=u,e;case me:return e=st(19,l,t,n),e.elementType=me,e.lanes=u,e;default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case U:case Q:o=10;break e;case P:o=9;break e;case ee:o=11;break e;case ve:o=14;break e;case k:o=16,a=null;break e}o=29,l=Error(r(130,e===null?"null":typeof e,"")),a=null}return t=st(o,l,t,n),t.elementType=e,t.type=a,t.lanes=u,t}function Gl(e,t,l,a){return e=st(7,e,a,t),e.lanes=l,e}function cc(e,t,l){return e=st(6,e,null,t),e.lanes=l,e}function rc(e,t,l){return t=st(4,e.children!==null?e.children:[],e.key,t),t.lanes=l,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var ga=[],pa=0,Su=null,xu=0,Et=[],Tt=0,Yl=null,Xt=1,kt="";function Vl(e,t){ga[pa++]=xu,ga[pa++]=Su,Su=e,xu=t}function bs(e,t,l){Et[Tt++]=Xt,Et[Tt++]=kt,Et[Tt++]=Yl,Yl=e;var a=Xt;e=kt;var n=32-rt(a)-1;a&=~(1<<n),l+=1;var u=32-rt(t)+n;if(30<u){var o=n-n%5;u=(a&(1<<o)-1).toString(32),a>>=o,n-=o,Xt=1<<32-rt(t)+n|l<<n|a,kt=u+e}else Xt=1<<u|l<<n|a,kt=e}function oc(e){e.return!==null&&(Vl(e,1),bs(e,1,0))}function sc(e){for(;e===Su;)Su=ga[--pa],ga[pa]=null,xu=ga[--pa],ga[pa]=null;for(;e===Yl;)Yl=Et[--Tt],Et[Tt]=null,kt=Et[--Tt],Et[Tt]=null,Xt=Et[--Tt],Et[Tt]=null}var et=null,we=null,pe=!1,Xl=null,wt=!1,fc=Error(r(519));function kl(e){var t=Error(r(418,""));throw on(St(t,e)),fc}function Ss(e){var t=e.stateNode,l=e.type,a=e.memoizedProps;switch(t[Fe]=e,t[tt]=a,l){case"dialog":fe("cancel",t),fe("close",t);break;case"iframe":case"object":case"embed":fe("load",t);break;case"video":case"audio":for(l=0;l<Dn.length;l++)fe(Dn[l],t);break;case"source":fe("error",t);break;case"img":case"image":case"link":fe("error",t),fe("load",t);break;case"details":fe("toggle",t);break;case"input":fe("invalid",t),jo(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0),cu(t);break;case"select":fe("invalid",t);break;case"textarea":fe("invalid",t),Bo(t,a.value,a.defaultValue,a.children),cu(t)}l=a.children,typeof l!="string"&&typeof l!="number"&&typeof l!="bigint"||t.textContent===""+l||a.suppressHydrationWarning===!0||qd(t.textContent,l)?(a.popover!=null&&(fe("beforetoggle",t),fe("toggle",t)),a.onScroll!=null&&fe("scroll",t),a.onScrollEnd!=null&&fe("scrollend",t),a.onClick!=null&&(t.onclick=ti),t=!0):t=!1,t||kl(e)}function xs(e){for(et=e.return;et;)switch(et.tag){case 5:case 13:wt=!1;return;case 27:case 3:wt=!0;return;default:et=et.return}}function cn(e){if(e!==et)return!1;if(!pe)return xs(e),pe=!0,!1;var t=e.tag,l;if((l=t!==3&&t!==27)&&((l=t===5)&&(l=e.type,l=!(l!=="form"&&l!=="button")||_r(e.type,e.memoizedProps)),l=!l),l&&we&&kl(e),xs(e),t===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(r(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8)if(l=e.data,l==="/$"){if(t===0){we=Nt(e.nextSibling);break e}t--}else l!=="$"&&l!=="$!"&&l!=="$?"||t++;e=e.nextSibling}we=null}}else t===27?(t=we,_l(e.type)?(e=Cr,Cr=null,we=e):we=t):we=et?Nt(e.stateNode.nextSibling):null;return!0}function rn(){we=et=null,pe=!1}function Es(){var e=Xl;return e!==null&&(ut===null?ut=e:ut.push.apply(ut,e),Xl=null),e}function on(e){Xl===null?Xl=[e]:Xl.push(e)}var dc=L(null),Ql=null,Qt=null;function dl(e,t,l){V(dc,t._currentValue),t._currentValue=l}function Zt(e){e._currentValue=dc.current,Z(dc)}function mc(e,t,l){for(;e!==null;){var a=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),e===l)break;e=e.return}}function hc(e,t,l,a){var n=e.child;for(n!==null&&(n.return=e);n!==null;){var u=n.dependencies;if(u!==null){var o=n.child;u=u.firstContext;e:for(;u!==null;){var d=u;u=n;for(var y=0;y<t.length;y++)if(d.context===t[y]){u.lanes|=l,d=u.alternate,d!==null&&(d.lanes|=l),mc(u.return,l,e),a||(o=null);break e}u=d.next}}else if(n.tag===18){if(o=n.return,o===null)throw Error(r(341));o.lanes|=l,u=o.alternate,u!==null&&(u.lanes|=l),mc(o,l,e),o=null}else o=n.child;if(o!==null)o.return=n;else for(o=n;o!==null;){if(o===e){o=null;break}if(n=o.sibling,n!==null){n.return=o.return,o=n;break}o=o.return}n=o}}function sn(e,t,l,a){e=null;for(var n=t,u=!1;n!==null;){if(!u){if((n.flags&524288)!==0)u=!0;else if((n.flags&262144)!==0)break}if(n.tag===10){var o=n.alternate;if(o===null)throw Error(r(387));if(o=o.memoizedProps,o!==null){var d=n.type;ot(n.pendingProps.value,o.value)||(e!==null?e.push(d):e=[d])}}else if(n===ye.current){if(o=n.alternate,o===null)throw Error(r(387));o.memoizedState.memoizedState!==n.memoizedState.memoizedState&&(e!==null?e.push(Ln):e=[Ln])}n=n.return}e!==null&&hc(t,e,l,a),t.flags|=262144}function Eu(e){for(e=e.firstContext;e!==null;){if(!ot(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Zl(e){Ql=e,Qt=null,e=e.dependencies,e!==null&&(e.firstContext=null)}function Pe(e){return Ts(Ql,e)}function Tu(e,t){return Ql===null&&Zl(e),Ts(e,t)}function Ts(e,t){var l=t._currentValue;if(t={context:t,memoizedValue:l,next:null},Qt===null){if(e===null)throw Error(r(308));Qt=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else Qt=Qt.next=t;return l}var Jv=typeof AbortController<"u"?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(l,a){e.push(a)}};this.abort=function(){t.aborted=!0,e.forEach(function(l){return l()})}},$v=i.unstable_scheduleCallback,Wv=i.unstable_NormalPriority,Ge={$$typeof:Q,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function vc(){return{controller:new Jv,data:new Map,refCount:0}}function fn(e){e.refCount--,e.refCount===0&&$v(Wv,function(){e.controller.abort()})}var dn=null,yc=0,ba=0,Sa=null;function Fv(e,t){if(dn===null){var l=dn=[];yc=0,ba=pr(),Sa={status:"pending",value:void 0,then:function(a){l.push(a)}}}return yc++,t.then(As,As),t}function As(){if(--yc===0&&dn!==null){Sa!==null&&(Sa.status="fulfilled");var e=dn;dn=null,ba=0,Sa=null;for(var t=0;t<e.length;t++)(0,e[t])()}}function Pv(e,t){var l=[],a={status:"pending",value:null,reason:null,then:function(n){l.push(n)}};return e.then(function(){a.status="fulfilled",a.value=t;for(var n=0;n<l.length;n++)(0,l[n])(t)},function(n){for(a.status="rejected",a.reason=n,n=0;n<l.length;n++)(0,l[n])(void 0)}),a}var Rs=O.S;O.S=function(e,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&Fv(e,t),Rs!==null&&Rs(e,t)};var Kl=L(null);function gc(){var e=Kl.current;return e!==null?e:_e.pooledCache}function Au(e,t){t===null?V(Kl,Kl.current):V(Kl,t.pool)}function Ms(){var e=gc();return e===null?null:{parent:Ge._currentValue,pool:e}}var mn=Error(r(460)),_s=Error(r(474)),Ru=Error(r(542)),pc={then:function(){}};function zs(e){return e=e.status,e==="fulfilled"||e==="rejected"}function Mu(){}function Ns(e,t,l){switch(l=e[l],l===void 0?e.push(t):l!==t&&(t.then(Mu,Mu),t=l),t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,Cs(e),e;default:if(typeof t.status=="string")t.then(Mu,Mu);else{if(e=_e,e!==null&&100<e.shellSuspendCounter)throw Error(r(482));e=t,e.status="pending",e.then(function(a){if(t.status==="pending"){var n=t;n.status="fulfilled",n.value=a}},function(a){if(t.status==="pending"){var n=t;n.status="rejected",n.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,Cs(e),e}throw hn=t,mn}}var hn=null;function Os(){if(hn===null)throw Error(r(459));var e=hn;return hn=null,e}function Cs(e){if(e===mn||e===Ru)throw Error(r(483))}var ml=!1;function bc(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Sc(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function hl(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function vl(e,t,l){var a=e.updateQueue;if(a===null)return null;if(a=a.shared,(Se&2)!==0){var n=a.pending;return n===null?t.next=t:(t.next=n.next,n.next=t),a.pending=t,t=pu(e),gs(e,null,l),t}return gu(e,a,t,l),pu(e)}function vn(e,t,l){if(t=t.updateQueue,t!==null&&(t=t.shared,(l&4194048)!==0)){var a=t.lanes;a&=e.pendingLanes,l|=a,t.lanes=l,Ao(e,l)}}function xc(e,t){var l=e.updateQueue,a=e.alternate;if(a!==null&&(a=a.updateQueue,l===a)){var n=null,u=null;if(l=l.firstBaseUpdate,l!==null){do{var o={lane:l.lane,tag:l.tag,payload:l.payload,callback:null,next:null};u===null?n=u=o:u=u.next=o,l=l.next}while(l!==null);u===null?n=u=t:u=u.next=t}else n=u=t;l={baseState:a.baseState,firstBaseUpdate:n,lastBaseUpdate:u,shared:a.shared,callbacks:a.callbacks},e.updateQueue=l;return}e=l.lastBaseUpdate,e===null?l.firstBaseUpdate=t:e.next=t,l.lastBaseUpdate=t}var Ec=!1;function yn(){if(Ec){var e=Sa;if(e!==null)throw e}}function gn(e,t,l,a){Ec=!1;var n=e.updateQueue;ml=!1;var u=n.firstBaseUpdate,o=n.lastBaseUpdate,d=n.shared.pending;if(d!==null){n.shared.pending=null;var y=d,M=y.next;y.next=null,o===null?u=M:o.next=M,o=y;var D=e.alternate;D!==null&&(D=D.updateQueue,d=D.lastBaseUpdate,d!==o&&(d===null?D.firstBaseUpdate=M:d.next=M,D.lastBaseUpdate=y))}if(u!==null){var H=n.baseState;o=0,D=M=y=null,d=u;do{var _=d.lane&-536870913,z=_!==d.lane;if(z?(he&_)===_:(a&_)===_){_!==0&&_===ba&&(Ec=!0),D!==null&&(D=D.next={lane:0,tag:d.tag,payload:d.payload,callback:null,next:null});e:{var ae=e,te=d;_=t;var Ae=l;switch(te.tag){case 1:if(ae=te.payload,typeof ae=="function"){H=ae.call(Ae,H,_);break e}H=ae;break e;case 3:ae.flags=ae.flags&-65537|128;case 0:if(ae=te.payload,_=typeof ae=="function"?ae.call(Ae,H,_):ae,_==null)break e;H=S({},H,_);break e;case 2:ml=!0}}_=d.callback,_!==null&&(e.flags|=64,z&&(e.flags|=8192),z=n.callbacks,z===null?n.callbacks=[_]:z.push(_))}else z={lane:_,tag:d.tag,payload:d.payload,callback:d.callback,next:null},D===null?(M=D=z,y=H):D=D.next=z,o|=_;if(d=d.next,d===null){if(d=n.shared.pending,d===null)break;z=d,d=z.next,z.next=null,n.lastBaseUpdate=z,n.shared.pending=null}}while(!0);D===null&&(y=H),n.baseState=y,n.firstBaseUpdate=M,n.lastBaseUpdate=D,u===null&&(n.shared.lanes=0),Tl|=o,e.lanes=o,e.memoizedState=H}}function ws(e,t){if(typeof e!="function")throw Error(r(191,e));e.call(t)}function Ds(e,t){var l=e.callbacks;if(l!==null)for(e.callbacks=null,e=0;e<l.length;e++)ws(l[e],t)}var xa=L(null),_u=L(0);function Us(e,t){e=It,V(_u,e),V(xa,t),It=e|t.baseLanes}function Tc(){V(_u,It),V(xa,xa.current)}function Ac(){It=_u.current,Z(xa),Z(_u)}var yl=0,ie=null,Ee=null,Be=null,zu=!1,Ea=!1,Jl=!1,Nu=0,pn=0,Ta=null,Iv=0;function je(){throw Error(r(321))}function Rc(e,t){if(t===null)return!1;for(var l=0;l<t.length&&l<e.length;l++)if(!ot(e[l],t[l]))return!1;return!0}function Mc(e,t,l,a,n,u){return yl=u,ie=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,O.H=e===null||e.memoizedState===null?pf:bf,Jl=!1,u=l(a,n),Jl=!1,Ea&&(u=Hs(t,l,a,n)),js(e),u}function js(e){O.H=ju;var t=Ee!==null&&Ee.next!==null;if(yl=0,Be=Ee=ie=null,zu=!1,pn=0,Ta=null,t)throw Error(r(300));e===null||Qe||(e=e.dependencies,e!==null&&Eu(e)&&(Qe=!0))}function Hs(e,t,l,a){ie=e;var n=0;do{if(Ea&&(Ta=null),pn=0,Ea=!1,25<=n)throw Error(r(301));if(n+=1,Be=Ee=null,e.updateQueue!=null){var u=e.updateQueue;u.lastEffect=null,u.events=null,u.stores=null,u.memoCache!=null&&(u.memoCache.index=0)}O.H=iy,u=t(l,a)}while(Ea);return u}function ey(){var e=O.H,t=e.useState()[0];return t=typeof t.then=="function"?bn(t):t,e=e.useState()[0],(Ee!==null?Ee.memoizedState:null)!==e&&(ie.flags|=1024),t}function _c(){var e=Nu!==0;return Nu=0,e}function zc(e,t,l){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l}function Nc(e){if(zu){for(e=e.memoizedState;e!==null;){var t=e.queue;t!==null&&(t.pending=null),e=e.next}zu=!1}yl=0,Be=Ee=ie=null,Ea=!1,pn=Nu=0,Ta=null}function at(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Be===null?ie.memoizedState=Be=e:Be=Be.next=e,Be}function qe(){if(Ee===null){var e=ie.alternate;e=e!==null?e.memoizedState:null}else e=Ee.next;var t=Be===null?ie.memoizedState:Be.next;if(t!==null)Be=t,Ee=e;else{if(e===null)throw ie.alternate===null?Error(r(467)):Error(r(310));Ee=e,e={memoizedState:Ee.memoizedState,baseState:Ee.baseState,baseQueue:Ee.baseQueue,queue:Ee.queue,next:null},Be===null?ie.memoizedState=Be=e:Be=Be.next=e}return Be}function Oc(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function bn(e){var t=pn;return pn+=1,Ta===null&&(Ta=[]),e=Ns(Ta,e,t),t=ie,(Be===null?t.memoizedState:Be.next)===null&&(t=t.alternate,O.H=t===null||t.memoizedState===null?pf:bf),e}function Ou(e){if(e!==null&&typeof e=="object"){if(typeof e.then=="function")return bn(e);if(e.$$typeof===Q)return Pe(e)}throw Error(r(438,String(e)))}function Cc(e){var t=null,l=ie.updateQueue;if(l!==null&&(t=l.memoCache),t==null){var a=ie.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(n){return n.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),l===null&&(l=Oc(),ie.updateQueue=l),l.memoCache=t,l=t.data[t.index],l===void 0)for(l=t.data[t.index]=Array(e),a=0;a<e;a++)l[a]=Ue;return t.index++,l}function Kt(e,t){return typeof t=="function"?t(e):t}function Cu(e){var t=qe();return wc(t,Ee,e)}function wc(e,t,l){var a=e.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=l;var n=e.baseQueue,u=a.pending;if(u!==null){if(n!==null){var o=n.next;n.next=u.next,u.next=o}t.baseQueue=n=u,a.pending=null}if(u=e.baseState,n===null)e.memoizedState=u;else{t=n.next;var d=o=null,y=null,M=t,D=!1;do{var H=M.lane&-536870913;if(H!==M.lane?(he&H)===H:(yl&H)===H){var _=M.revertLane;if(_===0)y!==null&&(y=y.next={lane:0,revertLane:0,action:M.action,hasEagerState:M.hasEagerState,eagerState:M.eagerState,next:null}),H===ba&&(D=!0);else if((yl&_)===_){M=M.next,_===ba&&(D=!0);continue}else H={lane:0,revertLane:M.revertLane,action:M.action,hasEagerState:M.hasEagerState,eagerState:M.eagerState,next:null},y===null?(d=y=H,o=u):y=y.next=H,ie.lanes|=_,Tl|=_;H=M.action,Jl&&l(u,H),u=M.hasEagerState?M.eagerState:l(u,H)}else _={lane:H,revertLane:M.revertLane,action:M.action,hasEagerState:M.hasEagerState,eagerState:M.eagerState,next:null},y===null?(d=y=_,o=u):y=y.next=_,ie.lanes|=H,Tl|=H;M=M.next}while(M!==null&&M!==t);if(y===null?o=u:y.next=d,!ot(u,e.memoizedState)&&(Qe=!0,D&&(l=Sa,l!==null)))throw l;e.memoizedState=u,e.baseState=o,e.baseQueue=y,a.lastRenderedState=u}return n===null&&(a.lanes=0),[e.memoizedState,a.dispatch]}function Dc(e){var t=qe(),l=t.queue;if(l===null)throw Error(r(311));l.lastRenderedReducer=e;var a=l.dispatch,n=l.pending,u=t.memoizedState;if(n!==null){l.pending=null;var o=n=n.next;do u=e(u,o.action),o=o.next;while(o!==n);ot(u,t.memoizedState)||(Qe=!0),t.memoizedState=u,t.baseQueue===null&&(t.baseState=u),l.lastRenderedState=u}return[u,a]}function Bs(e,t,l){var a=ie,n=qe(),u=pe;if(u){if(l===void 0)throw Error(r(407));l=l()}else l=t();var o=!ot((Ee||n).memoizedState,l);o&&(n.memoizedState=l,Qe=!0),n=n.queue;var d=Gs.bind(null,a,n,e);if(Sn(2048,8,d,[e]),n.getSnapshot!==t||o||Be!==null&&Be.memoizedState.tag&1){if(a.flags|=2048,Aa(9,wu(),Ls.bind(null,a,n,l,t),null),_e===null)throw Error(r(349));u||(yl&124)!==0||qs(a,t,l)}return l}function qs(e,t,l){e.flags|=16384,e={getSnapshot:t,value:l},t=ie.updateQueue,t===null?(t=Oc(),ie.updateQueue=t,t.stores=[e]):(l=t.stores,l===null?t.stores=[e]:l.push(e))}function Ls(e,t,l,a){t.value=l,t.getSnapshot=a,Ys(t)&&Vs(e)}function Gs(e,t,l){return l(function(){Ys(t)&&Vs(e)})}function Ys(e){var t=e.getSnapshot;e=e.value;try{var l=t();return!ot(e,l)}catch{return!0}}function Vs(e){var t=va(e,2);t!==null&&vt(t,e,2)}function Uc(e){var t=at();if(typeof e=="function"){var l=e;if(e=l(),Jl){ol(!0);try{l()}finally{ol(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Kt,lastRenderedState:e},t}function Xs(e,t,l,a){return e.baseState=l,wc(e,Ee,typeof a=="function"?a:Kt)}function ty(e,t,l,a,n){if(Uu(e))throw Error(r(485));if(e=t.action,e!==null){var u={payload:n,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(o){u.listeners.push(o)}};O.T!==null?l(!0):u.isTransition=!1,a(u),l=t.pending,l===null?(u.next=t.pending=u,ks(t,u)):(u.next=l.next,t.pending=l.next=u)}}function ks(e,t){var l=t.action,a=t.payload,n=e.state;if(t.isTransition){var u=O.T,o={};O.T=o;try{var d=l(n,a),y=O.S;y!==null&&y(o,d),Qs(e,t,d)}catch(M){jc(e,t,M)}finally{O.T=u}}else try{u=l(n,a),Qs(e,t,u)}catch(M){jc(e,t,M)}}function Qs(e,t,l){l!==null&&typeof l=="object"&&typeof l.then=="function"?l.then(function(a){Zs(e,t,a)},function(a){return jc(e,t,a)}):Zs(e,t,l)}function Zs(e,t,l){t.status="fulfilled",t.value=l,Ks(t),e.state=l,t=e.pending,t!==null&&(l=t.next,l===t?e.pending=null:(l=l.next,t.next=l,ks(e,l)))}function jc(e,t,l){var a=e.pending;if(e.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=l,Ks(t),t=t.next;while(t!==a)}e.action=null}function Ks(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function Js(e,t){return t}function $s(e,t){if(pe){var l=_e.formState;if(l!==null){e:{var a=ie;if(pe){if(we){t:{for(var n=we,u=wt;n.nodeType!==8;){if(!u){n=null;break t}if(n=Nt(n.nextSibling),n===null){n=null;break t}}u=n.data,n=u==="F!"||u==="F"?n:null}if(n){we=Nt(n.nextSibling),a=n.data==="F!";break e}}kl(a)}a=!1}a&&(t=l[0])}}return l=at(),l.memoizedState=l.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Js,lastRenderedState:t},l.queue=a,l=vf.bind(null,ie,a),a.dispatch=l,a=Uc(!1),u=Gc.bind(null,ie,!1,a.queue),a=at(),n={state:t,dispatch:null,action:e,pending:null},a.queue=n,l=ty.bind(null,ie,n,u,l),n.dispatch=l,a.memoizedState=e,[t,l,!1]}function Ws(e){var t=qe();return Fs(t,Ee,e)}function Fs(e,t,l){if(t=wc(e,t,Js)[0],e=Cu(Kt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=bn(t)}catch(o){throw o===mn?Ru:o}else a=t;t=qe();var n=t.queue,u=n.dispatch;return l!==t.memoizedState&&(ie.flags|=2048,Aa(9,wu(),ly.bind(null,n,l),null)),[a,u,e]}function ly(e,t){e.action=t}function Ps(e){var t=qe(),l=Ee;if(l!==null)return Fs(t,l,e);qe(),t=t.memoizedState,l=qe();var a=l.queue.dispatch;return l.memoizedState=e,[t,a,!1]}function Aa(e,t,l,a){return e={tag:e,create:l,deps:a,inst:t,next:null},t=ie.updateQueue,t===null&&(t=Oc(),ie.updateQueue=t),l=t.lastEffect,l===null?t.lastEffect=e.next=e:(a=l.next,l.next=e,e.next=a,t.lastEffect=e),e}function wu(){return{destroy:void 0,resource:void 0}}function Is(){return qe().memoizedState}function Du(e,t,l,a){var n=at();a=a===void 0?null:a,ie.flags|=e,n.memoizedState=Aa(1|t,wu(),l,a)}function Sn(e,t,l,a){var n=qe();a=a===void 0?null:a;var u=n.memoizedState.inst;Ee!==null&&a!==null&&Rc(a,Ee.memoizedState.deps)?n.memoizedState=Aa(t,u,l,a):(ie.flags|=e,n.memoizedState=Aa(1|t,u,l,a))}function ef(e,t){Du(8390656,8,e,t)}function tf(e,t){Sn(2048,8,e,t)}function lf(e,t){return Sn(4,2,e,t)}function af(e,t){return Sn(4,4,e,t)}function nf(e,t){if(typeof t=="function"){e=e();var l=t(e);return function(){typeof l=="function"?l():t(null)}}if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function uf(e,t,l){l=l!=null?l.concat([e]):null,Sn(4,4,nf.bind(null,t,e),l)}function Hc(){}function cf(e,t){var l=qe();t=t===void 0?null:t;var a=l.memoizedState;return t!==null&&Rc(t,a[1])?a[0]:(l.memoizedState=[e,t],e)}function rf(e,t){var l=qe();t=t===void 0?null:t;var a=l.memoizedState;if(t!==null&&Rc(t,a[1]))return a[0];if(a=e(),Jl){ol(!0);try{e()}finally{ol(!1)}}return l.memoizedState=[a,t],a}function Bc(e,t,l){return l===void 0||(yl&1073741824)!==0?e.memoizedState=t:(e.memoizedState=l,e=fd(),ie.lanes|=e,Tl|=e,l)}function of(e,t,l,a){return ot(l,t)?l:xa.current!==null?(e=Bc(e,l,a),ot(e,t)||(Qe=!0),e):(yl&42)===0?(Qe=!0,e.memoizedState=l):(e=fd(),ie.lanes|=e,Tl|=e,t)}function sf(e,t,l,a,n){var u=X.p;X.p=u!==0&&8>u?u:8;var o=O.T,d={};O.T=d,Gc(e,!1,t,l);try{var y=n(),M=O.S;if(M!==null&&M(d,y),y!==null&&typeof y=="object"&&typeof y.then=="function"){var D=Pv(y,a);xn(e,t,D,ht(e))}else xn(e,t,a,ht(e))}catch(H){xn(e,t,{then:function(){},status:"rejected",reason:H},ht())}finally{X.p=u,O.T=o}}function ay(){}function qc(e,t,l,a){if(e.tag!==5)throw Error(r(476));var n=ff(e).queue;sf(e,n,t,G,l===null?ay:function(){return df(e),l(a)})}function ff(e){var t=e.memoizedState;if(t!==null)return t;t={memoizedState:G,baseState:G,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Kt,lastRenderedState:G},next:null};var l={};return t.next={memoizedState:l,baseState:l,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Kt,lastRenderedState:l},next:null},e.memoizedState=t,e=e.alternate,e!==null&&(e.memoizedState=t),t}function df(e){var t=ff(e).next.queue;xn(e,t,{},ht())}function Lc(){return Pe(Ln)}function mf(){return qe().memoizedState}function hf(){return qe().memoizedState}function ny(e){for(var t=e.return;t!==null;){switch(t.tag){case 24:case 3:var l=ht();e=hl(l);var a=vl(t,e,l);a!==null&&(vt(a,t,l),vn(a,t,l)),t={cache:vc()},e.payload=t;return}t=t.return}}function uy(e,t,l){var a=ht();l={lane:a,revertLane:0,action:l,hasEagerState:!1,eagerState:null,next:null},Uu(e)?yf(t,l):(l=uc(e,t,l,a),l!==null&&(vt(l,e,a),gf(l,t,a)))}function vf(e,t,l){var a=ht();xn(e,t,l,a)}function xn(e,t,l,a){var n={lane:a,revertLane:0,action:l,hasEagerState:!1,eagerState:null,next:null};if(Uu(e))yf(t,n);else{var u=e.alternate;if(e.lanes===0&&(u===null||u.lanes===0)&&(u=t.lastRenderedReducer,u!==null))try{var o=t.lastRenderedState,d=u(o,l);if(n.hasEagerState=!0,n.eagerState=d,ot(d,o))return gu(e,t,n,0),_e===null&&yu(),!1}catch{}finally{}if(l=uc(e,t,n,a),l!==null)return vt(l,e,a),gf(l,t,a),!0}return!1}function Gc(e,t,l,a){if(a={lane:2,revertLane:pr(),action:a,hasEagerState:!1,eagerState:null,next:null},Uu(e)){if(t)throw Error(r(479))}else t=uc(e,l,a,2),t!==null&&vt(t,e,2)}function Uu(e){var t=e.alternate;return e===ie||t!==null&&t===ie}function yf(e,t){Ea=zu=!0;var l=e.pending;l===null?t.next=t:(t.next=l.next,l.next=t),e.pending=t}function gf(e,t,l){if((l&4194048)!==0){var a=t.lanes;a&=e.pendingLanes,l|=a,t.lanes=l,Ao(e,l)}}var ju={readContext:Pe,use:Ou,useCallback:je,useContext:je,useEffect:je,useImperativeHandle:je,useLayoutEffect:je,useInsertionEffect:je,useMemo:je,useReducer:je,useRef:je,useState:je,useDebugValue:je,useDeferredValue:je,useTransition:je,useSyncExternalStore:je,useId:je,useHostTransitionStatus:je,useFormState:je,useActionState:je,useOptimistic:je,useMemoCache:je,useCacheRefresh:je},pf={readContext:Pe,use:Ou,useCallback:function(e,t){return at().memoizedState=[e,t===void 0?null:t],e},useContext:Pe,useEffect:ef,useImperativeHandle:function(e,t,l){l=l!=null?l.concat([e]):null,Du(4194308,4,nf.bind(null,t,e),l)},useLayoutEffect:function(e,t){return Du(4194308,4,e,t)},useInsertionEffect:function(e,t){Du(4,2,e,t)},useMemo:function(e,t){var l=at();t=t===void 0?null:t;var a=e();if(Jl){ol(!0);try{e()}finally{ol(!1)}}return l.memoizedState=[a,t],a},useReducer:function(e,t,l){var a=at();if(l!==void 0){var n=l(t);if(Jl){ol(!0);try{l(t)}finally{ol(!1)}}}else n=t;return a.memoizedState=a.baseState=n,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},a.queue=e,e=e.dispatch=uy.bind(null,ie,e),[a.memoizedState,e]},useRef:function(e){var t=at();return e={current:e},t.memoizedState=e},useState:function(e){e=Uc(e);var t=e.queue,l=vf.bind(null,ie,t);return t.dispatch=l,[e.memoizedState,l]},useDebugValue:Hc,useDeferredValue:function(e,t){var l=at();return Bc(l,e,t)},useTransition:function(){var e=Uc(!1);return e=sf.bind(null,ie,e.queue,!0,!1),at().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,l){var a=ie,n=at();if(pe){if(l===void 0)throw Error(r(407));l=l()}else{if(l=t(),_e===null)throw Error(r(349));(he&124)!==0||qs(a,t,l)}n.memoizedState=l;var u={value:l,getSnapshot:t};return n.queue=u,ef(Gs.bind(null,a,u,e),[e]),a.flags|=2048,Aa(9,wu(),Ls.bind(null,a,u,l,t),null),l},useId:function(){var e=at(),t=_e.identifierPrefix;if(pe){var l=kt,a=Xt;l=(a&~(1<<32-rt(a)-1)).toString(32)+l,t="«"+t+"R"+l,l=Nu++,0<l&&(t+="H"+l.toString(32)),t+="»"}else l=Iv++,t="«"+t+"r"+l.toString(32)+"»";return e.memoizedState=t},useHostTransitionStatus:Lc,useFormState:$s,useActionState:$s,useOptimistic:function(e){var t=at();t.memoizedState=t.baseState=e;var l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=l,t=Gc.bind(null,ie,!0,l),l.dispatch=t,[e,t]},useMemoCache:Cc,useCacheRefresh:function(){return at().memoizedState=ny.bind(null,ie)}},bf={readContext:Pe,use:Ou,useCallback:cf,useContext:Pe,useEffect:tf,useImperativeHandle:uf,useInsertionEffect:lf,useLayoutEffect:af,useMemo:rf,useReducer:Cu,useRef:Is,useState:function(){return Cu(Kt)},useDebugValue:Hc,useDeferredValue:function(e,t){var l=qe();return of(l,Ee.memoizedState,e,t)},useTransition:function(){var e=Cu(Kt)[0],t=qe().memoizedState;return[typeof e=="boolean"?e:bn(e),t]},useSyncExternalStore:Bs,useId:mf,useHostTransitionStatus:Lc,useFormState:Ws,useActionState:Ws,useOptimistic:function(e,t){var l=qe();return Xs(l,Ee,e,t)},useMemoCache:Cc,useCacheRefresh:hf},iy={readContext:Pe,use:Ou,useCallback:cf,useContext:Pe,useEffect:tf,useImperativeHandle:uf,useInsertionEffect:lf,useLayoutEffect:af,useMemo:rf,useReducer:Dc,useRef:Is,useState:function(){return Dc(Kt)},useDebugValue:Hc,useDeferredValue:function(e,t){var l=qe();return Ee===null?Bc(l,e,t):of(l,Ee.memoizedState,e,t)},useTransition:function(){var e=Dc(Kt)[0],t=qe().memoizedState;return[typeof e=="boolean"?e:bn(e),t]},useSyncExternalStore:Bs,useId:mf,useHostTransitionStatus:Lc,useFormState:Ps,useActionState:Ps,useOptimistic:function(e,t){var l=qe();return Ee!==null?Xs(l,Ee,e,t):(l.baseState=e,[e,l.queue.dispatch])},useMemoCache:Cc,useCacheRefresh:hf},Ra=null,En=0;function Hu(e){var t=En;return En+=1,Ra===null&&(Ra=[]),Ns(Ra,e,t)}function Tn(e,t){t=t.props.ref,e.ref=t!==void 0?t:null}function Bu(e,t){throw t.$$typeof===N?Error(r(525)):(e=Object.prototype.toString.call(t),Error(r(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)))}function Sf(e){var t=e._init;return t(e._payload)}function xf(e){function t(T,b){if(e){var A=T.deletions;A===null?(T.deletions=[b],T.flags|=16):A.push(b)}}function l(T,b){if(!e)return null;for(;b!==null;)t(T,b),b=b.sibling;return null}function a(T){for(var b=new Map;T!==null;)T.key!==null?b.set(T.key,T):b.set(T.index,T),T=T.sibling;return b}function n(T,b){return T=Vt(T,b),T.index=0,T.sibling=null,T}function u(T,b,A){return T.index=A,e?(A=T.alternate,A!==null?(A=A.index,A<b?(T.flags|=67108866,b):A):(T.flags|=67108866,b)):(T.flags|=1048576,b)}function o(T){return e&&T.alternate===null&&(T.flags|=67108866),T}function d(T,b,A,j){return b===null||b.tag!==6?(b=cc(A,T.mode,j),b.return=T,b):(b=n(b,A),b.return=T,b)}function y(T,b,A,j){var J=A.type;return J===C?D(T,b,A.props.children,j,A.key):b!==null&&(b.elementType===J||typeof J=="object"&&J!==null&&J.$$typeof===k&&Sf(J)===b.type)?(b=n(b,A.props),Tn(b,A),b.return=T,b):(b=bu(A.type,A.key,A.props,null,T.mode,j),Tn(b,A),b.return=T,b)}function M(T,b,A,j){return b===null||b.tag!==4||b.stateNode.containerInfo!==A.containerInfo||b.stateNode.implementation!==A.implementation?(b=rc(A,T.mode,j),b.return=T,b):(b=n(b,A.children||[]),b.return=T,b)}function D(T,b,A,j,J){return b===null||b.tag!==7?(b=Gl(A,T.mode,j,J),b.return=T,b):(b=n(b,A),b.return=T,b)}function H(T,b,A){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return b=cc(""+b,T.mode,A),b.return=T,b;if(typeof b=="object"&&b!==null){switch(b.$$typeof){case R:return A=bu(b.type,b.key,b.props,null,T.mode,A),Tn(A,b),A.return=T,A;case Y:return b=rc(b,T.mode,A),b.return=T,b;case k:var j=b._init;return b=j(b._payload),H(T,b,A)}if(ze(b)||Oe(b))return b=Gl(b,T.mode,A,null),b.return=T,b;if(typeof b.then=="function")return H(T,Hu(b),A);if(b.$$typeof===Q)return H(T,Tu(T,b),A);Bu(T,b)}return null}function _(T,b,A,j){var J=b!==null?b.key:null;if(typeof A=="string"&&A!==""||typeof A=="number"||typeof A=="bigint")return J!==null?null:d(T,b,""+A,j);if(typeof A=="object"&&A!==null){switch(A.$$typeof){case R:return A.key===J?y(T,b,A,j):null;case Y:return A.key===J?M(T,b,A,j):null;case k:return J=A._init,A=J(A._payload),_(T,b,A,j)}if(ze(A)||Oe(A))return J!==null?null:D(T,b,A,j,null);if(typeof A.then=="function")return _(T,b,Hu(A),j);if(A.$$typeof===Q)return _(T,b,Tu(T,A),j);Bu(T,A)}return null}function z(T,b,A,j,J){if(typeof j=="string"&&j!==""||typeof j=="number"||typeof j=="bigint")return T=T.get(A)||null,d(b,T,""+j,J);if(typeof j=="object"&&j!==null){switch(j.$$typeof){case R:return T=T.get(j.key===null?A:j.key)||null,y(b,T,j,J);case Y:return T=T.get(j.key===null?A:j.key)||null,M(b,T,j,J);case k:var re=j._init;return j=re(j._payload),z(T,b,A,j,J)}if(ze(j)||Oe(j))return T=T.get(A)||null,D(b,T,j,J,null);if(typeof j.then=="function")return z(T,b,A,Hu(j),J);if(j.$$typeof===Q)return z(T,b,A,Tu(b,j),J);Bu(b,j)}return null}function ae(T,b,A,j){for(var J=null,re=null,I=b,le=b=0,Ke=null;I!==null&&le<A.length;le++){I.index>le?(Ke=I,I=null):Ke=I.sibling;var ge=_(T,I,A[le],j);if(ge===null){I===null&&(I=Ke);break}e&&I&&ge.alternate===null&&t(T,I),b=u(ge,b,le),re===null?J=ge:re.sibling=ge,re=ge,I=Ke}if(le===A.length)return l(T,I),pe&&Vl(T,le),J;if(I===null){for(;le<A.length;le++)I=H(T,A[le],j),I!==null&&(b=u(I,b,le),re===null?J=I:re.sibling=I,re=I);return pe&&Vl(T,le),J}for(I=a(I);le<A.length;le++)Ke=z(I,T,le,A[le],j),Ke!==null&&(e&&Ke.alternate!==null&&I.delete(Ke.key===null?le:Ke.key),b=u(Ke,b,le),re===null?J=Ke:re.sibling=Ke,re=Ke);return e&&I.forEach(function(wl){return t(T,wl)}),pe&&Vl(T,le),J}function te(T,b,A,j){if(A==null)throw Error(r(151));for(var J=null,re=null,I=b,le=b=0,Ke=null,ge=A.next();I!==null&&!ge.done;le++,ge=A.next()){I.index>le?(Ke=I,I=null):Ke=I.sibling;var wl=_(T,I,ge.value,j);if(wl===null){I===null&&(I=Ke);break}e&&I&&wl.alternate===null&&t(T,I),b=u(wl,b,le),re===null?J=wl:re.sibling=wl,re=wl,I=Ke}if(ge.done)return l(T,I),pe&&Vl(T,le),J;if(I===null){for(;!ge.done;le++,ge=A.next())ge=H(T,ge.value,j),ge!==null&&(b=u(ge,b,le),re===null?J=ge:re.sibling=ge,re=ge);return pe&&Vl(T,le),J}for(I=a(I);!ge.done;le++,ge=A.next())ge=z(I,T,le,ge.value,j),ge!==null&&(e&&ge.alternate!==null&&I.delete(ge.key===null?le:ge.key),b=u(ge,b,le),re===null?J=ge:re.sibling=ge,re=ge);return e&&I.forEach(function(c0){return t(T,c0)}),pe&&Vl(T,le),J}function Ae(T,b,A,j){if(typeof A=="object"&&A!==null&&A.type===C&&A.key===null&&(A=A.props.children),typeof A=="object"&&A!==null){switch(A.$$typeof){case R:e:{for(var J=A.key;b!==null;){if(b.key===J){if(J=A.type,J===C){if(b.tag===7){l(T,b.sibling),j=n(b,A.props.children),j.return=T,T=j;break e}}else if(b.elementType===J||typeof J=="object"&&J!==null&&J.$$typeof===k&&Sf(J)===b.type){l(T,b.sibling),j=n(b,A.props),Tn(j,A),j.return=T,T=j;break e}l(T,b);break}else t(T,b);b=b.sibling}A.type===C?(j=Gl(A.props.children,T.mode,j,A.key),j.return=T,T=j):(j=bu(A.type,A.key,A.props,null,T.mode,j),Tn(j,A),j.return=T,T=j)}return o(T);case Y:e:{for(J=A.key;b!==null;){if(b.key===J)if(b.tag===4&&b.stateNode.containerInfo===A.containerInfo&&b.stateNode.implementation===A.implementation){l(T,b.sibling),j=n(b,A.children||[]),j.return=T,T=j;break e}else{l(T,b);break}else t(T,b);b=b.sibling}j=rc(A,T.mode,j),j.return=T,T=j}return o(T);case k:return J=A._init,A=J(A._payload),Ae(T,b,A,j)}if(ze(A))return ae(T,b,A,j);if(Oe(A)){if(J=Oe(A),typeof J!="function")throw Error(r(150));return A=J.call(A),te(T,b,A,j)}if(typeof A.then=="function")return Ae(T,b,Hu(A),j);if(A.$$typeof===Q)return Ae(T,b,Tu(T,A),j);Bu(T,A)}return typeof A=="string"&&A!==""||typeof A=="number"||typeof A=="bigint"?(A=""+A,b!==null&&b.tag===6?(l(T,b.sibling),j=n(b,A),j.return=T,T=j):(l(T,b),j=cc(A,T.mode,j),j.return=T,T=j),o(T)):l(T,b)}return function(T,b,A,j){try{En=0;var J=Ae(T,b,A,j);return Ra=null,J}catch(I){if(I===mn||I===Ru)throw I;var re=st(29,I,null,T.mode);return re.lanes=j,re.return=T,re}finally{}}}var Ma=xf(!0),Ef=xf(!1),At=L(null),Dt=null;function gl(e){var t=e.alternate;V(Ye,Ye.current&1),V(At,e),Dt===null&&(t===null||xa.current!==null||t.memoizedState!==null)&&(Dt=e)}function Tf(e){if(e.tag===22){if(V(Ye,Ye.current),V(At,e),Dt===null){var t=e.alternate;t!==null&&t.memoizedState!==null&&(Dt=e)}}else pl()}function pl(){V(Ye,Ye.current),V(At,At.current)}function Jt(e){Z(At),Dt===e&&(Dt=null),Z(Ye)}var Ye=L(0);function qu(e){for(var t=e;t!==null;){if(t.tag===13){var l=t.memoizedState;if(l!==null&&(l=l.dehydrated,l===null||l.data==="$?"||Or(l)))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function Yc(e,t,l,a){t=e.memoizedState,l=l(a,t),l=l==null?t:S({},t,l),e.memoizedState=l,e.lanes===0&&(e.updateQueue.baseState=l)}var Vc={enqueueSetState:function(e,t,l){e=e._reactInternals;var a=ht(),n=hl(a);n.payload=t,l!=null&&(n.callback=l),t=vl(e,n,a),t!==null&&(vt(t,e,a),vn(t,e,a))},enqueueReplaceState:function(e,t,l){e=e._reactInternals;var a=ht(),n=hl(a);n.tag=1,n.payload=t,l!=null&&(n.callback=l),t=vl(e,n,a),t!==null&&(vt(t,e,a),vn(t,e,a))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var l=ht(),a=hl(l);a.tag=2,t!=null&&(a.callback=t),t=vl(e,a,l),t!==null&&(vt(t,e,l),vn(t,e,l))}};function Af(e,t,l,a,n,u,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(a,u,o):t.prototype&&t.prototype.isPureReactComponent?!nn(l,a)||!nn(n,u):!0}function Rf(e,t,l,a){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(l,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(l,a),t.state!==e&&Vc.enqueueReplaceState(t,t.state,null)}function $l(e,t){var l=t;if("ref"in t){l={};for(var a in t)a!=="ref"&&(l[a]=t[a])}if(e=e.defaultProps){l===t&&(l=S({},l));for(var n in e)l[n]===void 0&&(l[n]=e[n])}return l}var Lu=typeof reportError=="function"?reportError:function(e){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof e=="object"&&e!==null&&typeof e.message=="string"?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",e);return}console.error(e)};function Mf(e){Lu(e)}function _f(e){console.error(e)}function zf(e){Lu(e)}function Gu(e,t){try{var l=e.onUncaughtError;l(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function Nf(e,t,l){try{var a=e.onCaughtError;a(l.value,{componentStack:l.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(n){setTimeout(function(){throw n})}}function Xc(e,t,l){return l=hl(l),l.tag=3,l.payload={element:null},l.callback=function(){Gu(e,t)},l}function Of(e){return e=hl(e),e.tag=3,e}function Cf(e,t,l,a){var n=l.type.getDerivedStateFromError;if(typeof n=="function"){var u=a.value;e.payload=function(){return n(u)},e.callback=function(){Nf(t,l,a)}}var o=l.stateNode;o!==null&&typeof o.componentDidCatch=="function"&&(e.callback=function(){Nf(t,l,a),typeof n!="function"&&(Al===null?Al=new Set([this]):Al.add(this));var d=a.stack;this.componentDidCatch(a.value,{componentStack:d!==null?d:""})})}function cy(e,t,l,a,n){if(l.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=l.alternate,t!==null&&sn(t,l,n,!0),l=At.current,l!==null){switch(l.tag){case 13:return Dt===null?mr():l.alternate===null&&De===0&&(De=3),l.flags&=-257,l.flags|=65536,l.lanes=n,a===pc?l.flags|=16384:(t=l.updateQueue,t===null?l.updateQueue=new Set([a]):t.add(a),vr(e,a,n)),!1;case 22:return l.flags|=65536,a===pc?l.flags|=16384:(t=l.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},l.updateQueue=t):(l=t.retryQueue,l===null?t.retryQueue=new Set([a]):l.add(a)),vr(e,a,n)),!1}throw Error(r(435,l.tag))}return vr(e,a,n),mr(),!1}if(pe)return t=At.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=n,a!==fc&&(e=Error(r(422),{cause:a}),on(St(e,l)))):(a!==fc&&(t=Error(r(423),{cause:a}),on(St(t,l))),e=e.current.alternate,e.flags|=65536,n&=-n,e.lanes|=n,a=St(a,l),n=Xc(e.stateNode,a,n),xc(e,n),De!==4&&(De=2)),!1;var u=Error(r(520),{cause:a});if(u=St(u,l),On===null?On=[u]:On.push(u),De!==4&&(De=2),t===null)return!0;a=St(a,l),l=t;do{switch(l.tag){case 3:return l.flags|=65536,e=n&-n,l.lanes|=e,e=Xc(l.stateNode,a,e),xc(l,e),!1;case 1:if(t=l.type,u=l.stateNode,(l.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||u!==null&&typeof u.componentDidCatch=="function"&&(Al===null||!Al.has(u))))return l.flags|=65536,n&=-n,l.lanes|=n,n=Of(n),Cf(n,e,l,a),xc(l,n),!1}l=l.return}while(l!==null);return!1}var wf=Error(r(461)),Qe=!1;function Je(e,t,l,a){t.child=e===null?Ef(t,null,l,a):Ma(t,e.child,l,a)}function Df(e,t,l,a,n){l=l.render;var u=t.ref;if("ref"in a){var o={};for(var d in a)d!=="ref"&&(o[d]=a[d])}else o=a;return Zl(t),a=Mc(e,t,l,o,u,n),d=_c(),e!==null&&!Qe?(zc(e,t,n),$t(e,t,n)):(pe&&d&&oc(t),t.flags|=1,Je(e,t,a,n),t.child)}function Uf(e,t,l,a,n){if(e===null){var u=l.type;return typeof u=="function"&&!ic(u)&&u.defaultProps===void 0&&l.compare===null?(t.tag=15,t.type=u,jf(e,t,u,a,n)):(e=bu(l.type,null,a,t,t.mode,n),e.ref=t.ref,e.return=t,t.child=e)}if(u=e.child,!Fc(e,n)){var o=u.memoizedProps;if(l=l.compare,l=l!==null?l:nn,l(o,a)&&e.ref===t.ref)return $t(e,t,n)}return t.flags|=1,e=Vt(u,a),e.ref=t.ref,e.return=t,t.child=e}function jf(e,t,l,a,n){if(e!==null){var u=e.memoizedProps;if(nn(u,a)&&e.ref===t.ref)if(Qe=!1,t.pendingProps=a=u,Fc(e,n))(e.flags&131072)!==0&&(Qe=!0);else return t.lanes=e.lanes,$t(e,t,n)}return kc(e,t,l,a,n)}function Hf(e,t,l){var a=t.pendingProps,n=a.children,u=e!==null?e.memoizedState:null;if(a.mode==="hidden"){if((t.flags&128)!==0){if(a=u!==null?u.baseLanes|l:l,e!==null){for(n=t.child=e.child,u=0;n!==null;)u=u|n.lanes|n.childLanes,n=n.sibling;t.childLanes=u&~a}else t.childLanes=0,t.child=null;return Bf(e,t,a,l)}if((l&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},e!==null&&Au(t,u!==null?u.cachePool:null),u!==null?Us(t,u):Tc(),Tf(t);else return t.lanes=t.childLanes=536870912,Bf(e,t,u!==null?u.baseLanes|l:l,l)}else u!==null?(Au(t,u.cachePool),Us(t,u),pl(),t.memoizedState=null):(e!==null&&Au(t,null),Tc(),pl());return Je(e,t,n,l),t.child}function Bf(e,t,l,a){var n=gc();return n=n===null?null:{parent:Ge._currentValue,pool:n},t.memoizedState={baseLanes:l,cachePool:n},e!==null&&Au(t,null),Tc(),Tf(t),e!==null&&sn(e,t,a,!0),null}function Yu(e,t){var l=t.ref;if(l===null)e!==null&&e.ref!==null&&(t.flags|=4194816);else{if(typeof l!="function"&&typeof l!="object")throw Error(r(284));(e===null||e.ref!==l)&&(t.flags|=4194816)}}function kc(e,t,l,a,n){return Zl(t),l=Mc(e,t,l,a,void 0,n),a=_c(),e!==null&&!Qe?(zc(e,t,n),$t(e,t,n)):(pe&&a&&oc(t),t.flags|=1,Je(e,t,l,n),t.child)}function qf(e,t,l,a,n,u){return Zl(t),t.updateQueue=null,l=Hs(t,a,l,n),js(e),a=_c(),e!==null&&!Qe?(zc(e,t,u),$t(e,t,u)):(pe&&a&&oc(t),t.flags|=1,Je(e,t,l,u),t.child)}function Lf(e,t,l,a,n){if(Zl(t),t.stateNode===null){var u=ya,o=l.contextType;typeof o=="object"&&o!==null&&(u=Pe(o)),u=new l(a,u),t.memoizedState=u.state!==null&&u.state!==void 0?u.state:null,u.updater=Vc,t.stateNode=u,u._reactInternals=t,u=t.stateNode,u.props=a,u.state=t.memoizedState,u.refs={},bc(t),o=l.contextType,u.context=typeof o=="object"&&o!==null?Pe(o):ya,u.state=t.memoizedState,o=l.getDerivedStateFromProps,typeof o=="function"&&(Yc(t,l,o,a),u.state=t.memoizedState),typeof l.getDerivedStateFromProps=="function"||typeof u.getSnapshotBeforeUpdate=="function"||typeof u.UNSAFE_componentWillMount!="function"&&typeof u.componentWillMount!="function"||(o=u.state,typeof u.componentWillMount=="function"&&u.componentWillMount(),typeof u.UNSAFE_componentWillMount=="function"&&u.UNSAFE_componentWillMount(),o!==u.state&&Vc.enqueueReplaceState(u,u.state,null),gn(t,a,u,n),yn(),u.state=t.memoizedState),typeof u.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(e===null){u=t.stateNode;var d=t.memoizedProps,y=$l(l,d);u.props=y;var M=u.context,D=l.contextType;o=ya,typeof D=="object"&&D!==null&&(o=Pe(D));var H=l.getDerivedStateFromProps;D=typeof H=="function"||typeof u.getSnapshotBeforeUpdate=="function",d=t.pendingProps!==d,D||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(d||M!==o)&&Rf(t,u,a,o),ml=!1;var _=t.memoizedState;u.state=_,gn(t,a,u,n),yn(),M=t.memoizedState,d||_!==M||ml?(typeof H=="function"&&(Yc(t,l,H,a),M=t.memoizedState),(y=ml||Af(t,l,y,a,_,M,o))?(D||typeof u.UNSAFE_componentWillMount!="function"&&typeof u.componentWillMount!="function"||(typeof u.componentWillMount=="function"&&u.componentWillMount(),typeof u.UNSAFE_componentWillMount=="function"&&u.UNSAFE_componentWillMount()),typeof u.componentDidMount=="function"&&(t.flags|=4194308)):(typeof u.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=M),u.props=a,u.state=M,u.context=o,a=y):(typeof u.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{u=t.stateNode,Sc(e,t),o=t.memoizedProps,D=$l(l,o),u.props=D,H=t.pendingProps,_=u.context,M=l.contextType,y=ya,typeof M=="object"&&M!==null&&(y=Pe(M)),d=l.getDerivedStateFromProps,(M=typeof d=="function"||typeof u.getSnapshotBeforeUpdate=="function")||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(o!==H||_!==y)&&Rf(t,u,a,y),ml=!1,_=t.memoizedState,u.state=_,gn(t,a,u,n),yn();var z=t.memoizedState;o!==H||_!==z||ml||e!==null&&e.dependencies!==null&&Eu(e.dependencies)?(typeof d=="function"&&(Yc(t,l,d,a),z=t.memoizedState),(D=ml||Af(t,l,D,a,_,z,y)||e!==null&&e.dependencies!==null&&Eu(e.dependencies))?(M||typeof u.UNSAFE_componentWillUpdate!="function"&&typeof u.componentWillUpdate!="function"||(typeof u.componentWillUpdate=="function"&&u.componentWillUpdate(a,z,y),typeof u.UNSAFE_componentWillUpdate=="function"&&u.UNSAFE_componentWillUpdate(a,z,y)),typeof u.componentDidUpdate=="function"&&(t.flags|=4),typeof u.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof u.componentDidUpdate!="function"||o===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||o===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=z),u.props=a,u.state=z,u.context=y,a=D):(typeof u.componentDidUpdate!="function"||o===e.memoizedProps&&_===e.memoizedState||(t.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||o===e.memoizedProps&&_===e.memoizedState||(t.flags|=1024),a=!1)}return u=a,Yu(e,t),a=(t.flags&128)!==0,u||a?(u=t.stateNode,l=a&&typeof l.getDerivedStateFromError!="function"?null:u.render(),t.flags|=1,e!==null&&a?(t.child=Ma(t,e.child,null,n),t.child=Ma(t,null,l,n)):Je(e,t,l,n),t.memoizedState=u.state,e=t.child):e=$t(e,t,n),e}function Gf(e,t,l,a){return rn(),t.flags|=256,Je(e,t,l,a),t.child}var Qc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Zc(e){return{baseLanes:e,cachePool:Ms()}}function Kc(e,t,l){return e=e!==null?e.childLanes&~l:0,t&&(e|=Rt),e}function Yf(e,t,l){var a=t.pendingProps,n=!1,u=(t.flags&128)!==0,o;if((o=u)||(o=e!==null&&e.memoizedState===null?!1:(Ye.current&2)!==0),o&&(n=!0,t.flags&=-129),o=(t.flags&32)!==0,t.flags&=-33,e===null){if(pe){if(n?gl(t):pl(),pe){var d=we,y;if(y=d){e:{for(y=d,d=wt;y.nodeType!==8;){if(!d){d=null;break e}if(y=Nt(y.nextSibling),y===null){d=null;break e}}d=y}d!==null?(t.memoizedState={dehydrated:d,treeContext:Yl!==null?{id:Xt,overflow:kt}:null,retryLane:536870912,hydrationErrors:null},y=st(18,null,null,0),y.stateNode=d,y.return=t,t.child=y,et=t,we=null,y=!0):y=!1}y||kl(t)}if(d=t.memoizedState,d!==null&&(d=d.dehydrated,d!==null))return Or(d)?t.lanes=32:t.lanes=536870912,null;Jt(t)}return d=a.children,a=a.fallback,n?(pl(),n=t.mode,d=Vu({mode:"hidden",children:d},n),a=Gl(a,n,l,null),d.return=t,a.return=t,d.sibling=a,t.child=d,n=t.child,n.memoizedState=Zc(l),n.childLanes=Kc(e,o,l),t.memoizedState=Qc,a):(gl(t),Jc(t,d))}if(y=e.memoizedState,y!==null&&(d=y.dehydrated,d!==null)){if(u)t.flags&256?(gl(t),t.flags&=-257,t=$c(e,t,l)):t.memoizedState!==null?(pl(),t.child=e.child,t.flags|=128,t=null):(pl(),n=a.fallback,d=t.mode,a=Vu({mode:"visible",children:a.children},d),n=Gl(n,d,l,null),n.flags|=2,a.return=t,n.return=t,a.sibling=n,t.child=a,Ma(t,e.child,null,l),a=t.child,a.memoizedState=Zc(l),a.childLanes=Kc(e,o,l),t.memoizedState=Qc,t=n);else if(gl(t),Or(d)){if(o=d.nextSibling&&d.nextSibling.dataset,o)var M=o.dgst;o=M,a=Error(r(419)),a.stack="",a.digest=o,on({value:a,source:null,stack:null}),t=$c(e,t,l)}else if(Qe||sn(e,t,l,!1),o=(l&e.childLanes)!==0,Qe||o){if(o=_e,o!==null&&(a=l&-l,a=(a&42)!==0?1:Ci(a),a=(a&(o.suspendedLanes|l))!==0?0:a,a!==0&&a!==y.retryLane))throw y.retryLane=a,va(e,a),vt(o,e,a),wf;d.data==="$?"||mr(),t=$c(e,t,l)}else d.data==="$?"?(t.flags|=192,t.child=e.child,t=null):(e=y.treeContext,we=Nt(d.nextSibling),et=t,pe=!0,Xl=null,wt=!1,e!==null&&(Et[Tt++]=Xt,Et[Tt++]=kt,Et[Tt++]=Yl,Xt=e.id,kt=e.overflow,Yl=t),t=Jc(t,a.children),t.flags|=4096);return t}return n?(pl(),n=a.fallback,d=t.mode,y=e.child,M=y.sibling,a=Vt(y,{mode:"hidden",children:a.children}),a.subtreeFlags=y.subtreeFlags&65011712,M!==null?n=Vt(M,n):(n=Gl(n,d,l,null),n.flags|=2),n.return=t,a.return=t,a.sibling=n,t.child=a,a=n,n=t.child,d=e.child.memoizedState,d===null?d=Zc(l):(y=d.cachePool,y!==null?(M=Ge._currentValue,y=y.parent!==M?{parent:M,pool:M}:y):y=Ms(),d={baseLanes:d.baseLanes|l,cachePool:y}),n.memoizedState=d,n.childLanes=Kc(e,o,l),t.memoizedState=Qc,a):(gl(t),l=e.child,e=l.sibling,l=Vt(l,{mode:"visible",children:a.children}),l.return=t,l.sibling=null,e!==null&&(o=t.deletions,o===null?(t.deletions=[e],t.flags|=16):o.push(e)),t.child=l,t.memoizedState=null,l)}function Jc(e,t){return t=Vu({mode:"visible",children:t},e.mode),t.return=e,e.child=t}function Vu(e,t){return e=st(22,e,null,t),e.lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function $c(e,t,l){return Ma(t,e.child,null,l),e=Jc(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Vf(e,t,l){e.lanes|=t;var a=e.alternate;a!==null&&(a.lanes|=t),mc(e.return,t,l)}function Wc(e,t,l,a,n){var u=e.memoizedState;u===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:l,tailMode:n}:(u.isBackwards=t,u.rendering=null,u.renderingStartTime=0,u.last=a,u.tail=l,u.tailMode=n)}function Xf(e,t,l){var a=t.pendingProps,n=a.revealOrder,u=a.tail;if(Je(e,t,a.children,l),a=Ye.current,(a&2)!==0)a=a&1|2,t.flags|=128;else{if(e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Vf(e,l,t);else if(e.tag===19)Vf(e,l,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}a&=1}switch(V(Ye,a),n){case"forwards":for(l=t.child,n=null;l!==null;)e=l.alternate,e!==null&&qu(e)===null&&(n=l),l=l.sibling;l=n,l===null?(n=t.child,t.child=null):(n=l.sibling,l.sibling=null),Wc(t,!1,n,l,u);break;case"backwards":for(l=null,n=t.child,t.child=null;n!==null;){if(e=n.alternate,e!==null&&qu(e)===null){t.child=n;break}e=n.sibling,n.sibling=l,l=n,n=e}Wc(t,!0,l,null,u);break;case"together":Wc(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function $t(e,t,l){if(e!==null&&(t.dependencies=e.dependencies),Tl|=t.lanes,(l&t.childLanes)===0)if(e!==null){if(sn(e,t,l,!1),(l&t.childLanes)===0)return null}else return null;if(e!==null&&t.child!==e.child)throw Error(r(153));if(t.child!==null){for(e=t.child,l=Vt(e,e.pendingProps),t.child=l,l.return=t;e.sibling!==null;)e=e.sibling,l=l.sibling=Vt(e,e.pendingProps),l.return=t;l.sibling=null}return t.child}function Fc(e,t){return(e.lanes&t)!==0?!0:(e=e.dependencies,!!(e!==null&&Eu(e)))}function ry(e,t,l){switch(t.tag){case 3:Re(t,t.stateNode.containerInfo),dl(t,Ge,e.memoizedState.cache),rn();break;case 27:case 5:il(t);break;case 4:Re(t,t.stateNode.containerInfo);break;case 10:dl(t,t.type,t.memoizedProps.value);break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(gl(t),t.flags|=128,null):(l&t.child.childLanes)!==0?Yf(e,t,l):(gl(t),e=$t(e,t,l),e!==null?e.sibling:null);gl(t);break;case 19:var n=(e.flags&128)!==0;if(a=(l&t.childLanes)!==0,a||(sn(e,t,l,!1),a=(l&t.childLanes)!==0),n){if(a)return Xf(e,t,l);t.flags|=128}if(n=t.memoizedState,n!==null&&(n.rendering=null,n.tail=null,n.lastEffect=null),V(Ye,Ye.current),a)break;return null;case 22:case 23:return t.lanes=0,Hf(e,t,l);case 24:dl(t,Ge,e.memoizedState.cache)}return $t(e,t,l)}function kf(e,t,l){if(e!==null)if(e.memoizedProps!==t.pendingProps)Qe=!0;else{if(!Fc(e,l)&&(t.flags&128)===0)return Qe=!1,ry(e,t,l);Qe=(e.flags&131072)!==0}else Qe=!1,pe&&(t.flags&1048576)!==0&&bs(t,xu,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var a=t.elementType,n=a._init;if(a=n(a._payload),t.type=a,typeof a=="function")ic(a)?(e=$l(a,e),t.tag=1,t=Lf(null,t,a,e,l)):(t.tag=0,t=kc(null,t,a,e,l));else{if(a!=null){if(n=a.$$typeof,n===ee){t.tag=11,t=Df(null,t,a,e,l);break e}else if(n===ve){t.tag=14,t=Uf(null,t,a,e,l);break e}}throw t=gt(a)||a,Error(r(306,t,""))}}return t;case 0:return kc(e,t,t.type,t.pendingProps,l);case 1:return a=t.type,n=$l(a,t.pendingProps),Lf(e,t,a,n,l);case 3:e:{if(Re(t,t.stateNode.containerInfo),e===null)throw Error(r(387));a=t.pendingProps;var u=t.memoizedState;n=u.element,Sc(e,t),gn(t,a,null,l);var o=t.memoizedState;if(a=o.cache,dl(t,Ge,a),a!==u.cache&&hc(t,[Ge],l,!0),yn(),a=o.element,u.isDehydrated)if(u={element:a,isDehydrated:!1,cache:o.cache},t.updateQueue.baseState=u,t.memoizedState=u,t.flags&256){t=Gf(e,t,a,l);break e}else if(a!==n){n=St(Error(r(424)),t),on(n),t=Gf(e,t,a,l);break e}else{switch(e=t.stateNode.containerInfo,e.nodeType){case 9:e=e.body;break;default:e=e.nodeName==="HTML"?e.ownerDocument.body:e}for(we=Nt(e.firstChild),et=t,pe=!0,Xl=null,wt=!0,l=Ef(t,null,a,l),t.child=l;l;)l.flags=l.flags&-3|4096,l=l.sibling}else{if(rn(),a===n){t=$t(e,t,l);break e}Je(e,t,a,l)}t=t.child}return t;case 26:return Yu(e,t),e===null?(l=Jd(t.type,null,t.pendingProps,null))?t.memoizedState=l:pe||(l=t.type,e=t.pendingProps,a=li(ne.current).createElement(l),a[Fe]=t,a[tt]=e,We(a,l,e),ke(a),t.stateNode=a):t.memoizedState=Jd(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return il(t),e===null&&pe&&(a=t.stateNode=Qd(t.type,t.pendingProps,ne.current),et=t,wt=!0,n=we,_l(t.type)?(Cr=n,we=Nt(a.firstChild)):we=n),Je(e,t,t.pendingProps.children,l),Yu(e,t),e===null&&(t.flags|=4194304),t.child;case 5:return e===null&&pe&&((n=a=we)&&(a=Hy(a,t.type,t.pendingProps,wt),a!==null?(t.stateNode=a,et=t,we=Nt(a.firstChild),wt=!1,n=!0):n=!1),n||kl(t)),il(t),n=t.type,u=t.pendingProps,o=e!==null?e.memoizedProps:null,a=u.children,_r(n,u)?a=null:o!==null&&_r(n,o)&&(t.flags|=32),t.memoizedState!==null&&(n=Mc(e,t,ey,null,null,l),Ln._currentValue=n),Yu(e,t),Je(e,t,a,l),t.child;case 6:return e===null&&pe&&((e=l=we)&&(l=By(l,t.pendingProps,wt),l!==null?(t.stateNode=l,et=t,we=null,e=!0):e=!1),e||kl(t)),null;case 13:return Yf(e,t,l);case 4:return Re(t,t.stateNode.containerInfo),a=t.pendingProps,e===null?t.child=Ma(t,null,a,l):Je(e,t,a,l),t.child;case 11:return Df(e,t,t.type,t.pendingProps,l);case 7:return Je(e,t,t.pendingProps,l),t.child;case 8:return Je(e,t,t.pendingProps.children,l),t.child;case 12:return Je(e,t,t.pendingProps.children,l),t.child;case 10:return a=t.pendingProps,dl(t,t.type,a.value),Je(e,t,a.children,l),t.child;case 9:return n=t.type._context,a=t.pendingProps.children,Zl(t),n=Pe(n),a=a(n),t.flags|=1,Je(e,t,a,l),t.child;case 14:return Uf(e,t,t.type,t.pendingProps,l);case 15:return jf(e,t,t.type,t.pendingProps,l);case 19:return Xf(e,t,l);case 31:return a=t.pendingProps,l=t.mode,a={mode:a.mode,children:a.children},e===null?(l=Vu(a,l),l.ref=t.ref,t.child=l,l.return=t,t=l):(l=Vt(e.child,a),l.ref=t.ref,t.child=l,l.return=t,t=l),t;case 22:return Hf(e,t,l);case 24:return Zl(t),a=Pe(Ge),e===null?(n=gc(),n===null&&(n=_e,u=vc(),n.pooledCache=u,u.refCount++,u!==null&&(n.pooledCacheLanes|=l),n=u),t.memoizedState={parent:a,cache:n},bc(t),dl(t,Ge,n)):((e.lanes&l)!==0&&(Sc(e,t),gn(t,null,null,l),yn()),n=e.memoizedState,u=t.memoizedState,n.parent!==a?(n={parent:a,cache:a},t.memoizedState=n,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=n),dl(t,Ge,a)):(a=u.cache,dl(t,Ge,a),a!==n.cache&&hc(t,[Ge],l,!0))),Je(e,t,t.pendingProps.children,l),t.child;case 29:throw t.pendingProps}throw Error(r(156,t.tag))}function Wt(e){e.flags|=4}function Qf(e,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)e.flags&=-16777217;else if(e.flags|=16777216,!Id(t)){if(t=At.current,t!==null&&((he&4194048)===he?Dt!==null:(he&62914560)!==he&&(he&536870912)===0||t!==Dt))throw hn=pc,_s;e.flags|=8192}}function Xu(e,t){t!==null&&(e.flags|=4),e.flags&16384&&(t=e.tag!==22?Eo():536870912,e.lanes|=t,Oa|=t)}function An(e,t){if(!pe)switch(e.tailMode){case"hidden":t=e.tail;for(var l=null;t!==null;)t.alternate!==null&&(l=t),t=t.sibling;l===null?e.tail=null:l.sibling=null;break;case"collapsed":l=e.tail;for(var a=null;l!==null;)l.alternate!==null&&(a=l),l=l.sibling;a===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:a.sibling=null}}function Ce(e){var t=e.alternate!==null&&e.alternate.child===e.child,l=0,a=0;if(t)for(var n=e.child;n!==null;)l|=n.lanes|n.childLanes,a|=n.subtreeFlags&65011712,a|=n.flags&65011712,n.return=e,n=n.sibling;else for(n=e.child;n!==null;)l|=n.lanes|n.childLanes,a|=n.subtreeFlags,a|=n.flags,n.return=e,n=n.sibling;return e.subtreeFlags|=a,e.childLanes=l,t}function oy(e,t,l){var a=t.pendingProps;switch(sc(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ce(t),null;case 1:return Ce(t),null;case 3:return l=t.stateNode,a=null,e!==null&&(a=e.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Zt(Ge),it(),l.pendingContext&&(l.context=l.pendingContext,l.pendingContext=null),(e===null||e.child===null)&&(cn(t)?Wt(t):e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Es())),Ce(t),null;case 26:return l=t.memoizedState,e===null?(Wt(t),l!==null?(Ce(t),Qf(t,l)):(Ce(t),t.flags&=-16777217)):l?l!==e.memoizedState?(Wt(t),Ce(t),Qf(t,l)):(Ce(t),t.flags&=-16777217):(e.memoizedProps!==a&&Wt(t),Ce(t),t.flags&=-16777217),null;case 27:cl(t),l=ne.current;var n=t.type;if(e!==null&&t.stateNode!=null)e.memoizedProps!==a&&Wt(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return Ce(t),null}e=K.current,cn(t)?Ss(t):(e=Qd(n,a,l),t.stateNode=e,Wt(t))}return Ce(t),null;case 5:if(cl(t),l=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==a&&Wt(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return Ce(t),null}if(e=K.current,cn(t))Ss(t);else{switch(n=li(ne.current),e){case 1:e=n.createElementNS("http://www.w3.org/2000/svg",l);break;case 2:e=n.createElementNS("http://www.w3.org/1998/Math/MathML",l);break;default:switch(l){case"svg":e=n.createElementNS("http://www.w3.org/2000/svg",l);break;case"math":e=n.createElementNS("http://www.w3.org/1998/Math/MathML",l);break;case"script":e=n.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e=typeof a.is=="string"?n.createElement("select",{is:a.is}):n.createElement("select"),a.multiple?e.multiple=!0:a.size&&(e.size=a.size);break;default:e=typeof a.is=="string"?n.createElement(l,{is:a.is}):n.createElement(l)}}e[Fe]=t,e[tt]=a;e:for(n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.tag!==27&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break e;for(;n.sibling===null;){if(n.return===null||n.return===t)break e;n=n.return}n.sibling.return=n.return,n=n.sibling}t.stateNode=e;e:switch(We(e,l,a),l){case"button":case"input":case"select":case"textarea":e=!!a.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Wt(t)}}return Ce(t),t.flags&=-16777217,null;case 6:if(e&&t.stateNode!=null)e.memoizedProps!==a&&Wt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(r(166));if(e=ne.current,cn(t)){if(e=t.stateNode,l=t.memoizedProps,a=null,n=et,n!==null)switch(n.tag){case 27:case 5:a=n.memoizedProps}e[Fe]=t,e=!!(e.nodeValue===l||a!==null&&a.suppressHydrationWarning===!0||qd(e.nodeValue,l)),e||kl(t)}else e=li(e).createTextNode(a),e[Fe]=t,t.stateNode=e}return Ce(t),null;case 13:if(a=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(n=cn(t),a!==null&&a.dehydrated!==null){if(e===null){if(!n)throw Error(r(318));if(n=t.memoizedState,n=n!==null?n.dehydrated:null,!n)throw Error(r(317));n[Fe]=t}else rn(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;Ce(t),n=!1}else n=Es(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=n),n=!0;if(!n)return t.flags&256?(Jt(t),t):(Jt(t),null)}if(Jt(t),(t.flags&128)!==0)return t.lanes=l,t;if(l=a!==null,e=e!==null&&e.memoizedState!==null,l){a=t.child,n=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(n=a.alternate.memoizedState.cachePool.pool);var u=null;a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(u=a.memoizedState.cachePool.pool),u!==n&&(a.flags|=2048)}return l!==e&&l&&(t.child.flags|=8192),Xu(t,t.updateQueue),Ce(t),null;case 4:return it(),e===null&&Er(t.stateNode.containerInfo),Ce(t),null;case 10:return Zt(t.type),Ce(t),null;case 19:if(Z(Ye),n=t.memoizedState,n===null)return Ce(t),null;if(a=(t.flags&128)!==0,u=n.rendering,u===null)if(a)An(n,!1);else{if(De!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(u=qu(e),u!==null){for(t.flags|=128,An(n,!1),e=u.updateQueue,t.updateQueue=e,Xu(t,e),t.subtreeFlags=0,e=l,l=t.child;l!==null;)ps(l,e),l=l.sibling;return V(Ye,Ye.current&1|2),t.child}e=e.sibling}n.tail!==null&&Ct()>Zu&&(t.flags|=128,a=!0,An(n,!1),t.lanes=4194304)}else{if(!a)if(e=qu(u),e!==null){if(t.flags|=128,a=!0,e=e.updateQueue,t.updateQueue=e,Xu(t,e),An(n,!0),n.tail===null&&n.tailMode==="hidden"&&!u.alternate&&!pe)return Ce(t),null}else 2*Ct()-n.renderingStartTime>Zu&&l!==536870912&&(t.flags|=128,a=!0,An(n,!1),t.lanes=4194304);n.isBackwards?(u.sibling=t.child,t.child=u):(e=n.last,e!==null?e.sibling=u:t.child=u,n.last=u)}return n.tail!==null?(t=n.tail,n.rendering=t,n.tail=t.sibling,n.renderingStartTime=Ct(),t.sibling=null,e=Ye.current,V(Ye,a?e&1|2:e&1),t):(Ce(t),null);case 22:case 23:return Jt(t),Ac(),a=t.memoizedState!==null,e!==null?e.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(l&536870912)!==0&&(t.flags&128)===0&&(Ce(t),t.subtreeFlags&6&&(t.flags|=8192)):Ce(t),l=t.updateQueue,l!==null&&Xu(t,l.retryQueue),l=null,e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(l=e.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==l&&(t.flags|=2048),e!==null&&Z(Kl),null;case 24:return l=null,e!==null&&(l=e.memoizedState.cache),t.memoizedState.cache!==l&&(t.flags|=2048),Zt(Ge),Ce(t),null;case 25:return null;case 30:return null}throw Error(r(156,t.tag))}function sy(e,t){switch(sc(t),t.tag){case 1:return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Zt(Ge),it(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 26:case 27:case 5:return cl(t),null;case 13:if(Jt(t),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(r(340));rn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return Z(Ye),null;case 4:return it(),null;case 10:return Zt(t.type),null;case 22:case 23:return Jt(t),Ac(),e!==null&&Z(Kl),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 24:return Zt(Ge),null;case 25:return null;default:return null}}function Zf(e,t){switch(sc(t),t.tag){case 3:Zt(Ge),it();break;case 26:case 27:case 5:cl(t);break;case 4:it();break;case 13:Jt(t);break;case 19:Z(Ye);break;case 10:Zt(t.type);break;case 22:case 23:Jt(t),Ac(),e!==null&&Z(Kl);break;case 24:Zt(Ge)}}function Rn(e,t){try{var l=t.updateQueue,a=l!==null?l.lastEffect:null;if(a!==null){var n=a.next;l=n;do{if((l.tag&e)===e){a=void 0;var u=l.create,o=l.inst;a=u(),o.destroy=a}l=l.next}while(l!==n)}}catch(d){Me(t,t.return,d)}}function bl(e,t,l){try{var a=t.updateQueue,n=a!==null?a.lastEffect:null;if(n!==null){var u=n.next;a=u;do{if((a.tag&e)===e){var o=a.inst,d=o.destroy;if(d!==void 0){o.destroy=void 0,n=t;var y=l,M=d;try{M()}catch(D){Me(n,y,D)}}}a=a.next}while(a!==u)}}catch(D){Me(t,t.return,D)}}function Kf(e){var t=e.updateQueue;if(t!==null){var l=e.stateNode;try{Ds(t,l)}catch(a){Me(e,e.return,a)}}}function Jf(e,t,l){l.props=$l(e.type,e.memoizedProps),l.state=e.memoizedState;try{l.componentWillUnmount()}catch(a){Me(e,t,a)}}function Mn(e,t){try{var l=e.ref;if(l!==null){switch(e.tag){case 26:case 27:case 5:var a=e.stateNode;break;case 30:a=e.stateNode;break;default:a=e.stateNode}typeof l=="function"?e.refCleanup=l(a):l.current=a}}catch(n){Me(e,t,n)}}function Ut(e,t){var l=e.ref,a=e.refCleanup;if(l!==null)if(typeof a=="function")try{a()}catch(n){Me(e,t,n)}finally{e.refCleanup=null,e=e.alternate,e!=null&&(e.refCleanup=null)}else if(typeof l=="function")try{l(null)}catch(n){Me(e,t,n)}else l.current=null}function $f(e){var t=e.type,l=e.memoizedProps,a=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":l.autoFocus&&a.focus();break e;case"img":l.src?a.src=l.src:l.srcSet&&(a.srcset=l.srcSet)}}catch(n){Me(e,e.return,n)}}function Pc(e,t,l){try{var a=e.stateNode;Cy(a,e.type,l,t),a[tt]=t}catch(n){Me(e,e.return,n)}}function Wf(e){return e.tag===5||e.tag===3||e.tag===26||e.tag===27&&_l(e.type)||e.tag===4}function Ic(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Wf(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.tag===27&&_l(e.type)||e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function er(e,t,l){var a=e.tag;if(a===5||a===6)e=e.stateNode,t?(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l).insertBefore(e,t):(t=l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,t.appendChild(e),l=l._reactRootContainer,l!=null||t.onclick!==null||(t.onclick=ti));else if(a!==4&&(a===27&&_l(e.type)&&(l=e.stateNode,t=null),e=e.child,e!==null))for(er(e,t,l),e=e.sibling;e!==null;)er(e,t,l),e=e.sibling}function ku(e,t,l){var a=e.tag;if(a===5||a===6)e=e.stateNode,t?l.insertBefore(e,t):l.appendChild(e);else if(a!==4&&(a===27&&_l(e.type)&&(l=e.stateNode),e=e.child,e!==null))for(ku(e,t,l),e=e.sibling;e!==null;)ku(e,t,l),e=e.sibling}function Ff(e){var t=e.stateNode,l=e.memoizedProps;try{for(var a=e.type,n=t.attributes;n.length;)t.removeAttributeNode(n[0]);We(t,a,l),t[Fe]=e,t[tt]=l}catch(u){Me(e,e.return,u)}}var Ft=!1,He=!1,tr=!1,Pf=typeof WeakSet=="function"?WeakSet:Set,Ze=null;function fy(e,t){if(e=e.containerInfo,Rr=ri,e=rs(e),Ii(e)){if("selectionStart"in e)var l={start:e.selectionStart,end:e.selectionEnd};else e:{l=(l=e.ownerDocument)&&l.defaultView||window;var a=l.getSelection&&l.getSelection();if(a&&a.rangeCount!==0){l=a.anchorNode;var n=a.anchorOffset,u=a.focusNode;a=a.focusOffset;try{l.nodeType,u.nodeType}catch{l=null;break e}var o=0,d=-1,y=-1,M=0,D=0,H=e,_=null;t:for(;;){for(var z;H!==l||n!==0&&H.nodeType!==3||(d=o+n),H!==u||a!==0&&H.nodeType!==3||(y=o+a),H.nodeType===3&&(o+=H.nodeValue.length),(z=H.firstChild)!==null;)_=H,H=z;for(;;){if(H===e)break t;if(_===l&&++M===n&&(d=o),_===u&&++D===a&&(y=o),(z=H.nextSibling)!==null)break;H=_,_=H.parentNode}H=z}l=d===-1||y===-1?null:{start:d,end:y}}else l=null}l=l||{start:0,end:0}}else l=null;for(Mr={focusedElem:e,selectionRange:l},ri=!1,Ze=t;Ze!==null;)if(t=Ze,e=t.child,(t.subtreeFlags&1024)!==0&&e!==null)e.return=t,Ze=e;else for(;Ze!==null;){switch(t=Ze,u=t.alternate,e=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((e&1024)!==0&&u!==null){e=void 0,l=t,n=u.memoizedProps,u=u.memoizedState,a=l.stateNode;try{var ae=$l(l.type,n,l.elementType===l.type);e=a.getSnapshotBeforeUpdate(ae,u),a.__reactInternalSnapshotBeforeUpdate=e}catch(te){Me(l,l.return,te)}}break;case 3:if((e&1024)!==0){if(e=t.stateNode.containerInfo,l=e.nodeType,l===9)Nr(e);else if(l===1)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":Nr(e);break;default:e.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((e&1024)!==0)throw Error(r(163))}if(e=t.sibling,e!==null){e.return=t.return,Ze=e;break}Ze=t.return}}function If(e,t,l){var a=l.flags;switch(l.tag){case 0:case 11:case 15:Sl(e,l),a&4&&Rn(5,l);break;case 1:if(Sl(e,l),a&4)if(e=l.stateNode,t===null)try{e.componentDidMount()}catch(o){Me(l,l.return,o)}else{var n=$l(l.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(n,t,e.__reactInternalSnapshotBeforeUpdate)}catch(o){Me(l,l.return,o)}}a&64&&Kf(l),a&512&&Mn(l,l.return);break;case 3:if(Sl(e,l),a&64&&(e=l.updateQueue,e!==null)){if(t=null,l.child!==null)switch(l.child.tag){case 27:case 5:t=l.child.stateNode;break;case 1:t=l.child.stateNode}try{Ds(e,t)}catch(o){Me(l,l.return,o)}}break;case 27:t===null&&a&4&&Ff(l);case 26:case 5:Sl(e,l),t===null&&a&4&&$f(l),a&512&&Mn(l,l.return);break;case 12:Sl(e,l);break;case 13:Sl(e,l),a&4&&ld(e,l),a&64&&(e=l.memoizedState,e!==null&&(e=e.dehydrated,e!==null&&(l=Sy.bind(null,l),qy(e,l))));break;case 22:if(a=l.memoizedState!==null||Ft,!a){t=t!==null&&t.memoizedState!==null||He,n=Ft;var u=He;Ft=a,(He=t)&&!u?xl(e,l,(l.subtreeFlags&8772)!==0):Sl(e,l),Ft=n,He=u}break;case 30:break;default:Sl(e,l)}}function ed(e){var t=e.alternate;t!==null&&(e.alternate=null,ed(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&Ui(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ne=null,nt=!1;function Pt(e,t,l){for(l=l.child;l!==null;)td(e,t,l),l=l.sibling}function td(e,t,l){if(ct&&typeof ct.onCommitFiberUnmount=="function")try{ct.onCommitFiberUnmount(Za,l)}catch{}switch(l.tag){case 26:He||Ut(l,t),Pt(e,t,l),l.memoizedState?l.memoizedState.count--:l.stateNode&&(l=l.stateNode,l.parentNode.removeChild(l));break;case 27:He||Ut(l,t);var a=Ne,n=nt;_l(l.type)&&(Ne=l.stateNode,nt=!1),Pt(e,t,l),jn(l.stateNode),Ne=a,nt=n;break;case 5:He||Ut(l,t);case 6:if(a=Ne,n=nt,Ne=null,Pt(e,t,l),Ne=a,nt=n,Ne!==null)if(nt)try{(Ne.nodeType===9?Ne.body:Ne.nodeName==="HTML"?Ne.ownerDocument.body:Ne).removeChild(l.stateNode)}catch(u){Me(l,t,u)}else try{Ne.removeChild(l.stateNode)}catch(u){Me(l,t,u)}break;case 18:Ne!==null&&(nt?(e=Ne,Xd(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.stateNode),Xn(e)):Xd(Ne,l.stateNode));break;case 4:a=Ne,n=nt,Ne=l.stateNode.containerInfo,nt=!0,Pt(e,t,l),Ne=a,nt=n;break;case 0:case 11:case 14:case 15:He||bl(2,l,t),He||bl(4,l,t),Pt(e,t,l);break;case 1:He||(Ut(l,t),a=l.stateNode,typeof a.componentWillUnmount=="function"&&Jf(l,t,a)),Pt(e,t,l);break;case 21:Pt(e,t,l);break;case 22:He=(a=He)||l.memoizedState!==null,Pt(e,t,l),He=a;break;default:Pt(e,t,l)}}function ld(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null&&(e=e.dehydrated,e!==null))))try{Xn(e)}catch(l){Me(t,t.return,l)}}function dy(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return t===null&&(t=e.stateNode=new Pf),t;case 22:return e=e.stateNode,t=e._retryCache,t===null&&(t=e._retryCache=new Pf),t;default:throw Error(r(435,e.tag))}}function lr(e,t){var l=dy(e);t.forEach(function(a){var n=xy.bind(null,e,a);l.has(a)||(l.add(a),a.then(n,n))})}function ft(e,t){var l=t.deletions;if(l!==null)for(var a=0;a<l.length;a++){var n=l[a],u=e,o=t,d=o;e:for(;d!==null;){switch(d.tag){case 27:if(_l(d.type)){Ne=d.stateNode,nt=!1;break e}break;case 5:Ne=d.stateNode,nt=!1;break e;case 3:case 4:Ne=d.stateNode.containerInfo,nt=!0;break e}d=d.return}if(Ne===null)throw Error(r(160));td(u,o,n),Ne=null,nt=!1,u=n.alternate,u!==null&&(u.return=null),n.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)ad(t,e),t=t.sibling}var zt=null;function ad(e,t){var l=e.alternate,a=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:ft(t,e),dt(e),a&4&&(bl(3,e,e.return),Rn(3,e),bl(5,e,e.return));break;case 1:ft(t,e),dt(e),a&512&&(He||l===null||Ut(l,l.return)),a&64&&Ft&&(e=e.updateQueue,e!==null&&(a=e.callbacks,a!==null&&(l=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=l===null?a:l.concat(a))));break;case 26:var n=zt;if(ft(t,e),dt(e),a&512&&(He||l===null||Ut(l,l.return)),a&4){var u=l!==null?l.memoizedState:null;if(a=e.memoizedState,l===null)if(a===null)if(e.stateNode===null){e:{a=e.type,l=e.memoizedProps,n=n.ownerDocument||n;t:switch(a){case"title":u=n.getElementsByTagName("title")[0],(!u||u[$a]||u[Fe]||u.namespaceURI==="http://www.w3.org/2000/svg"||u.hasAttribute("itemprop"))&&(u=n.createElement(a),n.head.insertBefore(u,n.querySelector("head > title"))),We(u,a,l),u[Fe]=e,ke(u),a=u;break e;case"link":var o=Fd("link","href",n).get(a+(l.href||""));if(o){for(var d=0;d<o.length;d++)if(u=o[d],u.getAttribute("href")===(l.href==null||l.href===""?null:l.href)&&u.getAttribute("rel")===(l.rel==null?null:l.rel)&&u.getAttribute("title")===(l.title==null?null:l.title)&&u.getAttribute("crossorigin")===(l.crossOrigin==null?null:l.crossOrigin)){o.splice(d,1);break t}}u=n.createElement(a),We(u,a,l),n.head.appendChild(u);break;case"meta":if(o=Fd("meta","content",n).get(a+(l.content||""))){for(d=0;d<o.length;d++)if(u=o[d],u.getAttribute("content")===(l.content==null?null:""+l.content)&&u.getAttribute("name")===(l.name==null?null:l.name)&&u.getAttribute("property")===(l.property==null?null:l.property)&&u.getAttribute("http-equiv")===(l.httpEquiv==null?null:l.httpEquiv)&&u.getAttribute("charset")===(l.charSet==null?null:l.charSet)){o.splice(d,1);break t}}u=n.createElement(a),We(u,a,l),n.head.appendChild(u);break;default:throw Error(r(468,a))}u[Fe]=e,ke(u),a=u}e.stateNode=a}else Pd(n,e.type,e.stateNode);else e.stateNode=Wd(n,a,e.memoizedProps);else u!==a?(u===null?l.stateNode!==null&&(l=l.stateNode,l.parentNode.removeChild(l)):u.count--,a===null?Pd(n,e.type,e.stateNode):Wd(n,a,e.memoizedProps)):a===null&&e.stateNode!==null&&Pc(e,e.memoizedProps,l.memoizedProps)}break;case 27:ft(t,e),dt(e),a&512&&(He||l===null||Ut(l,l.return)),l!==null&&a&4&&Pc(e,e.memoizedProps,l.memoizedProps);break;case 5:if(ft(t,e),dt(e),a&512&&(He||l===null||Ut(l,l.return)),e.flags&32){n=e.stateNode;try{ra(n,"")}catch(z){Me(e,e.return,z)}}a&4&&e.stateNode!=null&&(n=e.memoizedProps,Pc(e,n,l!==null?l.memoizedProps:n)),a&1024&&(tr=!0);break;case 6:if(ft(t,e),dt(e),a&4){if(e.stateNode===null)throw Error(r(162));a=e.memoizedProps,l=e.stateNode;try{l.nodeValue=a}catch(z){Me(e,e.return,z)}}break;case 3:if(ui=null,n=zt,zt=ai(t.containerInfo),ft(t,e),zt=n,dt(e),a&4&&l!==null&&l.memoizedState.isDehydrated)try{Xn(t.containerInfo)}catch(z){Me(e,e.return,z)}tr&&(tr=!1,nd(e));break;case 4:a=zt,zt=ai(e.stateNode.containerInfo),ft(t,e),dt(e),zt=a;break;case 12:ft(t,e),dt(e);break;case 13:ft(t,e),dt(e),e.child.flags&8192&&e.memoizedState!==null!=(l!==null&&l.memoizedState!==null)&&(rr=Ct()),a&4&&(a=e.updateQueue,a!==null&&(e.updateQueue=null,lr(e,a)));break;case 22:n=e.memoizedState!==null;var y=l!==null&&l.memoizedState!==null,M=Ft,D=He;if(Ft=M||n,He=D||y,ft(t,e),He=D,Ft=M,dt(e),a&8192)e:for(t=e.stateNode,t._visibility=n?t._visibility&-2:t._visibility|1,n&&(l===null||y||Ft||He||Wl(e)),l=null,t=e;;){if(t.tag===5||t.tag===26){if(l===null){y=l=t;try{if(u=y.stateNode,n)o=u.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none";else{d=y.stateNode;var H=y.memoizedProps.style,_=H!=null&&H.hasOwnProperty("display")?H.display:null;d.style.display=_==null||typeof _=="boolean"?"":(""+_).trim()}}catch(z){Me(y,y.return,z)}}}else if(t.tag===6){if(l===null){y=t;try{y.stateNode.nodeValue=n?"":y.memoizedProps}catch(z){Me(y,y.return,z)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===e)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;l===t&&(l=null),t=t.return}l===t&&(l=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=e.updateQueue,a!==null&&(l=a.retryQueue,l!==null&&(a.retryQueue=null,lr(e,l))));break;case 19:ft(t,e),dt(e),a&4&&(a=e.updateQueue,a!==null&&(e.updateQueue=null,lr(e,a)));break;case 30:break;case 21:break;default:ft(t,e),dt(e)}}function dt(e){var t=e.flags;if(t&2){try{for(var l,a=e.return;a!==null;){if(Wf(a)){l=a;break}a=a.return}if(l==null)throw Error(r(160));switch(l.tag){case 27:var n=l.stateNode,u=Ic(e);ku(e,u,n);break;case 5:var o=l.stateNode;l.flags&32&&(ra(o,""),l.flags&=-33);var d=Ic(e);ku(e,d,o);break;case 3:case 4:var y=l.stateNode.containerInfo,M=Ic(e);er(e,M,y);break;default:throw Error(r(161))}}catch(D){Me(e,e.return,D)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function nd(e){if(e.subtreeFlags&1024)for(e=e.child;e!==null;){var t=e;nd(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),e=e.sibling}}function Sl(e,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)If(e,t.alternate,t),t=t.sibling}function Wl(e){for(e=e.child;e!==null;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:bl(4,t,t.return),Wl(t);break;case 1:Ut(t,t.return);var l=t.stateNode;typeof l.componentWillUnmount=="function"&&Jf(t,t.return,l),Wl(t);break;case 27:jn(t.stateNode);case 26:case 5:Ut(t,t.return),Wl(t);break;case 22:t.memoizedState===null&&Wl(t);break;case 30:Wl(t);break;default:Wl(t)}e=e.sibling}}function xl(e,t,l){for(l=l&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,n=e,u=t,o=u.flags;switch(u.tag){case 0:case 11:case 15:xl(n,u,l),Rn(4,u);break;case 1:if(xl(n,u,l),a=u,n=a.stateNode,typeof n.componentDidMount=="function")try{n.componentDidMount()}catch(M){Me(a,a.return,M)}if(a=u,n=a.updateQueue,n!==null){var d=a.stateNode;try{var y=n.shared.hiddenCallbacks;if(y!==null)for(n.shared.hiddenCallbacks=null,n=0;n<y.length;n++)ws(y[n],d)}catch(M){Me(a,a.return,M)}}l&&o&64&&Kf(u),Mn(u,u.return);break;case 27:Ff(u);case 26:case 5:xl(n,u,l),l&&a===null&&o&4&&$f(u),Mn(u,u.return);break;case 12:xl(n,u,l);break;case 13:xl(n,u,l),l&&o&4&&ld(n,u);break;case 22:u.memoizedState===null&&xl(n,u,l),Mn(u,u.return);break;case 30:break;default:xl(n,u,l)}t=t.sibling}}function ar(e,t){var l=null;e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(l=e.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==l&&(e!=null&&e.refCount++,l!=null&&fn(l))}function nr(e,t){e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&fn(e))}function jt(e,t,l,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)ud(e,t,l,a),t=t.sibling}function ud(e,t,l,a){var n=t.flags;switch(t.tag){case 0:case 11:case 15:jt(e,t,l,a),n&2048&&Rn(9,t);break;case 1:jt(e,t,l,a);break;case 3:jt(e,t,l,a),n&2048&&(e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&fn(e)));break;case 12:if(n&2048){jt(e,t,l,a),e=t.stateNode;try{var u=t.memoizedProps,o=u.id,d=u.onPostCommit;typeof d=="function"&&d(o,t.alternate===null?"mount":"update",e.passiveEffectDuration,-0)}catch(y){Me(t,t.return,y)}}else jt(e,t,l,a);break;case 13:jt(e,t,l,a);break;case 23:break;case 22:u=t.stateNode,o=t.alternate,t.memoizedState!==null?u._visibility&2?jt(e,t,l,a):_n(e,t):u._visibility&2?jt(e,t,l,a):(u._visibility|=2,_a(e,t,l,a,(t.subtreeFlags&10256)!==0)),n&2048&&ar(o,t);break;case 24:jt(e,t,l,a),n&2048&&nr(t.alternate,t);break;default:jt(e,t,l,a)}}function _a(e,t,l,a,n){for(n=n&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var u=e,o=t,d=l,y=a,M=o.flags;switch(o.tag){case 0:case 11:case 15:_a(u,o,d,y,n),Rn(8,o);break;case 23:break;case 22:var D=o.stateNode;o.memoizedState!==null?D._visibility&2?_a(u,o,d,y,n):_n(u,o):(D._visibility|=2,_a(u,o,d,y,n)),n&&M&2048&&ar(o.alternate,o);break;case 24:_a(u,o,d,y,n),n&&M&2048&&nr(o.alternate,o);break;default:_a(u,o,d,y,n)}t=t.sibling}}function _n(e,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var l=e,a=t,n=a.flags;switch(a.tag){case 22:_n(l,a),n&2048&&ar(a.alternate,a);break;case 24:_n(l,a),n&2048&&nr(a.alternate,a);break;default:_n(l,a)}t=t.sibling}}var zn=8192;function za(e){if(e.subtreeFlags&zn)for(e=e.child;e!==null;)id(e),e=e.sibling}function id(e){switch(e.tag){case 26:za(e),e.flags&zn&&e.memoizedState!==null&&Fy(zt,e.memoizedState,e.memoizedProps);break;case 5:za(e);break;case 3:case 4:var t=zt;zt=ai(e.stateNode.containerInfo),za(e),zt=t;break;case 22:e.memoizedState===null&&(t=e.alternate,t!==null&&t.memoizedState!==null?(t=zn,zn=16777216,za(e),zn=t):za(e));break;default:za(e)}}function cd(e){var t=e.alternate;if(t!==null&&(e=t.child,e!==null)){t.child=null;do t=e.sibling,e.sibling=null,e=t;while(e!==null)}}function Nn(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var l=0;l<t.length;l++){var a=t[l];Ze=a,od(a,e)}cd(e)}if(e.subtreeFlags&10256)for(e=e.child;e!==null;)rd(e),e=e.sibling}function rd(e){switch(e.tag){case 0:case 11:case 15:Nn(e),e.flags&2048&&bl(9,e,e.return);break;case 3:Nn(e);break;case 12:Nn(e);break;case 22:var t=e.stateNode;e.memoizedState!==null&&t._visibility&2&&(e.return===null||e.return.tag!==13)?(t._visibility&=-3,Qu(e)):Nn(e);break;default:Nn(e)}}function Qu(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var l=0;l<t.length;l++){var a=t[l];Ze=a,od(a,e)}cd(e)}for(e=e.child;e!==null;){switch(t=e,t.tag){case 0:case 11:case 15:bl(8,t,t.return),Qu(t);break;case 22:l=t.stateNode,l._visibility&2&&(l._visibility&=-3,Qu(t));break;default:Qu(t)}e=e.sibling}}function od(e,t){for(;Ze!==null;){var l=Ze;switch(l.tag){case 0:case 11:case 15:bl(8,l,t);break;case 23:case 22:if(l.memoizedState!==null&&l.memoizedState.cachePool!==null){var a=l.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:fn(l.memoizedState.cache)}if(a=l.child,a!==null)a.return=l,Ze=a;else e:for(l=e;Ze!==null;){a=Ze;var n=a.sibling,u=a.return;if(ed(a),a===l){Ze=null;break e}if(n!==null){n.return=u,Ze=n;break e}Ze=u}}}var my={getCacheForType:function(e){var t=Pe(Ge),l=t.data.get(e);return l===void 0&&(l=e(),t.data.set(e,l)),l}},hy=typeof WeakMap=="function"?WeakMap:Map,Se=0,_e=null,se=null,he=0,xe=0,mt=null,El=!1,Na=!1,ur=!1,It=0,De=0,Tl=0,Fl=0,ir=0,Rt=0,Oa=0,On=null,ut=null,cr=!1,rr=0,Zu=1/0,Ku=null,Al=null,$e=0,Rl=null,Ca=null,wa=0,or=0,sr=null,sd=null,Cn=0,fr=null;function ht(){if((Se&2)!==0&&he!==0)return he&-he;if(O.T!==null){var e=ba;return e!==0?e:pr()}return Ro()}function fd(){Rt===0&&(Rt=(he&536870912)===0||pe?xo():536870912);var e=At.current;return e!==null&&(e.flags|=32),Rt}function vt(e,t,l){(e===_e&&(xe===2||xe===9)||e.cancelPendingCommit!==null)&&(Da(e,0),Ml(e,he,Rt,!1)),Ja(e,l),((Se&2)===0||e!==_e)&&(e===_e&&((Se&2)===0&&(Fl|=l),De===4&&Ml(e,he,Rt,!1)),Ht(e))}function dd(e,t,l){if((Se&6)!==0)throw Error(r(327));var a=!l&&(t&124)===0&&(t&e.expiredLanes)===0||Ka(e,t),n=a?gy(e,t):hr(e,t,!0),u=a;do{if(n===0){Na&&!a&&Ml(e,t,0,!1);break}else{if(l=e.current.alternate,u&&!vy(l)){n=hr(e,t,!1),u=!1;continue}if(n===2){if(u=t,e.errorRecoveryDisabledLanes&u)var o=0;else o=e.pendingLanes&-536870913,o=o!==0?o:o&536870912?536870912:0;if(o!==0){t=o;e:{var d=e;n=On;var y=d.current.memoizedState.isDehydrated;if(y&&(Da(d,o).flags|=256),o=hr(d,o,!1),o!==2){if(ur&&!y){d.errorRecoveryDisabledLanes|=u,Fl|=u,n=4;break e}u=ut,ut=n,u!==null&&(ut===null?ut=u:ut.push.apply(ut,u))}n=o}if(u=!1,n!==2)continue}}if(n===1){Da(e,0),Ml(e,t,0,!0);break}e:{switch(a=e,u=n,u){case 0:case 1:throw Error(r(345));case 4:if((t&4194048)!==t)break;case 6:Ml(a,t,Rt,!El);break e;case 2:ut=null;break;case 3:case 5:break;default:throw Error(r(329))}if((t&62914560)===t&&(n=rr+300-Ct(),10<n)){if(Ml(a,t,Rt,!El),nu(a,0,!0)!==0)break e;a.timeoutHandle=Yd(md.bind(null,a,l,ut,Ku,cr,t,Rt,Fl,Oa,El,u,2,-0,0),n);break e}md(a,l,ut,Ku,cr,t,Rt,Fl,Oa,El,u,0,-0,0)}}break}while(!0);Ht(e)}function md(e,t,l,a,n,u,o,d,y,M,D,H,_,z){if(e.timeoutHandle=-1,H=t.subtreeFlags,(H&8192||(H&16785408)===16785408)&&(qn={stylesheets:null,count:0,unsuspend:Wy},id(t),H=Py(),H!==null)){e.cancelPendingCommit=H(Sd.bind(null,e,t,u,l,a,n,o,d,y,D,1,_,z)),Ml(e,u,o,!M);return}Sd(e,t,u,l,a,n,o,d,y)}function vy(e){for(var t=e;;){var l=t.tag;if((l===0||l===11||l===15)&&t.flags&16384&&(l=t.updateQueue,l!==null&&(l=l.stores,l!==null)))for(var a=0;a<l.length;a++){var n=l[a],u=n.getSnapshot;n=n.value;try{if(!ot(u(),n))return!1}catch{return!1}}if(l=t.child,t.subtreeFlags&16384&&l!==null)l.return=t,t=l;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ml(e,t,l,a){t&=~ir,t&=~Fl,e.suspendedLanes|=t,e.pingedLanes&=~t,a&&(e.warmLanes|=t),a=e.expirationTimes;for(var n=t;0<n;){var u=31-rt(n),o=1<<u;a[u]=-1,n&=~o}l!==0&&To(e,l,t)}function Ju(){return(Se&6)===0?(wn(0),!1):!0}function dr(){if(se!==null){if(xe===0)var e=se.return;else e=se,Qt=Ql=null,Nc(e),Ra=null,En=0,e=se;for(;e!==null;)Zf(e.alternate,e),e=e.return;se=null}}function Da(e,t){var l=e.timeoutHandle;l!==-1&&(e.timeoutHandle=-1,Dy(l)),l=e.cancelPendingCommit,l!==null&&(e.cancelPendingCommit=null,l()),dr(),_e=e,se=l=Vt(e.current,null),he=t,xe=0,mt=null,El=!1,Na=Ka(e,t),ur=!1,Oa=Rt=ir=Fl=Tl=De=0,ut=On=null,cr=!1,(t&8)!==0&&(t|=t&32);var a=e.entangledLanes;if(a!==0)for(e=e.entanglements,a&=t;0<a;){var n=31-rt(a),u=1<<n;t|=e[n],a&=~u}return It=t,yu(),l}function hd(e,t){ie=null,O.H=ju,t===mn||t===Ru?(t=Os(),xe=3):t===_s?(t=Os(),xe=4):xe=t===wf?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,mt=t,se===null&&(De=1,Gu(e,St(t,e.current)))}function vd(){var e=O.H;return O.H=ju,e===null?ju:e}function yd(){var e=O.A;return O.A=my,e}function mr(){De=4,El||(he&4194048)!==he&&At.current!==null||(Na=!0),(Tl&134217727)===0&&(Fl&134217727)===0||_e===null||Ml(_e,he,Rt,!1)}function hr(e,t,l){var a=Se;Se|=2;var n=vd(),u=yd();(_e!==e||he!==t)&&(Ku=null,Da(e,t)),t=!1;var o=De;e:do try{if(xe!==0&&se!==null){var d=se,y=mt;switch(xe){case 8:dr(),o=6;break e;case 3:case 2:case 9:case 6:At.current===null&&(t=!0);var M=xe;if(xe=0,mt=null,Ua(e,d,y,M),l&&Na){o=0;break e}break;default:M=xe,xe=0,mt=null,Ua(e,d,y,M)}}yy(),o=De;break}catch(D){hd(e,D)}while(!0);return t&&e.shellSuspendCounter++,Qt=Ql=null,Se=a,O.H=n,O.A=u,se===null&&(_e=null,he=0,yu()),o}function yy(){for(;se!==null;)gd(se)}function gy(e,t){var l=Se;Se|=2;var a=vd(),n=yd();_e!==e||he!==t?(Ku=null,Zu=Ct()+500,Da(e,t)):Na=Ka(e,t);e:do try{if(xe!==0&&se!==null){t=se;var u=mt;t:switch(xe){case 1:xe=0,mt=null,Ua(e,t,u,1);break;case 2:case 9:if(zs(u)){xe=0,mt=null,pd(t);break}t=function(){xe!==2&&xe!==9||_e!==e||(xe=7),Ht(e)},u.then(t,t);break e;case 3:xe=7;break e;case 4:xe=5;break e;case 7:zs(u)?(xe=0,mt=null,pd(t)):(xe=0,mt=null,Ua(e,t,u,7));break;case 5:var o=null;switch(se.tag){case 26:o=se.memoizedState;case 5:case 27:var d=se;if(!o||Id(o)){xe=0,mt=null;var y=d.sibling;if(y!==null)se=y;else{var M=d.return;M!==null?(se=M,$u(M)):se=null}break t}}xe=0,mt=null,Ua(e,t,u,5);break;case 6:xe=0,mt=null,Ua(e,t,u,6);break;case 8:dr(),De=6;break e;default:throw Error(r(462))}}py();break}catch(D){hd(e,D)}while(!0);return Qt=Ql=null,O.H=a,O.A=n,Se=l,se!==null?0:(_e=null,he=0,yu(),De)}function py(){for(;se!==null&&!Gh();)gd(se)}function gd(e){var t=kf(e.alternate,e,It);e.memoizedProps=e.pendingProps,t===null?$u(e):se=t}function pd(e){var t=e,l=t.alternate;switch(t.tag){case 15:case 0:t=qf(l,t,t.pendingProps,t.type,void 0,he);break;case 11:t=qf(l,t,t.pendingProps,t.type.render,t.ref,he);break;case 5:Nc(t);default:Zf(l,t),t=se=ps(t,It),t=kf(l,t,It)}e.memoizedProps=e.pendingProps,t===null?$u(e):se=t}function Ua(e,t,l,a){Qt=Ql=null,Nc(t),Ra=null,En=0;var n=t.return;try{if(cy(e,n,t,l,he)){De=1,Gu(e,St(l,e.current)),se=null;return}}catch(u){if(n!==null)throw se=n,u;De=1,Gu(e,St(l,e.current)),se=null;return}t.flags&32768?(pe||a===1?e=!0:Na||(he&536870912)!==0?e=!1:(El=e=!0,(a===2||a===9||a===3||a===6)&&(a=At.current,a!==null&&a.tag===13&&(a.flags|=16384))),bd(t,e)):$u(t)}function $u(e){var t=e;do{if((t.flags&32768)!==0){bd(t,El);return}e=t.return;var l=oy(t.alternate,t,It);if(l!==null){se=l;return}if(t=t.sibling,t!==null){se=t;return}se=t=e}while(t!==null);De===0&&(De=5)}function bd(e,t){do{var l=sy(e.alternate,e);if(l!==null){l.flags&=32767,se=l;return}if(l=e.return,l!==null&&(l.flags|=32768,l.subtreeFlags=0,l.deletions=null),!t&&(e=e.sibling,e!==null)){se=e;return}se=e=l}while(e!==null);De=6,se=null}function Sd(e,t,l,a,n,u,o,d,y){e.cancelPendingCommit=null;do Wu();while($e!==0);if((Se&6)!==0)throw Error(r(327));if(t!==null){if(t===e.current)throw Error(r(177));if(u=t.lanes|t.childLanes,u|=nc,Wh(e,l,u,o,d,y),e===_e&&(se=_e=null,he=0),Ca=t,Rl=e,wa=l,or=u,sr=n,sd=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(e.callbackNode=null,e.callbackPriority=0,Ey(tu,function(){return Rd(),null})):(e.callbackNode=null,e.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=O.T,O.T=null,n=X.p,X.p=2,o=Se,Se|=4;try{fy(e,t,l)}finally{Se=o,X.p=n,O.T=a}}$e=1,xd(),Ed(),Td()}}function xd(){if($e===1){$e=0;var e=Rl,t=Ca,l=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||l){l=O.T,O.T=null;var a=X.p;X.p=2;var n=Se;Se|=4;try{ad(t,e);var u=Mr,o=rs(e.containerInfo),d=u.focusedElem,y=u.selectionRange;if(o!==d&&d&&d.ownerDocument&&cs(d.ownerDocument.documentElement,d)){if(y!==null&&Ii(d)){var M=y.start,D=y.end;if(D===void 0&&(D=M),"selectionStart"in d)d.selectionStart=M,d.selectionEnd=Math.min(D,d.value.length);else{var H=d.ownerDocument||document,_=H&&H.defaultView||window;if(_.getSelection){var z=_.getSelection(),ae=d.textContent.length,te=Math.min(y.start,ae),Ae=y.end===void 0?te:Math.min(y.end,ae);!z.extend&&te>Ae&&(o=Ae,Ae=te,te=o);var T=is(d,te),b=is(d,Ae);if(T&&b&&(z.rangeCount!==1||z.anchorNode!==T.node||z.anchorOffset!==T.offset||z.focusNode!==b.node||z.focusOffset!==b.offset)){var A=H.createRange();A.setStart(T.node,T.offset),z.removeAllRanges(),te>Ae?(z.addRange(A),z.extend(b.node,b.offset)):(A.setEnd(b.node,b.offset),z.addRange(A))}}}}for(H=[],z=d;z=z.parentNode;)z.nodeType===1&&H.push({element:z,left:z.scrollLeft,top:z.scrollTop});for(typeof d.focus=="function"&&d.focus(),d=0;d<H.length;d++){var j=H[d];j.element.scrollLeft=j.left,j.element.scrollTop=j.top}}ri=!!Rr,Mr=Rr=null}finally{Se=n,X.p=a,O.T=l}}e.current=t,$e=2}}function Ed(){if($e===2){$e=0;var e=Rl,t=Ca,l=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||l){l=O.T,O.T=null;var a=X.p;X.p=2;var n=Se;Se|=4;try{If(e,t.alternate,t)}finally{Se=n,X.p=a,O.T=l}}$e=3}}function Td(){if($e===4||$e===3){$e=0,Yh();var e=Rl,t=Ca,l=wa,a=sd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?$e=5:($e=0,Ca=Rl=null,Ad(e,e.pendingLanes));var n=e.pendingLanes;if(n===0&&(Al=null),wi(l),t=t.stateNode,ct&&typeof ct.onCommitFiberRoot=="function")try{ct.onCommitFiberRoot(Za,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=O.T,n=X.p,X.p=2,O.T=null;try{for(var u=e.onRecoverableError,o=0;o<a.length;o++){var d=a[o];u(d.value,{componentStack:d.stack})}}finally{O.T=t,X.p=n}}(wa&3)!==0&&Wu(),Ht(e),n=e.pendingLanes,(l&4194090)!==0&&(n&42)!==0?e===fr?Cn++:(Cn=0,fr=e):Cn=0,wn(0)}}function Ad(e,t){(e.pooledCacheLanes&=t)===0&&(t=e.pooledCache,t!=null&&(e.pooledCache=null,fn(t)))}function Wu(e){return xd(),Ed(),Td(),Rd()}function Rd(){if($e!==5)return!1;var e=Rl,t=or;or=0;var l=wi(wa),a=O.T,n=X.p;try{X.p=32>l?32:l,O.T=null,l=sr,sr=null;var u=Rl,o=wa;if($e=0,Ca=Rl=null,wa=0,(Se&6)!==0)throw Error(r(331));var d=Se;if(Se|=4,rd(u.current),ud(u,u.current,o,l),Se=d,wn(0,!1),ct&&typeof ct.onPostCommitFiberRoot=="function")try{ct.onPostCommitFiberRoot(Za,u)}catch{}return!0}finally{X.p=n,O.T=a,Ad(e,t)}}function Md(e,t,l){t=St(l,t),t=Xc(e.stateNode,t,2),e=vl(e,t,2),e!==null&&(Ja(e,2),Ht(e))}function Me(e,t,l){if(e.tag===3)Md(e,e,l);else for(;t!==null;){if(t.tag===3){Md(t,e,l);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(Al===null||!Al.has(a))){e=St(l,e),l=Of(2),a=vl(t,l,2),a!==null&&(Cf(l,a,t,e),Ja(a,2),Ht(a));break}}t=t.return}}function vr(e,t,l){var a=e.pingCache;if(a===null){a=e.pingCache=new hy;var n=new Set;a.set(t,n)}else n=a.get(t),n===void 0&&(n=new Set,a.set(t,n));n.has(l)||(ur=!0,n.add(l),e=by.bind(null,e,t,l),t.then(e,e))}function by(e,t,l){var a=e.pingCache;a!==null&&a.delete(t),e.pingedLanes|=e.suspendedLanes&l,e.warmLanes&=~l,_e===e&&(he&l)===l&&(De===4||De===3&&(he&62914560)===he&&300>Ct()-rr?(Se&2)===0&&Da(e,0):ir|=l,Oa===he&&(Oa=0)),Ht(e)}function _d(e,t){t===0&&(t=Eo()),e=va(e,t),e!==null&&(Ja(e,t),Ht(e))}function Sy(e){var t=e.memoizedState,l=0;t!==null&&(l=t.retryLane),_d(e,l)}function xy(e,t){var l=0;switch(e.tag){case 13:var a=e.stateNode,n=e.memoizedState;n!==null&&(l=n.retryLane);break;case 19:a=e.stateNode;break;case 22:a=e.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(t),_d(e,l)}function Ey(e,t){return zi(e,t)}var Fu=null,ja=null,yr=!1,Pu=!1,gr=!1,Pl=0;function Ht(e){e!==ja&&e.next===null&&(ja===null?Fu=ja=e:ja=ja.next=e),Pu=!0,yr||(yr=!0,Ay())}function wn(e,t){if(!gr&&Pu){gr=!0;do for(var l=!1,a=Fu;a!==null;){if(e!==0){var n=a.pendingLanes;if(n===0)var u=0;else{var o=a.suspendedLanes,d=a.pingedLanes;u=(1<<31-rt(42|e)+1)-1,u&=n&~(o&~d),u=u&201326741?u&201326741|1:u?u|2:0}u!==0&&(l=!0,Cd(a,u))}else u=he,u=nu(a,a===_e?u:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(u&3)===0||Ka(a,u)||(l=!0,Cd(a,u));a=a.next}while(l);gr=!1}}function Ty(){zd()}function zd(){Pu=yr=!1;var e=0;Pl!==0&&(wy()&&(e=Pl),Pl=0);for(var t=Ct(),l=null,a=Fu;a!==null;){var n=a.next,u=Nd(a,t);u===0?(a.next=null,l===null?Fu=n:l.next=n,n===null&&(ja=l)):(l=a,(e!==0||(u&3)!==0)&&(Pu=!0)),a=n}wn(e)}function Nd(e,t){for(var l=e.suspendedLanes,a=e.pingedLanes,n=e.expirationTimes,u=e.pendingLanes&-62914561;0<u;){var o=31-rt(u),d=1<<o,y=n[o];y===-1?((d&l)===0||(d&a)!==0)&&(n[o]=$h(d,t)):y<=t&&(e.expiredLanes|=d),u&=~d}if(t=_e,l=he,l=nu(e,e===t?l:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),a=e.callbackNode,l===0||e===t&&(xe===2||xe===9)||e.cancelPendingCommit!==null)return a!==null&&a!==null&&Ni(a),e.callbackNode=null,e.callbackPriority=0;if((l&3)===0||Ka(e,l)){if(t=l&-l,t===e.callbackPriority)return t;switch(a!==null&&Ni(a),wi(l)){case 2:case 8:l=bo;break;case 32:l=tu;break;case 268435456:l=So;break;default:l=tu}return a=Od.bind(null,e),l=zi(l,a),e.callbackPriority=t,e.callbackNode=l,t}return a!==null&&a!==null&&Ni(a),e.callbackPriority=2,e.callbackNode=null,2}function Od(e,t){if($e!==0&&$e!==5)return e.callbackNode=null,e.callbackPriority=0,null;var l=e.callbackNode;if(Wu()&&e.callbackNode!==l)return null;var a=he;return a=nu(e,e===_e?a:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),a===0?null:(dd(e,a,t),Nd(e,Ct()),e.callbackNode!=null&&e.callbackNode===l?Od.bind(null,e):null)}function Cd(e,t){if(Wu())return null;dd(e,t,!0)}function Ay(){Uy(function(){(Se&6)!==0?zi(po,Ty):zd()})}function pr(){return Pl===0&&(Pl=xo()),Pl}function wd(e){return e==null||typeof e=="symbol"||typeof e=="boolean"?null:typeof e=="function"?e:ou(""+e)}function Dd(e,t){var l=t.ownerDocument.createElement("input");return l.name=t.name,l.value=t.value,e.id&&l.setAttribute("form",e.id),t.parentNode.insertBefore(l,t),e=new FormData(e),l.parentNode.removeChild(l),e}function Ry(e,t,l,a,n){if(t==="submit"&&l&&l.stateNode===n){var u=wd((n[tt]||null).action),o=a.submitter;o&&(t=(t=o[tt]||null)?wd(t.formAction):o.getAttribute("formAction"),t!==null&&(u=t,o=null));var d=new mu("action","action",null,a,n);e.push({event:d,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(Pl!==0){var y=o?Dd(n,o):new FormData(n);qc(l,{pending:!0,data:y,method:n.method,action:u},null,y)}}else typeof u=="function"&&(d.preventDefault(),y=o?Dd(n,o):new FormData(n),qc(l,{pending:!0,data:y,method:n.method,action:u},u,y))},currentTarget:n}]})}}for(var br=0;br<ac.length;br++){var Sr=ac[br],My=Sr.toLowerCase(),_y=Sr[0].toUpperCase()+Sr.slice(1);_t(My,"on"+_y)}_t(fs,"onAnimationEnd"),_t(ds,"onAnimationIteration"),_t(ms,"onAnimationStart"),_t("dblclick","onDoubleClick"),_t("focusin","onFocus"),_t("focusout","onBlur"),_t(kv,"onTransitionRun"),_t(Qv,"onTransitionStart"),_t(Zv,"onTransitionCancel"),_t(hs,"onTransitionEnd"),ua("onMouseEnter",["mouseout","mouseover"]),ua("onMouseLeave",["mouseout","mouseover"]),ua("onPointerEnter",["pointerout","pointerover"]),ua("onPointerLeave",["pointerout","pointerover"]),Hl("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Hl("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Hl("onBeforeInput",["compositionend","keypress","textInput","paste"]),Hl("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Hl("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Hl("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Dn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),zy=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Dn));function Ud(e,t){t=(t&4)!==0;for(var l=0;l<e.length;l++){var a=e[l],n=a.event;a=a.listeners;e:{var u=void 0;if(t)for(var o=a.length-1;0<=o;o--){var d=a[o],y=d.instance,M=d.currentTarget;if(d=d.listener,y!==u&&n.isPropagationStopped())break e;u=d,n.currentTarget=M;try{u(n)}catch(D){Lu(D)}n.currentTarget=null,u=y}else for(o=0;o<a.length;o++){if(d=a[o],y=d.instance,M=d.currentTarget,d=d.listener,y!==u&&n.isPropagationStopped())break e;u=d,n.currentTarget=M;try{u(n)}catch(D){Lu(D)}n.currentTarget=null,u=y}}}}function fe(e,t){var l=t[Di];l===void 0&&(l=t[Di]=new Set);var a=e+"__bubble";l.has(a)||(jd(t,e,2,!1),l.add(a))}function xr(e,t,l){var a=0;t&&(a|=4),jd(l,e,a,t)}var Iu="_reactListening"+Math.random().toString(36).slice(2);function Er(e){if(!e[Iu]){e[Iu]=!0,_o.forEach(function(l){l!=="selectionchange"&&(zy.has(l)||xr(l,!1,e),xr(l,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Iu]||(t[Iu]=!0,xr("selectionchange",!1,t))}}function jd(e,t,l,a){switch(um(t)){case 2:var n=t0;break;case 8:n=l0;break;default:n=Hr}l=n.bind(null,t,l,e),n=void 0,!ki||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(n=!0),a?n!==void 0?e.addEventListener(t,l,{capture:!0,passive:n}):e.addEventListener(t,l,!0):n!==void 0?e.addEventListener(t,l,{passive:n}):e.addEventListener(t,l,!1)}function Tr(e,t,l,a,n){var u=a;if((t&1)===0&&(t&2)===0&&a!==null)e:for(;;){if(a===null)return;var o=a.tag;if(o===3||o===4){var d=a.stateNode.containerInfo;if(d===n)break;if(o===4)for(o=a.return;o!==null;){var y=o.tag;if((y===3||y===4)&&o.stateNode.containerInfo===n)return;o=o.return}for(;d!==null;){if(o=la(d),o===null)return;if(y=o.tag,y===5||y===6||y===26||y===27){a=u=o;continue e}d=d.parentNode}}a=a.return}Yo(function(){var M=u,D=Vi(l),H=[];e:{var _=vs.get(e);if(_!==void 0){var z=mu,ae=e;switch(e){case"keypress":if(fu(l)===0)break e;case"keydown":case"keyup":z=Ev;break;case"focusin":ae="focus",z=Ji;break;case"focusout":ae="blur",z=Ji;break;case"beforeblur":case"afterblur":z=Ji;break;case"click":if(l.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":z=ko;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":z=sv;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":z=Rv;break;case fs:case ds:case ms:z=mv;break;case hs:z=_v;break;case"scroll":case"scrollend":z=rv;break;case"wheel":z=Nv;break;case"copy":case"cut":case"paste":z=vv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":z=Zo;break;case"toggle":case"beforetoggle":z=Cv}var te=(t&4)!==0,Ae=!te&&(e==="scroll"||e==="scrollend"),T=te?_!==null?_+"Capture":null:_;te=[];for(var b=M,A;b!==null;){var j=b;if(A=j.stateNode,j=j.tag,j!==5&&j!==26&&j!==27||A===null||T===null||(j=Fa(b,T),j!=null&&te.push(Un(b,j,A))),Ae)break;b=b.return}0<te.length&&(_=new z(_,ae,null,l,D),H.push({event:_,listeners:te}))}}if((t&7)===0){e:{if(_=e==="mouseover"||e==="pointerover",z=e==="mouseout"||e==="pointerout",_&&l!==Yi&&(ae=l.relatedTarget||l.fromElement)&&(la(ae)||ae[ta]))break e;if((z||_)&&(_=D.window===D?D:(_=D.ownerDocument)?_.defaultView||_.parentWindow:window,z?(ae=l.relatedTarget||l.toElement,z=M,ae=ae?la(ae):null,ae!==null&&(Ae=m(ae),te=ae.tag,ae!==Ae||te!==5&&te!==27&&te!==6)&&(ae=null)):(z=null,ae=M),z!==ae)){if(te=ko,j="onMouseLeave",T="onMouseEnter",b="mouse",(e==="pointerout"||e==="pointerover")&&(te=Zo,j="onPointerLeave",T="onPointerEnter",b="pointer"),Ae=z==null?_:Wa(z),A=ae==null?_:Wa(ae),_=new te(j,b+"leave",z,l,D),_.target=Ae,_.relatedTarget=A,j=null,la(D)===M&&(te=new te(T,b+"enter",ae,l,D),te.target=A,te.relatedTarget=Ae,j=te),Ae=j,z&&ae)t:{for(te=z,T=ae,b=0,A=te;A;A=Ha(A))b++;for(A=0,j=T;j;j=Ha(j))A++;for(;0<b-A;)te=Ha(te),b--;for(;0<A-b;)T=Ha(T),A--;for(;b--;){if(te===T||T!==null&&te===T.alternate)break t;te=Ha(te),T=Ha(T)}te=null}else te=null;z!==null&&Hd(H,_,z,te,!1),ae!==null&&Ae!==null&&Hd(H,Ae,ae,te,!0)}}e:{if(_=M?Wa(M):window,z=_.nodeName&&_.nodeName.toLowerCase(),z==="select"||z==="input"&&_.type==="file")var J=es;else if(Po(_))if(ts)J=Yv;else{J=Lv;var re=qv}else z=_.nodeName,!z||z.toLowerCase()!=="input"||_.type!=="checkbox"&&_.type!=="radio"?M&&Gi(M.elementType)&&(J=es):J=Gv;if(J&&(J=J(e,M))){Io(H,J,l,D);break e}re&&re(e,_,M),e==="focusout"&&M&&_.type==="number"&&M.memoizedProps.value!=null&&Li(_,"number",_.value)}switch(re=M?Wa(M):window,e){case"focusin":(Po(re)||re.contentEditable==="true")&&(da=re,ec=M,un=null);break;case"focusout":un=ec=da=null;break;case"mousedown":tc=!0;break;case"contextmenu":case"mouseup":case"dragend":tc=!1,os(H,l,D);break;case"selectionchange":if(Xv)break;case"keydown":case"keyup":os(H,l,D)}var I;if(Wi)e:{switch(e){case"compositionstart":var le="onCompositionStart";break e;case"compositionend":le="onCompositionEnd";break e;case"compositionupdate":le="onCompositionUpdate";break e}le=void 0}else fa?Wo(e,l)&&(le="onCompositionEnd"):e==="keydown"&&l.keyCode===229&&(le="onCompositionStart");le&&(Ko&&l.locale!=="ko"&&(fa||le!=="onCompositionStart"?le==="onCompositionEnd"&&fa&&(I=Vo()):(fl=D,Qi="value"in fl?fl.value:fl.textContent,fa=!0)),re=ei(M,le),0<re.length&&(le=new Qo(le,e,null,l,D),H.push({event:le,listeners:re}),I?le.data=I:(I=Fo(l),I!==null&&(le.data=I)))),(I=Dv?Uv(e,l):jv(e,l))&&(le=ei(M,"onBeforeInput"),0<le.length&&(re=new Qo("onBeforeInput","beforeinput",null,l,D),H.push({event:re,listeners:le}),re.data=I)),Ry(H,e,M,l,D)}Ud(H,t)})}function Un(e,t,l){return{instance:e,listener:t,currentTarget:l}}function ei(e,t){for(var l=t+"Capture",a=[];e!==null;){var n=e,u=n.stateNode;if(n=n.tag,n!==5&&n!==26&&n!==27||u===null||(n=Fa(e,l),n!=null&&a.unshift(Un(e,n,u)),n=Fa(e,t),n!=null&&a.push(Un(e,n,u))),e.tag===3)return a;e=e.return}return[]}function Ha(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5&&e.tag!==27);return e||null}function Hd(e,t,l,a,n){for(var u=t._reactName,o=[];l!==null&&l!==a;){var d=l,y=d.alternate,M=d.stateNode;if(d=d.tag,y!==null&&y===a)break;d!==5&&d!==26&&d!==27||M===null||(y=M,n?(M=Fa(l,u),M!=null&&o.unshift(Un(l,M,y))):n||(M=Fa(l,u),M!=null&&o.push(Un(l,M,y)))),l=l.return}o.length!==0&&e.push({event:t,listeners:o})}var Ny=/\r\n?/g,Oy=/\u0000|\uFFFD/g;function Bd(e){return(typeof e=="string"?e:""+e).replace(Ny,`
-`).replace(Oy,"")}function qd(e,t){return t=Bd(t),Bd(e)===t}function ti(){}function Te(e,t,l,a,n,u){switch(l){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||ra(e,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&ra(e,""+a);break;case"className":iu(e,"class",a);break;case"tabIndex":iu(e,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":iu(e,l,a);break;case"style":Lo(e,a,u);break;case"data":if(t!=="object"){iu(e,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||l!=="href")){e.removeAttribute(l);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){e.removeAttribute(l);break}a=ou(""+a),e.setAttribute(l,a);break;case"action":case"formAction":if(typeof a=="function"){e.setAttribute(l,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof u=="function"&&(l==="formAction"?(t!=="input"&&Te(e,t,"name",n.name,n,null),Te(e,t,"formEncType",n.formEncType,n,null),Te(e,t,"formMethod",n.formMethod,n,null),Te(e,t,"formTarget",n.formTarget,n,null)):(Te(e,t,"encType",n.encType,n,null),Te(e,t,"method",n.method,n,null),Te(e,t,"target",n.target,n,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){e.removeAttribute(l);break}a=ou(""+a),e.setAttribute(l,a);break;case"onClick":a!=null&&(e.onclick=ti);break;case"onScroll":a!=null&&fe("scroll",e);break;case"onScrollEnd":a!=null&&fe("scrollend",e);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(l=a.__html,l!=null){if(n.children!=null)throw Error(r(60));e.innerHTML=l}}break;case"multiple":e.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":e.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){e.removeAttribute("xlink:href");break}l=ou(""+a),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",l);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?e.setAttribute(l,""+a):e.removeAttribute(l);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?e.setAttribute(l,""):e.removeAttribute(l);break;case"capture":case"download":a===!0?e.setAttribute(l,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?e.setAttribute(l,a):e.removeAttribute(l);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?e.setAttribute(l,a):e.removeAttribute(l);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?e.removeAttribute(l):e.setAttribute(l,a);break;case"popover":fe("beforetoggle",e),fe("toggle",e),uu(e,"popover",a);break;case"xlinkActuate":Gt(e,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Gt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Gt(e,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Gt(e,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Gt(e,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Gt(e,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Gt(e,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Gt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Gt(e,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":uu(e,"is",a);break;case"innerText":case"textContent":break;default:(!(2<l.length)||l[0]!=="o"&&l[0]!=="O"||l[1]!=="n"&&l[1]!=="N")&&(l=iv.get(l)||l,uu(e,l,a))}}function Ar(e,t,l,a,n,u){switch(l){case"style":Lo(e,a,u);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(l=a.__html,l!=null){if(n.children!=null)throw Error(r(60));e.innerHTML=l}}break;case"children":typeof a=="string"?ra(e,a):(typeof a=="number"||typeof a=="bigint")&&ra(e,""+a);break;case"onScroll":a!=null&&fe("scroll",e);break;case"onScrollEnd":a!=null&&fe("scrollend",e);break;case"onClick":a!=null&&(e.onclick=ti);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!zo.hasOwnProperty(l))e:{if(l[0]==="o"&&l[1]==="n"&&(n=l.endsWith("Capture"),t=l.slice(2,n?l.length-7:void 0),u=e[tt]||null,u=u!=null?u[l]:null,typeof u=="function"&&e.removeEventListener(t,u,n),typeof a=="function")){typeof u!="function"&&u!==null&&(l in e?e[l]=null:e.hasAttribute(l)&&e.removeAttribute(l)),e.addEventListener(t,a,n);break e}l in e?e[l]=a:a===!0?e.setAttribute(l,""):uu(e,l,a)}}}function We(e,t,l){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":fe("error",e),fe("load",e);var a=!1,n=!1,u;for(u in l)if(l.hasOwnProperty(u)){var o=l[u];if(o!=null)switch(u){case"src":a=!0;break;case"srcSet":n=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:Te(e,t,u,o,l,null)}}n&&Te(e,t,"srcSet",l.srcSet,l,null),a&&Te(e,t,"src",l.src,l,null);return;case"input":fe("invalid",e);var d=u=o=n=null,y=null,M=null;for(a in l)if(l.hasOwnProperty(a)){var D=l[a];if(D!=null)switch(a){case"name":n=D;break;case"type":o=D;break;case"checked":y=D;break;case"defaultChecked":M=D;break;case"value":u=D;break;case"defaultValue":d=D;break;case"children":case"dangerouslySetInnerHTML":if(D!=null)throw Error(r(137,t));break;default:Te(e,t,a,D,l,null)}}jo(e,u,d,y,M,o,n,!1),cu(e);return;case"select":fe("invalid",e),a=o=u=null;for(n in l)if(l.hasOwnProperty(n)&&(d=l[n],d!=null))switch(n){case"value":u=d;break;case"defaultValue":o=d;break;case"multiple":a=d;default:Te(e,t,n,d,l,null)}t=u,l=o,e.multiple=!!a,t!=null?ca(e,!!a,t,!1):l!=null&&ca(e,!!a,l,!0);return;case"textarea":fe("invalid",e),u=n=a=null;for(o in l)if(l.hasOwnProperty(o)&&(d=l[o],d!=null))switch(o){case"value":a=d;break;case"defaultValue":n=d;break;case"children":u=d;break;case"dangerouslySetInnerHTML":if(d!=null)throw Error(r(91));break;default:Te(e,t,o,d,l,null)}Bo(e,a,n,u),cu(e);return;case"option":for(y in l)if(l.hasOwnProperty(y)&&(a=l[y],a!=null))switch(y){case"selected":e.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:Te(e,t,y,a,l,null)}return;case"dialog":fe("beforetoggle",e),fe("toggle",e),fe("cancel",e),fe("close",e);break;case"iframe":case"object":fe("load",e);break;case"video":case"audio":for(a=0;a<Dn.length;a++)fe(Dn[a],e);break;case"image":fe("error",e),fe("load",e);break;case"details":fe("toggle",e);break;case"embed":case"source":case"link":fe("error",e),fe("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(M in l)if(l.hasOwnProperty(M)&&(a=l[M],a!=null))switch(M){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:Te(e,t,M,a,l,null)}return;default:if(Gi(t)){for(D in l)l.hasOwnProperty(D)&&(a=l[D],a!==void 0&&Ar(e,t,D,a,l,void 0));return}}for(d in l)l.hasOwnProperty(d)&&(a=l[d],a!=null&&Te(e,t,d,a,l,null))}function Cy(e,t,l,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var n=null,u=null,o=null,d=null,y=null,M=null,D=null;for(z in l){var H=l[z];if(l.hasOwnProperty(z)&&H!=null)switch(z){case"checked":break;case"value":break;case"defaultValue":y=H;default:a.hasOwnProperty(z)||Te(e,t,z,null,a,H)}}for(var _ in a){var z=a[_];if(H=l[_],a.hasOwnProperty(_)&&(z!=null||H!=null))switch(_){case"type":u=z;break;case"name":n=z;break;case"checked":M=z;break;case"defaultChecked":D=z;break;case"value":o=z;break;case"defaultValue":d=z;break;case"children":case"dangerouslySetInnerHTML":if(z!=null)throw Error(r(137,t));break;default:z!==H&&Te(e,t,_,z,a,H)}}qi(e,o,d,y,M,D,u,n);return;case"select":z=o=d=_=null;for(u in l)if(y=l[u],l.hasOwnProperty(u)&&y!=null)switch(u){case"value":break;case"multiple":z=y;default:a.hasOwnProperty(u)||Te(e,t,u,null,a,y)}for(n in a)if(u=a[n],y=l[n],a.hasOwnProperty(n)&&(u!=null||y!=null))switch(n){case"value":_=u;break;case"defaultValue":d=u;break;case"multiple":o=u;default:u!==y&&Te(e,t,n,u,a,y)}t=d,l=o,a=z,_!=null?ca(e,!!l,_,!1):!!a!=!!l&&(t!=null?ca(e,!!l,t,!0):ca(e,!!l,l?[]:"",!1));return;case"textarea":z=_=null;for(d in l)if(n=l[d],l.hasOwnProperty(d)&&n!=null&&!a.hasOwnProperty(d))switch(d){case"value":break;case"children":break;default:Te(e,t,d,null,a,n)}for(o in a)if(n=a[o],u=l[o],a.hasOwnProperty(o)&&(n!=null||u!=null))switch(o){case"value":_=n;break;case"defaultValue":z=n;break;case"children":break;case"dangerouslySetInnerHTML":if(n!=null)throw Error(r(91));break;default:n!==u&&Te(e,t,o,n,a,u)}Ho(e,_,z);return;case"option":for(var ae in l)if(_=l[ae],l.hasOwnProperty(ae)&&_!=null&&!a.hasOwnProperty(ae))switch(ae){case"selected":e.selected=!1;break;default:Te(e,t,ae,null,a,_)}for(y in a)if(_=a[y],z=l[y],a.hasOwnProperty(y)&&_!==z&&(_!=null||z!=null))switch(y){case"selected":e.selected=_&&typeof _!="function"&&typeof _!="symbol";break;default:Te(e,t,y,_,a,z)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var te in l)_=l[te],l.hasOwnProperty(te)&&_!=null&&!a.hasOwnProperty(te)&&Te(e,t,te,null,a,_);for(M in a)if(_=a[M],z=l[M],a.hasOwnProperty(M)&&_!==z&&(_!=null||z!=null))switch(M){case"children":case"dangerouslySetInnerHTML":if(_!=null)throw Error(r(137,t));break;default:Te(e,t,M,_,a,z)}return;default:if(Gi(t)){for(var Ae in l)_=l[Ae],l.hasOwnProperty(Ae)&&_!==void 0&&!a.hasOwnProperty(Ae)&&Ar(e,t,Ae,void 0,a,_);for(D in a)_=a[D],z=l[D],!a.hasOwnProperty(D)||_===z||_===void 0&&z===void 0||Ar(e,t,D,_,a,z);return}}for(var T in l)_=l[T],l.hasOwnProperty(T)&&_!=null&&!a.hasOwnProperty(T)&&Te(e,t,T,null,a,_);for(H in a)_=a[H],z=l[H],!a.hasOwnProperty(H)||_===z||_==null&&z==null||Te(e,t,H,_,a,z)}var Rr=null,Mr=null;function li(e){return e.nodeType===9?e:e.ownerDocument}function Ld(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gd(e,t){if(e===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return e===1&&t==="foreignObject"?0:e}function _r(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var zr=null;function wy(){var e=window.event;return e&&e.type==="popstate"?e===zr?!1:(zr=e,!0):(zr=null,!1)}var Yd=typeof setTimeout=="function"?setTimeout:void 0,Dy=typeof clearTimeout=="function"?clearTimeout:void 0,Vd=typeof Promise=="function"?Promise:void 0,Uy=typeof queueMicrotask=="function"?queueMicrotask:typeof Vd<"u"?function(e){return Vd.resolve(null).then(e).catch(jy)}:Yd;function jy(e){setTimeout(function(){throw e})}function _l(e){return e==="head"}function Xd(e,t){var l=t,a=0,n=0;do{var u=l.nextSibling;if(e.removeChild(l),u&&u.nodeType===8)if(l=u.data,l==="/$"){if(0<a&&8>a){l=a;var o=e.ownerDocument;if(l&1&&jn(o.documentElement),l&2&&jn(o.body),l&4)for(l=o.head,jn(l),o=l.firstChild;o;){var d=o.nextSibling,y=o.nodeName;o[$a]||y==="SCRIPT"||y==="STYLE"||y==="LINK"&&o.rel.toLowerCase()==="stylesheet"||l.removeChild(o),o=d}}if(n===0){e.removeChild(u),Xn(t);return}n--}else l==="$"||l==="$?"||l==="$!"?n++:a=l.charCodeAt(0)-48;else a=0;l=u}while(l);Xn(t)}function Nr(e){var t=e.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var l=t;switch(t=t.nextSibling,l.nodeName){case"HTML":case"HEAD":case"BODY":Nr(l),Ui(l);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(l.rel.toLowerCase()==="stylesheet")continue}e.removeChild(l)}}function Hy(e,t,l,a){for(;e.nodeType===1;){var n=l;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(e.nodeName!=="INPUT"||e.type!=="hidden"))break}else if(a){if(!e[$a])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if(u=e.getAttribute("rel"),u==="stylesheet"&&e.hasAttribute("data-precedence"))break;if(u!==n.rel||e.getAttribute("href")!==(n.href==null||n.href===""?null:n.href)||e.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin)||e.getAttribute("title")!==(n.title==null?null:n.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(u=e.getAttribute("src"),(u!==(n.src==null?null:n.src)||e.getAttribute("type")!==(n.type==null?null:n.type)||e.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin))&&u&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else if(t==="input"&&e.type==="hidden"){var u=n.name==null?null:""+n.name;if(n.type==="hidden"&&e.getAttribute("name")===u)return e}else return e;if(e=Nt(e.nextSibling),e===null)break}return null}function By(e,t,l){if(t==="")return null;for(;e.nodeType!==3;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!l||(e=Nt(e.nextSibling),e===null))return null;return e}function Or(e){return e.data==="$!"||e.data==="$?"&&e.ownerDocument.readyState==="complete"}function qy(e,t){var l=e.ownerDocument;if(e.data!=="$?"||l.readyState==="complete")t();else{var a=function(){t(),l.removeEventListener("DOMContentLoaded",a)};l.addEventListener("DOMContentLoaded",a),e._reactRetry=a}}function Nt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return e}var Cr=null;function kd(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var l=e.data;if(l==="$"||l==="$!"||l==="$?"){if(t===0)return e;t--}else l==="/$"&&t++}e=e.previousSibling}return null}function Qd(e,t,l){switch(t=li(l),e){case"html":if(e=t.documentElement,!e)throw Error(r(452));return e;case"head":if(e=t.head,!e)throw Error(r(453));return e;case"body":if(e=t.body,!e)throw Error(r(454));return e;default:throw Error(r(451))}}function jn(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Ui(e)}var Mt=new Map,Zd=new Set;function ai(e){return typeof e.getRootNode=="function"?e.getRootNode():e.nodeType===9?e:e.ownerDocument}var el=X.d;X.d={f:Ly,r:Gy,D:Yy,C:Vy,L:Xy,m:ky,X:Zy,S:Qy,M:Ky};function Ly(){var e=el.f(),t=Ju();return e||t}function Gy(e){var t=aa(e);t!==null&&t.tag===5&&t.type==="form"?df(t):el.r(e)}var Ba=typeof document>"u"?null:document;function Kd(e,t,l){var a=Ba;if(a&&typeof t=="string"&&t){var n=bt(t);n='link[rel="'+e+'"][href="'+n+'"]',typeof l=="string"&&(n+='[crossorigin="'+l+'"]'),Zd.has(n)||(Zd.add(n),e={rel:e,crossOrigin:l,href:t},a.querySelector(n)===null&&(t=a.createElement("link"),We(t,"link",e),ke(t),a.head.appendChild(t)))}}function Yy(e){el.D(e),Kd("dns-prefetch",e,null)}function Vy(e,t){el.C(e,t),Kd("preconnect",e,t)}function Xy(e,t,l){el.L(e,t,l);var a=Ba;if(a&&e&&t){var n='link[rel="preload"][as="'+bt(t)+'"]';t==="image"&&l&&l.imageSrcSet?(n+='[imagesrcset="'+bt(l.imageSrcSet)+'"]',typeof l.imageSizes=="string"&&(n+='[imagesizes="'+bt(l.imageSizes)+'"]')):n+='[href="'+bt(e)+'"]';var u=n;switch(t){case"style":u=qa(e);break;case"script":u=La(e)}Mt.has(u)||(e=S({rel:"preload",href:t==="image"&&l&&l.imageSrcSet?void 0:e,as:t},l),Mt.set(u,e),a.querySelector(n)!==null||t==="style"&&a.querySelector(Hn(u))||t==="script"&&a.querySelector(Bn(u))||(t=a.createElement("link"),We(t,"link",e),ke(t),a.head.appendChild(t)))}}function ky(e,t){el.m(e,t);var l=Ba;if(l&&e){var a=t&&typeof t.as=="string"?t.as:"script",n='link[rel="modulepreload"][as="'+bt(a)+'"][href="'+bt(e)+'"]',u=n;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":u=La(e)}if(!Mt.has(u)&&(e=S({rel:"modulepreload",href:e},t),Mt.set(u,e),l.querySelector(n)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(l.querySelector(Bn(u)))return}a=l.createElement("link"),We(a,"link",e),ke(a),l.head.appendChild(a)}}}function Qy(e,t,l){el.S(e,t,l);var a=Ba;if(a&&e){var n=na(a).hoistableStyles,u=qa(e);t=t||"default";var o=n.get(u);if(!o){var d={loading:0,preload:null};if(o=a.querySelector(Hn(u)))d.loading=5;else{e=S({rel:"stylesheet",href:e,"data-precedence":t},l),(l=Mt.get(u))&&wr(e,l);var y=o=a.createElement("link");ke(y),We(y,"link",e),y._p=new Promise(function(M,D){y.onload=M,y.onerror=D}),y.addEventListener("load",function(){d.loading|=1}),y.addEventListener("error",function(){d.loading|=2}),d.loading|=4,ni(o,t,a)}o={type:"stylesheet",instance:o,count:1,state:d},n.set(u,o)}}}function Zy(e,t){el.X(e,t);var l=Ba;if(l&&e){var a=na(l).hoistableScripts,n=La(e),u=a.get(n);u||(u=l.querySelector(Bn(n)),u||(e=S({src:e,async:!0},t),(t=Mt.get(n))&&Dr(e,t),u=l.createElement("script"),ke(u),We(u,"link",e),l.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function Ky(e,t){el.M(e,t);var l=Ba;if(l&&e){var a=na(l).hoistableScripts,n=La(e),u=a.get(n);u||(u=l.querySelector(Bn(n)),u||(e=S({src:e,async:!0,type:"module"},t),(t=Mt.get(n))&&Dr(e,t),u=l.createElement("script"),ke(u),We(u,"link",e),l.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function Jd(e,t,l,a){var n=(n=ne.current)?ai(n):null;if(!n)throw Error(r(446));switch(e){case"meta":case"title":return null;case"style":return typeof l.precedence=="string"&&typeof l.href=="string"?(t=qa(l.href),l=na(n).hoistableStyles,a=l.get(t),a||(a={type:"style",instance:null,count:0,state:null},l.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(l.rel==="stylesheet"&&typeof l.href=="string"&&typeof l.precedence=="string"){e=qa(l.href);var u=na(n).hoistableStyles,o=u.get(e);if(o||(n=n.ownerDocument||n,o={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(e,o),(u=n.querySelector(Hn(e)))&&!u._p&&(o.instance=u,o.state.loading=5),Mt.has(e)||(l={rel:"preload",as:"style",href:l.href,crossOrigin:l.crossOrigin,integrity:l.integrity,media:l.media,hrefLang:l.hrefLang,referrerPolicy:l.referrerPolicy},Mt.set(e,l),u||Jy(n,e,l,o.state))),t&&a===null)throw Error(r(528,""));return o}if(t&&a!==null)throw Error(r(529,""));return null;case"script":return t=l.async,l=l.src,typeof l=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=La(l),l=na(n).hoistableScripts,a=l.get(t),a||(a={type:"script",instance:null,count:0,state:null},l.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,e))}}function qa(e){return'href="'+bt(e)+'"'}function Hn(e){return'link[rel="stylesheet"]['+e+"]"}function $d(e){return S({},e,{"data-precedence":e.precedence,precedence:null})}function Jy(e,t,l,a){e.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=e.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),We(t,"link",l),ke(t),e.head.appendChild(t))}function La(e){return'[src="'+bt(e)+'"]'}function Bn(e){return"script[async]"+e}function Wd(e,t,l){if(t.count++,t.instance===null)switch(t.type){case"style":var a=e.querySelector('style[data-href~="'+bt(l.href)+'"]');if(a)return t.instance=a,ke(a),a;var n=S({},l,{"data-href":l.href,"data-precedence":l.precedence,href:null,precedence:null});return a=(e.ownerDocument||e).createElement("style"),ke(a),We(a,"style",n),ni(a,l.precedence,e),t.instance=a;case"stylesheet":n=qa(l.href);var u=e.querySelector(Hn(n));if(u)return t.state.loading|=4,t.instance=u,ke(u),u;a=$d(l),(n=Mt.get(n))&&wr(a,n),u=(e.ownerDocument||e).createElement("link"),ke(u);var o=u;return o._p=new Promise(function(d,y){o.onload=d,o.onerror=y}),We(u,"link",a),t.state.loading|=4,ni(u,l.precedence,e),t.instance=u;case"script":return u=La(l.src),(n=e.querySelector(Bn(u)))?(t.instance=n,ke(n),n):(a=l,(n=Mt.get(u))&&(a=S({},l),Dr(a,n)),e=e.ownerDocument||e,n=e.createElement("script"),ke(n),We(n,"link",a),e.head.appendChild(n),t.instance=n);case"void":return null;default:throw Error(r(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,ni(a,l.precedence,e));return t.instance}function ni(e,t,l){for(var a=l.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),n=a.length?a[a.length-1]:null,u=n,o=0;o<a.length;o++){var d=a[o];if(d.dataset.precedence===t)u=d;else if(u!==n)break}u?u.parentNode.insertBefore(e,u.nextSibling):(t=l.nodeType===9?l.head:l,t.insertBefore(e,t.firstChild))}function wr(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.title==null&&(e.title=t.title)}function Dr(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.integrity==null&&(e.integrity=t.integrity)}var ui=null;function Fd(e,t,l){if(ui===null){var a=new Map,n=ui=new Map;n.set(l,a)}else n=ui,a=n.get(l),a||(a=new Map,n.set(l,a));if(a.has(e))return a;for(a.set(e,null),l=l.getElementsByTagName(e),n=0;n<l.length;n++){var u=l[n];if(!(u[$a]||u[Fe]||e==="link"&&u.getAttribute("rel")==="stylesheet")&&u.namespaceURI!=="http://www.w3.org/2000/svg"){var o=u.getAttribute(t)||"";o=e+o;var d=a.get(o);d?d.push(u):a.set(o,[u])}}return a}function Pd(e,t,l){e=e.ownerDocument||e,e.head.insertBefore(l,t==="title"?e.querySelector("head > title"):null)}function $y(e,t,l){if(l===1||t.itemProp!=null)return!1;switch(e){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return e=t.disabled,typeof t.precedence=="string"&&e==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function Id(e){return!(e.type==="stylesheet"&&(e.state.loading&3)===0)}var qn=null;function Wy(){}function Fy(e,t,l){if(qn===null)throw Error(r(475));var a=qn;if(t.type==="stylesheet"&&(typeof l.media!="string"||matchMedia(l.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var n=qa(l.href),u=e.querySelector(Hn(n));if(u){e=u._p,e!==null&&typeof e=="object"&&typeof e.then=="function"&&(a.count++,a=ii.bind(a),e.then(a,a)),t.state.loading|=4,t.instance=u,ke(u);return}u=e.ownerDocument||e,l=$d(l),(n=Mt.get(n))&&wr(l,n),u=u.createElement("link"),ke(u);var o=u;o._p=new Promise(function(d,y){o.onload=d,o.onerror=y}),We(u,"link",l),t.instance=u}a.stylesheets===null&&(a.stylesheets=new Map),a.stylesheets.set(t,e),(e=t.state.preload)&&(t.state.loading&3)===0&&(a.count++,t=ii.bind(a),e.addEventListener("load",t),e.addEventListener("error",t))}}function Py(){if(qn===null)throw Error(r(475));var e=qn;return e.stylesheets&&e.count===0&&Ur(e,e.stylesheets),0<e.count?function(t){var l=setTimeout(function(){if(e.stylesheets&&Ur(e,e.stylesheets),e.unsuspend){var a=e.unsuspend;e.unsuspend=null,a()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(l)}}:null}function ii(){if(this.count--,this.count===0){if(this.stylesheets)Ur(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}}var ci=null;function Ur(e,t){e.stylesheets=null,e.unsuspend!==null&&(e.count++,ci=new Map,t.forEach(Iy,e),ci=null,ii.call(e))}function Iy(e,t){if(!(t.state.loading&4)){var l=ci.get(e);if(l)var a=l.get(null);else{l=new Map,ci.set(e,l);for(var n=e.querySelectorAll("link[data-precedence],style[data-precedence]"),u=0;u<n.length;u++){var o=n[u];(o.nodeName==="LINK"||o.getAttribute("media")!=="not all")&&(l.set(o.dataset.precedence,o),a=o)}a&&l.set(null,a)}n=t.instance,o=n.getAttribute("data-precedence"),u=l.get(o)||a,u===a&&l.set(null,n),l.set(o,n),this.count++,a=ii.bind(this),n.addEventListener("load",a),n.addEventListener("error",a),u?u.parentNode.insertBefore(n,u.nextSibling):(e=e.nodeType===9?e.head:e,e.insertBefore(n,e.firstChild)),t.state.loading|=4}}var Ln={$$typeof:Q,Provider:null,Consumer:null,_currentValue:G,_currentValue2:G,_threadCount:0};function e0(e,t,l,a,n,u,o,d){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Oi(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Oi(0),this.hiddenUpdates=Oi(null),this.identifierPrefix=a,this.onUncaughtError=n,this.onCaughtError=u,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=d,this.incompleteTransitions=new Map}function em(e,t,l,a,n,u,o,d,y,M,D,H){return e=new e0(e,t,l,o,d,y,M,H),t=1,u===!0&&(t|=24),u=st(3,null,null,t),e.current=u,u.stateNode=e,t=vc(),t.refCount++,e.pooledCache=t,t.refCount++,u.memoizedState={element:a,isDehydrated:l,cache:t},bc(u),e}function tm(e){return e?(e=ya,e):ya}function lm(e,t,l,a,n,u){n=tm(n),a.context===null?a.context=n:a.pendingContext=n,a=hl(t),a.payload={element:l},u=u===void 0?null:u,u!==null&&(a.callback=u),l=vl(e,a,t),l!==null&&(vt(l,e,t),vn(l,e,t))}function am(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var l=e.retryLane;e.retryLane=l!==0&&l<t?l:t}}function jr(e,t){am(e,t),(e=e.alternate)&&am(e,t)}function nm(e){if(e.tag===13){var t=va(e,67108864);t!==null&&vt(t,e,67108864),jr(e,67108864)}}var ri=!0;function t0(e,t,l,a){var n=O.T;O.T=null;var u=X.p;try{X.p=2,Hr(e,t,l,a)}finally{X.p=u,O.T=n}}function l0(e,t,l,a){var n=O.T;O.T=null;var u=X.p;try{X.p=8,Hr(e,t,l,a)}finally{X.p=u,O.T=n}}function Hr(e,t,l,a){if(ri){var n=Br(a);if(n===null)Tr(e,t,a,oi,l),im(e,a);else if(n0(n,e,t,l,a))a.stopPropagation();else if(im(e,a),t&4&&-1<a0.indexOf(e)){for(;n!==null;){var u=aa(n);if(u!==null)switch(u.tag){case 3:if(u=u.stateNode,u.current.memoizedState.isDehydrated){var o=jl(u.pendingLanes);if(o!==0){var d=u;for(d.pendingLanes|=2,d.entangledLanes|=2;o;){var y=1<<31-rt(o);d.entanglements[1]|=y,o&=~y}Ht(u),(Se&6)===0&&(Zu=Ct()+500,wn(0))}}break;case 13:d=va(u,2),d!==null&&vt(d,u,2),Ju(),jr(u,2)}if(u=Br(a),u===null&&Tr(e,t,a,oi,l),u===n)break;n=u}n!==null&&a.stopPropagation()}else Tr(e,t,a,null,l)}}function Br(e){return e=Vi(e),qr(e)}var oi=null;function qr(e){if(oi=null,e=la(e),e!==null){var t=m(e);if(t===null)e=null;else{var l=t.tag;if(l===13){if(e=g(t),e!==null)return e;e=null}else if(l===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return oi=e,null}function um(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Vh()){case po:return 2;case bo:return 8;case tu:case Xh:return 32;case So:return 268435456;default:return 32}default:return 32}}var Lr=!1,zl=null,Nl=null,Ol=null,Gn=new Map,Yn=new Map,Cl=[],a0="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function im(e,t){switch(e){case"focusin":case"focusout":zl=null;break;case"dragenter":case"dragleave":Nl=null;break;case"mouseover":case"mouseout":Ol=null;break;case"pointerover":case"pointerout":Gn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Yn.delete(t.pointerId)}}function Vn(e,t,l,a,n,u){return e===null||e.nativeEvent!==u?(e={blockedOn:t,domEventName:l,eventSystemFlags:a,nativeEvent:u,targetContainers:[n]},t!==null&&(t=aa(t),t!==null&&nm(t)),e):(e.eventSystemFlags|=a,t=e.targetContainers,n!==null&&t.indexOf(n)===-1&&t.push(n),e)}function n0(e,t,l,a,n){switch(t){case"focusin":return zl=Vn(zl,e,t,l,a,n),!0;case"dragenter":return Nl=Vn(Nl,e,t,l,a,n),!0;case"mouseover":return Ol=Vn(Ol,e,t,l,a,n),!0;case"pointerover":var u=n.pointerId;return Gn.set(u,Vn(Gn.get(u)||null,e,t,l,a,n)),!0;case"gotpointercapture":return u=n.pointerId,Yn.set(u,Vn(Yn.get(u)||null,e,t,l,a,n)),!0}return!1}function cm(e){var t=la(e.target);if(t!==null){var l=m(t);if(l!==null){if(t=l.tag,t===13){if(t=g(l),t!==null){e.blockedOn=t,Fh(e.priority,function(){if(l.tag===13){var a=ht();a=Ci(a);var n=va(l,a);n!==null&&vt(n,l,a),jr(l,a)}});return}}else if(t===3&&l.stateNode.current.memoizedState.isDehydrated){e.blockedOn=l.tag===3?l.stateNode.containerInfo:null;return}}}e.blockedOn=null}function si(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var l=Br(e.nativeEvent);if(l===null){l=e.nativeEvent;var a=new l.constructor(l.type,l);Yi=a,l.target.dispatchEvent(a),Yi=null}else return t=aa(l),t!==null&&nm(t),e.blockedOn=l,!1;t.shift()}return!0}function rm(e,t,l){si(e)&&l.delete(t)}function u0(){Lr=!1,zl!==null&&si(zl)&&(zl=null),Nl!==null&&si(Nl)&&(Nl=null),Ol!==null&&si(Ol)&&(Ol=null),Gn.forEach(rm),Yn.forEach(rm)}function fi(e,t){e.blockedOn===t&&(e.blockedOn=null,Lr||(Lr=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,u0)))}var di=null;function om(e){di!==e&&(di=e,i.unstable_scheduleCallback(i.unstable_NormalPriority,function(){di===e&&(di=null);for(var t=0;t<e.length;t+=3){var l=e[t],a=e[t+1],n=e[t+2];if(typeof a!="function"){if(qr(a||l)===null)continue;break}var u=aa(l);u!==null&&(e.splice(t,3),t-=3,qc(u,{pending:!0,data:n,method:l.method,action:a},a,n))}}))}function Xn(e){function t(y){return fi(y,e)}zl!==null&&fi(zl,e),Nl!==null&&fi(Nl,e),Ol!==null&&fi(Ol,e),Gn.forEach(t),Yn.forEach(t);for(var l=0;l<Cl.length;l++){var a=Cl[l];a.blockedOn===e&&(a.blockedOn=null)}for(;0<Cl.length&&(l=Cl[0],l.blockedOn===null);)cm(l),l.blockedOn===null&&Cl.shift();if(l=(e.ownerDocument||e).$$reactFormReplay,l!=null)for(a=0;a<l.length;a+=3){var n=l[a],u=l[a+1],o=n[tt]||null;if(typeof u=="function")o||om(l);else if(o){var d=null;if(u&&u.hasAttribute("formAction")){if(n=u,o=u[tt]||null)d=o.formAction;else if(qr(n)!==null)continue}else d=o.action;typeof d=="function"?l[a+1]=d:(l.splice(a,3),a-=3),om(l)}}}function Gr(e){this._internalRoot=e}mi.prototype.render=Gr.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(r(409));var l=t.current,a=ht();lm(l,a,e,t,null,null)},mi.prototype.unmount=Gr.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;lm(e.current,2,null,e,null,null),Ju(),t[ta]=null}};function mi(e){this._internalRoot=e}mi.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ro();e={blockedOn:null,target:e,priority:t};for(var l=0;l<Cl.length&&t!==0&&t<Cl[l].priority;l++);Cl.splice(l,0,e),l===0&&cm(e)}};var sm=c.version;if(sm!=="19.1.0")throw Error(r(527,sm,"19.1.0"));X.findDOMNode=function(e){var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(r(188)):(e=Object.keys(e).join(","),Error(r(268,e)));return e=v(t),e=e!==null?h(e):null,e=e===null?null:e.stateNode,e};var i0={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:O,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var hi=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!hi.isDisabled&&hi.supportsFiber)try{Za=hi.inject(i0),ct=hi}catch{}}return Qn.createRoot=function(e,t){if(!f(e))throw Error(r(299));var l=!1,a="",n=Mf,u=_f,o=zf,d=null;return t!=null&&(t.unstable_strictMode===!0&&(l=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(n=t.onUncaughtError),t.onCaughtError!==void 0&&(u=t.onCaughtError),t.onRecoverableError!==void 0&&(o=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(d=t.unstable_transitionCallbacks)),t=em(e,1,!1,null,null,l,a,n,u,o,d,null),e[ta]=t.current,Er(e),new Gr(t)},Qn.hydrateRoot=function(e,t,l){if(!f(e))throw Error(r(299));var a=!1,n="",u=Mf,o=_f,d=zf,y=null,M=null;return l!=null&&(l.unstable_strictMode===!0&&(a=!0),l.identifierPrefix!==void 0&&(n=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(o=l.onCaughtError),l.onRecoverableError!==void 0&&(d=l.onRecoverableError),l.unstable_transitionCallbacks!==void 0&&(y=l.unstable_transitionCallbacks),l.formState!==void 0&&(M=l.formState)),t=em(e,1,!0,t,l??null,a,n,u,o,d,y,M),t.context=tm(null),l=t.current,a=ht(),a=Ci(a),n=hl(a),n.callback=null,vl(l,n,a),l=a,t.current.lanes=l,Ja(t,l),Ht(t),e[ta]=t.current,Er(e),new mi(t)},Qn.version="19.1.0",Qn}var Sm;function g0(){if(Sm)return Xr.exports;Sm=1;function i(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(i)}catch(c){console.error(c)}}return i(),Xr.exports=y0(),Xr.exports}var p0=g0(),Zn={},xm;function b0(){if(xm)return Zn;xm=1,Object.defineProperty(Zn,"__esModule",{value:!0}),Zn.parse=g,Zn.serialize=h;const i=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,c=/^[\u0021-\u003A\u003C-\u007E]*$/,s=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,r=/^[\u0020-\u003A\u003D-\u007E]*$/,f=Object.prototype.toString,m=(()=>{const R=function(){};return R.prototype=Object.create(null),R})();function g(R,Y){const C=new m,B=R.length;if(B<2)return C;const q=(Y==null?void 0:Y.decode)||S;let U=0;do{const P=R.indexOf("=",U);if(P===-1)break;const Q=R.indexOf(";",U),ee=Q===-1?B:Q;if(P>ee){U=R.lastIndexOf(";",P-1)+1;continue}const F=x(R,U,P),me=v(R,P,F),ve=R.slice(F,me);if(C[ve]===void 0){let k=x(R,P+1,ee),de=v(R,ee,k);const Ue=q(R.slice(k,de));C[ve]=Ue}U=ee+1}while(U<B);return C}function x(R,Y,C){do{const B=R.charCodeAt(Y);if(B!==32&&B!==9)return Y}while(++Y<C);return C}function v(R,Y,C){for(;Y>C;){const B=R.charCodeAt(--Y);if(B!==32&&B!==9)return Y+1}return C}function h(R,Y,C){const B=(C==null?void 0:C.encode)||encodeURIComponent;if(!i.test(R))throw new TypeError(`argument name is invalid: ${R}`);const q=B(Y);if(!c.test(q))throw new TypeError(`argument val is invalid: ${Y}`);let U=R+"="+q;if(!C)return U;if(C.maxAge!==void 0){if(!Number.isInteger(C.maxAge))throw new TypeError(`option maxAge is invalid: ${C.maxAge}`);U+="; Max-Age="+C.maxAge}if(C.domain){if(!s.test(C.domain))throw new TypeError(`option domain is invalid: ${C.domain}`);U+="; Domain="+C.domain}if(C.path){if(!r.test(C.path))throw new TypeError(`option path is invalid: ${C.path}`);U+="; Path="+C.path}if(C.expires){if(!N(C.expires)||!Number.isFinite(C.expires.valueOf()))throw new TypeError(`option expires is invalid: ${C.expires}`);U+="; Expires="+C.expires.toUTCString()}if(C.httpOnly&&(U+="; HttpOnly"),C.secure&&(U+="; Secure"),C.partitioned&&(U+="; Partitioned"),C.priority)switch(typeof C.priority=="string"?C.priority.toLowerCase():void 0){case"low":U+="; Priority=Low";break;case"medium":U+="; Priority=Medium";break;case"high":U+="; Priority=High";break;default:throw new TypeError(`option priority is invalid: ${C.priority}`)}if(C.sameSite)switch(typeof C.sameSite=="string"?C.sameSite.toLowerCase():C.sameSite){case!0:case"strict":U+="; SameSite=Strict";break;case"lax":U+="; SameSite=Lax";break;case"none":U+="; SameSite=None";break;default:throw new TypeError(`option sameSite is invalid: ${C.sameSite}`)}return U}function S(R){if(R.indexOf("%")===-1)return R;try{return decodeURIComponent(R)}catch{return R}}function N(R){return f.call(R)==="[object Date]"}return Zn}b0();var Em="popstate";function S0(i={}){function c(r,f){let{pathname:m,search:g,hash:x}=r.location;return Pr("",{pathname:m,search:g,hash:x},f.state&&f.state.usr||null,f.state&&f.state.key||"default")}function s(r,f){return typeof f=="string"?f:$n(f)}return E0(c,s,null,i)}function Xe(i,c){if(i===!1||i===null||typeof i>"u")throw new Error(c)}function Bt(i,c){if(!i){typeof console<"u"&&console.warn(c);try{throw new Error(c)}catch{}}}function x0(){return Math.random().toString(36).substring(2,10)}function Tm(i,c){return{usr:i.state,key:i.key,idx:c}}function Pr(i,c,s=null,r){return{pathname:typeof i=="string"?i:i.pathname,search:"",hash:"",...typeof c=="string"?Fn(c):c,state:s,key:c&&c.key||r||x0()}}function $n({pathname:i="/",search:c="",hash:s=""}){return c&&c!=="?"&&(i+=c.charAt(0)==="?"?c:"?"+c),s&&s!=="#"&&(i+=s.charAt(0)==="#"?s:"#"+s),i}function Fn(i){let c={};if(i){let s=i.indexOf("#");s>=0&&(c.hash=i.substring(s),i=i.substring(0,s));let r=i.indexOf("?");r>=0&&(c.search=i.substring(r),i=i.substring(0,r)),i&&(c.pathname=i)}return c}function E0(i,c,s,r={}){let{window:f=document.defaultView,v5Compat:m=!1}=r,g=f.history,x="POP",v=null,h=S();h==null&&(h=0,g.replaceState({...g.state,idx:h},""));function S(){return(g.state||{idx:null}).idx}function N(){x="POP";let q=S(),U=q==null?null:q-h;h=q,v&&v({action:x,location:B.location,delta:U})}function R(q,U){x="PUSH";let P=Pr(B.location,q,U);h=S()+1;let Q=Tm(P,h),ee=B.createHref(P);try{g.pushState(Q,"",ee)}catch(F){if(F instanceof DOMException&&F.name==="DataCloneError")throw F;f.location.assign(ee)}m&&v&&v({action:x,location:B.location,delta:1})}function Y(q,U){x="REPLACE";let P=Pr(B.location,q,U);h=S();let Q=Tm(P,h),ee=B.createHref(P);g.replaceState(Q,"",ee),m&&v&&v({action:x,location:B.location,delta:0})}function C(q){return T0(q)}let B={get action(){return x},get location(){return i(f,g)},listen(q){if(v)throw new Error("A history only accepts one active listener");return f.addEventListener(Em,N),v=q,()=>{f.removeEventListener(Em,N),v=null}},createHref(q){return c(f,q)},createURL:C,encodeLocation(q){let U=C(q);return{pathname:U.pathname,search:U.search,hash:U.hash}},push:R,replace:Y,go(q){return g.go(q)}};return B}function T0(i,c=!1){let s="http://localhost";typeof window<"u"&&(s=window.location.origin!=="null"?window.location.origin:window.location.href),Xe(s,"No window.location.(origin|href) available to create URL");let r=typeof i=="string"?i:$n(i);return r=r.replace(/ $/,"%20"),!c&&r.startsWith("//")&&(r=s+r),new URL(r,s)}function Ym(i,c,s="/"){return A0(i,c,s,!1)}function A0(i,c,s,r){let f=typeof c=="string"?Fn(c):c,m=nl(f.pathname||"/",s);if(m==null)return null;let g=Vm(i);R0(g);let x=null;for(let v=0;x==null&&v<g.length;++v){let h=H0(m);x=U0(g[v],h,r)}return x}function Vm(i,c=[],s=[],r=""){let f=(m,g,x)=>{let v={relativePath:x===void 0?m.path||"":x,caseSensitive:m.caseSensitive===!0,childrenIndex:g,route:m};v.relativePath.startsWith("/")&&(Xe(v.relativePath.startsWith(r),`Absolute route path "${v.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),v.relativePath=v.relativePath.slice(r.length));let h=ll([r,v.relativePath]),S=s.concat(v);m.children&&m.children.length>0&&(Xe(m.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${h}".`),Vm(m.children,c,S,h)),!(m.path==null&&!m.index)&&c.push({path:h,score:w0(h,m.index),routesMeta:S})};return i.forEach((m,g)=>{var x;if(m.path===""||!((x=m.path)!=null&&x.includes("?")))f(m,g);else for(let v of Xm(m.path))f(m,g,v)}),c}function Xm(i){let c=i.split("/");if(c.length===0)return[];let[s,...r]=c,f=s.endsWith("?"),m=s.replace(/\?$/,"");if(r.length===0)return f?[m,""]:[m];let g=Xm(r.join("/")),x=[];return x.push(...g.map(v=>v===""?m:[m,v].join("/"))),f&&x.push(...g),x.map(v=>i.startsWith("/")&&v===""?"/":v)}function R0(i){i.sort((c,s)=>c.score!==s.score?s.score-c.score:D0(c.routesMeta.map(r=>r.childrenIndex),s.routesMeta.map(r=>r.childrenIndex)))}var M0=/^:[\w-]+$/,_0=3,z0=2,N0=1,O0=10,C0=-2,Am=i=>i==="*";function w0(i,c){let s=i.split("/"),r=s.length;return s.some(Am)&&(r+=C0),c&&(r+=z0),s.filter(f=>!Am(f)).reduce((f,m)=>f+(M0.test(m)?_0:m===""?N0:O0),r)}function D0(i,c){return i.length===c.length&&i.slice(0,-1).every((r,f)=>r===c[f])?i[i.length-1]-c[c.length-1]:0}function U0(i,c,s=!1){let{routesMeta:r}=i,f={},m="/",g=[];for(let x=0;x<r.length;++x){let v=r[x],h=x===r.length-1,S=m==="/"?c:c.slice(m.length)||"/",N=xi({path:v.relativePath,caseSensitive:v.caseSensitive,end:h},S),R=v.route;if(!N&&h&&s&&!r[r.length-1].route.index&&(N=xi({path:v.relativePath,caseSensitive:v.caseSensitive,end:!1},S)),!N)return null;Object.assign(f,N.params),g.push({params:f,pathname:ll([m,N.pathname]),pathnameBase:G0(ll([m,N.pathnameBase])),route:R}),N.pathnameBase!=="/"&&(m=ll([m,N.pathnameBase]))}return g}function xi(i,c){typeof i=="string"&&(i={path:i,caseSensitive:!1,end:!0});let[s,r]=j0(i.path,i.caseSensitive,i.end),f=c.match(s);if(!f)return null;let m=f[0],g=m.replace(/(.)\/+$/,"$1"),x=f.slice(1);return{params:r.reduce((h,{paramName:S,isOptional:N},R)=>{if(S==="*"){let C=x[R]||"";g=m.slice(0,m.length-C.length).replace(/(.)\/+$/,"$1")}const Y=x[R];return N&&!Y?h[S]=void 0:h[S]=(Y||"").replace(/%2F/g,"/"),h},{}),pathname:m,pathnameBase:g,pattern:i}}function j0(i,c=!1,s=!0){Bt(i==="*"||!i.endsWith("*")||i.endsWith("/*"),`Route path "${i}" will be treated as if it were "${i.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${i.replace(/\*$/,"/*")}".`);let r=[],f="^"+i.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(g,x,v)=>(r.push({paramName:x,isOptional:v!=null}),v?"/?([^\\/]+)?":"/([^\\/]+)"));return i.endsWith("*")?(r.push({paramName:"*"}),f+=i==="*"||i==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):s?f+="\\/*$":i!==""&&i!=="/"&&(f+="(?:(?=\\/|$))"),[new RegExp(f,c?void 0:"i"),r]}function H0(i){try{return i.split("/").map(c=>decodeURIComponent(c).replace(/\//g,"%2F")).join("/")}catch(c){return Bt(!1,`The URL path "${i}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${c}).`),i}}function nl(i,c){if(c==="/")return i;if(!i.toLowerCase().startsWith(c.toLowerCase()))return null;let s=c.endsWith("/")?c.length-1:c.length,r=i.charAt(s);return r&&r!=="/"?null:i.slice(s)||"/"}function B0(i,c="/"){let{pathname:s,search:r="",hash:f=""}=typeof i=="string"?Fn(i):i;return{pathname:s?s.startsWith("/")?s:q0(s,c):c,search:Y0(r),hash:V0(f)}}function q0(i,c){let s=c.replace(/\/+$/,"").split("/");return i.split("/").forEach(f=>{f===".."?s.length>1&&s.pop():f!=="."&&s.push(f)}),s.length>1?s.join("/"):"/"}function Kr(i,c,s,r){return`Cannot include a '${i}' character in a manually specified \`to.${c}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${s}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function L0(i){return i.filter((c,s)=>s===0||c.route.path&&c.route.path.length>0)}function km(i){let c=L0(i);return c.map((s,r)=>r===c.length-1?s.pathname:s.pathnameBase)}function Qm(i,c,s,r=!1){let f;typeof i=="string"?f=Fn(i):(f={...i},Xe(!f.pathname||!f.pathname.includes("?"),Kr("?","pathname","search",f)),Xe(!f.pathname||!f.pathname.includes("#"),Kr("#","pathname","hash",f)),Xe(!f.search||!f.search.includes("#"),Kr("#","search","hash",f)));let m=i===""||f.pathname==="",g=m?"/":f.pathname,x;if(g==null)x=s;else{let N=c.length-1;if(!r&&g.startsWith("..")){let R=g.split("/");for(;R[0]==="..";)R.shift(),N-=1;f.pathname=R.join("/")}x=N>=0?c[N]:"/"}let v=B0(f,x),h=g&&g!=="/"&&g.endsWith("/"),S=(m||g===".")&&s.endsWith("/");return!v.pathname.endsWith("/")&&(h||S)&&(v.pathname+="/"),v}var ll=i=>i.join("/").replace(/\/\/+/g,"/"),G0=i=>i.replace(/\/+$/,"").replace(/^\/*/,"/"),Y0=i=>!i||i==="?"?"":i.startsWith("?")?i:"?"+i,V0=i=>!i||i==="#"?"":i.startsWith("#")?i:"#"+i;function X0(i){return i!=null&&typeof i.status=="number"&&typeof i.statusText=="string"&&typeof i.internal=="boolean"&&"data"in i}var Zm=["POST","PUT","PATCH","DELETE"];new Set(Zm);var k0=["GET",...Zm];new Set(k0);var Va=E.createContext(null);Va.displayName="DataRouter";var Ai=E.createContext(null);Ai.displayName="DataRouterState";var Km=E.createContext({isTransitioning:!1});Km.displayName="ViewTransition";var Q0=E.createContext(new Map);Q0.displayName="Fetchers";var Z0=E.createContext(null);Z0.displayName="Await";var qt=E.createContext(null);qt.displayName="Navigation";var Ri=E.createContext(null);Ri.displayName="Location";var ul=E.createContext({outlet:null,matches:[],isDataRoute:!1});ul.displayName="Route";var uo=E.createContext(null);uo.displayName="RouteError";function K0(i,{relative:c}={}){Xe(Pn(),"useHref() may be used only in the context of a <Router> component.");let{basename:s,navigator:r}=E.useContext(qt),{hash:f,pathname:m,search:g}=In(i,{relative:c}),x=m;return s!=="/"&&(x=m==="/"?s:ll([s,m])),r.createHref({pathname:x,search:g,hash:f})}function Pn(){return E.useContext(Ri)!=null}function ea(){return Xe(Pn(),"useLocation() may be used only in the context of a <Router> component."),E.useContext(Ri).location}var Jm="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function $m(i){E.useContext(qt).static||E.useLayoutEffect(i)}function J0(){let{isDataRoute:i}=E.useContext(ul);return i?cg():$0()}function $0(){Xe(Pn(),"useNavigate() may be used only in the context of a <Router> component.");let i=E.useContext(Va),{basename:c,navigator:s}=E.useContext(qt),{matches:r}=E.useContext(ul),{pathname:f}=ea(),m=JSON.stringify(km(r)),g=E.useRef(!1);return $m(()=>{g.current=!0}),E.useCallback((v,h={})=>{if(Bt(g.current,Jm),!g.current)return;if(typeof v=="number"){s.go(v);return}let S=Qm(v,JSON.parse(m),f,h.relative==="path");i==null&&c!=="/"&&(S.pathname=S.pathname==="/"?c:ll([c,S.pathname])),(h.replace?s.replace:s.push)(S,h.state,h)},[c,s,m,f,i])}E.createContext(null);function In(i,{relative:c}={}){let{matches:s}=E.useContext(ul),{pathname:r}=ea(),f=JSON.stringify(km(s));return E.useMemo(()=>Qm(i,JSON.parse(f),r,c==="path"),[i,f,r,c])}function W0(i,c,s,r){Xe(Pn(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:f}=E.useContext(qt),{matches:m}=E.useContext(ul),g=m[m.length-1],x=g?g.params:{},v=g?g.pathname:"/",h=g?g.pathnameBase:"/",S=g&&g.route;{let U=S&&S.path||"";Wm(v,!S||U.endsWith("*")||U.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${v}" (under <Route path="${U}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${U}"> to <Route path="${U==="/"?"*":`${U}/*`}">.`)}let N=ea(),R;R=N;let Y=R.pathname||"/",C=Y;if(h!=="/"){let U=h.replace(/^\//,"").split("/");C="/"+Y.replace(/^\//,"").split("/").slice(U.length).join("/")}let B=Ym(i,{pathname:C});return Bt(S||B!=null,`No routes matched location "${R.pathname}${R.search}${R.hash}" `),Bt(B==null||B[B.length-1].route.element!==void 0||B[B.length-1].route.Component!==void 0||B[B.length-1].route.lazy!==void 0,`Matched leaf route at location "${R.pathname}${R.search}${R.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`),tg(B&&B.map(U=>Object.assign({},U,{params:Object.assign({},x,U.params),pathname:ll([h,f.encodeLocation?f.encodeLocation(U.pathname).pathname:U.pathname]),pathnameBase:U.pathnameBase==="/"?h:ll([h,f.encodeLocation?f.encodeLocation(U.pathnameBase).pathname:U.pathnameBase])})),m,s,r)}function F0(){let i=ig(),c=X0(i)?`${i.status} ${i.statusText}`:i instanceof Error?i.message:JSON.stringify(i),s=i instanceof Error?i.stack:null,r="rgba(200,200,200, 0.5)",f={padding:"0.5rem",backgroundColor:r},m={padding:"2px 4px",backgroundColor:r},g=null;return console.error("Error handled by React Router default ErrorBoundary:",i),g=E.createElement(E.Fragment,null,E.createElement("p",null,"💿 Hey developer 👋"),E.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",E.createElement("code",{style:m},"ErrorBoundary")," or"," ",E.createElement("code",{style:m},"errorElement")," prop on your route.")),E.createElement(E.Fragment,null,E.createElement("h2",null,"Unexpected Application Error!"),E.createElement("h3",{style:{fontStyle:"italic"}},c),s?E.createElement("pre",{style:f},s):null,g)}var P0=E.createElement(F0,null),I0=class extends E.Component{constructor(i){super(i),this.state={location:i.location,revalidation:i.revalidation,error:i.error}}static getDerivedStateFromError(i){return{error:i}}static getDerivedStateFromProps(i,c){return c.location!==i.location||c.revalidation!=="idle"&&i.revalidation==="idle"?{error:i.error,location:i.location,revalidation:i.revalidation}:{error:i.error!==void 0?i.error:c.error,location:c.location,revalidation:i.revalidation||c.revalidation}}componentDidCatch(i,c){console.error("React Router caught the following error during render",i,c)}render(){return this.state.error!==void 0?E.createElement(ul.Provider,{value:this.props.routeContext},E.createElement(uo.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function eg({routeContext:i,match:c,children:s}){let r=E.useContext(Va);return r&&r.static&&r.staticContext&&(c.route.errorElement||c.route.ErrorBoundary)&&(r.staticContext._deepestRenderedBoundaryId=c.route.id),E.createElement(ul.Provider,{value:i},s)}function tg(i,c=[],s=null,r=null){if(i==null){if(!s)return null;if(s.errors)i=s.matches;else if(c.length===0&&!s.initialized&&s.matches.length>0)i=s.matches;else return null}let f=i,m=s==null?void 0:s.errors;if(m!=null){let v=f.findIndex(h=>h.route.id&&(m==null?void 0:m[h.route.id])!==void 0);Xe(v>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(m).join(",")}`),f=f.slice(0,Math.min(f.length,v+1))}let g=!1,x=-1;if(s)for(let v=0;v<f.length;v++){let h=f[v];if((h.route.HydrateFallback||h.route.hydrateFallbackElement)&&(x=v),h.route.id){let{loaderData:S,errors:N}=s,R=h.route.loader&&!S.hasOwnProperty(h.route.id)&&(!N||N[h.route.id]===void 0);if(h.route.lazy||R){g=!0,x>=0?f=f.slice(0,x+1):f=[f[0]];break}}}return f.reduceRight((v,h,S)=>{let N,R=!1,Y=null,C=null;s&&(N=m&&h.route.id?m[h.route.id]:void 0,Y=h.route.errorElement||P0,g&&(x<0&&S===0?(Wm("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),R=!0,C=null):x===S&&(R=!0,C=h.route.hydrateFallbackElement||null)));let B=c.concat(f.slice(0,S+1)),q=()=>{let U;return N?U=Y:R?U=C:h.route.Component?U=E.createElement(h.route.Component,null):h.route.element?U=h.route.element:U=v,E.createElement(eg,{match:h,routeContext:{outlet:v,matches:B,isDataRoute:s!=null},children:U})};return s&&(h.route.ErrorBoundary||h.route.errorElement||S===0)?E.createElement(I0,{location:s.location,revalidation:s.revalidation,component:Y,error:N,children:q(),routeContext:{outlet:null,matches:B,isDataRoute:!0}}):q()},null)}function io(i){return`${i} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function lg(i){let c=E.useContext(Va);return Xe(c,io(i)),c}function ag(i){let c=E.useContext(Ai);return Xe(c,io(i)),c}function ng(i){let c=E.useContext(ul);return Xe(c,io(i)),c}function co(i){let c=ng(i),s=c.matches[c.matches.length-1];return Xe(s.route.id,`${i} can only be used on routes that contain a unique "id"`),s.route.id}function ug(){return co("useRouteId")}function ig(){var r;let i=E.useContext(uo),c=ag("useRouteError"),s=co("useRouteError");return i!==void 0?i:(r=c.errors)==null?void 0:r[s]}function cg(){let{router:i}=lg("useNavigate"),c=co("useNavigate"),s=E.useRef(!1);return $m(()=>{s.current=!0}),E.useCallback(async(f,m={})=>{Bt(s.current,Jm),s.current&&(typeof f=="number"?i.navigate(f):await i.navigate(f,{fromRouteId:c,...m}))},[i,c])}var Rm={};function Wm(i,c,s){!c&&!Rm[i]&&(Rm[i]=!0,Bt(!1,s))}E.memo(rg);function rg({routes:i,future:c,state:s}){return W0(i,void 0,s,c)}function og({basename:i="/",children:c=null,location:s,navigationType:r="POP",navigator:f,static:m=!1}){Xe(!Pn(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let g=i.replace(/^\/*/,"/"),x=E.useMemo(()=>({basename:g,navigator:f,static:m,future:{}}),[g,f,m]);typeof s=="string"&&(s=Fn(s));let{pathname:v="/",search:h="",hash:S="",state:N=null,key:R="default"}=s,Y=E.useMemo(()=>{let C=nl(v,g);return C==null?null:{location:{pathname:C,search:h,hash:S,state:N,key:R},navigationType:r}},[g,v,h,S,N,R,r]);return Bt(Y!=null,`<Router basename="${g}"> is not able to match the URL "${v}${h}${S}" because it does not start with the basename, so the <Router> won't render anything.`),Y==null?null:E.createElement(qt.Provider,{value:x},E.createElement(Ri.Provider,{children:c,value:Y}))}var bi="get",Si="application/x-www-form-urlencoded";function Mi(i){return i!=null&&typeof i.tagName=="string"}function sg(i){return Mi(i)&&i.tagName.toLowerCase()==="button"}function fg(i){return Mi(i)&&i.tagName.toLowerCase()==="form"}function dg(i){return Mi(i)&&i.tagName.toLowerCase()==="input"}function mg(i){return!!(i.metaKey||i.altKey||i.ctrlKey||i.shiftKey)}function hg(i,c){return i.button===0&&(!c||c==="_self")&&!mg(i)}var vi=null;function vg(){if(vi===null)try{new FormData(document.createElement("form"),0),vi=!1}catch{vi=!0}return vi}var yg=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Jr(i){return i!=null&&!yg.has(i)?(Bt(!1,`"${i}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Si}"`),null):i}function gg(i,c){let s,r,f,m,g;if(fg(i)){let x=i.getAttribute("action");r=x?nl(x,c):null,s=i.getAttribute("method")||bi,f=Jr(i.getAttribute("enctype"))||Si,m=new FormData(i)}else if(sg(i)||dg(i)&&(i.type==="submit"||i.type==="image")){let x=i.form;if(x==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let v=i.getAttribute("formaction")||x.getAttribute("action");if(r=v?nl(v,c):null,s=i.getAttribute("formmethod")||x.getAttribute("method")||bi,f=Jr(i.getAttribute("formenctype"))||Jr(x.getAttribute("enctype"))||Si,m=new FormData(x,i),!vg()){let{name:h,type:S,value:N}=i;if(S==="image"){let R=h?`${h}.`:"";m.append(`${R}x`,"0"),m.append(`${R}y`,"0")}else h&&m.append(h,N)}}else{if(Mi(i))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');s=bi,r=null,f=Si,g=i}return m&&f==="text/plain"&&(g=m,m=void 0),{action:r,method:s.toLowerCase(),encType:f,formData:m,body:g}}function ro(i,c){if(i===!1||i===null||typeof i>"u")throw new Error(c)}async function pg(i,c){if(i.id in c)return c[i.id];try{let s=await import(i.module);return c[i.id]=s,s}catch(s){return console.error(`Error loading route module \`${i.module}\`, reloading page...`),console.error(s),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function bg(i){return i==null?!1:i.href==null?i.rel==="preload"&&typeof i.imageSrcSet=="string"&&typeof i.imageSizes=="string":typeof i.rel=="string"&&typeof i.href=="string"}async function Sg(i,c,s){let r=await Promise.all(i.map(async f=>{let m=c.routes[f.route.id];if(m){let g=await pg(m,s);return g.links?g.links():[]}return[]}));return Ag(r.flat(1).filter(bg).filter(f=>f.rel==="stylesheet"||f.rel==="preload").map(f=>f.rel==="stylesheet"?{...f,rel:"prefetch",as:"style"}:{...f,rel:"prefetch"}))}function Mm(i,c,s,r,f,m){let g=(v,h)=>s[h]?v.route.id!==s[h].route.id:!0,x=(v,h)=>{var S;return s[h].pathname!==v.pathname||((S=s[h].route.path)==null?void 0:S.endsWith("*"))&&s[h].params["*"]!==v.params["*"]};return m==="assets"?c.filter((v,h)=>g(v,h)||x(v,h)):m==="data"?c.filter((v,h)=>{var N;let S=r.routes[v.route.id];if(!S||!S.hasLoader)return!1;if(g(v,h)||x(v,h))return!0;if(v.route.shouldRevalidate){let R=v.route.shouldRevalidate({currentUrl:new URL(f.pathname+f.search+f.hash,window.origin),currentParams:((N=s[0])==null?void 0:N.params)||{},nextUrl:new URL(i,window.origin),nextParams:v.params,defaultShouldRevalidate:!0});if(typeof R=="boolean")return R}return!0}):[]}function xg(i,c,{includeHydrateFallback:s}={}){return Eg(i.map(r=>{let f=c.routes[r.route.id];if(!f)return[];let m=[f.module];return f.clientActionModule&&(m=m.concat(f.clientActionModule)),f.clientLoaderModule&&(m=m.concat(f.clientLoaderModule)),s&&f.hydrateFallbackModule&&(m=m.concat(f.hydrateFallbackModule)),f.imports&&(m=m.concat(f.imports)),m}).flat(1))}function Eg(i){return[...new Set(i)]}function Tg(i){let c={},s=Object.keys(i).sort();for(let r of s)c[r]=i[r];return c}function Ag(i,c){let s=new Set;return new Set(c),i.reduce((r,f)=>{let m=JSON.stringify(Tg(f));return s.has(m)||(s.add(m),r.push({key:m,link:f})),r},[])}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var Rg=new Set([100,101,204,205]);function Mg(i,c){let s=typeof i=="string"?new URL(i,typeof window>"u"?"server://singlefetch/":window.location.origin):i;return s.pathname==="/"?s.pathname="_root.data":c&&nl(s.pathname,c)==="/"?s.pathname=`${c.replace(/\/$/,"")}/_root.data`:s.pathname=`${s.pathname.replace(/\/$/,"")}.data`,s}function Fm(){let i=E.useContext(Va);return ro(i,"You must render this element inside a <DataRouterContext.Provider> element"),i}function _g(){let i=E.useContext(Ai);return ro(i,"You must render this element inside a <DataRouterStateContext.Provider> element"),i}var oo=E.createContext(void 0);oo.displayName="FrameworkContext";function Pm(){let i=E.useContext(oo);return ro(i,"You must render this element inside a <HydratedRouter> element"),i}function zg(i,c){let s=E.useContext(oo),[r,f]=E.useState(!1),[m,g]=E.useState(!1),{onFocus:x,onBlur:v,onMouseEnter:h,onMouseLeave:S,onTouchStart:N}=c,R=E.useRef(null);E.useEffect(()=>{if(i==="render"&&g(!0),i==="viewport"){let B=U=>{U.forEach(P=>{g(P.isIntersecting)})},q=new IntersectionObserver(B,{threshold:.5});return R.current&&q.observe(R.current),()=>{q.disconnect()}}},[i]),E.useEffect(()=>{if(r){let B=setTimeout(()=>{g(!0)},100);return()=>{clearTimeout(B)}}},[r]);let Y=()=>{f(!0)},C=()=>{f(!1),g(!1)};return s?i!=="intent"?[m,R,{}]:[m,R,{onFocus:Kn(x,Y),onBlur:Kn(v,C),onMouseEnter:Kn(h,Y),onMouseLeave:Kn(S,C),onTouchStart:Kn(N,Y)}]:[!1,R,{}]}function Kn(i,c){return s=>{i&&i(s),s.defaultPrevented||c(s)}}function Ng({page:i,...c}){let{router:s}=Fm(),r=E.useMemo(()=>Ym(s.routes,i,s.basename),[s.routes,i,s.basename]);return r?E.createElement(Cg,{page:i,matches:r,...c}):null}function Og(i){let{manifest:c,routeModules:s}=Pm(),[r,f]=E.useState([]);return E.useEffect(()=>{let m=!1;return Sg(i,c,s).then(g=>{m||f(g)}),()=>{m=!0}},[i,c,s]),r}function Cg({page:i,matches:c,...s}){let r=ea(),{manifest:f,routeModules:m}=Pm(),{basename:g}=Fm(),{loaderData:x,matches:v}=_g(),h=E.useMemo(()=>Mm(i,c,v,f,r,"data"),[i,c,v,f,r]),S=E.useMemo(()=>Mm(i,c,v,f,r,"assets"),[i,c,v,f,r]),N=E.useMemo(()=>{if(i===r.pathname+r.search+r.hash)return[];let C=new Set,B=!1;if(c.forEach(U=>{var Q;let P=f.routes[U.route.id];!P||!P.hasLoader||(!h.some(ee=>ee.route.id===U.route.id)&&U.route.id in x&&((Q=m[U.route.id])!=null&&Q.shouldRevalidate)||P.hasClientLoader?B=!0:C.add(U.route.id))}),C.size===0)return[];let q=Mg(i,g);return B&&C.size>0&&q.searchParams.set("_routes",c.filter(U=>C.has(U.route.id)).map(U=>U.route.id).join(",")),[q.pathname+q.search]},[g,x,r,f,h,c,i,m]),R=E.useMemo(()=>xg(S,f),[S,f]),Y=Og(S);return E.createElement(E.Fragment,null,N.map(C=>E.createElement("link",{key:C,rel:"prefetch",as:"fetch",href:C,...s})),R.map(C=>E.createElement("link",{key:C,rel:"modulepreload",href:C,...s})),Y.map(({key:C,link:B})=>E.createElement("link",{key:C,...B})))}function wg(...i){return c=>{i.forEach(s=>{typeof s=="function"?s(c):s!=null&&(s.current=c)})}}var Im=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{Im&&(window.__reactRouterVersion="7.6.1")}catch{}function Dg({basename:i,children:c,window:s}){let r=E.useRef();r.current==null&&(r.current=S0({window:s,v5Compat:!0}));let f=r.current,[m,g]=E.useState({action:f.action,location:f.location}),x=E.useCallback(v=>{E.startTransition(()=>g(v))},[g]);return E.useLayoutEffect(()=>f.listen(x),[f,x]),E.createElement(og,{basename:i,children:c,location:m.location,navigationType:m.action,navigator:f})}var eh=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,th=E.forwardRef(function({onClick:c,discover:s="render",prefetch:r="none",relative:f,reloadDocument:m,replace:g,state:x,target:v,to:h,preventScrollReset:S,viewTransition:N,...R},Y){let{basename:C}=E.useContext(qt),B=typeof h=="string"&&eh.test(h),q,U=!1;if(typeof h=="string"&&B&&(q=h,Im))try{let de=new URL(window.location.href),Ue=h.startsWith("//")?new URL(de.protocol+h):new URL(h),Le=nl(Ue.pathname,C);Ue.origin===de.origin&&Le!=null?h=Le+Ue.search+Ue.hash:U=!0}catch{Bt(!1,`<Link to="${h}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let P=K0(h,{relative:f}),[Q,ee,F]=zg(r,R),me=Bg(h,{replace:g,state:x,target:v,preventScrollReset:S,relative:f,viewTransition:N});function ve(de){c&&c(de),de.defaultPrevented||me(de)}let k=E.createElement("a",{...R,...F,href:q||P,onClick:U||m?c:ve,ref:wg(Y,ee),target:v,"data-discover":!B&&s==="render"?"true":void 0});return Q&&!B?E.createElement(E.Fragment,null,k,E.createElement(Ng,{page:P})):k});th.displayName="Link";var Ug=E.forwardRef(function({"aria-current":c="page",caseSensitive:s=!1,className:r="",end:f=!1,style:m,to:g,viewTransition:x,children:v,...h},S){let N=In(g,{relative:h.relative}),R=ea(),Y=E.useContext(Ai),{navigator:C,basename:B}=E.useContext(qt),q=Y!=null&&Vg(N)&&x===!0,U=C.encodeLocation?C.encodeLocation(N).pathname:N.pathname,P=R.pathname,Q=Y&&Y.navigation&&Y.navigation.location?Y.navigation.location.pathname:null;s||(P=P.toLowerCase(),Q=Q?Q.toLowerCase():null,U=U.toLowerCase()),Q&&B&&(Q=nl(Q,B)||Q);const ee=U!=="/"&&U.endsWith("/")?U.length-1:U.length;let F=P===U||!f&&P.startsWith(U)&&P.charAt(ee)==="/",me=Q!=null&&(Q===U||!f&&Q.startsWith(U)&&Q.charAt(U.length)==="/"),ve={isActive:F,isPending:me,isTransitioning:q},k=F?c:void 0,de;typeof r=="function"?de=r(ve):de=[r,F?"active":null,me?"pending":null,q?"transitioning":null].filter(Boolean).join(" ");let Ue=typeof m=="function"?m(ve):m;return E.createElement(th,{...h,"aria-current":k,className:de,ref:S,style:Ue,to:g,viewTransition:x},typeof v=="function"?v(ve):v)});Ug.displayName="NavLink";var jg=E.forwardRef(({discover:i="render",fetcherKey:c,navigate:s,reloadDocument:r,replace:f,state:m,method:g=bi,action:x,onSubmit:v,relative:h,preventScrollReset:S,viewTransition:N,...R},Y)=>{let C=Gg(),B=Yg(x,{relative:h}),q=g.toLowerCase()==="get"?"get":"post",U=typeof x=="string"&&eh.test(x),P=Q=>{if(v&&v(Q),Q.defaultPrevented)return;Q.preventDefault();let ee=Q.nativeEvent.submitter,F=(ee==null?void 0:ee.getAttribute("formmethod"))||g;C(ee||Q.currentTarget,{fetcherKey:c,method:F,navigate:s,replace:f,state:m,relative:h,preventScrollReset:S,viewTransition:N})};return E.createElement("form",{ref:Y,method:q,action:B,onSubmit:r?v:P,...R,"data-discover":!U&&i==="render"?"true":void 0})});jg.displayName="Form";function Hg(i){return`${i} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function lh(i){let c=E.useContext(Va);return Xe(c,Hg(i)),c}function Bg(i,{target:c,replace:s,state:r,preventScrollReset:f,relative:m,viewTransition:g}={}){let x=J0(),v=ea(),h=In(i,{relative:m});return E.useCallback(S=>{if(hg(S,c)){S.preventDefault();let N=s!==void 0?s:$n(v)===$n(h);x(i,{replace:N,state:r,preventScrollReset:f,relative:m,viewTransition:g})}},[v,x,h,s,r,c,i,f,m,g])}var qg=0,Lg=()=>`__${String(++qg)}__`;function Gg(){let{router:i}=lh("useSubmit"),{basename:c}=E.useContext(qt),s=ug();return E.useCallback(async(r,f={})=>{let{action:m,method:g,encType:x,formData:v,body:h}=gg(r,c);if(f.navigate===!1){let S=f.fetcherKey||Lg();await i.fetch(S,s,f.action||m,{preventScrollReset:f.preventScrollReset,formData:v,body:h,formMethod:f.method||g,formEncType:f.encType||x,flushSync:f.flushSync})}else await i.navigate(f.action||m,{preventScrollReset:f.preventScrollReset,formData:v,body:h,formMethod:f.method||g,formEncType:f.encType||x,replace:f.replace,state:f.state,fromRouteId:s,flushSync:f.flushSync,viewTransition:f.viewTransition})},[i,c,s])}function Yg(i,{relative:c}={}){let{basename:s}=E.useContext(qt),r=E.useContext(ul);Xe(r,"useFormAction must be used inside a RouteContext");let[f]=r.matches.slice(-1),m={...In(i||".",{relative:c})},g=ea();if(i==null){m.search=g.search;let x=new URLSearchParams(m.search),v=x.getAll("index");if(v.some(S=>S==="")){x.delete("index"),v.filter(N=>N).forEach(N=>x.append("index",N));let S=x.toString();m.search=S?`?${S}`:""}}return(!i||i===".")&&f.route.index&&(m.search=m.search?m.search.replace(/^\?/,"?index&"):"?index"),s!=="/"&&(m.pathname=m.pathname==="/"?s:ll([s,m.pathname])),$n(m)}function Vg(i,c={}){let s=E.useContext(Km);Xe(s!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=lh("useViewTransitionState"),f=In(i,{relative:c.relative});if(!s.isTransitioning)return!1;let m=nl(s.currentLocation.pathname,r)||s.currentLocation.pathname,g=nl(s.nextLocation.pathname,r)||s.nextLocation.pathname;return xi(f.pathname,g)!=null||xi(f.pathname,m)!=null}[...Rg];Gm();function _m(i,c){if(typeof i=="function")return i(c);i!=null&&(i.current=c)}function Xg(...i){return c=>{let s=!1;const r=i.map(f=>{const m=_m(f,c);return!s&&typeof m=="function"&&(s=!0),m});if(s)return()=>{for(let f=0;f<r.length;f++){const m=r[f];typeof m=="function"?m():_m(i[f],null)}}}}function Wn(...i){return E.useCallback(Xg(...i),i)}function Ei(i){const c=kg(i),s=E.forwardRef((r,f)=>{const{children:m,...g}=r,x=E.Children.toArray(m),v=x.find(Zg);if(v){const h=v.props.children,S=x.map(N=>N===v?E.Children.count(h)>1?E.Children.only(null):E.isValidElement(h)?h.props.children:null:N);return w.jsx(c,{...g,ref:f,children:E.isValidElement(h)?E.cloneElement(h,void 0,S):null})}return w.jsx(c,{...g,ref:f,children:m})});return s.displayName=`${i}.Slot`,s}var ah=Ei("Slot");function kg(i){const c=E.forwardRef((s,r)=>{const{children:f,...m}=s,g=E.isValidElement(f)?Jg(f):void 0,x=Wn(g,r);if(E.isValidElement(f)){const v=Kg(m,f.props);return f.type!==E.Fragment&&(v.ref=x),E.cloneElement(f,v)}return E.Children.count(f)>1?E.Children.only(null):null});return c.displayName=`${i}.SlotClone`,c}var Qg=Symbol("radix.slottable");function Zg(i){return E.isValidElement(i)&&typeof i.type=="function"&&"__radixId"in i.type&&i.type.__radixId===Qg}function Kg(i,c){const s={...c};for(const r in c){const f=i[r],m=c[r];/^on[A-Z]/.test(r)?f&&m?s[r]=(...x)=>{const v=m(...x);return f(...x),v}:f&&(s[r]=f):r==="style"?s[r]={...f,...m}:r==="className"&&(s[r]=[f,m].filter(Boolean).join(" "))}return{...i,...s}}function Jg(i){var r,f;let c=(r=Object.getOwnPropertyDescriptor(i.props,"ref"))==null?void 0:r.get,s=c&&"isReactWarning"in c&&c.isReactWarning;return s?i.ref:(c=(f=Object.getOwnPropertyDescriptor(i,"ref"))==null?void 0:f.get,s=c&&"isReactWarning"in c&&c.isReactWarning,s?i.props.ref:i.props.ref||i.ref)}function nh(i){var c,s,r="";if(typeof i=="string"||typeof i=="number")r+=i;else if(typeof i=="object")if(Array.isArray(i)){var f=i.length;for(c=0;c<f;c++)i[c]&&(s=nh(i[c]))&&(r&&(r+=" "),r+=s)}else for(s in i)i[s]&&(r&&(r+=" "),r+=s);return r}function uh(){for(var i,c,s=0,r="",f=arguments.length;s<f;s++)(i=arguments[s])&&(c=nh(i))&&(r&&(r+=" "),r+=c);return r}const zm=i=>typeof i=="boolean"?`${i}`:i===0?"0":i,Nm=uh,ih=(i,c)=>s=>{var r;if((c==null?void 0:c.variants)==null)return Nm(i,s==null?void 0:s.class,s==null?void 0:s.className);const{variants:f,defaultVariants:m}=c,g=Object.keys(f).map(h=>{const S=s==null?void 0:s[h],N=m==null?void 0:m[h];if(S===null)return null;const R=zm(S)||zm(N);return f[h][R]}),x=s&&Object.entries(s).reduce((h,S)=>{let[N,R]=S;return R===void 0||(h[N]=R),h},{}),v=c==null||(r=c.compoundVariants)===null||r===void 0?void 0:r.reduce((h,S)=>{let{class:N,className:R,...Y}=S;return Object.entries(Y).every(C=>{let[B,q]=C;return Array.isArray(q)?q.includes({...m,...x}[B]):{...m,...x}[B]===q})?[...h,N,R]:h},[]);return Nm(i,g,v,s==null?void 0:s.class,s==null?void 0:s.className)},so="-",$g=i=>{const c=Fg(i),{conflictingClassGroups:s,conflictingClassGroupModifiers:r}=i;return{getClassGroupId:g=>{const x=g.split(so);return x[0]===""&&x.length!==1&&x.shift(),ch(x,c)||Wg(g)},getConflictingClassGroupIds:(g,x)=>{const v=s[g]||[];return x&&r[g]?[...v,...r[g]]:v}}},ch=(i,c)=>{var g;if(i.length===0)return c.classGroupId;const s=i[0],r=c.nextPart.get(s),f=r?ch(i.slice(1),r):void 0;if(f)return f;if(c.validators.length===0)return;const m=i.join(so);return(g=c.validators.find(({validator:x})=>x(m)))==null?void 0:g.classGroupId},Om=/^\[(.+)\]$/,Wg=i=>{if(Om.test(i)){const c=Om.exec(i)[1],s=c==null?void 0:c.substring(0,c.indexOf(":"));if(s)return"arbitrary.."+s}},Fg=i=>{const{theme:c,classGroups:s}=i,r={nextPart:new Map,validators:[]};for(const f in s)Ir(s[f],r,f,c);return r},Ir=(i,c,s,r)=>{i.forEach(f=>{if(typeof f=="string"){const m=f===""?c:Cm(c,f);m.classGroupId=s;return}if(typeof f=="function"){if(Pg(f)){Ir(f(r),c,s,r);return}c.validators.push({validator:f,classGroupId:s});return}Object.entries(f).forEach(([m,g])=>{Ir(g,Cm(c,m),s,r)})})},Cm=(i,c)=>{let s=i;return c.split(so).forEach(r=>{s.nextPart.has(r)||s.nextPart.set(r,{nextPart:new Map,validators:[]}),s=s.nextPart.get(r)}),s},Pg=i=>i.isThemeGetter,Ig=i=>{if(i<1)return{get:()=>{},set:()=>{}};let c=0,s=new Map,r=new Map;const f=(m,g)=>{s.set(m,g),c++,c>i&&(c=0,r=s,s=new Map)};return{get(m){let g=s.get(m);if(g!==void 0)return g;if((g=r.get(m))!==void 0)return f(m,g),g},set(m,g){s.has(m)?s.set(m,g):f(m,g)}}},eo="!",to=":",ep=to.length,tp=i=>{const{prefix:c,experimentalParseClassName:s}=i;let r=f=>{const m=[];let g=0,x=0,v=0,h;for(let C=0;C<f.length;C++){let B=f[C];if(g===0&&x===0){if(B===to){m.push(f.slice(v,C)),v=C+ep;continue}if(B==="/"){h=C;continue}}B==="["?g++:B==="]"?g--:B==="("?x++:B===")"&&x--}const S=m.length===0?f:f.substring(v),N=lp(S),R=N!==S,Y=h&&h>v?h-v:void 0;return{modifiers:m,hasImportantModifier:R,baseClassName:N,maybePostfixModifierPosition:Y}};if(c){const f=c+to,m=r;r=g=>g.startsWith(f)?m(g.substring(f.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:g,maybePostfixModifierPosition:void 0}}if(s){const f=r;r=m=>s({className:m,parseClassName:f})}return r},lp=i=>i.endsWith(eo)?i.substring(0,i.length-1):i.startsWith(eo)?i.substring(1):i,ap=i=>{const c=Object.fromEntries(i.orderSensitiveModifiers.map(r=>[r,!0]));return r=>{if(r.length<=1)return r;const f=[];let m=[];return r.forEach(g=>{g[0]==="["||c[g]?(f.push(...m.sort(),g),m=[]):m.push(g)}),f.push(...m.sort()),f}},np=i=>({cache:Ig(i.cacheSize),parseClassName:tp(i),sortModifiers:ap(i),...$g(i)}),up=/\s+/,ip=(i,c)=>{const{parseClassName:s,getClassGroupId:r,getConflictingClassGroupIds:f,sortModifiers:m}=c,g=[],x=i.trim().split(up);let v="";for(let h=x.length-1;h>=0;h-=1){const S=x[h],{isExternal:N,modifiers:R,hasImportantModifier:Y,baseClassName:C,maybePostfixModifierPosition:B}=s(S);if(N){v=S+(v.length>0?" "+v:v);continue}let q=!!B,U=r(q?C.substring(0,B):C);if(!U){if(!q){v=S+(v.length>0?" "+v:v);continue}if(U=r(C),!U){v=S+(v.length>0?" "+v:v);continue}q=!1}const P=m(R).join(":"),Q=Y?P+eo:P,ee=Q+U;if(g.includes(ee))continue;g.push(ee);const F=f(U,q);for(let me=0;me<F.length;++me){const ve=F[me];g.push(Q+ve)}v=S+(v.length>0?" "+v:v)}return v};function cp(){let i=0,c,s,r="";for(;i<arguments.length;)(c=arguments[i++])&&(s=rh(c))&&(r&&(r+=" "),r+=s);return r}const rh=i=>{if(typeof i=="string")return i;let c,s="";for(let r=0;r<i.length;r++)i[r]&&(c=rh(i[r]))&&(s&&(s+=" "),s+=c);return s};function rp(i,...c){let s,r,f,m=g;function g(v){const h=c.reduce((S,N)=>N(S),i());return s=np(h),r=s.cache.get,f=s.cache.set,m=x,x(v)}function x(v){const h=r(v);if(h)return h;const S=ip(v,s);return f(v,S),S}return function(){return m(cp.apply(null,arguments))}}const Ve=i=>{const c=s=>s[i]||[];return c.isThemeGetter=!0,c},oh=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,sh=/^\((?:(\w[\w-]*):)?(.+)\)$/i,op=/^\d+\/\d+$/,sp=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,fp=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,dp=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,mp=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,hp=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,Ga=i=>op.test(i),ce=i=>!!i&&!Number.isNaN(Number(i)),Dl=i=>!!i&&Number.isInteger(Number(i)),$r=i=>i.endsWith("%")&&ce(i.slice(0,-1)),tl=i=>sp.test(i),vp=()=>!0,yp=i=>fp.test(i)&&!dp.test(i),fh=()=>!1,gp=i=>mp.test(i),pp=i=>hp.test(i),bp=i=>!$(i)&&!W(i),Sp=i=>Xa(i,hh,fh),$=i=>oh.test(i),Il=i=>Xa(i,vh,yp),Wr=i=>Xa(i,Rp,ce),wm=i=>Xa(i,dh,fh),xp=i=>Xa(i,mh,pp),yi=i=>Xa(i,yh,gp),W=i=>sh.test(i),Jn=i=>ka(i,vh),Ep=i=>ka(i,Mp),Dm=i=>ka(i,dh),Tp=i=>ka(i,hh),Ap=i=>ka(i,mh),gi=i=>ka(i,yh,!0),Xa=(i,c,s)=>{const r=oh.exec(i);return r?r[1]?c(r[1]):s(r[2]):!1},ka=(i,c,s=!1)=>{const r=sh.exec(i);return r?r[1]?c(r[1]):s:!1},dh=i=>i==="position"||i==="percentage",mh=i=>i==="image"||i==="url",hh=i=>i==="length"||i==="size"||i==="bg-size",vh=i=>i==="length",Rp=i=>i==="number",Mp=i=>i==="family-name",yh=i=>i==="shadow",_p=()=>{const i=Ve("color"),c=Ve("font"),s=Ve("text"),r=Ve("font-weight"),f=Ve("tracking"),m=Ve("leading"),g=Ve("breakpoint"),x=Ve("container"),v=Ve("spacing"),h=Ve("radius"),S=Ve("shadow"),N=Ve("inset-shadow"),R=Ve("text-shadow"),Y=Ve("drop-shadow"),C=Ve("blur"),B=Ve("perspective"),q=Ve("aspect"),U=Ve("ease"),P=Ve("animate"),Q=()=>["auto","avoid","all","avoid-page","page","left","right","column"],ee=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],F=()=>[...ee(),W,$],me=()=>["auto","hidden","clip","visible","scroll"],ve=()=>["auto","contain","none"],k=()=>[W,$,v],de=()=>[Ga,"full","auto",...k()],Ue=()=>[Dl,"none","subgrid",W,$],Le=()=>["auto",{span:["full",Dl,W,$]},Dl,W,$],Oe=()=>[Dl,"auto",W,$],yt=()=>["auto","min","max","fr",W,$],gt=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],ze=()=>["start","end","center","stretch","center-safe","end-safe"],O=()=>["auto",...k()],X=()=>[Ga,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...k()],G=()=>[i,W,$],be=()=>[...ee(),Dm,wm,{position:[W,$]}],p=()=>["no-repeat",{repeat:["","x","y","space","round"]}],L=()=>["auto","cover","contain",Tp,Sp,{size:[W,$]}],Z=()=>[$r,Jn,Il],V=()=>["","none","full",h,W,$],K=()=>["",ce,Jn,Il],oe=()=>["solid","dashed","dotted","double"],ne=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],ye=()=>[ce,$r,Dm,wm],Re=()=>["","none",C,W,$],it=()=>["none",ce,W,$],il=()=>["none",ce,W,$],cl=()=>[ce,W,$],rl=()=>[Ga,"full",...k()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[tl],breakpoint:[tl],color:[vp],container:[tl],"drop-shadow":[tl],ease:["in","out","in-out"],font:[bp],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[tl],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[tl],shadow:[tl],spacing:["px",ce],text:[tl],"text-shadow":[tl],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",Ga,$,W,q]}],container:["container"],columns:[{columns:[ce,$,W,x]}],"break-after":[{"break-after":Q()}],"break-before":[{"break-before":Q()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:F()}],overflow:[{overflow:me()}],"overflow-x":[{"overflow-x":me()}],"overflow-y":[{"overflow-y":me()}],overscroll:[{overscroll:ve()}],"overscroll-x":[{"overscroll-x":ve()}],"overscroll-y":[{"overscroll-y":ve()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:de()}],"inset-x":[{"inset-x":de()}],"inset-y":[{"inset-y":de()}],start:[{start:de()}],end:[{end:de()}],top:[{top:de()}],right:[{right:de()}],bottom:[{bottom:de()}],left:[{left:de()}],visibility:["visible","invisible","collapse"],z:[{z:[Dl,"auto",W,$]}],basis:[{basis:[Ga,"full","auto",x,...k()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[ce,Ga,"auto","initial","none",$]}],grow:[{grow:["",ce,W,$]}],shrink:[{shrink:["",ce,W,$]}],order:[{order:[Dl,"first","last","none",W,$]}],"grid-cols":[{"grid-cols":Ue()}],"col-start-end":[{col:Le()}],"col-start":[{"col-start":Oe()}],"col-end":[{"col-end":Oe()}],"grid-rows":[{"grid-rows":Ue()}],"row-start-end":[{row:Le()}],"row-start":[{"row-start":Oe()}],"row-end":[{"row-end":Oe()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":yt()}],"auto-rows":[{"auto-rows":yt()}],gap:[{gap:k()}],"gap-x":[{"gap-x":k()}],"gap-y":[{"gap-y":k()}],"justify-content":[{justify:[...gt(),"normal"]}],"justify-items":[{"justify-items":[...ze(),"normal"]}],"justify-self":[{"justify-self":["auto",...ze()]}],"align-content":[{content:["normal",...gt()]}],"align-items":[{items:[...ze(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...ze(),{baseline:["","last"]}]}],"place-content":[{"place-content":gt()}],"place-items":[{"place-items":[...ze(),"baseline"]}],"place-self":[{"place-self":["auto",...ze()]}],p:[{p:k()}],px:[{px:k()}],py:[{py:k()}],ps:[{ps:k()}],pe:[{pe:k()}],pt:[{pt:k()}],pr:[{pr:k()}],pb:[{pb:k()}],pl:[{pl:k()}],m:[{m:O()}],mx:[{mx:O()}],my:[{my:O()}],ms:[{ms:O()}],me:[{me:O()}],mt:[{mt:O()}],mr:[{mr:O()}],mb:[{mb:O()}],ml:[{ml:O()}],"space-x":[{"space-x":k()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":k()}],"space-y-reverse":["space-y-reverse"],size:[{size:X()}],w:[{w:[x,"screen",...X()]}],"min-w":[{"min-w":[x,"screen","none",...X()]}],"max-w":[{"max-w":[x,"screen","none","prose",{screen:[g]},...X()]}],h:[{h:["screen","lh",...X()]}],"min-h":[{"min-h":["screen","lh","none",...X()]}],"max-h":[{"max-h":["screen","lh",...X()]}],"font-size":[{text:["base",s,Jn,Il]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[r,W,Wr]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",$r,$]}],"font-family":[{font:[Ep,$,c]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[f,W,$]}],"line-clamp":[{"line-clamp":[ce,"none",W,Wr]}],leading:[{leading:[m,...k()]}],"list-image":[{"list-image":["none",W,$]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",W,$]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:G()}],"text-color":[{text:G()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...oe(),"wavy"]}],"text-decoration-thickness":[{decoration:[ce,"from-font","auto",W,Il]}],"text-decoration-color":[{decoration:G()}],"underline-offset":[{"underline-offset":[ce,"auto",W,$]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:k()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",W,$]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",W,$]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:be()}],"bg-repeat":[{bg:p()}],"bg-size":[{bg:L()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Dl,W,$],radial:["",W,$],conic:[Dl,W,$]},Ap,xp]}],"bg-color":[{bg:G()}],"gradient-from-pos":[{from:Z()}],"gradient-via-pos":[{via:Z()}],"gradient-to-pos":[{to:Z()}],"gradient-from":[{from:G()}],"gradient-via":[{via:G()}],"gradient-to":[{to:G()}],rounded:[{rounded:V()}],"rounded-s":[{"rounded-s":V()}],"rounded-e":[{"rounded-e":V()}],"rounded-t":[{"rounded-t":V()}],"rounded-r":[{"rounded-r":V()}],"rounded-b":[{"rounded-b":V()}],"rounded-l":[{"rounded-l":V()}],"rounded-ss":[{"rounded-ss":V()}],"rounded-se":[{"rounded-se":V()}],"rounded-ee":[{"rounded-ee":V()}],"rounded-es":[{"rounded-es":V()}],"rounded-tl":[{"rounded-tl":V()}],"rounded-tr":[{"rounded-tr":V()}],"rounded-br":[{"rounded-br":V()}],"rounded-bl":[{"rounded-bl":V()}],"border-w":[{border:K()}],"border-w-x":[{"border-x":K()}],"border-w-y":[{"border-y":K()}],"border-w-s":[{"border-s":K()}],"border-w-e":[{"border-e":K()}],"border-w-t":[{"border-t":K()}],"border-w-r":[{"border-r":K()}],"border-w-b":[{"border-b":K()}],"border-w-l":[{"border-l":K()}],"divide-x":[{"divide-x":K()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":K()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...oe(),"hidden","none"]}],"divide-style":[{divide:[...oe(),"hidden","none"]}],"border-color":[{border:G()}],"border-color-x":[{"border-x":G()}],"border-color-y":[{"border-y":G()}],"border-color-s":[{"border-s":G()}],"border-color-e":[{"border-e":G()}],"border-color-t":[{"border-t":G()}],"border-color-r":[{"border-r":G()}],"border-color-b":[{"border-b":G()}],"border-color-l":[{"border-l":G()}],"divide-color":[{divide:G()}],"outline-style":[{outline:[...oe(),"none","hidden"]}],"outline-offset":[{"outline-offset":[ce,W,$]}],"outline-w":[{outline:["",ce,Jn,Il]}],"outline-color":[{outline:G()}],shadow:[{shadow:["","none",S,gi,yi]}],"shadow-color":[{shadow:G()}],"inset-shadow":[{"inset-shadow":["none",N,gi,yi]}],"inset-shadow-color":[{"inset-shadow":G()}],"ring-w":[{ring:K()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:G()}],"ring-offset-w":[{"ring-offset":[ce,Il]}],"ring-offset-color":[{"ring-offset":G()}],"inset-ring-w":[{"inset-ring":K()}],"inset-ring-color":[{"inset-ring":G()}],"text-shadow":[{"text-shadow":["none",R,gi,yi]}],"text-shadow-color":[{"text-shadow":G()}],opacity:[{opacity:[ce,W,$]}],"mix-blend":[{"mix-blend":[...ne(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":ne()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[ce]}],"mask-image-linear-from-pos":[{"mask-linear-from":ye()}],"mask-image-linear-to-pos":[{"mask-linear-to":ye()}],"mask-image-linear-from-color":[{"mask-linear-from":G()}],"mask-image-linear-to-color":[{"mask-linear-to":G()}],"mask-image-t-from-pos":[{"mask-t-from":ye()}],"mask-image-t-to-pos":[{"mask-t-to":ye()}],"mask-image-t-from-color":[{"mask-t-from":G()}],"mask-image-t-to-color":[{"mask-t-to":G()}],"mask-image-r-from-pos":[{"mask-r-from":ye()}],"mask-image-r-to-pos":[{"mask-r-to":ye()}],"mask-image-r-from-color":[{"mask-r-from":G()}],"mask-image-r-to-color":[{"mask-r-to":G()}],"mask-image-b-from-pos":[{"mask-b-from":ye()}],"mask-image-b-to-pos":[{"mask-b-to":ye()}],"mask-image-b-from-color":[{"mask-b-from":G()}],"mask-image-b-to-color":[{"mask-b-to":G()}],"mask-image-l-from-pos":[{"mask-l-from":ye()}],"mask-image-l-to-pos":[{"mask-l-to":ye()}],"mask-image-l-from-color":[{"mask-l-from":G()}],"mask-image-l-to-color":[{"mask-l-to":G()}],"mask-image-x-from-pos":[{"mask-x-from":ye()}],"mask-image-x-to-pos":[{"mask-x-to":ye()}],"mask-image-x-from-color":[{"mask-x-from":G()}],"mask-image-x-to-color":[{"mask-x-to":G()}],"mask-image-y-from-pos":[{"mask-y-from":ye()}],"mask-image-y-to-pos":[{"mask-y-to":ye()}],"mask-image-y-from-color":[{"mask-y-from":G()}],"mask-image-y-to-color":[{"mask-y-to":G()}],"mask-image-radial":[{"mask-radial":[W,$]}],"mask-image-radial-from-pos":[{"mask-radial-from":ye()}],"mask-image-radial-to-pos":[{"mask-radial-to":ye()}],"mask-image-radial-from-color":[{"mask-radial-from":G()}],"mask-image-radial-to-color":[{"mask-radial-to":G()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":ee()}],"mask-image-conic-pos":[{"mask-conic":[ce]}],"mask-image-conic-from-pos":[{"mask-conic-from":ye()}],"mask-image-conic-to-pos":[{"mask-conic-to":ye()}],"mask-image-conic-from-color":[{"mask-conic-from":G()}],"mask-image-conic-to-color":[{"mask-conic-to":G()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:be()}],"mask-repeat":[{mask:p()}],"mask-size":[{mask:L()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",W,$]}],filter:[{filter:["","none",W,$]}],blur:[{blur:Re()}],brightness:[{brightness:[ce,W,$]}],contrast:[{contrast:[ce,W,$]}],"drop-shadow":[{"drop-shadow":["","none",Y,gi,yi]}],"drop-shadow-color":[{"drop-shadow":G()}],grayscale:[{grayscale:["",ce,W,$]}],"hue-rotate":[{"hue-rotate":[ce,W,$]}],invert:[{invert:["",ce,W,$]}],saturate:[{saturate:[ce,W,$]}],sepia:[{sepia:["",ce,W,$]}],"backdrop-filter":[{"backdrop-filter":["","none",W,$]}],"backdrop-blur":[{"backdrop-blur":Re()}],"backdrop-brightness":[{"backdrop-brightness":[ce,W,$]}],"backdrop-contrast":[{"backdrop-contrast":[ce,W,$]}],"backdrop-grayscale":[{"backdrop-grayscale":["",ce,W,$]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[ce,W,$]}],"backdrop-invert":[{"backdrop-invert":["",ce,W,$]}],"backdrop-opacity":[{"backdrop-opacity":[ce,W,$]}],"backdrop-saturate":[{"backdrop-saturate":[ce,W,$]}],"backdrop-sepia":[{"backdrop-sepia":["",ce,W,$]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":k()}],"border-spacing-x":[{"border-spacing-x":k()}],"border-spacing-y":[{"border-spacing-y":k()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",W,$]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[ce,"initial",W,$]}],ease:[{ease:["linear","initial",U,W,$]}],delay:[{delay:[ce,W,$]}],animate:[{animate:["none",P,W,$]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[B,W,$]}],"perspective-origin":[{"perspective-origin":F()}],rotate:[{rotate:it()}],"rotate-x":[{"rotate-x":it()}],"rotate-y":[{"rotate-y":it()}],"rotate-z":[{"rotate-z":it()}],scale:[{scale:il()}],"scale-x":[{"scale-x":il()}],"scale-y":[{"scale-y":il()}],"scale-z":[{"scale-z":il()}],"scale-3d":["scale-3d"],skew:[{skew:cl()}],"skew-x":[{"skew-x":cl()}],"skew-y":[{"skew-y":cl()}],transform:[{transform:[W,$,"","none","gpu","cpu"]}],"transform-origin":[{origin:F()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:rl()}],"translate-x":[{"translate-x":rl()}],"translate-y":[{"translate-y":rl()}],"translate-z":[{"translate-z":rl()}],"translate-none":["translate-none"],accent:[{accent:G()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:G()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",W,$]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":k()}],"scroll-mx":[{"scroll-mx":k()}],"scroll-my":[{"scroll-my":k()}],"scroll-ms":[{"scroll-ms":k()}],"scroll-me":[{"scroll-me":k()}],"scroll-mt":[{"scroll-mt":k()}],"scroll-mr":[{"scroll-mr":k()}],"scroll-mb":[{"scroll-mb":k()}],"scroll-ml":[{"scroll-ml":k()}],"scroll-p":[{"scroll-p":k()}],"scroll-px":[{"scroll-px":k()}],"scroll-py":[{"scroll-py":k()}],"scroll-ps":[{"scroll-ps":k()}],"scroll-pe":[{"scroll-pe":k()}],"scroll-pt":[{"scroll-pt":k()}],"scroll-pr":[{"scroll-pr":k()}],"scroll-pb":[{"scroll-pb":k()}],"scroll-pl":[{"scroll-pl":k()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",W,$]}],fill:[{fill:["none",...G()]}],"stroke-w":[{stroke:[ce,Jn,Il,Wr]}],stroke:[{stroke:["none",...G()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},zp=rp(_p);function Ot(...i){return zp(uh(i))}const Np=ih("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg:not([class*='size-'])]:size-4 shrink-0 [&_svg]:shrink-0 outline-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",{variants:{variant:{default:"bg-primary text-primary-foreground shadow-xs hover:bg-primary/90",destructive:"bg-destructive text-white shadow-xs hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"border bg-background shadow-xs hover:bg-accent hover:text-accent-foreground dark:bg-input/30 dark:border-input dark:hover:bg-input/50",secondary:"bg-secondary text-secondary-foreground shadow-xs hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground dark:hover:bg-accent/50",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-9 px-4 py-2 has-[>svg]:px-3",sm:"h-8 rounded-md gap-1.5 px-3 has-[>svg]:px-2.5",lg:"h-10 rounded-md px-6 has-[>svg]:px-4",icon:"size-9"}},defaultVariants:{variant:"default",size:"default"}});function Ya({className:i,variant:c,size:s,asChild:r=!1,...f}){const m=r?ah:"button";return w.jsx(m,{"data-slot":"button",className:Ot(Np({variant:c,size:s,className:i})),...f})}function fo({className:i,...c}){return w.jsx("div",{"data-slot":"card",className:Ot("bg-card text-card-foreground flex flex-col gap-6 rounded-xl border py-6 shadow-sm",i),...c})}function mo({className:i,...c}){return w.jsx("div",{"data-slot":"card-header",className:Ot("@container/card-header grid auto-rows-min grid-rows-[auto_auto] items-start gap-1.5 px-6 has-data-[slot=card-action]:grid-cols-[1fr_auto] [.border-b]:pb-6",i),...c})}function ho({className:i,...c}){return w.jsx("div",{"data-slot":"card-title",className:Ot("leading-none font-semibold",i),...c})}function gh({className:i,...c}){return w.jsx("div",{"data-slot":"card-description",className:Ot("text-muted-foreground text-sm",i),...c})}function vo({className:i,...c}){return w.jsx("div",{"data-slot":"card-content",className:Ot("px-6",i),...c})}const Op=ih("inline-flex items-center justify-center rounded-md border px-2 py-0.5 text-xs font-medium w-fit whitespace-nowrap shrink-0 [&>svg]:size-3 gap-1 [&>svg]:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive transition-[color,box-shadow] overflow-hidden",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground [a&]:hover:bg-primary/90",secondary:"border-transparent bg-secondary text-secondary-foreground [a&]:hover:bg-secondary/90",destructive:"border-transparent bg-destructive text-white [a&]:hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"text-foreground [a&]:hover:bg-accent [a&]:hover:text-accent-foreground"}},defaultVariants:{variant:"default"}});function lo({className:i,variant:c,asChild:s=!1,...r}){const f=s?ah:"span";return w.jsx(f,{"data-slot":"badge",className:Ot(Op({variant:c}),i),...r})}function al(i,c,{checkForDefaultPrevented:s=!0}={}){return function(f){if(i==null||i(f),s===!1||!f.defaultPrevented)return c==null?void 0:c(f)}}function yo(i,c=[]){let s=[];function r(m,g){const x=E.createContext(g),v=s.length;s=[...s,g];const h=N=>{var U;const{scope:R,children:Y,...C}=N,B=((U=R==null?void 0:R[i])==null?void 0:U[v])||x,q=E.useMemo(()=>C,Object.values(C));return w.jsx(B.Provider,{value:q,children:Y})};h.displayName=m+"Provider";function S(N,R){var B;const Y=((B=R==null?void 0:R[i])==null?void 0:B[v])||x,C=E.useContext(Y);if(C)return C;if(g!==void 0)return g;throw new Error(`\`${N}\` must be used within \`${m}\``)}return[h,S]}const f=()=>{const m=s.map(g=>E.createContext(g));return function(x){const v=(x==null?void 0:x[i])||m;return E.useMemo(()=>({[`__scope${i}`]:{...x,[i]:v}}),[x,v])}};return f.scopeName=i,[r,Cp(f,...c)]}function Cp(...i){const c=i[0];if(i.length===1)return c;const s=()=>{const r=i.map(f=>({useScope:f(),scopeName:f.scopeName}));return function(m){const g=r.reduce((x,{useScope:v,scopeName:h})=>{const N=v(m)[`__scope${h}`];return{...x,...N}},{});return E.useMemo(()=>({[`__scope${c.scopeName}`]:g}),[g])}};return s.scopeName=c.scopeName,s}function wp(i){const c=i+"CollectionProvider",[s,r]=yo(c),[f,m]=s(c,{collectionRef:{current:null},itemMap:new Map}),g=B=>{const{scope:q,children:U}=B,P=Ul.useRef(null),Q=Ul.useRef(new Map).current;return w.jsx(f,{scope:q,itemMap:Q,collectionRef:P,children:U})};g.displayName=c;const x=i+"CollectionSlot",v=Ei(x),h=Ul.forwardRef((B,q)=>{const{scope:U,children:P}=B,Q=m(x,U),ee=Wn(q,Q.collectionRef);return w.jsx(v,{ref:ee,children:P})});h.displayName=x;const S=i+"CollectionItemSlot",N="data-radix-collection-item",R=Ei(S),Y=Ul.forwardRef((B,q)=>{const{scope:U,children:P,...Q}=B,ee=Ul.useRef(null),F=Wn(q,ee),me=m(S,U);return Ul.useEffect(()=>(me.itemMap.set(ee,{ref:ee,...Q}),()=>void me.itemMap.delete(ee))),w.jsx(R,{[N]:"",ref:F,children:P})});Y.displayName=S;function C(B){const q=m(i+"CollectionConsumer",B);return Ul.useCallback(()=>{const P=q.collectionRef.current;if(!P)return[];const Q=Array.from(P.querySelectorAll(`[${N}]`));return Array.from(q.itemMap.values()).sort((me,ve)=>Q.indexOf(me.ref.current)-Q.indexOf(ve.ref.current))},[q.collectionRef,q.itemMap])}return[{Provider:g,Slot:h,ItemSlot:Y},C,r]}var Ti=globalThis!=null&&globalThis.document?E.useLayoutEffect:()=>{},Dp=Lm[" useId ".trim().toString()]||(()=>{}),Up=0;function ph(i){const[c,s]=E.useState(Dp());return Ti(()=>{s(r=>r??String(Up++))},[i]),i||(c?`radix-${c}`:"")}var jp=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],Qa=jp.reduce((i,c)=>{const s=Ei(`Primitive.${c}`),r=E.forwardRef((f,m)=>{const{asChild:g,...x}=f,v=g?s:c;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),w.jsx(v,{...x,ref:m})});return r.displayName=`Primitive.${c}`,{...i,[c]:r}},{});function Hp(i){const c=E.useRef(i);return E.useEffect(()=>{c.current=i}),E.useMemo(()=>(...s)=>{var r;return(r=c.current)==null?void 0:r.call(c,...s)},[])}var Bp=Lm[" useInsertionEffect ".trim().toString()]||Ti;function bh({prop:i,defaultProp:c,onChange:s=()=>{},caller:r}){const[f,m,g]=qp({defaultProp:c,onChange:s}),x=i!==void 0,v=x?i:f;{const S=E.useRef(i!==void 0);E.useEffect(()=>{const N=S.current;N!==x&&console.warn(`${r} is changing from ${N?"controlled":"uncontrolled"} to ${x?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),S.current=x},[x,r])}const h=E.useCallback(S=>{var N;if(x){const R=Lp(S)?S(i):S;R!==i&&((N=g.current)==null||N.call(g,R))}else m(S)},[x,i,m,g]);return[v,h]}function qp({defaultProp:i,onChange:c}){const[s,r]=E.useState(i),f=E.useRef(s),m=E.useRef(c);return Bp(()=>{m.current=c},[c]),E.useEffect(()=>{var g;f.current!==s&&((g=m.current)==null||g.call(m,s),f.current=s)},[s,f]),[s,r,m]}function Lp(i){return typeof i=="function"}var Gp=E.createContext(void 0);function Sh(i){const c=E.useContext(Gp);return i||c||"ltr"}var Fr="rovingFocusGroup.onEntryFocus",Yp={bubbles:!1,cancelable:!0},eu="RovingFocusGroup",[ao,xh,Vp]=wp(eu),[Xp,Eh]=yo(eu,[Vp]),[kp,Qp]=Xp(eu),Th=E.forwardRef((i,c)=>w.jsx(ao.Provider,{scope:i.__scopeRovingFocusGroup,children:w.jsx(ao.Slot,{scope:i.__scopeRovingFocusGroup,children:w.jsx(Zp,{...i,ref:c})})}));Th.displayName=eu;var Zp=E.forwardRef((i,c)=>{const{__scopeRovingFocusGroup:s,orientation:r,loop:f=!1,dir:m,currentTabStopId:g,defaultCurrentTabStopId:x,onCurrentTabStopIdChange:v,onEntryFocus:h,preventScrollOnEntryFocus:S=!1,...N}=i,R=E.useRef(null),Y=Wn(c,R),C=Sh(m),[B,q]=bh({prop:g,defaultProp:x??null,onChange:v,caller:eu}),[U,P]=E.useState(!1),Q=Hp(h),ee=xh(s),F=E.useRef(!1),[me,ve]=E.useState(0);return E.useEffect(()=>{const k=R.current;if(k)return k.addEventListener(Fr,Q),()=>k.removeEventListener(Fr,Q)},[Q]),w.jsx(kp,{scope:s,orientation:r,dir:C,loop:f,currentTabStopId:B,onItemFocus:E.useCallback(k=>q(k),[q]),onItemShiftTab:E.useCallback(()=>P(!0),[]),onFocusableItemAdd:E.useCallback(()=>ve(k=>k+1),[]),onFocusableItemRemove:E.useCallback(()=>ve(k=>k-1),[]),children:w.jsx(Qa.div,{tabIndex:U||me===0?-1:0,"data-orientation":r,...N,ref:Y,style:{outline:"none",...i.style},onMouseDown:al(i.onMouseDown,()=>{F.current=!0}),onFocus:al(i.onFocus,k=>{const de=!F.current;if(k.target===k.currentTarget&&de&&!U){const Ue=new CustomEvent(Fr,Yp);if(k.currentTarget.dispatchEvent(Ue),!Ue.defaultPrevented){const Le=ee().filter(O=>O.focusable),Oe=Le.find(O=>O.active),yt=Le.find(O=>O.id===B),ze=[Oe,yt,...Le].filter(Boolean).map(O=>O.ref.current);Mh(ze,S)}}F.current=!1}),onBlur:al(i.onBlur,()=>P(!1))})})}),Ah="RovingFocusGroupItem",Rh=E.forwardRef((i,c)=>{const{__scopeRovingFocusGroup:s,focusable:r=!0,active:f=!1,tabStopId:m,children:g,...x}=i,v=ph(),h=m||v,S=Qp(Ah,s),N=S.currentTabStopId===h,R=xh(s),{onFocusableItemAdd:Y,onFocusableItemRemove:C,currentTabStopId:B}=S;return E.useEffect(()=>{if(r)return Y(),()=>C()},[r,Y,C]),w.jsx(ao.ItemSlot,{scope:s,id:h,focusable:r,active:f,children:w.jsx(Qa.span,{tabIndex:N?0:-1,"data-orientation":S.orientation,...x,ref:c,onMouseDown:al(i.onMouseDown,q=>{r?S.onItemFocus(h):q.preventDefault()}),onFocus:al(i.onFocus,()=>S.onItemFocus(h)),onKeyDown:al(i.onKeyDown,q=>{if(q.key==="Tab"&&q.shiftKey){S.onItemShiftTab();return}if(q.target!==q.currentTarget)return;const U=$p(q,S.orientation,S.dir);if(U!==void 0){if(q.metaKey||q.ctrlKey||q.altKey||q.shiftKey)return;q.preventDefault();let Q=R().filter(ee=>ee.focusable).map(ee=>ee.ref.current);if(U==="last")Q.reverse();else if(U==="prev"||U==="next"){U==="prev"&&Q.reverse();const ee=Q.indexOf(q.currentTarget);Q=S.loop?Wp(Q,ee+1):Q.slice(ee+1)}setTimeout(()=>Mh(Q))}}),children:typeof g=="function"?g({isCurrentTabStop:N,hasTabStop:B!=null}):g})})});Rh.displayName=Ah;var Kp={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function Jp(i,c){return c!=="rtl"?i:i==="ArrowLeft"?"ArrowRight":i==="ArrowRight"?"ArrowLeft":i}function $p(i,c,s){const r=Jp(i.key,s);if(!(c==="vertical"&&["ArrowLeft","ArrowRight"].includes(r))&&!(c==="horizontal"&&["ArrowUp","ArrowDown"].includes(r)))return Kp[r]}function Mh(i,c=!1){const s=document.activeElement;for(const r of i)if(r===s||(r.focus({preventScroll:c}),document.activeElement!==s))return}function Wp(i,c){return i.map((s,r)=>i[(c+r)%i.length])}var Fp=Th,Pp=Rh;function Ip(i,c){return E.useReducer((s,r)=>c[s][r]??s,i)}var _h=i=>{const{present:c,children:s}=i,r=eb(c),f=typeof s=="function"?s({present:r.isPresent}):E.Children.only(s),m=Wn(r.ref,tb(f));return typeof s=="function"||r.isPresent?E.cloneElement(f,{ref:m}):null};_h.displayName="Presence";function eb(i){const[c,s]=E.useState(),r=E.useRef(null),f=E.useRef(i),m=E.useRef("none"),g=i?"mounted":"unmounted",[x,v]=Ip(g,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return E.useEffect(()=>{const h=pi(r.current);m.current=x==="mounted"?h:"none"},[x]),Ti(()=>{const h=r.current,S=f.current;if(S!==i){const R=m.current,Y=pi(h);i?v("MOUNT"):Y==="none"||(h==null?void 0:h.display)==="none"?v("UNMOUNT"):v(S&&R!==Y?"ANIMATION_OUT":"UNMOUNT"),f.current=i}},[i,v]),Ti(()=>{if(c){let h;const S=c.ownerDocument.defaultView??window,N=Y=>{const B=pi(r.current).includes(Y.animationName);if(Y.target===c&&B&&(v("ANIMATION_END"),!f.current)){const q=c.style.animationFillMode;c.style.animationFillMode="forwards",h=S.setTimeout(()=>{c.style.animationFillMode==="forwards"&&(c.style.animationFillMode=q)})}},R=Y=>{Y.target===c&&(m.current=pi(r.current))};return c.addEventListener("animationstart",R),c.addEventListener("animationcancel",N),c.addEventListener("animationend",N),()=>{S.clearTimeout(h),c.removeEventListener("animationstart",R),c.removeEventListener("animationcancel",N),c.removeEventListener("animationend",N)}}else v("ANIMATION_END")},[c,v]),{isPresent:["mounted","unmountSuspended"].includes(x),ref:E.useCallback(h=>{r.current=h?getComputedStyle(h):null,s(h)},[])}}function pi(i){return(i==null?void 0:i.animationName)||"none"}function tb(i){var r,f;let c=(r=Object.getOwnPropertyDescriptor(i.props,"ref"))==null?void 0:r.get,s=c&&"isReactWarning"in c&&c.isReactWarning;return s?i.ref:(c=(f=Object.getOwnPropertyDescriptor(i,"ref"))==null?void 0:f.get,s=c&&"isReactWarning"in c&&c.isReactWarning,s?i.props.ref:i.props.ref||i.ref)}var _i="Tabs",[lb,Bb]=yo(_i,[Eh]),zh=Eh(),[ab,go]=lb(_i),Nh=E.forwardRef((i,c)=>{const{__scopeTabs:s,value:r,onValueChange:f,defaultValue:m,orientation:g="horizontal",dir:x,activationMode:v="automatic",...h}=i,S=Sh(x),[N,R]=bh({prop:r,onChange:f,defaultProp:m??"",caller:_i});return w.jsx(ab,{scope:s,baseId:ph(),value:N,onValueChange:R,orientation:g,dir:S,activationMode:v,children:w.jsx(Qa.div,{dir:S,"data-orientation":g,...h,ref:c})})});Nh.displayName=_i;var Oh="TabsList",Ch=E.forwardRef((i,c)=>{const{__scopeTabs:s,loop:r=!0,...f}=i,m=go(Oh,s),g=zh(s);return w.jsx(Fp,{asChild:!0,...g,orientation:m.orientation,dir:m.dir,loop:r,children:w.jsx(Qa.div,{role:"tablist","aria-orientation":m.orientation,...f,ref:c})})});Ch.displayName=Oh;var wh="TabsTrigger",Dh=E.forwardRef((i,c)=>{const{__scopeTabs:s,value:r,disabled:f=!1,...m}=i,g=go(wh,s),x=zh(s),v=Hh(g.baseId,r),h=Bh(g.baseId,r),S=r===g.value;return w.jsx(Pp,{asChild:!0,...x,focusable:!f,active:S,children:w.jsx(Qa.button,{type:"button",role:"tab","aria-selected":S,"aria-controls":h,"data-state":S?"active":"inactive","data-disabled":f?"":void 0,disabled:f,id:v,...m,ref:c,onMouseDown:al(i.onMouseDown,N=>{!f&&N.button===0&&N.ctrlKey===!1?g.onValueChange(r):N.preventDefault()}),onKeyDown:al(i.onKeyDown,N=>{[" ","Enter"].includes(N.key)&&g.onValueChange(r)}),onFocus:al(i.onFocus,()=>{const N=g.activationMode!=="manual";!S&&!f&&N&&g.onValueChange(r)})})})});Dh.displayName=wh;var Uh="TabsContent",jh=E.forwardRef((i,c)=>{const{__scopeTabs:s,value:r,forceMount:f,children:m,...g}=i,x=go(Uh,s),v=Hh(x.baseId,r),h=Bh(x.baseId,r),S=r===x.value,N=E.useRef(S);return E.useEffect(()=>{const R=requestAnimationFrame(()=>N.current=!1);return()=>cancelAnimationFrame(R)},[]),w.jsx(_h,{present:f||S,children:({present:R})=>w.jsx(Qa.div,{"data-state":S?"active":"inactive","data-orientation":x.orientation,role:"tabpanel","aria-labelledby":v,hidden:!R,id:h,tabIndex:0,...g,ref:c,style:{...i.style,animationDuration:N.current?"0s":void 0},children:R&&m})})});jh.displayName=Uh;function Hh(i,c){return`${i}-trigger-${c}`}function Bh(i,c){return`${i}-content-${c}`}var nb=Nh,ub=Ch,ib=Dh,cb=jh;function rb({className:i,...c}){return w.jsx(nb,{"data-slot":"tabs",className:Ot("flex flex-col gap-2",i),...c})}function ob({className:i,...c}){return w.jsx(ub,{"data-slot":"tabs-list",className:Ot("bg-muted text-muted-foreground inline-flex h-9 w-fit items-center justify-center rounded-lg p-[3px]",i),...c})}function Um({className:i,...c}){return w.jsx(ib,{"data-slot":"tabs-trigger",className:Ot("data-[state=active]:bg-background dark:data-[state=active]:text-foreground focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:outline-ring dark:data-[state=active]:border-input dark:data-[state=active]:bg-input/30 text-foreground dark:text-muted-foreground inline-flex h-[calc(100%-1px)] flex-1 items-center justify-center gap-1.5 rounded-md border border-transparent px-2 py-1 text-sm font-medium whitespace-nowrap transition-[color,box-shadow] focus-visible:ring-[3px] focus-visible:outline-1 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:shadow-sm [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",i),...c})}function jm({className:i,...c}){return w.jsx(cb,{"data-slot":"tabs-content",className:Ot("flex-1 outline-none",i),...c})}/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const sb=i=>i.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),fb=i=>i.replace(/^([A-Z])|[\s-_]+(\w)/g,(c,s,r)=>r?r.toUpperCase():s.toLowerCase()),Hm=i=>{const c=fb(i);return c.charAt(0).toUpperCase()+c.slice(1)},qh=(...i)=>i.filter((c,s,r)=>!!c&&c.trim()!==""&&r.indexOf(c)===s).join(" ").trim(),db=i=>{for(const c in i)if(c.startsWith("aria-")||c==="role"||c==="title")return!0};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var mb={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const hb=E.forwardRef(({color:i="currentColor",size:c=24,strokeWidth:s=2,absoluteStrokeWidth:r,className:f="",children:m,iconNode:g,...x},v)=>E.createElement("svg",{ref:v,...mb,width:c,height:c,stroke:i,strokeWidth:r?Number(s)*24/Number(c):s,className:qh("lucide",f),...!m&&!db(x)&&{"aria-hidden":"true"},...x},[...g.map(([h,S])=>E.createElement(h,S)),...Array.isArray(m)?m:[m]]));/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Lt=(i,c)=>{const s=E.forwardRef(({className:r,...f},m)=>E.createElement(hb,{ref:m,iconNode:c,className:qh(`lucide-${sb(Hm(i))}`,`lucide-${i}`,r),...f}));return s.displayName=Hm(i),s};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const vb=[["path",{d:"M12 5a3 3 0 1 0-5.997.125 4 4 0 0 0-2.526 5.77 4 4 0 0 0 .556 6.588A4 4 0 1 0 12 18Z",key:"l5xja"}],["path",{d:"M12 5a3 3 0 1 1 5.997.125 4 4 0 0 1 2.526 5.77 4 4 0 0 1-.556 6.588A4 4 0 1 1 12 18Z",key:"ep3f8r"}],["path",{d:"M15 13a4.5 4.5 0 0 1-3-4 4.5 4.5 0 0 1-3 4",key:"1p4c4q"}],["path",{d:"M17.599 6.5a3 3 0 0 0 .399-1.375",key:"tmeiqw"}],["path",{d:"M6.003 5.125A3 3 0 0 0 6.401 6.5",key:"105sqy"}],["path",{d:"M3.477 10.896a4 4 0 0 1 .585-.396",key:"ql3yin"}],["path",{d:"M19.938 10.5a4 4 0 0 1 .585.396",key:"1qfode"}],["path",{d:"M6 18a4 4 0 0 1-1.967-.516",key:"2e4loj"}],["path",{d:"M19.967 17.484A4 4 0 0 1 18 18",key:"159ez6"}]],Bm=Lt("brain",vb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const yb=[["path",{d:"M11.562 3.266a.5.5 0 0 1 .876 0L15.39 8.87a1 1 0 0 0 1.516.294L21.183 5.5a.5.5 0 0 1 .798.519l-2.834 10.246a1 1 0 0 1-.956.734H5.81a1 1 0 0 1-.957-.734L2.02 6.02a.5.5 0 0 1 .798-.519l4.276 3.664a1 1 0 0 0 1.516-.294z",key:"1vdc57"}],["path",{d:"M5 21h14",key:"11awu3"}]],gb=Lt("crown",yb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const pb=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"M12 2a14.5 14.5 0 0 0 0 20 14.5 14.5 0 0 0 0-20",key:"13o1zl"}],["path",{d:"M2 12h20",key:"9i4pu4"}]],bb=Lt("globe",pb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Sb=[["rect",{width:"18",height:"18",x:"3",y:"3",rx:"2",ry:"2",key:"1m3agn"}],["circle",{cx:"9",cy:"9",r:"2",key:"af1f0g"}],["path",{d:"m21 15-3.086-3.086a2 2 0 0 0-2.828 0L6 21",key:"1xmnt7"}]],xb=Lt("image",Sb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Eb=[["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 18h16",key:"19g7jn"}],["path",{d:"M4 6h16",key:"1o0s65"}]],Tb=Lt("menu",Eb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ab=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"M8 14s1.5 2 4 2 4-2 4-2",key:"1y1vjs"}],["line",{x1:"9",x2:"9.01",y1:"9",y2:"9",key:"yxxnd0"}],["line",{x1:"15",x2:"15.01",y1:"9",y2:"9",key:"1p4y9e"}]],Rb=Lt("smile",Ab);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Mb=[["path",{d:"M21 10.5V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h12.5",key:"1uzm8b"}],["path",{d:"m9 11 3 3L22 4",key:"1pflzl"}]],_b=Lt("square-check-big",Mb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const zb=[["path",{d:"M11.525 2.295a.53.53 0 0 1 .95 0l2.31 4.679a2.123 2.123 0 0 0 1.595 1.16l5.166.756a.53.53 0 0 1 .294.904l-3.736 3.638a2.123 2.123 0 0 0-.611 1.878l.882 5.14a.53.53 0 0 1-.771.56l-4.618-2.428a2.122 2.122 0 0 0-1.973 0L6.396 21.01a.53.53 0 0 1-.77-.56l.881-5.139a2.122 2.122 0 0 0-.611-1.879L2.16 9.795a.53.53 0 0 1 .294-.906l5.165-.755a2.122 2.122 0 0 0 1.597-1.16z",key:"r04s7s"}]],Nb=Lt("star",zb);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ob=[["path",{d:"M6 9H4.5a2.5 2.5 0 0 1 0-5H6",key:"17hqa7"}],["path",{d:"M18 9h1.5a2.5 2.5 0 0 0 0-5H18",key:"lmptdp"}],["path",{d:"M4 22h16",key:"57wxv0"}],["path",{d:"M10 14.66V17c0 .55-.47.98-.97 1.21C7.85 18.75 7 20.24 7 22",key:"1nw9bq"}],["path",{d:"M14 14.66V17c0 .55.47.98.97 1.21C16.15 18.75 17 20.24 17 22",key:"1np0yb"}],["path",{d:"M18 2H6v7a6 6 0 0 0 12 0V2Z",key:"u46fv3"}]],Lh=Lt("trophy",Ob);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Cb=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],wb=Lt("x",Cb),Db=()=>{const[i,c]=E.useState("ar"),s={ar:{title:"الأدوات الذكية",subtitle:"مجموعة من الأدوات المفيدة لتحسين إنتاجيتك",tools:"الأدوات",leaderboard:"لوحة الصدارة",posts:"المنشورات",login:"تسجيل الدخول",register:"إنشاء حساب",points:"نقطة",smartTitles:"العناوين الذكية",tasks:"المهام",smartEmoji:"الإيموجي الذكية",advancedTitles:"العناوين المطورة",userImage:"عرض الصورة",freeTools:"الأدوات المجانية",premiumTools:"الأدوات المميزة",dailyPoints:"نقطة يومياً",requiredPoints:"نقطة مطلوبة",topUsers:"أفضل المستخدمين",latestPosts:"أحدث المنشورات",comments:"التعليقات",readMore:"اقرأ المزيد"},en:{title:"Smart Tools",subtitle:"A collection of useful tools to improve your productivity",tools:"Tools",leaderboard:"Leaderboard",posts:"Posts",login:"Login",register:"Register",points:"points",smartTitles:"Smart Titles",tasks:"Tasks",smartEmoji:"Smart Emoji",advancedTitles:"Advanced Titles",userImage:"Image Display",freeTools:"Free Tools",premiumTools:"Premium Tools",dailyPoints:"daily points",requiredPoints:"points required",topUsers:"Top Users",latestPosts:"Latest Posts",comments:"Comments",readMore:"Read More"}};return{t:f=>s[i][f]||f,language:i,setLanguage:c}},qm=({tool:i,t:c,language:s})=>{const f={smart_titles:Bm,tasks:_b,smart_emoji:Rb,advanced_titles:gb,user_image:xb}[i.name]||Bm;return w.jsxs(fo,{className:"hover:shadow-lg transition-shadow duration-300",children:[w.jsx(mo,{children:w.jsxs("div",{className:"flex items-center justify-between",children:[w.jsxs("div",{className:"flex items-center gap-3",children:[w.jsx(f,{className:"h-8 w-8 text-blue-600"}),w.jsxs("div",{children:[w.jsx(ho,{className:"text-lg",children:s==="ar"?i.name_ar:i.name_en}),w.jsx(gh,{children:s==="ar"?i.description_ar:i.description_en})]})]}),i.is_free?w.jsx(lo,{variant:"secondary",className:"bg-green-100 text-green-800",children:"مجاني"}):w.jsx(lo,{variant:"outline",className:"bg-yellow-100 text-yellow-800",children:"مميز"})]})}),w.jsx(vo,{children:w.jsxs("div",{className:"flex items-center justify-between",children:[w.jsx("div",{className:"text-sm text-gray-600",children:i.is_free?w.jsxs("span",{className:"flex items-center gap-1",children:[w.jsx(Nb,{className:"h-4 w-4"}),i.daily_points_reward," ",c("dailyPoints")]}):w.jsxs("span",{className:"flex items-center gap-1",children:[w.jsx(Lh,{className:"h-4 w-4"}),i.required_points," ",c("requiredPoints")]})}),w.jsx(Ya,{variant:i.is_free?"default":"outline",size:"sm",disabled:!i.can_use,children:"استخدم الأداة"})]})})]})},Ub=({users:i,t:c})=>w.jsxs(fo,{children:[w.jsx(mo,{children:w.jsxs(ho,{className:"flex items-center gap-2",children:[w.jsx(Lh,{className:"h-5 w-5 text-yellow-500"}),c("topUsers")]})}),w.jsx(vo,{children:w.jsx("div",{className:"space-y-3",children:i.map((s,r)=>w.jsxs("div",{className:"flex items-center justify-between p-2 rounded-lg bg-gray-50",children:[w.jsxs("div",{className:"flex items-center gap-3",children:[w.jsxs(lo,{variant:r<3?"default":"secondary",children:["#",r+1]}),w.jsx("span",{className:"font-medium",children:s.username})]}),w.jsxs("span",{className:"text-sm font-bold text-blue-600",children:[s.total_points," ",c("points")]})]},s.id))})})]}),jb=({post:i,t:c,language:s})=>w.jsxs(fo,{className:"mb-4",children:[w.jsxs(mo,{children:[w.jsx(ho,{className:"text-xl",children:s==="ar"?i.title_ar:i.title_en}),w.jsx(gh,{children:new Date(i.created_at).toLocaleDateString(s==="ar"?"ar-SA":"en-US")})]}),w.jsxs(vo,{children:[w.jsxs("p",{className:"text-gray-700 mb-4",children:[(s==="ar"?i.content_ar:i.content_en).substring(0,200),"..."]}),w.jsxs("div",{className:"flex items-center justify-between",children:[w.jsx(Ya,{variant:"outline",size:"sm",children:c("readMore")}),w.jsxs("span",{className:"text-sm text-gray-500",children:[i.comments_count," ",c("comments")]})]})]})]});function Hb(){const{t:i,language:c,setLanguage:s}=Db(),[r,f]=E.useState([]),[m,g]=E.useState([]),[x,v]=E.useState([]),[h,S]=E.useState(!1),N="https://77h9ikcwe9e0.manus.space/api";return E.useEffect(()=>{(async()=>{try{const q=await(await fetch(`${N}/tools`)).json();f(q.tools)}catch(B){console.error("Error fetching tools:",B)}})(),(async()=>{try{const q=await(await fetch(`${N}/leaderboard`)).json();g(q.leaderboard)}catch(B){console.error("Error fetching leaderboard:",B)}})(),(async()=>{try{const q=await(await fetch(`${N}/posts`)).json();v(q.posts)}catch(B){console.error("Error fetching posts:",B)}})()},[]),w.jsx(Dg,{children:w.jsxs("div",{className:"min-h-screen bg-gray-50",dir:c==="ar"?"rtl":"ltr",children:[w.jsx("header",{className:"bg-white shadow-sm border-b",children:w.jsx("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:w.jsxs("div",{className:"flex justify-between items-center h-16",children:[w.jsx("div",{className:"flex items-center",children:w.jsx("h1",{className:"text-2xl font-bold text-blue-600",children:i("title")})}),w.jsxs("nav",{className:"hidden md:flex items-center space-x-8",children:[w.jsx("a",{href:"#tools",className:"text-gray-700 hover:text-blue-600 transition-colors",children:i("tools")}),w.jsx("a",{href:"#leaderboard",className:"text-gray-700 hover:text-blue-600 transition-colors",children:i("leaderboard")}),w.jsx("a",{href:"#posts",className:"text-gray-700 hover:text-blue-600 transition-colors",children:i("posts")})]}),w.jsxs("div",{className:"flex items-center gap-4",children:[w.jsxs(Ya,{variant:"outline",size:"sm",onClick:()=>s(c==="ar"?"en":"ar"),className:"flex items-center gap-2",children:[w.jsx(bb,{className:"h-4 w-4"}),c==="ar"?"EN":"عر"]}),w.jsx(Ya,{variant:"outline",size:"sm",children:i("login")}),w.jsx(Ya,{size:"sm",children:i("register")}),w.jsx(Ya,{variant:"ghost",size:"sm",className:"md:hidden",onClick:()=>S(!h),children:h?w.jsx(wb,{className:"h-5 w-5"}):w.jsx(Tb,{className:"h-5 w-5"})})]})]})})}),h&&w.jsx("div",{className:"md:hidden bg-white border-b shadow-sm",children:w.jsxs("div",{className:"px-4 py-2 space-y-2",children:[w.jsx("a",{href:"#tools",className:"block py-2 text-gray-700 hover:text-blue-600",children:i("tools")}),w.jsx("a",{href:"#leaderboard",className:"block py-2 text-gray-700 hover:text-blue-600",children:i("leaderboard")}),w.jsx("a",{href:"#posts",className:"block py-2 text-gray-700 hover:text-blue-600",children:i("posts")})]})}),w.jsxs("main",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8",children:[w.jsxs("div",{className:"text-center mb-12",children:[w.jsx("h2",{className:"text-4xl font-bold text-gray-900 mb-4",children:i("title")}),w.jsx("p",{className:"text-xl text-gray-600 mb-8",children:i("subtitle")})]}),w.jsxs("section",{id:"tools",className:"mb-12",children:[w.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-6",children:i("tools")}),w.jsxs(rb,{defaultValue:"free",className:"w-full",children:[w.jsxs(ob,{className:"grid w-full grid-cols-2",children:[w.jsx(Um,{value:"free",children:i("freeTools")}),w.jsx(Um,{value:"premium",children:i("premiumTools")})]}),w.jsx(jm,{value:"free",className:"mt-6",children:w.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:r.filter(R=>R.is_free).map(R=>w.jsx(qm,{tool:R,t:i,language:c},R.id))})}),w.jsx(jm,{value:"premium",className:"mt-6",children:w.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:r.filter(R=>!R.is_free).map(R=>w.jsx(qm,{tool:R,t:i,language:c},R.id))})})]})]}),w.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-8",children:[w.jsx("div",{id:"leaderboard",children:w.jsx(Ub,{users:m,t:i})}),w.jsxs("div",{id:"posts",className:"lg:col-span-2",children:[w.jsx("h3",{className:"text-2xl font-bold text-gray-900 mb-6",children:i("latestPosts")}),w.jsx("div",{children:x.map(R=>w.jsx(jb,{post:R,t:i,language:c},R.id))})]})]})]}),w.jsx("footer",{className:"bg-gray-800 text-white py-8 mt-12",children:w.jsx("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:w.jsxs("div",{className:"text-center",children:[w.jsx("h3",{className:"text-lg font-semibold mb-2",children:i("title")}),w.jsx("p",{className:"text-gray-400",children:i("subtitle")})]})})})]})})}p0.createRoot(document.getElementById("root")).render(w.jsx(E.StrictMode,{children:w.jsx(Hb,{})}));
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.main import create_app
+from src.models.user import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    """تطبيق على قاعدة SQLite مؤقتة بالبيانات الأولية (المدير admin معرّفه 1)"""
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'app.db'),
+        'INIT_DATABASE': True,
+        'CLEANUP_INTERVAL_SECONDS': 0,
+        'RESPONSE_CACHE_ENABLED': False,
+        'TESTING': True,
+    })
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def admin_client(app):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['username'] = 'admin'
+    return client
@@ -0,0 +1,52 @@
+import json
+import time
+
+import pytest
+
+from src.models.user import db, DailyPoints, utc_today
+
+
+@pytest.fixture
+def far_timezone(monkeypatch):
+    """توقيت محلي متقدم 14 ساعة حتى يختلف تاريخ اليوم المحلي عن UTC غالباً"""
+    monkeypatch.setenv('TZ', 'Etc/GMT-14')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _today_bucket(client):
+    response = client.get('/api/admin/analytics?granularity=day&range=1')
+    assert response.status_code == 200
+    bucket = response.get_json()['buckets'][0]
+    assert bucket['start'] == utc_today().isoformat()
+    return bucket
+
+
+def test_signups_include_admin_register_and_import(app, admin_client, far_timezone):
+    assert _today_bucket(admin_client)['new_users'] == 1
+
+    app.config.update(PASSWORD_HASH_WORKERS=0, PASSWORD_HASH_METHOD='pbkdf2:sha256:1000', IMPORT_HASH_WORKERS=1)
+    response = app.test_client().post('/api/register', json={
+        'username': 'newcomer', 'email': 'newcomer@example.com', 'password': 'secret123'
+    })
+    assert response.status_code == 201
+    records = '\n'.join(
+        json.dumps({'username': f'imported{i}', 'email': f'imported{i}@example.com', 'password': 'secret123'})
+        for i in range(2)
+    )
+    assert admin_client.post('/api/admin/users/import?format=ndjson', data=records).status_code == 200
+
+    assert _today_bucket(admin_client)['new_users'] == 4
+
+
+def test_tool_usage_and_signups_share_the_utc_day(app, admin_client, far_timezone):
+    response = admin_client.post('/api/tools/smart-titles', json={'topic': 'تقنية'})
+    assert response.get_json()['points_awarded']
+    with app.app_context():
+        assert db.session.query(DailyPoints.date_earned).scalar() == utc_today()
+
+    bucket = _today_bucket(admin_client)
+    assert bucket['tool_usage'] == 1
+    assert bucket['new_users'] == 1
@@ -0,0 +1,79 @@
+import time
+from datetime import datetime, timedelta
+
+from src.main import create_app
+from src.models.user import db, CleanupJob, JobLease, UserImage
+from src.services.cleanup import LEASE_NAME, cleanup_manager
+
+
+def _second_worker(app):
+    """تطبيق ثانٍ على القاعدة نفسها، كعامل gunicorn آخر"""
+    other = create_app({**app.config, 'INIT_DATABASE': False})
+    client = other.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return other, client
+
+
+def _wait(client, job_id):
+    for _ in range(100):
+        job = client.get(f'/api/admin/cleanup/{job_id}').get_json()
+        if job['status'] in ('done', 'failed'):
+            return job
+        time.sleep(0.05)
+    raise AssertionError('cleanup job did not finish')
+
+
+def _wait_idle():
+    for _ in range(100):
+        db.session.expire_all()
+        if db.session.get(JobLease, LEASE_NAME).expires_at is None:
+            return
+        time.sleep(0.05)
+    raise AssertionError('cleanup job did not finish')
+
+
+def test_job_status_is_visible_from_other_workers(app, admin_client, tmp_path):
+    expired = datetime.utcnow() - timedelta(days=1)
+    with app.app_context():
+        db.session.add_all([
+            UserImage(user_id=1, image_path=str(tmp_path / f'missing{i}.png'), expiry_date=expired)
+            for i in range(3)
+        ])
+        db.session.commit()
+
+    response = admin_client.post('/api/admin/cleanup')
+    assert response.status_code == 202
+    job_id = response.get_json()['job']['job_id']
+
+    other, client = _second_worker(app)
+    job = _wait(client, job_id)
+    assert job['status'] == 'done'
+    assert job['deleted_rows'] == 3
+    with other.app_context():
+        db.engine.dispose()
+
+
+def test_only_one_job_runs_across_workers(app, admin_client):
+    with app.app_context():
+        db.session.add(CleanupJob(id='a' * 32, status='running'))
+        db.session.add(JobLease(name=LEASE_NAME, job_id='a' * 32, expires_at=datetime.utcnow() + timedelta(minutes=5)))
+        db.session.commit()
+
+    other, client = _second_worker(app)
+    response = client.post('/api/admin/cleanup')
+    assert response.get_json()['job']['job_id'] == 'a' * 32
+    with other.app_context():
+        assert cleanup_manager.start(other, min_interval=3600) is None
+        assert db.session.query(CleanupJob).count() == 1
+        db.engine.dispose()
+
+
+def test_scheduled_run_waits_for_interval(app):
+    with app.app_context():
+        job = cleanup_manager.start(app, min_interval=3600)
+        assert job is not None
+        _wait_idle()
+        assert cleanup_manager.start(app, min_interval=3600) is None
+        assert cleanup_manager.start(app).id != job.id
+        _wait_idle()
@@ -0,0 +1,24 @@
+import pytest
+
+from src.services import emoji
+
+
+@pytest.mark.parametrize('text', [['hi'], 42, {'a': 1}, None, '', 'x' * (emoji.MAX_TEXT_LENGTH + 1)])
+def test_invalid_text_is_rejected(admin_client, text):
+    response = admin_client.post('/api/tools/smart-emoji', json={'text': text})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_non_string_mood_is_inferred(admin_client):
+    response = admin_client.post('/api/tools/smart-emoji', json={'text': 'أنا سعيد جداً', 'mood': ['happy']})
+    assert response.status_code == 200
+    assert response.get_json()['emojis']
+
+    response = admin_client.post('/api/tools/smart-emoji/batch', json={'texts': ['أنا سعيد'], 'mood': {'x': 1}})
+    assert response.status_code == 200
+
+
+def test_malformed_body_is_rejected(admin_client):
+    response = admin_client.post('/api/tools/smart-emoji', data='not json', content_type='application/json')
+    assert response.status_code == 400
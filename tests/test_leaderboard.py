@@ -0,0 +1,163 @@
+import bisect
+import json
+import random
+
+import pytest
+from sqlalchemy import event
+
+from src.models.user import db, User
+from src.services.leaderboard import IndexableSkiplist, Leaderboard
+
+
+# ---------------------------------------------------------------- IndexableSkiplist
+
+def assert_matches(skiplist, expected):
+    assert len(skiplist) == len(expected)
+    assert list(skiplist.iter_from(0)) == expected
+    for position, value in enumerate(expected):
+        # مع التكرار يعيد index أول موضع للقيمة
+        assert skiplist.index(value) == expected.index(value)
+        assert list(skiplist.iter_from(position)) == expected[position:]
+
+
+def test_insert_keeps_order_and_ranks():
+    skiplist = IndexableSkiplist()
+    expected = []
+    for value in [5, 1, 9, 3, 7, 2, 8]:
+        skiplist.insert(value)
+        bisect.insort(expected, value)
+    assert_matches(skiplist, expected)
+
+
+def test_ties_on_points_are_ordered_by_user_id():
+    skiplist = IndexableSkiplist()
+    for key in [(-10, 3), (-20, 2), (-10, 1), (-10, 2), (0, 4)]:
+        skiplist.insert(key)
+    assert list(skiplist.iter_from(0)) == [(-20, 2), (-10, 1), (-10, 2), (-10, 3), (0, 4)]
+    assert skiplist.index((-10, 2)) == 2
+
+
+def test_duplicates_are_removed_one_at_a_time():
+    skiplist = IndexableSkiplist()
+    for value in [4, 2, 4, 4, 1]:
+        skiplist.insert(value)
+    skiplist.remove(4)
+    assert_matches(skiplist, [1, 2, 4, 4])
+    skiplist.remove(4)
+    skiplist.remove(4)
+    assert_matches(skiplist, [1, 2])
+    with pytest.raises(KeyError):
+        skiplist.remove(4)
+    with pytest.raises(KeyError):
+        skiplist.index(4)
+
+
+def test_missing_values_and_bounds():
+    skiplist = IndexableSkiplist()
+    assert list(skiplist.iter_from(0)) == []
+    with pytest.raises(KeyError):
+        skiplist.remove(1)
+    skiplist.insert(1)
+    assert list(skiplist.iter_from(1)) == []
+    assert list(skiplist.iter_from(5)) == []
+    with pytest.raises(KeyError):
+        skiplist.index(0)
+
+
+def test_from_sorted_matches_inserts():
+    values = sorted(random.Random(1).randint(0, 50) for _ in range(300))
+    skiplist = IndexableSkiplist.from_sorted(values)
+    assert_matches(skiplist, values)
+    skiplist.insert(25)
+    skiplist.remove(values[0])
+    expected = values[1:]
+    bisect.insort(expected, 25)
+    assert_matches(skiplist, expected)
+
+
+def test_random_operations_match_a_sorted_list():
+    rng = random.Random(7)
+    skiplist = IndexableSkiplist(max_levels=8)
+    expected = []
+    for _ in range(2000):
+        if expected and rng.random() < 0.4:
+            value = rng.choice(expected)
+            skiplist.remove(value)
+            expected.remove(value)
+        else:
+            value = rng.randint(0, 100)
+            skiplist.insert(value)
+            bisect.insort(expected, value)
+    assert list(skiplist.iter_from(0)) == expected
+    for value in set(expected):
+        assert skiplist.index(value) == bisect.bisect_left(expected, value)
+    start = len(expected) // 2
+    assert list(skiplist.iter_from(start)) == expected[start:]
+
+
+# ---------------------------------------------------------------- المزامنة بين العمليات
+
+@pytest.fixture
+def other_worker(app, monkeypatch):
+    """لوحة صدارة عملية أخرى محمّلة مسبقاً، ويفشل الاختبار إن أعادت البناء بالكامل"""
+    board = Leaderboard(refresh_seconds=0)
+    with app.app_context():
+        board.load_from_db()
+    board.rebuilds = 0
+    load_from_db = board.load_from_db
+
+    def counting_load():
+        board.rebuilds += 1
+        load_from_db()
+
+    monkeypatch.setattr(board, 'load_from_db', counting_load)
+    return board
+
+
+def _sync(app, board):
+    statements = []
+    with app.app_context():
+        listener = lambda conn, cursor, statement, *args: statements.append(' '.join(statement.split()))
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            board.ensure_loaded()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+    return statements
+
+
+def test_changes_from_other_workers_are_applied_incrementally(app, admin_client, other_worker):
+    client = app.test_client()
+    assert client.post('/api/register', json={
+        'username': 'climber', 'email': 'climber@example.com', 'password': 'secret123'
+    }).status_code == 201
+    with app.app_context():
+        climber = User.query.filter_by(username='climber').one().id
+    assert admin_client.put(f'/api/admin/users/{climber}/points', json={'points': 5000}).status_code == 200
+
+    statements = _sync(app, other_worker)
+    assert other_worker.rebuilds == 0
+    assert other_worker.rank(climber) == 1
+    # لا تجميع ولا قراءة لجدول المستخدمين كاملاً: المتغيرون فقط
+    user_reads = [statement for statement in statements if 'FROM user' in statement]
+    assert user_reads and all('user.id IN' in statement for statement in user_reads)
+    assert not any('count(' in statement.lower() for statement in statements)
+
+    assert admin_client.delete(f'/api/users/{climber}').status_code == 200
+    _sync(app, other_worker)
+    assert other_worker.rank(climber) is None
+
+    assert admin_client.post('/api/tools/smart-titles', json={'topic': 'تقنية'}).get_json()['points_awarded']
+    _sync(app, other_worker)
+    assert other_worker.top(1)[0]['total_points'] == 1025
+    assert other_worker.rebuilds == 0
+
+
+def test_bulk_import_triggers_a_rebuild(app, admin_client, other_worker):
+    app.config.update(PASSWORD_HASH_METHOD='pbkdf2:sha256:1000', IMPORT_HASH_WORKERS=1)
+    records = json.dumps({'username': 'bulk', 'email': 'bulk@example.com', 'password': 'secret123'})
+    assert admin_client.post('/api/admin/users/import?format=ndjson', data=records).status_code == 200
+    _sync(app, other_worker)
+    assert other_worker.rebuilds == 1
+    with app.app_context():
+        assert other_worker.rank(User.query.filter_by(username='bulk').one().id) is not None
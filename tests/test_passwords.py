@@ -0,0 +1,23 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from src.services.passwords import hasher, method_prefix
+
+
+@pytest.mark.parametrize('method', [
+    'scrypt', 'scrypt:4096:8:1', 'pbkdf2', 'pbkdf2:sha512', 'pbkdf2:sha256:600000'
+])
+def test_method_prefix_matches_werkzeug(method):
+    assert method_prefix(method) == generate_password_hash('', method).split('$', 1)[0]
+
+
+def test_hash_timeout_returns_503(app):
+    app.config.update(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_TIMEOUT=0.001)
+    try:
+        response = app.test_client().post('/api/register', json={
+            'username': 'slowhash', 'email': 'slowhash@example.com', 'password': 'secret123'
+        })
+    finally:
+        hasher.shutdown()
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
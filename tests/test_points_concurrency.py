@@ -0,0 +1,43 @@
+import threading
+
+from src.models.user import db, User, DailyPoints
+
+USERS = 8
+THREADS_PER_TOOL = 6
+TOOLS = (('/api/tools/smart-titles', {'topic': 'stress'}), ('/api/tools/smart-emoji', {'text': 'stress'}))
+
+
+def test_concurrent_awards_sum_exactly(app):
+    with app.app_context():
+        users = [User(username=f'stress{i}', email=f'stress{i}@example.com', total_points=100) for i in range(USERS)]
+        db.session.add_all(users)
+        db.session.commit()
+        user_ids = [user.id for user in users]
+
+    jobs = [(user_id, path, body) for user_id in user_ids for path, body in TOOLS for _ in range(THREADS_PER_TOOL)]
+    barrier = threading.Barrier(len(jobs))
+    results = []
+
+    def award(user_id, path, body):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['user_id'] = user_id
+        barrier.wait()
+        response = client.post(path, json=body)
+        results.append((user_id, response.status_code, response.get_json().get('points_awarded')))
+
+    threads = [threading.Thread(target=award, args=job) for job in jobs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [status for _, status, _ in results if status != 200] == []
+    # مرة واحدة لكل أداة لكل مستخدم مهما تزامنت الطلبات
+    awarded = [user_id for user_id, _, points_awarded in results if points_awarded]
+    assert sorted(awarded) == sorted(user_ids * len(TOOLS))
+    with app.app_context():
+        totals = dict(db.session.query(User.id, User.total_points).filter(User.id.in_(user_ids)))
+        rows = db.session.query(DailyPoints).filter(DailyPoints.user_id.in_(user_ids)).count()
+    assert totals == {user_id: 100 + 25 * len(TOOLS) for user_id in user_ids}
+    assert rows == USERS * len(TOOLS)
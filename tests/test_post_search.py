@@ -0,0 +1,36 @@
+from src.models.user import db, Post
+from src.services import post_search
+
+
+def search(client, query, **params):
+    response = client.get('/api/posts/search', query_string={'q': query, **params})
+    assert response.status_code == 200
+    return [result['snippet'] for result in response.get_json()['results']]
+
+
+def test_snippet_uses_original_spelling(admin_client):
+    # النص مفهرس موحّداً (مجموعه متنوعه) لكن المقتطف يعرض النص كما كُتب
+    snippets = search(admin_client, 'مجموعه متنوعه')
+    assert any('<mark>مجموعة</mark> <mark>متنوعة</mark>' in snippet for snippet in snippets)
+    assert search(admin_client, 'نصايح') == ['<mark>نصائح</mark> لاستخدام الأدوات بفعالية']
+
+
+def test_snippet_keeps_tashkeel(admin_client):
+    response = admin_client.post('/api/posts', json={
+        'title_ar': 'اللُّغَةُ العَرَبِيَّةُ', 'title_en': 'Arabic', 'content_ar': 'محتوى', 'content_en': 'Content'
+    })
+    assert response.status_code == 201
+    assert search(admin_client, 'العربيه', lang='ar') == ['اللُّغَةُ <mark>العَرَبِيَّةُ</mark>']
+
+
+def test_indexing_does_not_commit_the_callers_transaction(app, monkeypatch):
+    # أول استدعاء في العملية هو الذي كان ينشئ الفهرس ويثبّت المعاملة
+    monkeypatch.setattr(post_search, '_available', None)
+    with app.app_context():
+        post = Post(title_ar='مسودة', title_en='Draft', content_ar='نص', content_en='Text')
+        db.session.add(post)
+        db.session.flush()
+        post_search.index_post(post)
+        db.session.rollback()
+        assert Post.query.filter_by(title_en='Draft').first() is None
+        assert db.session.execute(db.text("SELECT count(*) FROM post_search WHERE post_search MATCH 'draft'")).scalar() == 0
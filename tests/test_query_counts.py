@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.models.user import db, User, Post, Comment, UserImage
+
+
+def seed(app, count):
+    """إضافة مستخدمين مختلفين يعلّقون على المنشور 1 ويرفعون صوراً بانتظار الموافقة"""
+    now = datetime.utcnow()
+    with app.app_context():
+        start = db.session.query(db.func.count(User.id)).scalar()
+        db.session.execute(User.__table__.insert(), [
+            {'username': f'u{start + i}', 'email': f'u{start + i}@example.com', 'password_hash': 'x',
+             'total_points': 0, 'is_admin': False, 'preferred_language': 'ar'}
+            for i in range(count)
+        ])
+        user_ids = [row.id for row in db.session.query(User.id).order_by(User.id.desc()).limit(count)]
+        post_id = db.session.query(Post.id).order_by(Post.id).first().id
+        db.session.execute(Comment.__table__.insert(), [
+            {'content': f'تعليق {i}', 'user_id': user_id, 'post_id': post_id,
+             'is_approved': True, 'created_at': now - timedelta(seconds=i)}
+            for i, user_id in enumerate(user_ids)
+        ])
+        db.session.execute(UserImage.__table__.insert(), [
+            {'user_id': user_id, 'image_path': f'/tmp/{user_id}.png', 'upload_date': now - timedelta(seconds=i),
+             'expiry_date': now + timedelta(days=1), 'is_approved': False, 'is_active': True}
+            for i, user_id in enumerate(user_ids)
+        ])
+        db.session.commit()
+        return post_id
+
+
+def count_queries(app, client, url):
+    """عدد استعلامات SQL لطلب واحد (بعد طلب تمهيدي يملأ الذاكرات المؤقتة)"""
+    client.get(url)
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engines = [db.engine, app.extensions.get('sqlite_read_engine')]
+    for engine in filter(None, engines):
+        event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        for engine in filter(None, engines):
+            event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200
+    return len(statements), response.get_json()
+
+
+@pytest.mark.parametrize('url, key', [
+    ('/api/posts/{post}/comments?per_page=100', 'comments'),
+    ('/api/posts/{post}/comments?per_page=100&cursor=', 'comments'),
+    ('/api/admin/comments?per_page=100', 'comments'),
+    ('/api/admin/comments?per_page=100&cursor=', 'comments'),
+    ('/api/admin/images?per_page=100', 'images'),
+    ('/api/admin/images?per_page=100&cursor=', 'images'),
+])
+def test_listing_query_count_does_not_grow_with_rows(app, admin_client, url, key):
+    post_id = seed(app, 3)
+    url = url.format(post=post_id)
+    few, payload = count_queries(app, admin_client, url)
+    assert len(payload[key]) >= 3
+
+    seed(app, 60)
+    many, payload = count_queries(app, admin_client, url)
+    assert len(payload[key]) >= 63
+    assert all(item['username'] for item in payload[key])
+    assert many == few
+    assert many <= 3
@@ -0,0 +1,10 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import query_plans
+
+
+def test_hot_paths_use_indexes(capsys):
+    assert query_plans.main() == 0, capsys.readouterr().out
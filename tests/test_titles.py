@@ -0,0 +1,29 @@
+import pytest
+
+from src.models.user import db, User
+from src.services import titles
+
+
+@pytest.fixture
+def client(app, admin_client):
+    with app.app_context():
+        db.session.get(User, 1).total_points = 500
+        db.session.commit()
+    titles.render_titles.cache_clear()
+    return admin_client
+
+
+@pytest.mark.parametrize('path', ['/api/tools/smart-titles', '/api/tools/advanced-titles'])
+@pytest.mark.parametrize('topic', [42, ['تقنية'], {'a': 1}, None, '   ', 'x' * (titles.MAX_TOPIC_LENGTH + 1)])
+def test_invalid_topic_is_rejected(client, path, topic):
+    response = client.post(path, json={'topic': topic})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert titles.render_titles.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize('path', ['/api/tools/smart-titles', '/api/tools/advanced-titles'])
+def test_valid_topic(client, path):
+    response = client.post(path, json={'topic': 'x' * titles.MAX_TOPIC_LENGTH})
+    assert response.status_code == 200
+    assert response.get_json()['titles']
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from src.models.user import db, User
+
+
+def _ndjson(count, start=0):
+    return '\n'.join(
+        json.dumps({'username': f'imported{i}', 'email': f'imported{i}@example.com', 'password': 'secret123'})
+        for i in range(start, start + count)
+    )
+
+
+def test_import_uses_application_hash_policy(app, admin_client):
+    app.config.update(PASSWORD_HASH_METHOD='pbkdf2:sha256:1000', IMPORT_HASH_WORKERS=1)
+    response = admin_client.post('/api/admin/users/import?format=ndjson', data=_ndjson(2))
+    assert response.status_code == 200
+    assert response.get_json()['report']['imported'] == 2
+    with app.app_context():
+        password_hash = db.session.execute(
+            db.select(User.password_hash).where(User.username == 'imported0')
+        ).scalar_one()
+    assert password_hash.startswith('pbkdf2:sha256:1000$')
+
+
+def test_http_import_is_capped(app, admin_client):
+    app.config.update(IMPORT_MAX_HTTP_ROWS=3)
+    response = admin_client.post('/api/admin/users/import?format=ndjson', data=_ndjson(4))
+    assert response.status_code == 413
+    with app.app_context():
+        assert db.session.execute(
+            db.select(db.func.count(User.id)).where(User.username.like('imported%'))
+        ).scalar() == 0
+
+
+@pytest.mark.parametrize('returning', [True, False])
+def test_imported_count_excludes_rows_skipped_on_conflict(app, monkeypatch, returning):
+    from src.services import user_import
+    from src.services.analytics import get_buckets
+
+    app.config.update(IMPORT_HASH_WORKERS=1)
+    with app.app_context():
+        # مستخدم سُجّل بالتزامن بعد فحص الموجودين: يصل إلى INSERT ويُتجاهل بالتعارض
+        monkeypatch.setattr(user_import, '_drop_existing', lambda rows, report: rows)
+        monkeypatch.setattr(db.engine.dialect, 'insert_executemany_returning', returning)
+        records = [(1, {'username': 'admin', 'email': 'other@example.com', 'password': 'x'})] + [
+            (i + 2, {'username': f'bulk{i}', 'email': f'bulk{i}@example.com', 'password': 'x'}) for i in range(3)
+        ]
+        report = user_import.import_users(iter(records), method='pbkdf2:sha256:1000', workers=1)
+        assert report.imported == 3
+        assert report.conflicts == 1
+        assert get_buckets('day', 1)[0]['new_users'] == 4  # المدير + 3
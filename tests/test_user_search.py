@@ -0,0 +1,46 @@
+from sqlalchemy import event
+
+from src.models.user import db
+from src.services import user_search
+
+
+def usernames(client, term):
+    response = client.get('/api/admin/users/search', query_string={'q': term})
+    assert response.status_code == 200
+    return [user['username'] for user in response.get_json()['users']]
+
+
+def test_index_is_built_by_migration_and_kept_in_sync(app, admin_client):
+    with app.app_context():
+        assert db.session.execute(db.text(user_search._EXISTS)).first() is not None
+    assert usernames(admin_client, 'dmi') == ['admin']
+
+    response = app.test_client().post('/api/register', json={
+        'username': 'searchable', 'email': 'searchable@example.com', 'password': 'secret123'
+    })
+    assert response.status_code == 201
+    assert usernames(admin_client, 'chab') == ['searchable']
+
+
+def test_search_request_does_not_build_the_index(app, admin_client, monkeypatch):
+    with app.app_context():
+        db.session.execute(db.text('DROP TABLE user_search'))
+        db.session.commit()
+        engine = db.engine
+    monkeypatch.setattr(user_search, '_available', None)
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', listener)
+    try:
+        # بلا فهرس يعود البحث إلى LIKE ولا يُنشئ شيئاً
+        assert usernames(admin_client, 'dmi') == ['admin']
+        assert admin_client.get('/api/admin/users?search=dmi').status_code == 200
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+    assert not any(statement.lstrip().upper().startswith(('CREATE', 'INSERT INTO USER_SEARCH')) for statement in statements)
+
+    with app.app_context():
+        assert user_search.create_index()
+        assert user_search.ensure_index()
+    assert usernames(admin_client, 'dmi') == ['admin']